@@ -1,40 +1,72 @@
+from .cache import ReadCache, read_cache
 from .contract_functions import (
     active_balance_locking_mechanism,
+    allocations_merkle_root,
+    approve_to_spend_tokens_by_agent,
+    balance_locking_mechanism_of_id,
     balance_of,
+    batch_mint_migrated_holders,
+    batch_transfer_with_locking,
+    claim_locked_allocation,
+    clear_fully_vested_locking_mechanism_of,
+    commit_allocations_merkle_root,
     contract_locking_for_upgrade,
     deactivate_balance_locking_mechanism,
     development_push_date_of_contract,
     development_status,
+    finish_migration,
     initializing_active_balance_locking_mechanism,
+    is_allocation_claimed,
     last_mechanism_id,
     linear_release_dividend_and_divisor_of_address,
     linear_release_period_and_amount_of_address,
+    locking_statuses_of_addresses,
     max_supply,
     mechanism_status,
+    migration_status,
     mint,
     normal_transfer,
     remaining_blocked_tokens_at_now_of_address,
     remaining_seconds_to_finishing_the_cliff_of_address,
     shifted_days,
+    total_supply,
+    transfer_from_user_by_approved_agent,
     transfer_with_locking,
     turn_development_mode_off,
     wallet_affected_by_locking_mechanism_state,
     name,
 )
+from .instrumentation import (
+    AdapterCall,
+    HistogramSink,
+    Instrumentation,
+    InstrumentationSink,
+    JsonlTraceSink,
+    PrometheusTextSink,
+    adapter_instrumentation,
+)
+from .multicall import batch_read, batch_read_for_addresses
+from .preflight import preflight_many
+from .rpc import AsyncJsonRpcTransport, RpcError
+from .transaction_pipeline import TransactionPipeline
 
 __all__ = (
     "balance_of",
     "development_status",
     "max_supply",
+    "total_supply",
     "mechanism_status",
+    "migration_status",
     "wallet_affected_by_locking_mechanism_state",
     "last_mechanism_id",
     "shifted_days",
     "active_balance_locking_mechanism",
+    "balance_locking_mechanism_of_id",
     "linear_release_dividend_and_divisor_of_address",
     "linear_release_period_and_amount_of_address",
     "remaining_seconds_to_finishing_the_cliff_of_address",
     "remaining_blocked_tokens_at_now_of_address",
+    "locking_statuses_of_addresses",
     "initializing_active_balance_locking_mechanism",
     "deactivate_balance_locking_mechanism",
     "contract_locking_for_upgrade",
@@ -42,6 +74,31 @@ __all__ = (
     "development_push_date_of_contract",
     "turn_development_mode_off",
     "transfer_with_locking",
+    "batch_transfer_with_locking",
+    "batch_mint_migrated_holders",
+    "finish_migration",
+    "allocations_merkle_root",
+    "is_allocation_claimed",
+    "commit_allocations_merkle_root",
+    "claim_locked_allocation",
+    "clear_fully_vested_locking_mechanism_of",
     "normal_transfer",
+    "approve_to_spend_tokens_by_agent",
+    "transfer_from_user_by_approved_agent",
     "name",
+    "batch_read",
+    "batch_read_for_addresses",
+    "AsyncJsonRpcTransport",
+    "RpcError",
+    "ReadCache",
+    "read_cache",
+    "Instrumentation",
+    "InstrumentationSink",
+    "AdapterCall",
+    "HistogramSink",
+    "PrometheusTextSink",
+    "JsonlTraceSink",
+    "adapter_instrumentation",
+    "preflight_many",
+    "TransactionPipeline",
 )
@@ -0,0 +1,640 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, Sequence, TypeVar, Union
+
+from brownie.network.account import Account, LocalAccount
+from brownie.network.contract import ProjectContract
+from eth_account import Account as EthAccount
+
+from QMatic.schemas import (
+    AttachedLockingMechanismReleasingPeriodStructure,
+    Events,
+    GeneralActiveBalanceLockingMechanismStructure,
+    LinearReleaseShareStructure,
+    MigratedHolder,
+    RevertedMessage,
+    WalletBalanceLockingMechanism,
+    WalletLockingStatus,
+    events_from_logs,
+)
+
+from .contract_functions import (
+    DEFAULT_LOCKING_STATUSES_CHUNK_SIZE,
+    _to_attached_locking_mechanism_releasing_period_structure,
+    _to_general_active_balance_locking_mechanism_structure,
+    _to_linear_release_share_structure,
+    _to_migrated_holder_structure,
+    _to_wallet_balance_locking_mechanism,
+    _to_wallet_locking_status,
+)
+from .rpc import AsyncJsonRpcTransport, RpcError
+
+# async counterparts of `contract_functions`: same arguments after `transport`, same results.
+# the calls are encoded/decoded with the ABI of the brownie contract, only the transport is async.
+
+DEFAULT_CONCURRENCY: int = 32
+
+T = TypeVar("T")
+
+
+async def _call(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    method_name: str,
+    args: Sequence[Any],
+    caller: Union[Account, LocalAccount],
+) -> Any:
+    method = getattr(qmatic_contract, method_name)
+    return_data = await transport.request(
+        "eth_call",
+        [
+            {
+                "from": caller.address,
+                "to": qmatic_contract.address,
+                "data": method.encode_input(*args),
+            },
+            "latest",
+        ],
+    )
+    return method.decode_output(return_data)
+
+
+async def broadcast(
+    transport: AsyncJsonRpcTransport,
+    tx: dict[str, Any],
+    caller: Union[Account, LocalAccount],
+) -> str:
+    """
+    broadcasts `tx` (JSON-RPC quantities, `gas` included) from `caller`, returns the transaction hash.
+    the unlocked accounts of a dev node are sent by `eth_sendTransaction`, the local accounts are signed here
+    and need `nonce` and `gasPrice` in `tx`.
+    """
+    if not isinstance(caller, LocalAccount):
+        return await transport.request("eth_sendTransaction", [tx])
+    signed_tx = EthAccount.sign_transaction(
+        {
+            "to": tx["to"],
+            "data": tx.get("data", "0x"),
+            "value": int(tx.get("value", "0x0"), 16),
+            "gas": int(tx["gas"], 16),
+            "gasPrice": int(tx["gasPrice"], 16),
+            "nonce": int(tx["nonce"], 16),
+            "chainId": await transport.chain_id(),
+        },
+        caller.private_key,
+    )
+    return await transport.request(
+        "eth_sendRawTransaction", ["0x" + signed_tx.rawTransaction.hex()]
+    )
+
+
+async def _send(
+    transport: AsyncJsonRpcTransport,
+    tx: dict[str, Any],
+    caller: Union[Account, LocalAccount],
+) -> str:
+    async with transport.sender_lock(caller.address):
+        tx["gas"] = await transport.request("eth_estimateGas", [tx])
+        if isinstance(caller, LocalAccount):
+            tx["nonce"], tx["gasPrice"] = await asyncio.gather(
+                transport.request(
+                    "eth_getTransactionCount", [caller.address, "pending"]
+                ),
+                transport.request("eth_gasPrice", []),
+            )
+        return await broadcast(transport, tx, caller)
+
+
+async def outcome_of_receipt(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    tx: dict[str, Any],
+    receipt: dict[str, Any],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    """
+    the adapter result of a mined transaction: its QMatic events, or the revert message of a failed one.
+    """
+    if int(receipt["status"], 16) == 0:
+        # reverted after the gas estimation (e.g. a concurrent transaction), the reason is taken from a replay.
+        try:
+            await transport.request(
+                "eth_call",
+                [
+                    {key: tx[key] for key in ("from", "to", "data")},
+                    receipt["blockNumber"],
+                ],
+            )
+        except RpcError as error:
+            if not error.is_revert:
+                raise
+            return None, RevertedMessage(msg=error.revert_msg)
+        return None, RevertedMessage(msg=None)
+    return (
+        events_from_logs(
+            log
+            for log in receipt["logs"]
+            if log["address"].lower() == qmatic_contract.address.lower()
+        ),
+        None,
+    )
+
+
+async def _transact(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    method_name: str,
+    args: Sequence[Any],
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    tx = {
+        "from": caller.address,
+        "to": qmatic_contract.address,
+        "data": getattr(qmatic_contract, method_name).encode_input(*args),
+    }
+    try:
+        receipt = await transport.wait_for_receipt(
+            await _send(transport, dict(tx), caller)
+        )
+    except RpcError as error:
+        if not error.is_revert:
+            raise
+        return None, RevertedMessage(msg=error.revert_msg)
+    return await outcome_of_receipt(transport, qmatic_contract, tx, receipt)
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]], concurrency: int = DEFAULT_CONCURRENCY
+) -> list[T]:
+    """
+    awaits all of `awaitables` with at most `concurrency` of them in flight, results are in the same order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(bounded(awaitable) for awaitable in awaitables)))
+
+
+async def read_for_addresses(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    adapter: Callable[..., Awaitable[Any]],
+    addresses: Sequence[str],
+    caller: Union[Account, LocalAccount],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, Any]:
+    """
+    async counterpart of `batch_read_for_addresses`: one `eth_call` per address, `concurrency` of them in flight.
+    """
+    results = await gather_bounded(
+        (adapter(transport, qmatic_contract, address, caller) for address in addresses),
+        concurrency=concurrency,
+    )
+    return dict(zip(addresses, results))
+
+
+async def name(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> str:
+    return await _call(transport, qmatic_contract, "name", [], caller)
+
+
+async def balance_of(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    account_address: str,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(
+        transport, qmatic_contract, "balanceOf", [account_address], caller
+    )
+
+
+async def development_status(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> bool:
+    return await _call(transport, qmatic_contract, "IS_DEVELOPMENT", [], caller)
+
+
+async def max_supply(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(transport, qmatic_contract, "MAX_SUPPLY", [], caller)
+
+
+async def total_supply(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(transport, qmatic_contract, "totalSupply", [], caller)
+
+
+async def migration_status(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> bool:
+    return await _call(transport, qmatic_contract, "isMigrationFinished", [], caller)
+
+
+async def allocations_merkle_root(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> str:
+    root = await _call(transport, qmatic_contract, "allocationsMerkleRoot", [], caller)
+    return "0x" + bytes(root).hex()
+
+
+async def is_allocation_claimed(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    account_address: str,
+    amount: int,
+    mechanism_id: int,
+    caller: Union[Account, LocalAccount],
+) -> bool:
+    return await _call(
+        transport,
+        qmatic_contract,
+        "isAllocationClaimed",
+        [account_address, amount, mechanism_id],
+        caller,
+    )
+
+
+async def mechanism_status(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> bool:
+    return await _call(transport, qmatic_contract, "isMechanismActivated", [], caller)
+
+
+async def wallet_affected_by_locking_mechanism_state(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    account_address: str,
+    caller: Union[Account, LocalAccount],
+) -> WalletBalanceLockingMechanism:
+    data = await _call(
+        transport,
+        qmatic_contract,
+        "walletsAffectedByLockingMechanism",
+        [account_address],
+        caller,
+    )
+    return _to_wallet_balance_locking_mechanism(data)
+
+
+async def last_mechanism_id(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(transport, qmatic_contract, "lastMechanismId", [], caller)
+
+
+async def shifted_days(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(transport, qmatic_contract, "CONTRACT_SHIFT_DAYS", [], caller)
+
+
+async def active_balance_locking_mechanism(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> GeneralActiveBalanceLockingMechanismStructure:
+    data = await _call(
+        transport, qmatic_contract, "activeBalanceLockingMechanism", [], caller
+    )
+    return _to_general_active_balance_locking_mechanism_structure(data)
+
+
+async def balance_locking_mechanism_of_id(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    mechanism_id: int,
+    caller: Union[Account, LocalAccount],
+) -> GeneralActiveBalanceLockingMechanismStructure:
+    data = await _call(
+        transport, qmatic_contract, "balanceLockingMechanisms", [mechanism_id], caller
+    )
+    return _to_general_active_balance_locking_mechanism_structure(data)
+
+
+async def linear_release_dividend_and_divisor_of_address(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    target_address: str,
+    caller: Union[Account, LocalAccount],
+) -> LinearReleaseShareStructure:
+    response = await _call(
+        transport,
+        qmatic_contract,
+        "getLinearReleaseDividendAndDivisorOf",
+        [target_address],
+        caller,
+    )
+    return _to_linear_release_share_structure(response)
+
+
+async def linear_release_period_and_amount_of_address(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    target_address: str,
+    caller: Union[Account, LocalAccount],
+) -> AttachedLockingMechanismReleasingPeriodStructure:
+    response = await _call(
+        transport,
+        qmatic_contract,
+        "getLinearReleasePeriodAndAmountOf",
+        [target_address],
+        caller,
+    )
+    return _to_attached_locking_mechanism_releasing_period_structure(response)
+
+
+async def remaining_seconds_to_finishing_the_cliff_of_address(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    target_address: str,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(
+        transport,
+        qmatic_contract,
+        "getRemainingSecondsToFinishingTheCliffOf",
+        [target_address],
+        caller,
+    )
+
+
+async def remaining_blocked_tokens_at_now_of_address(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    target_address: str,
+    caller: Union[Account, LocalAccount],
+) -> int:
+    return await _call(
+        transport,
+        qmatic_contract,
+        "getRemainingBlockedTokensAtNowOf",
+        [target_address],
+        caller,
+    )
+
+
+async def locking_statuses_of_addresses(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    addresses: Sequence[str],
+    caller: Union[Account, LocalAccount],
+    chunk_size: int = DEFAULT_LOCKING_STATUSES_CHUNK_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, WalletLockingStatus]:
+    responses = await gather_bounded(
+        (
+            _call(
+                transport,
+                qmatic_contract,
+                "getLockingStatusesOf",
+                [addresses[start : start + chunk_size]],
+                caller,
+            )
+            for start in range(0, len(addresses), chunk_size)
+        ),
+        concurrency=concurrency,
+    )
+    statuses = [
+        _to_wallet_locking_status(data) for response in responses for data in response
+    ]
+    return dict(zip(addresses, statuses))
+
+
+async def initializing_active_balance_locking_mechanism(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    entries: GeneralActiveBalanceLockingMechanismStructure,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "initActiveBalanceLockingMechanism",
+        [
+            entries.cliff_duration_in_days,
+            entries.linear_release_period_in_days,
+            entries.linear_release_dividend,
+            entries.linear_release_divisor,
+            entries.releasing_tge_dividend_on_100,
+        ],
+        caller,
+    )
+
+
+async def deactivate_balance_locking_mechanism(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport, qmatic_contract, "deactivateBalanceLockingMechanism", [], caller
+    )
+
+
+async def contract_locking_for_upgrade(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    new_qmatic_address: str,
+    report_url: str,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "contractLockingForUpgrade",
+        [new_qmatic_address, report_url],
+        caller,
+    )
+
+
+async def mint(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    to: str,
+    amount: int,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(transport, qmatic_contract, "mint", [to, amount], caller)
+
+
+async def development_push_date_of_contract(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    days: int,
+    caller: Union[Account, LocalAccount],
+) -> Union[RevertedMessage, None]:
+    _, revert_exception = await _transact(
+        transport, qmatic_contract, "changeDateOfContract", [days], caller
+    )
+    return revert_exception
+
+
+async def turn_development_mode_off(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> Union[RevertedMessage, None]:
+    _, revert_exception = await _transact(
+        transport, qmatic_contract, "turnDevelopmentModeOff", [], caller
+    )
+    return revert_exception
+
+
+async def transfer_with_locking(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    to: str,
+    amount: int,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport, qmatic_contract, "transferWithLocking", [to, amount], caller
+    )
+
+
+async def batch_transfer_with_locking(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    recipients: Sequence[str],
+    amounts: Sequence[int],
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "batchTransferWithLocking",
+        [list(recipients), list(amounts)],
+        caller,
+    )
+
+
+async def commit_allocations_merkle_root(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    merkle_root: bytes,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "commitAllocationsMerkleRoot",
+        [merkle_root],
+        caller,
+    )
+
+
+async def claim_locked_allocation(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    amount: int,
+    mechanism_id: int,
+    proof: Sequence[bytes],
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "claimLockedAllocation",
+        [amount, mechanism_id, list(proof)],
+        caller,
+    )
+
+
+async def batch_mint_migrated_holders(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    holders: Sequence[MigratedHolder],
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "batchMintMigratedHolders",
+        [[_to_migrated_holder_structure(holder) for holder in holders]],
+        caller,
+    )
+
+
+async def finish_migration(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(transport, qmatic_contract, "finishMigration", [], caller)
+
+
+async def clear_fully_vested_locking_mechanism_of(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    target_address: str,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "clearFullyVestedLockingMechanismOf",
+        [target_address],
+        caller,
+    )
+
+
+async def transfer_from_user_by_approved_agent(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    from_address: str,
+    to_address: str,
+    amount: int,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport,
+        qmatic_contract,
+        "transferFrom",
+        [from_address, to_address, amount],
+        caller,
+    )
+
+
+async def approve_to_spend_tokens_by_agent(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    spender_address: str,
+    amount_spend: int,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(
+        transport, qmatic_contract, "approve", [spender_address, amount_spend], caller
+    )
+
+
+async def normal_transfer(
+    transport: AsyncJsonRpcTransport,
+    qmatic_contract: ProjectContract,
+    to: str,
+    amount: int,
+    caller: Union[Account, LocalAccount],
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return await _transact(transport, qmatic_contract, "transfer", [to, amount], caller)
@@ -0,0 +1,149 @@
+import inspect
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, NamedTuple, Union
+
+from brownie import history, web3
+
+from . import contract_functions
+
+DEFAULT_READ_CACHE_SIZE: int = 4_096
+# the block number is polled at most once per interval, a hit within it costs no JSON-RPC request.
+DEFAULT_BLOCK_NUMBER_TTL_IN_SECONDS: float = 0.25
+
+
+class ReadCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    invalidations: int
+    maxsize: int
+    currsize: int
+
+
+class ReadCache:
+    """
+    LRU cache of the view adapters keyed by (adapter, contract, arguments) and valid for one chain state.
+    the chain state is the (block number, last transaction of brownie's `history`) pair,
+    so a new block, a transaction sent by this process (e.g. a write adapter) or a `chain.revert()` drops the entries.
+    `history` is local and checked on every lookup, the block number is polled at most every `block_number_ttl` seconds
+    (0 polls it on every lookup), so a block mined by another process is seen after up to `block_number_ttl` seconds.
+    the adapters of `constant_adapters` (e.g. `max_supply`) are memoized per contract forever.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_READ_CACHE_SIZE,
+        constant_adapters: tuple[Callable[..., Any], ...] = (
+            contract_functions.max_supply,
+        ),
+        block_number_ttl: float = DEFAULT_BLOCK_NUMBER_TTL_IN_SECONDS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.block_number_ttl = block_number_ttl
+        self.constant_adapters = frozenset(constant_adapters)
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.constants: dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._chain_state: Union[tuple[int, Union[str, None]], None] = None
+        self._block_number: Union[int, None] = None
+        self._block_number_polled_at = 0.0
+
+    def chain_state(self) -> tuple[int, Union[str, None]]:
+        last_txid = history[-1].txid if len(history) else None
+        now = time.monotonic()
+        # a transaction of this process moves the block number as well, it is polled again right away.
+        block_number = self._block_number
+        if (
+            block_number is not None
+            and self._chain_state is not None
+            and last_txid == self._chain_state[1]
+            and now - self._block_number_polled_at < self.block_number_ttl
+        ):
+            return block_number, last_txid
+        polled_block_number: int = web3.eth.block_number
+        self._block_number = polled_block_number
+        self._block_number_polled_at = now
+        return polled_block_number, last_txid
+
+    def _drop_entries(self) -> None:
+        if self.entries:
+            self.invalidations += 1
+        self.entries.clear()
+
+    def invalidate(self) -> None:
+        self._drop_entries()
+        self._chain_state = None
+        self._block_number = None
+
+    def info(self) -> ReadCacheInfo:
+        return ReadCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            invalidations=self.invalidations,
+            maxsize=self.maxsize,
+            currsize=len(self.entries),
+        )
+
+    def _lookup(self, key: Hashable, is_constant: bool) -> tuple[bool, Any]:
+        if is_constant:
+            if key in self.constants:
+                return True, self.constants[key]
+            return False, None
+        chain_state = self.chain_state()
+        if chain_state != self._chain_state:
+            self._drop_entries()
+            self._chain_state = chain_state
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return True, self.entries[key]
+        return False, None
+
+    def _store(self, key: Hashable, value: Any, is_constant: bool) -> None:
+        if is_constant:
+            self.constants[key] = value
+            return
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def wrap(self, adapter: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        the cached version of a view adapter with the same signature, `caller` is not a part of the key.
+        """
+        signature = inspect.signature(adapter)
+        is_constant = adapter in self.constant_adapters
+
+        @wraps(adapter)
+        def cached_adapter(*args: Any, **kwargs: Any) -> Any:
+            arguments = signature.bind(*args, **kwargs).arguments
+            key = (
+                adapter,
+                arguments.pop("qmatic_contract").address,
+                *(value for name, value in arguments.items() if name != "caller"),
+            )
+            found, value = self._lookup(key, is_constant)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            value = adapter(*args, **kwargs)
+            self._store(key, value, is_constant)
+            return value
+
+        return cached_adapter
+
+
+read_cache = ReadCache()
+
+balance_of = read_cache.wrap(contract_functions.balance_of)
+mechanism_status = read_cache.wrap(contract_functions.mechanism_status)
+active_balance_locking_mechanism = read_cache.wrap(
+    contract_functions.active_balance_locking_mechanism
+)
+last_mechanism_id = read_cache.wrap(contract_functions.last_mechanism_id)
+max_supply = read_cache.wrap(contract_functions.max_supply)
+shifted_days = read_cache.wrap(contract_functions.shifted_days)
+development_status = read_cache.wrap(contract_functions.development_status)
@@ -1,18 +1,97 @@
-from typing import TypeAlias, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence, TypeAlias, Union
 
 from brownie.exceptions import VirtualMachineError
 from brownie.network.account import Account
-from brownie.network.contract import ProjectContract
+from brownie.network.contract import ContractTx, ProjectContract
 
 from QMatic.schemas import (
     AttachedLockingMechanismReleasingPeriodStructure,
     Events,
     GeneralActiveBalanceLockingMechanismStructure,
     LinearReleaseShareStructure,
+    MigratedHolder,
     RevertedMessage,
     WalletBalanceLockingMechanism,
+    WalletLockingStatus,
 )
 
+from .preflight import preflight as preflight_transaction
+
+# accounts per 'getLockingStatusesOf' call, a few thousand gas each keeps a chunk far below the usual RPC gas caps.
+DEFAULT_LOCKING_STATUSES_CHUNK_SIZE: int = 1_000
+DEFAULT_LOCKING_STATUSES_WORKERS: int = 8
+
+
+def _transact(
+    method: ContractTx, args: Sequence[Any], caller: Account, preflight: bool
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    """
+    sends `method(*args)` from `caller`, with `preflight` it is run as an 'eth_call' first and nothing is broadcast on a revert.
+    """
+    if preflight:
+        revert_exception = preflight_transaction(method, args, caller)
+        if revert_exception is not None:
+            return None, revert_exception
+    try:
+        tx = method(*args, {"from": caller})
+        return Events.from_tx(tx.events), None
+    except VirtualMachineError as error:
+        if error.revert_type != "revert":
+            raise
+        return (
+            None,
+            RevertedMessage(msg=error.revert_msg),
+        )
+
+
+def _to_general_active_balance_locking_mechanism_structure(
+    data: Sequence[int],
+) -> GeneralActiveBalanceLockingMechanismStructure:
+    return GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=data[0],
+        linear_release_period_in_days=data[1],
+        linear_release_dividend=data[2],
+        linear_release_divisor=data[3],
+        releasing_tge_dividend_on_100=data[4],
+    )
+
+
+def _to_wallet_balance_locking_mechanism(
+    data: Sequence[Any],
+) -> WalletBalanceLockingMechanism:
+    return WalletBalanceLockingMechanism(
+        started_date=data[0],
+        total_affected_tokens=data[1],
+        linear_release_tokens_per_period=data[2],
+        mechanism=_to_general_active_balance_locking_mechanism_structure(data[3]),
+    )
+
+
+def _to_linear_release_share_structure(
+    data: Sequence[int],
+) -> LinearReleaseShareStructure:
+    return LinearReleaseShareStructure(dividend=data[0], divisor=data[1])
+
+
+def _to_attached_locking_mechanism_releasing_period_structure(
+    data: Sequence[int],
+) -> AttachedLockingMechanismReleasingPeriodStructure:
+    return AttachedLockingMechanismReleasingPeriodStructure(
+        period_in_days=data[0], release_amount_per_period=data[1]
+    )
+
+
+def _to_wallet_locking_status(data: Sequence[int]) -> WalletLockingStatus:
+    return WalletLockingStatus(
+        remaining_blocked_tokens=data[0],
+        remaining_seconds_to_finishing_the_cliff=data[1],
+        period_in_days=data[2],
+        release_amount_per_period=data[3],
+        dividend=data[4],
+        divisor=data[5],
+    )
+
 
 def name(qmatic_contract: ProjectContract, caller: Account) -> str:
     return qmatic_contract.name({"from": caller})
@@ -32,6 +111,30 @@ def max_supply(qmatic_contract: ProjectContract, caller: Account) -> int:
     return qmatic_contract.MAX_SUPPLY({"from": caller})
 
 
+def total_supply(qmatic_contract: ProjectContract, caller: Account) -> int:
+    return qmatic_contract.totalSupply({"from": caller})
+
+
+def migration_status(qmatic_contract: ProjectContract, caller: Account) -> bool:
+    return qmatic_contract.isMigrationFinished({"from": caller})
+
+
+def allocations_merkle_root(qmatic_contract: ProjectContract, caller: Account) -> str:
+    return "0x" + bytes(qmatic_contract.allocationsMerkleRoot({"from": caller})).hex()
+
+
+def is_allocation_claimed(
+    qmatic_contract: ProjectContract,
+    account_address: str,
+    amount: int,
+    mechanism_id: int,
+    caller: Account,
+) -> bool:
+    return qmatic_contract.isAllocationClaimed(
+        account_address, amount, mechanism_id, {"from": caller}
+    )
+
+
 def mechanism_status(qmatic_contract: ProjectContract, caller: Account) -> bool:
     return qmatic_contract.isMechanismActivated({"from": caller})
 
@@ -42,18 +145,7 @@ def wallet_affected_by_locking_mechanism_state(
     data = qmatic_contract.walletsAffectedByLockingMechanism(
         account_address, {"from": caller}
     )
-    return WalletBalanceLockingMechanism(
-        started_date=data[0],
-        total_affected_tokens=data[1],
-        linear_release_tokens_per_period=data[2],
-        mechanism=GeneralActiveBalanceLockingMechanismStructure(
-            cliff_duration_in_days=data[3][0],
-            linear_release_period_in_days=data[3][1],
-            linear_release_dividend=data[3][2],
-            linear_release_divisor=data[3][3],
-            releasing_tge_dividend_on_100=data[3][4],
-        ),
-    )
+    return _to_wallet_balance_locking_mechanism(data)
 
 
 def last_mechanism_id(qmatic_contract: ProjectContract, caller: Account) -> int:
@@ -69,13 +161,16 @@ def active_balance_locking_mechanism(
     caller: Account,
 ) -> GeneralActiveBalanceLockingMechanismStructure:
     data = qmatic_contract.activeBalanceLockingMechanism({"from": caller})
-    return GeneralActiveBalanceLockingMechanismStructure(
-        cliff_duration_in_days=data[0],
-        linear_release_period_in_days=data[1],
-        linear_release_dividend=data[2],
-        linear_release_divisor=data[3],
-        releasing_tge_dividend_on_100=data[4],
-    )
+    return _to_general_active_balance_locking_mechanism_structure(data)
+
+
+def balance_locking_mechanism_of_id(
+    qmatic_contract: ProjectContract,
+    mechanism_id: int,
+    caller: Account,
+) -> GeneralActiveBalanceLockingMechanismStructure:
+    data = qmatic_contract.balanceLockingMechanisms(mechanism_id, {"from": caller})
+    return _to_general_active_balance_locking_mechanism_structure(data)
 
 
 def linear_release_dividend_and_divisor_of_address(
@@ -84,7 +179,7 @@ def linear_release_dividend_and_divisor_of_address(
     response = qmatic_contract.getLinearReleaseDividendAndDivisorOf(
         target_address, {"from": caller}
     )
-    return LinearReleaseShareStructure(dividend=response[0], divisor=response[1])
+    return _to_linear_release_share_structure(response)
 
 
 def linear_release_period_and_amount_of_address(
@@ -93,9 +188,7 @@ def linear_release_period_and_amount_of_address(
     response = qmatic_contract.getLinearReleasePeriodAndAmountOf(
         target_address, {"from": caller}
     )
-    return AttachedLockingMechanismReleasingPeriodStructure(
-        period_in_days=response[0], release_amount_per_period=response[1]
-    )
+    return _to_attached_locking_mechanism_releasing_period_structure(response)
 
 
 def remaining_seconds_to_finishing_the_cliff_of_address(
@@ -106,7 +199,6 @@ def remaining_seconds_to_finishing_the_cliff_of_address(
     )
 
 
-
 def remaining_blocked_tokens_at_now_of_address(
     qmatic_contract: ProjectContract, target_address: str, caller: Account
 ) -> int:
@@ -115,46 +207,63 @@ def remaining_blocked_tokens_at_now_of_address(
     )
 
 
+def locking_statuses_of_addresses(
+    qmatic_contract: ProjectContract,
+    addresses: Sequence[str],
+    caller: Account,
+    chunk_size: int = DEFAULT_LOCKING_STATUSES_CHUNK_SIZE,
+    max_workers: int = DEFAULT_LOCKING_STATUSES_WORKERS,
+    block_identifier: Union[int, str, None] = None,
+) -> dict[str, WalletLockingStatus]:
+    """
+    the lock statuses of `addresses` by 'getLockingStatusesOf', one 'eth_call' per `chunk_size` addresses
+    with `max_workers` of them in flight. a block number in `block_identifier` keeps all of the chunks on the same state.
+    """
+    chunks = [
+        addresses[start : start + chunk_size]
+        for start in range(0, len(addresses), chunk_size)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        responses = executor.map(
+            lambda chunk: qmatic_contract.getLockingStatusesOf.call(
+                chunk, {"from": caller}, block_identifier=block_identifier
+            ),
+            chunks,
+        )
+        statuses = [
+            _to_wallet_locking_status(data)
+            for response in responses
+            for data in response
+        ]
+    return dict(zip(addresses, statuses))
+
+
 def initializing_active_balance_locking_mechanism(
     qmatic_contract: ProjectContract,
     entries: GeneralActiveBalanceLockingMechanismStructure,
     caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.initActiveBalanceLockingMechanism(
+    return _transact(
+        qmatic_contract.initActiveBalanceLockingMechanism,
+        (
             entries.cliff_duration_in_days,
             entries.linear_release_period_in_days,
             entries.linear_release_dividend,
             entries.linear_release_divisor,
             entries.releasing_tge_dividend_on_100,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+        ),
+        caller,
+        preflight,
+    )
 
 
 def deactivate_balance_locking_mechanism(
-    qmatic_contract: ProjectContract, caller: Account
+    qmatic_contract: ProjectContract, caller: Account, preflight: bool = False
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.deactivateBalanceLockingMechanism(
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+    return _transact(
+        qmatic_contract.deactivateBalanceLockingMechanism, (), caller, preflight
+    )
 
 
 def contract_locking_for_upgrade(
@@ -162,21 +271,14 @@ def contract_locking_for_upgrade(
     new_qmatic_address: str,
     report_url: str,
     caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.contractLockingForUpgrade(
-            new_qmatic_address,
-            report_url,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+    return _transact(
+        qmatic_contract.contractLockingForUpgrade,
+        (new_qmatic_address, report_url),
+        caller,
+        preflight,
+    )
 
 
 def mint(
@@ -184,21 +286,9 @@ def mint(
     to: str,
     amount: int,
     caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.mint(
-            to,
-            amount,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+    return _transact(qmatic_contract.mint, (to, amount), caller, preflight)
 
 
 def development_push_date_of_contract(
@@ -226,23 +316,115 @@ def turn_development_mode_off(
 
 
 def transfer_with_locking(
-    qmatic_contract: ProjectContract, to: str, amount: int, caller: Account
+    qmatic_contract: ProjectContract,
+    to: str,
+    amount: int,
+    caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.transferWithLocking(
-            to,
-            amount,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
+    return _transact(
+        qmatic_contract.transferWithLocking, (to, amount), caller, preflight
+    )
 
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+
+def batch_transfer_with_locking(
+    qmatic_contract: ProjectContract,
+    recipients: Sequence[str],
+    amounts: Sequence[int],
+    caller: Account,
+    preflight: bool = False,
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    """
+    `recipients[i]` receives `amounts[i]`, the events of every recipient are decoded in order.
+    """
+    return _transact(
+        qmatic_contract.batchTransferWithLocking,
+        (list(recipients), list(amounts)),
+        caller,
+        preflight,
+    )
+
+
+def commit_allocations_merkle_root(
+    qmatic_contract: ProjectContract,
+    merkle_root: bytes,
+    caller: Account,
+    preflight: bool = False,
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return _transact(
+        qmatic_contract.commitAllocationsMerkleRoot, (merkle_root,), caller, preflight
+    )
+
+
+def claim_locked_allocation(
+    qmatic_contract: ProjectContract,
+    amount: int,
+    mechanism_id: int,
+    proof: Sequence[bytes],
+    caller: Account,
+    preflight: bool = False,
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    """
+    `caller` claims its allocation of the committed Merkle root with the `proof` of its leaf.
+    """
+    return _transact(
+        qmatic_contract.claimLockedAllocation,
+        (amount, mechanism_id, list(proof)),
+        caller,
+        preflight,
+    )
+
+
+def _to_migrated_holder_structure(holder: MigratedHolder) -> tuple:
+    return (
+        holder.account,
+        holder.balance,
+        holder.amount_of_invest_in_qmatic,
+        (
+            holder.started_date,
+            holder.total_affected_tokens,
+            holder.linear_release_tokens_per_period,
+            holder.mechanism_id,
+        ),
+    )
+
+
+def batch_mint_migrated_holders(
+    qmatic_contract: ProjectContract,
+    holders: Sequence[MigratedHolder],
+    caller: Account,
+    preflight: bool = False,
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    """
+    mints the balances of `holders` and restores their lock records on the successor contract of a migration.
+    """
+    structures = [_to_migrated_holder_structure(holder) for holder in holders]
+    return _transact(
+        qmatic_contract.batchMintMigratedHolders, (structures,), caller, preflight
+    )
+
+
+def finish_migration(
+    qmatic_contract: ProjectContract, caller: Account, preflight: bool = False
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    """
+    closes 'batchMintMigratedHolders' of the successor contract forever.
+    """
+    return _transact(qmatic_contract.finishMigration, (), caller, preflight)
+
+
+def clear_fully_vested_locking_mechanism_of(
+    qmatic_contract: ProjectContract,
+    target_address: str,
+    caller: Account,
+    preflight: bool = False,
+) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
+    return _transact(
+        qmatic_contract.clearFullyVestedLockingMechanismOf,
+        (target_address,),
+        caller,
+        preflight,
+    )
 
 
 def transfer_from_user_by_approved_agent(
@@ -251,23 +433,14 @@ def transfer_from_user_by_approved_agent(
     to_address: str,
     amount: int,
     caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.transferFrom(
-            from_address,
-            to_address,
-            amount,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+    return _transact(
+        qmatic_contract.transferFrom,
+        (from_address, to_address, amount),
+        caller,
+        preflight,
+    )
 
 
 def approve_to_spend_tokens_by_agent(
@@ -275,38 +448,18 @@ def approve_to_spend_tokens_by_agent(
     spender_address: str,
     amount_spend: int,
     caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-    try:
-        tx = qmatic_contract.approve(
-            spender_address,
-            amount_spend,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+    return _transact(
+        qmatic_contract.approve, (spender_address, amount_spend), caller, preflight
+    )
 
 
 def normal_transfer(
-    qmatic_contract: ProjectContract, to: str, amount: int, caller: Account
+    qmatic_contract: ProjectContract,
+    to: str,
+    amount: int,
+    caller: Account,
+    preflight: bool = False,
 ) -> tuple[Union[Events, None], Union[RevertedMessage, None]]:
-
-    try:
-        tx = qmatic_contract.transfer(
-            to,
-            amount,
-            {"from": caller},
-        )
-        return Events.from_tx(tx.events), None
-    except VirtualMachineError as error:
-        if error.revert_type != "revert":
-            raise
-        return (
-            None,
-            RevertedMessage(msg=error.revert_msg),
-        )
+    return _transact(qmatic_contract.transfer, (to, amount), caller, preflight)
@@ -0,0 +1,410 @@
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, TextIO, Union
+
+from brownie import history, web3
+
+from QMatic.schemas import RevertedMessage
+
+from . import contract_functions
+
+# upper bounds (in seconds) of the latency buckets, the last bucket is +Inf.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+RPC_COUNTER_MIDDLEWARE_NAME: str = "qmatic_rpc_counter"
+PROMETHEUS_METRICS_PREFIX: str = "qmatic_adapter"
+
+
+class AdapterCall(NamedTuple):
+    """
+    one instrumented adapter call. `gas_used` is None when the call did not send a transaction,
+    `error` is the exception type of a call that raised instead of returning.
+    the RPC requests and the transactions are counted process-wide, so the calls running in other threads are included.
+    """
+
+    adapter: str
+    started_at: float
+    seconds: float
+    rpc_count: int
+    gas_used: Union[int, None]
+    revert_message: Union[str, None]
+    error: Union[str, None]
+
+
+class InstrumentationSink(ABC):
+    """
+    receives every AdapterCall of an Instrumentation, `record` may be called from several threads.
+    """
+
+    @abstractmethod
+    def record(self, call: AdapterCall) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class AdapterHistogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # the last count is the +Inf bucket, the counts are not cumulative.
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.seconds_sum = 0.0
+        self.rpc_count = 0
+        self.transactions = 0
+        self.gas_used = 0
+        self.reverts: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+
+    def add(self, call: AdapterCall) -> None:
+        index = 0
+        while index < len(self.buckets) and call.seconds > self.buckets[index]:
+            index += 1
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.seconds_sum += call.seconds
+        self.rpc_count += call.rpc_count
+        if call.gas_used is not None:
+            self.transactions += 1
+            self.gas_used += call.gas_used
+        if call.revert_message is not None:
+            self.reverts[call.revert_message] += 1
+        if call.error is not None:
+            self.errors[call.error] += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        the upper bound of the bucket of the `q` quantile (inf for the +Inf bucket), nan without calls.
+        """
+        if self.count == 0:
+            return math.nan
+        rank = math.ceil(q * self.count)
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.buckets[index] if index < len(self.buckets) else math.inf
+        return math.inf
+
+
+class HistogramSink(InstrumentationSink):
+    """
+    in-memory latency histogram and counters (RPC requests, gas, reverts by message) per adapter.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.histograms: dict[str, AdapterHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, call: AdapterCall) -> None:
+        with self._lock:
+            histogram = self.histograms.get(call.adapter)
+            if histogram is None:
+                histogram = self.histograms[call.adapter] = AdapterHistogram(
+                    self.buckets
+                )
+            histogram.add(call)
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusTextSink(HistogramSink):
+    """
+    the histograms of HistogramSink in the Prometheus text exposition format,
+    `path` (e.g. a file of the node_exporter textfile collector) is rewritten by `write` and `close`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(buckets)
+        self.path = None if path is None else Path(path)
+
+    def render(self) -> str:
+        prefix = PROMETHEUS_METRICS_PREFIX
+        lines = [
+            f"# HELP {prefix}_duration_seconds wall time of the QMatic adapter calls.",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            for adapter, histogram in histograms:
+                cumulative = 0
+                for bound, bucket_count in zip(
+                    (*self.buckets, math.inf), histogram.bucket_counts
+                ):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(
+                        f'{prefix}_duration_seconds_bucket{{adapter="{adapter}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{prefix}_duration_seconds_sum{{adapter="{adapter}"}} {histogram.seconds_sum!r}'
+                )
+                lines.append(
+                    f'{prefix}_duration_seconds_count{{adapter="{adapter}"}} {histogram.count}'
+                )
+            for metric, help_text, attribute in (
+                ("rpc_requests", "JSON-RPC requests sent by", "rpc_count"),
+                ("transactions", "transactions sent by", "transactions"),
+                ("gas_used", "gas used by the transactions of", "gas_used"),
+            ):
+                lines.append(
+                    f"# HELP {prefix}_{metric}_total {help_text} the QMatic adapter calls."
+                )
+                lines.append(f"# TYPE {prefix}_{metric}_total counter")
+                for adapter, histogram in histograms:
+                    lines.append(
+                        f'{prefix}_{metric}_total{{adapter="{adapter}"}} {getattr(histogram, attribute)}'
+                    )
+            for metric, help_text, label, attribute in (
+                ("reverts", "reverted QMatic adapter calls.", "message", "reverts"),
+                ("errors", "QMatic adapter calls that raised.", "error", "errors"),
+            ):
+                lines.append(f"# HELP {prefix}_{metric}_total {help_text}")
+                lines.append(f"# TYPE {prefix}_{metric}_total counter")
+                for adapter, histogram in histograms:
+                    for value, count in sorted(getattr(histogram, attribute).items()):
+                        lines.append(
+                            f'{prefix}_{metric}_total{{adapter="{adapter}",{label}="{_label_value(value)}"}} {count}'
+                        )
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        if self.path is None:
+            raise ValueError("the PrometheusTextSink has no path")
+        # written next to the target and renamed, so a scraper never reads a partial file.
+        temporary_path = self.path.with_name(self.path.name + ".tmp")
+        temporary_path.write_text(self.render())
+        temporary_path.replace(self.path)
+
+    def close(self) -> None:
+        if self.path is not None:
+            self.write()
+
+
+class JsonlTraceSink(InstrumentationSink):
+    """
+    appends one JSON line per AdapterCall to `path`.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._file: TextIO = self.path.open("a")
+        self._lock = threading.Lock()
+
+    def record(self, call: AdapterCall) -> None:
+        line = json.dumps(call._asdict()) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _revert_message_of(result: Any) -> Union[str, None]:
+    # the write adapters return (events, revert) or the revert alone (e.g. development_push_date_of_contract).
+    if isinstance(result, tuple) and len(result) == 2:
+        result = result[1]
+    if isinstance(result, RevertedMessage):
+        # a revert without reason (e.g. an out of gas) is recorded with an empty message.
+        return result.msg or ""
+    return None
+
+
+class Instrumentation:
+    """
+    records an AdapterCall for every call of the wrapped adapters into `sinks`.
+    without sinks the wrapped adapters only check `sinks` and call the adapter, and the RPC counter is not installed.
+    """
+
+    def __init__(self) -> None:
+        self.sinks: list[InstrumentationSink] = []
+        self.rpc_count = 0
+        self._rpc_lock = threading.Lock()
+
+    def _rpc_counter_middleware(
+        self, make_request: Callable[..., Any], _: Any
+    ) -> Callable[..., Any]:
+        def middleware(method: str, params: Any) -> Any:
+            with self._rpc_lock:
+                self.rpc_count += 1
+            return make_request(method, params)
+
+        return middleware
+
+    def add_sink(self, sink: InstrumentationSink) -> None:
+        if not self.sinks:
+            # the innermost layer, the requests answered by the caching middlewares of brownie are not counted.
+            web3.middleware_onion.inject(
+                self._rpc_counter_middleware, name=RPC_COUNTER_MIDDLEWARE_NAME, layer=0
+            )
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: InstrumentationSink) -> None:
+        """
+        removes and closes `sink`.
+        """
+        self.sinks.remove(sink)
+        sink.close()
+        if not self.sinks:
+            web3.middleware_onion.remove(RPC_COUNTER_MIDDLEWARE_NAME)
+
+    def close(self) -> None:
+        for sink in list(self.sinks):
+            self.remove_sink(sink)
+
+    def _record(
+        self, adapter: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+    ) -> Any:
+        transactions_before = len(history)
+        rpc_count_before = self.rpc_count
+        started_at = time.time()
+        started = time.perf_counter()
+        result, error = None, None
+        try:
+            result = adapter(*args, **kwargs)
+        except Exception as exception:
+            error = exception
+        seconds = time.perf_counter() - started
+        transactions = history[transactions_before:]
+        call = AdapterCall(
+            adapter=adapter.__name__,
+            started_at=started_at,
+            seconds=seconds,
+            rpc_count=self.rpc_count - rpc_count_before,
+            gas_used=(
+                sum(tx.gas_used or 0 for tx in transactions) if transactions else None
+            ),
+            revert_message=_revert_message_of(result),
+            error=None if error is None else type(error).__name__,
+        )
+        for sink in self.sinks:
+            sink.record(call)
+        if error is not None:
+            raise error
+        return result
+
+    def wrap(self, adapter: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        the instrumented version of an adapter with the same signature.
+        """
+
+        @wraps(adapter)
+        def instrumented_adapter(*args: Any, **kwargs: Any) -> Any:
+            if not self.sinks:
+                return adapter(*args, **kwargs)
+            return self._record(adapter, args, kwargs)
+
+        return instrumented_adapter
+
+
+adapter_instrumentation = Instrumentation()
+
+name = adapter_instrumentation.wrap(contract_functions.name)
+balance_of = adapter_instrumentation.wrap(contract_functions.balance_of)
+development_status = adapter_instrumentation.wrap(contract_functions.development_status)
+max_supply = adapter_instrumentation.wrap(contract_functions.max_supply)
+total_supply = adapter_instrumentation.wrap(contract_functions.total_supply)
+migration_status = adapter_instrumentation.wrap(contract_functions.migration_status)
+allocations_merkle_root = adapter_instrumentation.wrap(
+    contract_functions.allocations_merkle_root
+)
+is_allocation_claimed = adapter_instrumentation.wrap(
+    contract_functions.is_allocation_claimed
+)
+mechanism_status = adapter_instrumentation.wrap(contract_functions.mechanism_status)
+wallet_affected_by_locking_mechanism_state = adapter_instrumentation.wrap(
+    contract_functions.wallet_affected_by_locking_mechanism_state
+)
+last_mechanism_id = adapter_instrumentation.wrap(contract_functions.last_mechanism_id)
+shifted_days = adapter_instrumentation.wrap(contract_functions.shifted_days)
+active_balance_locking_mechanism = adapter_instrumentation.wrap(
+    contract_functions.active_balance_locking_mechanism
+)
+balance_locking_mechanism_of_id = adapter_instrumentation.wrap(
+    contract_functions.balance_locking_mechanism_of_id
+)
+linear_release_dividend_and_divisor_of_address = adapter_instrumentation.wrap(
+    contract_functions.linear_release_dividend_and_divisor_of_address
+)
+linear_release_period_and_amount_of_address = adapter_instrumentation.wrap(
+    contract_functions.linear_release_period_and_amount_of_address
+)
+remaining_seconds_to_finishing_the_cliff_of_address = adapter_instrumentation.wrap(
+    contract_functions.remaining_seconds_to_finishing_the_cliff_of_address
+)
+remaining_blocked_tokens_at_now_of_address = adapter_instrumentation.wrap(
+    contract_functions.remaining_blocked_tokens_at_now_of_address
+)
+locking_statuses_of_addresses = adapter_instrumentation.wrap(
+    contract_functions.locking_statuses_of_addresses
+)
+initializing_active_balance_locking_mechanism = adapter_instrumentation.wrap(
+    contract_functions.initializing_active_balance_locking_mechanism
+)
+deactivate_balance_locking_mechanism = adapter_instrumentation.wrap(
+    contract_functions.deactivate_balance_locking_mechanism
+)
+contract_locking_for_upgrade = adapter_instrumentation.wrap(
+    contract_functions.contract_locking_for_upgrade
+)
+mint = adapter_instrumentation.wrap(contract_functions.mint)
+development_push_date_of_contract = adapter_instrumentation.wrap(
+    contract_functions.development_push_date_of_contract
+)
+turn_development_mode_off = adapter_instrumentation.wrap(
+    contract_functions.turn_development_mode_off
+)
+transfer_with_locking = adapter_instrumentation.wrap(
+    contract_functions.transfer_with_locking
+)
+batch_transfer_with_locking = adapter_instrumentation.wrap(
+    contract_functions.batch_transfer_with_locking
+)
+commit_allocations_merkle_root = adapter_instrumentation.wrap(
+    contract_functions.commit_allocations_merkle_root
+)
+claim_locked_allocation = adapter_instrumentation.wrap(
+    contract_functions.claim_locked_allocation
+)
+batch_mint_migrated_holders = adapter_instrumentation.wrap(
+    contract_functions.batch_mint_migrated_holders
+)
+finish_migration = adapter_instrumentation.wrap(contract_functions.finish_migration)
+clear_fully_vested_locking_mechanism_of = adapter_instrumentation.wrap(
+    contract_functions.clear_fully_vested_locking_mechanism_of
+)
+transfer_from_user_by_approved_agent = adapter_instrumentation.wrap(
+    contract_functions.transfer_from_user_by_approved_agent
+)
+approve_to_spend_tokens_by_agent = adapter_instrumentation.wrap(
+    contract_functions.approve_to_spend_tokens_by_agent
+)
+normal_transfer = adapter_instrumentation.wrap(contract_functions.normal_transfer)
@@ -0,0 +1,163 @@
+from typing import Any, Callable, Optional, Sequence, TypeAlias, Union
+
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.schemas import RevertedMessage
+
+from .contract_functions import (
+    _to_attached_locking_mechanism_releasing_period_structure,
+    _to_general_active_balance_locking_mechanism_structure,
+    _to_linear_release_share_structure,
+    _to_wallet_balance_locking_mechanism,
+    active_balance_locking_mechanism,
+    balance_locking_mechanism_of_id,
+    balance_of,
+    development_status,
+    last_mechanism_id,
+    linear_release_dividend_and_divisor_of_address,
+    linear_release_period_and_amount_of_address,
+    max_supply,
+    mechanism_status,
+    name,
+    remaining_blocked_tokens_at_now_of_address,
+    remaining_seconds_to_finishing_the_cliff_of_address,
+    shifted_days,
+    total_supply,
+    wallet_affected_by_locking_mechanism_state,
+)
+
+# a (read adapter, argument) pair, the argument is an address (or a mechanism id for balance_locking_mechanism_of_id),
+# None for the views without argument (e.g. max_supply).
+BatchReadRequest: TypeAlias = tuple[Callable[..., Any], Optional[Union[str, int]]]
+
+DEFAULT_MULTICALL_BATCH_SIZE: int = 500
+# bytes4(keccak256("Error(string)"))
+ERROR_STRING_SELECTOR: bytes = bytes.fromhex("08c379a0")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# maps every batchable read adapter to its contract method name and the decoder of its output.
+BATCHABLE_READ_ADAPTERS: dict[Callable[..., Any], tuple[str, Callable[[Any], Any]]] = {
+    name: ("name", _identity),
+    balance_of: ("balanceOf", _identity),
+    development_status: ("IS_DEVELOPMENT", _identity),
+    max_supply: ("MAX_SUPPLY", _identity),
+    total_supply: ("totalSupply", _identity),
+    mechanism_status: ("isMechanismActivated", _identity),
+    wallet_affected_by_locking_mechanism_state: (
+        "walletsAffectedByLockingMechanism",
+        _to_wallet_balance_locking_mechanism,
+    ),
+    last_mechanism_id: ("lastMechanismId", _identity),
+    shifted_days: ("CONTRACT_SHIFT_DAYS", _identity),
+    active_balance_locking_mechanism: (
+        "activeBalanceLockingMechanism",
+        _to_general_active_balance_locking_mechanism_structure,
+    ),
+    balance_locking_mechanism_of_id: (
+        "balanceLockingMechanisms",
+        _to_general_active_balance_locking_mechanism_structure,
+    ),
+    linear_release_dividend_and_divisor_of_address: (
+        "getLinearReleaseDividendAndDivisorOf",
+        _to_linear_release_share_structure,
+    ),
+    linear_release_period_and_amount_of_address: (
+        "getLinearReleasePeriodAndAmountOf",
+        _to_attached_locking_mechanism_releasing_period_structure,
+    ),
+    remaining_seconds_to_finishing_the_cliff_of_address: (
+        "getRemainingSecondsToFinishingTheCliffOf",
+        _identity,
+    ),
+    remaining_blocked_tokens_at_now_of_address: (
+        "getRemainingBlockedTokensAtNowOf",
+        _identity,
+    ),
+}
+
+
+def decode_revert_message(return_data: bytes) -> Union[str, None]:
+    """
+    decodes the `Error(string)` payload of a failed call, None will be returned for the other kinds of failure.
+    """
+    if not return_data.startswith(ERROR_STRING_SELECTOR):
+        return None
+    payload = return_data[len(ERROR_STRING_SELECTOR) :]
+    offset = int.from_bytes(payload[:32], "big")
+    length = int.from_bytes(payload[offset : offset + 32], "big")
+    return payload[offset + 32 : offset + 32 + length].decode("utf-8", "replace")
+
+
+def _encode_request(
+    qmatic_contract: ProjectContract, request: BatchReadRequest
+) -> tuple[str, str]:
+    adapter, address = request
+    if adapter not in BATCHABLE_READ_ADAPTERS:
+        raise ValueError(f"{adapter.__name__} is not a batchable read adapter")
+    method = getattr(qmatic_contract, BATCHABLE_READ_ADAPTERS[adapter][0])
+    call_data = (
+        method.encode_input() if address is None else method.encode_input(address)
+    )
+    return qmatic_contract.address, call_data
+
+
+def batch_read(
+    qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    requests: Sequence[BatchReadRequest],
+    caller: Account,
+    batch_size: int = DEFAULT_MULTICALL_BATCH_SIZE,
+    block_identifier: Union[int, str, None] = None,
+) -> list[Any]:
+    """
+    executes the read adapters of `requests` through `multicall_contract` with one 'eth_call' per `batch_size` requests.
+    results are in the same order of `requests` and have the same types of the read adapters,
+    the failed calls will be returned as RevertedMessage.
+    """
+    results: list[Any] = []
+    for start in range(0, len(requests), batch_size):
+        chunk = requests[start : start + batch_size]
+        calls = [_encode_request(qmatic_contract, request) for request in chunk]
+        responses = multicall_contract.tryAggregate.call(
+            False, calls, {"from": caller}, block_identifier=block_identifier
+        )
+        for (adapter, _), (success, return_data) in zip(chunk, responses):
+            return_data = bytes(return_data)
+            if not success:
+                results.append(RevertedMessage(msg=decode_revert_message(return_data)))
+                continue
+            method_name, decoder = BATCHABLE_READ_ADAPTERS[adapter]
+            results.append(
+                decoder(
+                    getattr(qmatic_contract, method_name).decode_output(return_data)
+                )
+            )
+    return results
+
+
+def batch_read_for_addresses(
+    qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    adapter: Callable[..., Any],
+    addresses: Sequence[str],
+    caller: Account,
+    batch_size: int = DEFAULT_MULTICALL_BATCH_SIZE,
+    block_identifier: Union[int, str, None] = None,
+) -> dict[str, Any]:
+    """
+    shortcut of `batch_read` for executing one read adapter over many addresses.
+    """
+    results = batch_read(
+        qmatic_contract=qmatic_contract,
+        multicall_contract=multicall_contract,
+        requests=[(adapter, address) for address in addresses],
+        caller=caller,
+        batch_size=batch_size,
+        block_identifier=block_identifier,
+    )
+    return dict(zip(addresses, results))
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence, TypeAlias, Union
+
+from brownie.exceptions import VirtualMachineError
+from brownie.network.account import Account
+from brownie.network.contract import ContractTx, ProjectContract
+
+from QMatic.schemas import RevertedMessage
+
+# a (contract method name, arguments) pair, e.g. ("transferWithLocking", (to, amount)).
+PreflightRequest: TypeAlias = tuple[str, Sequence[Any]]
+
+DEFAULT_PREFLIGHT_WORKERS: int = 16
+PREFLIGHT_BLOCK_IDENTIFIER: str = "pending"
+
+
+def preflight(
+    method: ContractTx, args: Sequence[Any], caller: Account
+) -> Union[RevertedMessage, None]:
+    """
+    runs the transaction as an 'eth_call' on the pending state without broadcasting it,
+    the revert will be returned as RevertedMessage (the same of the write adapters), None when it would succeed.
+    """
+    try:
+        method.call(
+            *args, {"from": caller}, block_identifier=PREFLIGHT_BLOCK_IDENTIFIER
+        )
+    except VirtualMachineError as error:
+        if error.revert_type != "revert":
+            raise
+        return RevertedMessage(msg=error.revert_msg)
+    return None
+
+
+def preflight_many(
+    qmatic_contract: ProjectContract,
+    requests: Sequence[PreflightRequest],
+    caller: Account,
+    max_workers: int = DEFAULT_PREFLIGHT_WORKERS,
+) -> list[Union[RevertedMessage, None]]:
+    """
+    preflights of `requests` with `max_workers` concurrent 'eth_call's, results are in the same order of `requests`.
+    every request is simulated on the same pending state, so the effects of the earlier requests are not visible to the later ones.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda request: preflight(
+                    getattr(qmatic_contract, request[0]), request[1], caller
+                ),
+                requests,
+            )
+        )
@@ -0,0 +1,136 @@
+import asyncio
+import itertools
+from typing import Any, Union
+
+import aiohttp
+
+from .multicall import decode_revert_message
+
+DEFAULT_CONNECTIONS: int = 32
+DEFAULT_TIMEOUT_IN_SECONDS: float = 30
+DEFAULT_RECEIPT_POLL_INTERVAL_IN_SECONDS: float = 0.1
+REVERT_MESSAGE_PREFIXES: tuple[str, ...] = (
+    "execution reverted: ",
+    "reverted with reason string '",
+    "revert ",
+)
+
+
+class RpcError(Exception):
+    """
+    the `error` object of a JSON-RPC response.
+    `is_revert` and `revert_msg` play the roles of `revert_type == "revert"` and `revert_msg` of brownie's VirtualMachineError.
+    """
+
+    def __init__(self, code: int, message: str, data: Any = None) -> None:
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+        self.data = data
+
+    @property
+    def is_revert(self) -> bool:
+        return "revert" in self.message.lower()
+
+    @property
+    def revert_msg(self) -> Union[str, None]:
+        # geth/anvil put the return data in `data`, ganache nests it with the decoded `reason`.
+        data = self.data
+        if isinstance(data, dict):
+            data = next(
+                (value for value in data.values() if isinstance(value, dict)), data
+            )
+            if isinstance(data.get("reason"), str):
+                return data["reason"]
+            data = data.get("result", data.get("data"))
+        if isinstance(data, str) and data.startswith("0x"):
+            message = decode_revert_message(bytes.fromhex(data[2:]))
+            if message is not None:
+                return message
+        for prefix in REVERT_MESSAGE_PREFIXES:
+            if prefix in self.message:
+                return self.message.split(prefix, 1)[1].rstrip("'")
+        return None
+
+
+class AsyncJsonRpcTransport:
+    """
+    JSON-RPC over HTTP for the async adapters, the requests share a pool of `connections` keep-alive connections.
+    the session is opened by the first request, so the transport can be created outside of the event loop.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        connections: int = DEFAULT_CONNECTIONS,
+        timeout_in_seconds: float = DEFAULT_TIMEOUT_IN_SECONDS,
+    ) -> None:
+        self.endpoint_uri = endpoint_uri
+        self.connections = connections
+        self.timeout_in_seconds = timeout_in_seconds
+        self._session: Union[aiohttp.ClientSession, None] = None
+        self._request_ids = itertools.count(1)
+        self._chain_id: Union[int, None] = None
+        # the nonce of a sender is read and used under its lock, so its concurrent transactions do not collide.
+        self.sender_locks: dict[str, asyncio.Lock] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_in_seconds),
+            )
+        return self._session
+
+    async def request(self, method: str, params: list[Any]) -> Any:
+        payload = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": method,
+            "params": params,
+        }
+        async with self._get_session().post(
+            self.endpoint_uri, json=payload
+        ) as response:
+            response.raise_for_status()
+            body = await response.json(content_type=None)
+        if "error" in body:
+            error = body["error"]
+            raise RpcError(
+                error.get("code", 0), error.get("message", ""), error.get("data")
+            )
+        return body["result"]
+
+    async def chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = int(await self.request("eth_chainId", []), 16)
+        return self._chain_id
+
+    def sender_lock(self, address: str) -> asyncio.Lock:
+        return self.sender_locks.setdefault(address.lower(), asyncio.Lock())
+
+    async def wait_for_receipt(
+        self,
+        tx_hash: str,
+        poll_interval_in_seconds: float = DEFAULT_RECEIPT_POLL_INTERVAL_IN_SECONDS,
+    ) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout_in_seconds
+        while True:
+            receipt = await self.request("eth_getTransactionReceipt", [tx_hash])
+            if receipt is not None:
+                return receipt
+            if loop.time() > deadline:
+                raise asyncio.TimeoutError(f"no receipt of {tx_hash}")
+            await asyncio.sleep(poll_interval_in_seconds)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncJsonRpcTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
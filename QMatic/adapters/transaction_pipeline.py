@@ -0,0 +1,247 @@
+import asyncio
+import heapq
+import math
+from typing import Any, Sequence, TypeAlias, Union
+
+from brownie.network.account import Account, LocalAccount
+from brownie.network.contract import ProjectContract
+
+from QMatic.schemas import Events, RevertedMessage
+
+from .async_contract_functions import broadcast, outcome_of_receipt
+from .rpc import AsyncJsonRpcTransport, RpcError
+
+# a (contract method name, arguments) pair, e.g. ("transferWithLocking", (to, amount)).
+TransactionRequest: TypeAlias = tuple[str, Sequence[Any]]
+TransactionOutcome: TypeAlias = tuple[Union[Events, None], Union[RevertedMessage, None]]
+
+DEFAULT_MAX_IN_FLIGHT: int = 64
+DEFAULT_STUCK_TIMEOUT_IN_SECONDS: float = 60
+# nodes accept a replacement with at least 10% higher gas price.
+DEFAULT_GAS_PRICE_INCREMENT: float = 1.125
+DEFAULT_MAX_REPLACEMENTS: int = 3
+DEFAULT_POLL_INTERVAL_IN_SECONDS: float = 0.5
+GAP_FILLING_GAS: int = 21_000
+REPLACED_TRANSACTION_MESSAGE: str = "nonce consumed by another transaction"
+
+
+class TransactionPipeline:
+    """
+    sends the transactions of `caller` with locally allocated nonces and keeps up to `max_in_flight` of them in flight,
+    so the throughput is bounded by the block inclusion instead of one round trip per transaction.
+    a transaction that is not included after `stuck_timeout_in_seconds` is rebroadcast with the same nonce
+    and a gas price bumped by `gas_price_increment`, whichever of them is included decides the outcome.
+    the outcomes have the result type of the write adapters.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncJsonRpcTransport,
+        qmatic_contract: ProjectContract,
+        caller: Union[Account, LocalAccount],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        stuck_timeout_in_seconds: float = DEFAULT_STUCK_TIMEOUT_IN_SECONDS,
+        gas_price_increment: float = DEFAULT_GAS_PRICE_INCREMENT,
+        max_replacements: int = DEFAULT_MAX_REPLACEMENTS,
+        poll_interval_in_seconds: float = DEFAULT_POLL_INTERVAL_IN_SECONDS,
+    ) -> None:
+        self.transport = transport
+        self.qmatic_contract = qmatic_contract
+        self.caller = caller
+        self.stuck_timeout_in_seconds = stuck_timeout_in_seconds
+        self.gas_price_increment = gas_price_increment
+        self.max_replacements = max_replacements
+        self.poll_interval_in_seconds = poll_interval_in_seconds
+        self.next_nonce: Union[int, None] = None
+        # nonces whose broadcast failed, they are never given to a later `submit` (that would break the submit order),
+        # `drain` consumes them by empty self-transfers in ascending order.
+        self.free_nonces: list[int] = []
+        self.in_flight: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._nonce_lock = asyncio.Lock()
+        self._confirmed_nonce: tuple[float, int] = (-math.inf, 0)
+
+    async def _allocate_nonce(self) -> int:
+        async with self._nonce_lock:
+            if self.next_nonce is None:
+                self.next_nonce = int(
+                    await self.transport.request(
+                        "eth_getTransactionCount", [self.caller.address, "pending"]
+                    ),
+                    16,
+                )
+            nonce = self.next_nonce
+            self.next_nonce += 1
+            return nonce
+
+    async def _get_confirmed_nonce(self) -> int:
+        """
+        the nonce count of the latest block, shared by all the tracked transactions of one poll interval.
+        """
+        loop = asyncio.get_running_loop()
+        read_at, confirmed_nonce = self._confirmed_nonce
+        if loop.time() - read_at >= self.poll_interval_in_seconds:
+            confirmed_nonce = int(
+                await self.transport.request(
+                    "eth_getTransactionCount", [self.caller.address, "latest"]
+                ),
+                16,
+            )
+            self._confirmed_nonce = (loop.time(), confirmed_nonce)
+        return confirmed_nonce
+
+    def _resolved(self, outcome: TransactionOutcome) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(outcome)
+        return future
+
+    async def submit(self, method_name: str, args: Sequence[Any]) -> asyncio.Future:
+        """
+        returns as soon as the transaction is broadcast, the returned future resolves to its outcome.
+        the nonce is allocated before the gas estimation, so the nonces follow the order of the `submit` calls.
+        a revert of the gas estimation is resolved right away and its nonce is consumed by an empty self-transfer,
+        which costs GAP_FILLING_GAS at the current gas price, requests that may revert are cheaper to check with 'preflight_many' first.
+        a failed broadcast leaves a nonce gap that blocks the later nonces until `drain` fills it.
+        """
+        await self._slots.acquire()
+        try:
+            nonce = await self._allocate_nonce()
+        except BaseException:
+            self._slots.release()
+            raise
+        tx = {
+            "from": self.caller.address,
+            "to": self.qmatic_contract.address,
+            "data": getattr(self.qmatic_contract, method_name).encode_input(*args),
+        }
+        try:
+            tx["gas"], tx["gasPrice"] = await asyncio.gather(
+                self.transport.request("eth_estimateGas", [tx]),
+                self.transport.request("eth_gasPrice", []),
+            )
+        except RpcError as error:
+            if not error.is_revert:
+                heapq.heappush(self.free_nonces, nonce)
+                self._slots.release()
+                raise
+            try:
+                await self._consume_nonce(nonce)
+            except BaseException:
+                heapq.heappush(self.free_nonces, nonce)
+                raise
+            finally:
+                self._slots.release()
+            return self._resolved((None, RevertedMessage(msg=error.revert_msg)))
+        except BaseException:
+            heapq.heappush(self.free_nonces, nonce)
+            self._slots.release()
+            raise
+        tx["nonce"] = hex(nonce)
+        try:
+            tx_hash = await broadcast(self.transport, tx, self.caller)
+        except BaseException:
+            heapq.heappush(self.free_nonces, nonce)
+            self._slots.release()
+            raise
+        task = asyncio.create_task(self._track(tx, nonce, [tx_hash]))
+        self.in_flight.add(task)
+        task.add_done_callback(self._settled)
+        return task
+
+    def _settled(self, task: asyncio.Task) -> None:
+        self.in_flight.discard(task)
+        self._slots.release()
+
+    async def _track(
+        self, tx: dict[str, Any], nonce: int, tx_hashes: list[str]
+    ) -> TransactionOutcome:
+        loop = asyncio.get_running_loop()
+        broadcast_at = loop.time()
+        replacements = 0
+        while True:
+            # the nonce count is read before the receipts, so an included transaction of ours is never missed.
+            is_nonce_consumed = await self._get_confirmed_nonce() > nonce
+            for tx_hash in reversed(tx_hashes):
+                receipt = await self.transport.request(
+                    "eth_getTransactionReceipt", [tx_hash]
+                )
+                if receipt is not None:
+                    return await outcome_of_receipt(
+                        self.transport, self.qmatic_contract, tx, receipt
+                    )
+            if is_nonce_consumed:
+                return None, RevertedMessage(msg=REPLACED_TRANSACTION_MESSAGE)
+            if (
+                loop.time() - broadcast_at > self.stuck_timeout_in_seconds
+                and replacements < self.max_replacements
+            ):
+                tx["gasPrice"] = hex(
+                    math.ceil(int(tx["gasPrice"], 16) * self.gas_price_increment)
+                )
+                try:
+                    tx_hashes.append(await broadcast(self.transport, tx, self.caller))
+                except RpcError:
+                    # e.g. 'nonce too low' when the previous broadcast is just included, the next poll finds it.
+                    pass
+                replacements += 1
+                broadcast_at = loop.time()
+            await asyncio.sleep(self.poll_interval_in_seconds)
+
+    async def _consume_nonce(
+        self, nonce: int, gas_price: Union[str, None] = None
+    ) -> str:
+        """
+        broadcasts an empty self-transfer with `nonce`, so no gap blocks the later nonces.
+        it is a paid transaction (GAP_FILLING_GAS at `gas_price`), the later nonces are already signed and broadcast,
+        so they cannot be re-sequenced into the gap.
+        """
+        tx = {
+            "from": self.caller.address,
+            "to": self.caller.address,
+            "value": "0x0",
+            "gas": hex(GAP_FILLING_GAS),
+            "gasPrice": gas_price or await self.transport.request("eth_gasPrice", []),
+            "nonce": hex(nonce),
+        }
+        return await broadcast(self.transport, tx, self.caller)
+
+    async def _fill_free_nonces(self) -> None:
+        """
+        the nonces that were never broadcast are consumed by empty self-transfers, otherwise the later nonces would be stuck.
+        """
+        gas_price = await self.transport.request("eth_gasPrice", [])
+        while self.free_nonces:
+            await self.transport.wait_for_receipt(
+                await self._consume_nonce(heapq.heappop(self.free_nonces), gas_price)
+            )
+
+    async def drain(self) -> None:
+        """
+        waits for every transaction in flight and fills the nonce gaps.
+        """
+        if self.free_nonces:
+            await self._fill_free_nonces()
+        if self.in_flight:
+            await asyncio.gather(*self.in_flight, return_exceptions=True)
+
+    async def send_many(
+        self, requests: Sequence[TransactionRequest]
+    ) -> list[TransactionOutcome]:
+        """
+        submits `requests` concurrently and returns their outcomes in the same order, their nonces follow that order too.
+        the gas of every request is estimated concurrently against the pending state, so the requests must be independent:
+        a request that only succeeds after an earlier one (e.g. 'transferWithLocking' after 'initActiveBalanceLockingMechanism')
+        has to be sent in a later call, once the earlier one is included.
+        """
+        submitted = await asyncio.gather(
+            *(self.submit(method_name, args) for method_name, args in requests),
+            return_exceptions=True,
+        )
+        # a failed broadcast leaves a nonce gap that would block the later transactions, `drain` fills it first.
+        await self.drain()
+        futures: list[asyncio.Future] = []
+        for result in submitted:
+            if isinstance(result, BaseException):
+                raise result
+            futures.append(result)
+        return [future.result() for future in futures]
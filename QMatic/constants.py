@@ -0,0 +1,9 @@
+# the accounts and amounts of the deploy script, the load test and the benchmarks, kept free of brownie and of the tests.
+DEPLOYER_ACCOUNT_INDEX: int = 0
+INVESTOR_ACCOUNT_INDEX: int = 1
+# 1 ether in wei.
+ONE_WEI: int = 10**18
+MINIMUM_AMOUNT_TO_SELL: int = 100_000 * ONE_WEI
+DEFAULT_MINT_AMOUNT: int = 4_000_000_000 * ONE_WEI
+MONTH_IN_DAYS: int = 30
+YEAR_IN_DAYS: int = 12 * MONTH_IN_DAYS
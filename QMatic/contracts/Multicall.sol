@@ -0,0 +1,42 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.8.17;
+
+/// @title Multicall
+/// @notice aggregates many read calls into a single 'eth_call'.
+/// @dev 'tryAggregate' is ABI compatible with Multicall3 (0xcA11bde05977b3631167028862bE2a173976CA11),
+/// so the QMatic adapters can use either this contract on the local chain or the canonical deployment on polygon.
+/// @custom:contract-official-git-repository https://github.com/QPoker/QMatic
+contract Multicall {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /**
+     * @notice executes every call of 'calls' and returns their raw results in the same order.
+     * @param requireSuccess if it was true, the whole aggregation will be reverted by the first failed call.
+     */
+    function tryAggregate(
+        bool requireSuccess,
+        Call[] calldata calls
+    ) public returns (Result[] memory returnData) {
+        uint256 length = calls.length;
+        returnData = new Result[](length);
+        for (uint256 i = 0; i < length; ) {
+            // slither-disable-next-line low-level-calls
+            (bool success, bytes memory result) = calls[i].target.call(calls[i].callData);
+            if (requireSuccess) {
+                require(success, "Multicall: call failed");
+            }
+            returnData[i] = Result(success, result);
+            unchecked {
+                ++i;
+            }
+        }
+    }
+}
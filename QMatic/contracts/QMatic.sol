@@ -792,14 +792,38 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
         uint256 totalAffectedTokens
     );
 
+    ///@dev will be emitted when the lock record of a fully vested wallet is deleted.
+    event LockingMechanismCleared(uint256 indexed mechanismId, address indexed account);
+
+    ///@dev will be emitted by 'commitAllocationsMerkleRoot', the allocations of the root can be claimed by 'claimLockedAllocation'.
+    event AllocationsMerkleRootCommitted(bytes32 indexed merkleRoot);
+
     /**
-     * @dev the main struct to store balance locking mechanism states of the wallet addresses
+     * @dev the main struct to store balance locking mechanism states of the wallet addresses, packed into one storage slot.
+     * the mechanism itself is stored once in 'balanceLockingMechanisms' and referenced by 'mechanismId'.
+     * the token amounts never exceed MAX_SUPPLY (< 2^96) and the timestamps fit into 40 bits.
      */
     struct WalletBalanceLockingMechanism {
-        uint256 startedDate;
-        uint256 totalAffectedTokens;
+        uint40 startedDate;
+        uint96 totalAffectedTokens;
+        uint96 linearReleaseTokensPerPeriod;
+        uint24 mechanismId;
+    }
+    ///@dev one holder of the previous QMatic contract for 'batchMintMigratedHolders', 'lock' keeps the mechanism id of the previous registry.
+    struct MigratedHolder {
+        address account;
+        uint256 balance;
+        uint256 amountOfInvestInQMatic;
+        WalletBalanceLockingMechanism lock;
+    }
+    ///@dev the values of the single-account lock getters for one account, returned by 'getLockingStatusesOf'.
+    struct WalletLockingStatus {
+        uint256 remainingBlockedTokens;
+        uint256 remainingSecondsToFinishingTheCliff;
+        uint256 linearReleasePeriodInDays;
         uint256 linearReleaseTokensPerPeriod;
-        GeneralActiveBalanceLockingMechanismStructure mechanism;
+        uint256 linearReleaseDividend;
+        uint256 linearReleaseDivisor;
     }
     struct GeneralActiveBalanceLockingMechanismStructure {
         uint256 cliffDurationInDays;
@@ -814,9 +838,16 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
     bool public isMechanismActivated;
     bool public  IS_DEVELOPMENT = false;
     bool public is_migrated = false;
+    ///@notice 'batchMintMigratedHolders' is closed forever once it is true, see 'finishMigration'.
+    bool public isMigrationFinished = false;
     uint256 public CONTRACT_SHIFT_DAYS;
-    mapping(address => WalletBalanceLockingMechanism) public walletsAffectedByLockingMechanism;
-    GeneralActiveBalanceLockingMechanismStructure public activeBalanceLockingMechanism;
+    mapping(address => WalletBalanceLockingMechanism) private _walletsAffectedByLockingMechanism;
+    ///@notice registry of every initialized Locking Mechanism by its id, entries are never changed after initializing.
+    mapping(uint256 => GeneralActiveBalanceLockingMechanismStructure) public balanceLockingMechanisms;
+    ///@notice Merkle root of the (account, amount, mechanismId) allocations that the investors claim by 'claimLockedAllocation'.
+    bytes32 public allocationsMerkleRoot;
+    ///@dev the leaves of the claimed allocations.
+    mapping(bytes32 => bool) private _claimedAllocations;
     constructor(bool is_development) ERC20("QMatic", "QMATIC") {
         // for deployment this line will be commented.
         IS_DEVELOPMENT = is_development;
@@ -824,6 +855,55 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
 
 
 
+    /**
+     * @notice the Locking Mechanism that 'transferWithLocking' assigns, all of the values are zero when it is deactivated.
+     */
+    function activeBalanceLockingMechanism()
+        public
+        view
+        returns (
+            uint256 cliffDurationInDays,
+            uint256 linearReleasePeriodInDays,
+            uint256 linearReleaseDividend,
+            uint256 linearReleaseDivisor,
+            uint256 releasingTGEDividendOn100
+        )
+    {
+        if (isMechanismActivated) {
+            GeneralActiveBalanceLockingMechanismStructure
+                memory _mechanism = balanceLockingMechanisms[lastMechanismId];
+            cliffDurationInDays = _mechanism.cliffDurationInDays;
+            linearReleasePeriodInDays = _mechanism.linearReleasePeriodInDays;
+            linearReleaseDividend = _mechanism.linearReleaseDividend;
+            linearReleaseDivisor = _mechanism.linearReleaseDivisor;
+            releasingTGEDividendOn100 = _mechanism.releasingTGEDividendOn100;
+        }
+    }
+
+    /**
+     * @notice the Locking Mechanism state of the wallet address, the mechanism is resolved from the registry.
+     */
+    function walletsAffectedByLockingMechanism(
+        address account
+    )
+        public
+        view
+        returns (
+            uint256 startedDate,
+            uint256 totalAffectedTokens,
+            uint256 linearReleaseTokensPerPeriod,
+            GeneralActiveBalanceLockingMechanismStructure memory mechanism
+        )
+    {
+        WalletBalanceLockingMechanism memory walletLocking = _walletsAffectedByLockingMechanism[
+            account
+        ];
+        startedDate = walletLocking.startedDate;
+        totalAffectedTokens = walletLocking.totalAffectedTokens;
+        linearReleaseTokensPerPeriod = walletLocking.linearReleaseTokensPerPeriod;
+        mechanism = balanceLockingMechanisms[walletLocking.mechanismId];
+    }
+
     /**
      * @dev after merging, name will be changed to 'Deprecated $QMATIC'.
      */
@@ -864,8 +944,10 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
             linearReleasePeriodInDays = 0;
         }
 
+        // the wallets keep the mechanism id in 24 bits.
+        require(lastMechanismId < type(uint24).max, "TF 12");
         lastMechanismId = lastMechanismId + 1;
-        activeBalanceLockingMechanism = GeneralActiveBalanceLockingMechanismStructure({
+        balanceLockingMechanisms[lastMechanismId] = GeneralActiveBalanceLockingMechanismStructure({
             cliffDurationInDays: cliffDurationInDays,
             linearReleasePeriodInDays: linearReleasePeriodInDays,
             linearReleaseDividend: linearReleaseDividend,
@@ -886,23 +968,22 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
 
     ///@notice removes the active Locking Mechanism.
     function deactivateBalanceLockingMechanism() public onlyOwner {
-        GeneralActiveBalanceLockingMechanismStructure
-            memory _mechanism = activeBalanceLockingMechanism;
-        activeBalanceLockingMechanism = GeneralActiveBalanceLockingMechanismStructure({
-            cliffDurationInDays: 0,
-            linearReleasePeriodInDays: 0,
-            linearReleaseDividend: 0,
-            linearReleaseDivisor: 0,
-            releasingTGEDividendOn100: 0
-        });
+        (
+            uint256 cliffDurationInDays,
+            uint256 linearReleasePeriodInDays,
+            uint256 linearReleaseDividend,
+            uint256 linearReleaseDivisor,
+            uint256 releasingTGEDividendOn100
+        ) = activeBalanceLockingMechanism();
+        // the registry keeps the mechanism for the wallets that are locked by it.
         isMechanismActivated = false;
         emit BalanceLockingMechanismUpdateLog(
             lastMechanismId,
-            _mechanism.cliffDurationInDays,
-            _mechanism.linearReleasePeriodInDays,
-            _mechanism.linearReleaseDividend,
-            _mechanism.linearReleaseDivisor,
-            _mechanism.releasingTGEDividendOn100,
+            cliffDurationInDays,
+            linearReleasePeriodInDays,
+            linearReleaseDividend,
+            linearReleaseDivisor,
+            releasingTGEDividendOn100,
             isMechanismActivated
         );
     }
@@ -944,8 +1025,11 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
     function getLinearReleaseDividendAndDivisorOf(
         address account
     ) public view returns (uint256 dividend, uint256 divisor) {
-        dividend = walletsAffectedByLockingMechanism[account].mechanism.linearReleaseDividend;
-        divisor = walletsAffectedByLockingMechanism[account].mechanism.linearReleaseDivisor;
+        GeneralActiveBalanceLockingMechanismStructure storage _mechanism = balanceLockingMechanisms[
+            _walletsAffectedByLockingMechanism[account].mechanismId
+        ];
+        dividend = _mechanism.linearReleaseDividend;
+        divisor = _mechanism.linearReleaseDivisor;
     }
 
     /**
@@ -956,12 +1040,13 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
     function getLinearReleasePeriodAndAmountOf(
         address account
     ) public view returns (uint256 periodInDays, uint256 releaseAmountPerPeriod) {
-        periodInDays = walletsAffectedByLockingMechanism[account]
-            .mechanism
+        WalletBalanceLockingMechanism memory walletLocking = _walletsAffectedByLockingMechanism[
+            account
+        ];
+        periodInDays = balanceLockingMechanisms[walletLocking.mechanismId]
             .linearReleasePeriodInDays;
 
-        releaseAmountPerPeriod = walletsAffectedByLockingMechanism[account]
-            .linearReleaseTokensPerPeriod;
+        releaseAmountPerPeriod = walletLocking.linearReleaseTokensPerPeriod;
     }
 
     /**
@@ -971,22 +1056,14 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
     function getRemainingSecondsToFinishingTheCliffOf(
         address account
     ) public view returns (uint256) {
-        uint256 startDate = walletsAffectedByLockingMechanism[account].startedDate;
-        uint256 cliffDays = walletsAffectedByLockingMechanism[account]
-            .mechanism
+        WalletBalanceLockingMechanism memory walletLocking = _walletsAffectedByLockingMechanism[
+            account
+        ];
+        uint256 startDate = walletLocking.startedDate;
+        uint256 cliffDays = balanceLockingMechanisms[walletLocking.mechanismId]
             .cliffDurationInDays;
         uint256 cliffEndDate = startDate + (cliffDays * 1 days);
-
-        /*
-        ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
-        */
-        /* solhint-disable not-rely-on-time */
-        uint256 timeNow = block.timestamp;
-        if (IS_DEVELOPMENT) {
-            // for development testing purpose
-            timeNow = timeNow + (CONTRACT_SHIFT_DAYS * 1 days);
-        }
-        /* solhint-enable not-rely-on-time */
+        uint256 timeNow = _timeNow();
         // if timeNow were grater or equals to cliffEndDate it means that the cliff is finished.
         if (timeNow >= cliffEndDate) {
             return 0;
@@ -997,34 +1074,35 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
 
 
     /**
-     * @notice this function calculates the remaining locked tokens by Locking Mechanism for the address at the moment..
-     * @dev for testing purposes, when 'IS DEVELOPMENT' was true, the function will be shifted to the present time by a value equal to CONTRACT_SHIFT_DAYS.
-     * @return uint256 return the current number of locked tokens.
+     * @dev the present time of the contract, shifted by CONTRACT_SHIFT_DAYS when 'IS DEVELOPMENT' is true.
      */
-    function getRemainingBlockedTokensAtNowOf(address account) public view returns (uint256) {
-        WalletBalanceLockingMechanism memory affected_mechanism = walletsAffectedByLockingMechanism[account];
-        uint256 startedDate = affected_mechanism.startedDate;
-        // startedDate will be calculated by the Owner at the moment of executing 'transferWithLocking' method.
-        //slither-disable-next-line incorrect-equality
-        if (startedDate == 0) {
-            //it means that account does not have any active locking mechanism.
-            return 0;
-        }
-
+    function _timeNow() internal view returns (uint256 timeNow) {
         /*
         ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
         */
         /* solhint-disable not-rely-on-time */
-        uint256 timeNow = block.timestamp;
+        timeNow = block.timestamp;
         /* solhint-enable not-rely-on-time */
 
         if (IS_DEVELOPMENT) {
             // for development testing purpose
             timeNow = timeNow + (CONTRACT_SHIFT_DAYS * 1 days);
         }
+    }
 
-        uint256 cliffEndDate = startedDate +
-            (affected_mechanism.mechanism.cliffDurationInDays * 1 days);
+    /**
+     * @dev the remaining locked tokens of an already loaded lock record at 'timeNow', the record must have a non-zero 'startedDate'.
+     */
+    function _remainingBlockedTokensOf(
+        WalletBalanceLockingMechanism memory affected_mechanism,
+        uint256 timeNow
+    ) internal view returns (uint256) {
+        // only the two fields of the mechanism that the calculation needs are read from the registry.
+        GeneralActiveBalanceLockingMechanismStructure storage _mechanism = balanceLockingMechanisms[
+            affected_mechanism.mechanismId
+        ];
+        uint256 cliffEndDate = affected_mechanism.startedDate +
+            (_mechanism.cliffDurationInDays * 1 days);
 
 
         if (timeNow < cliffEndDate) {
@@ -1032,14 +1110,15 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
             return affected_mechanism.totalAffectedTokens;
         }
 
-        if(affected_mechanism.mechanism.linearReleasePeriodInDays == 0){
+        uint256 linearReleasePeriodInDays = _mechanism.linearReleasePeriodInDays;
+        if(linearReleasePeriodInDays == 0){
             return 0;
         }
 
 
         // one part 'releasingTokenPerPeriodTick' will release when cliff ends.
         uint256 totalPastPeriodsCount = ((timeNow - cliffEndDate) /
-            (affected_mechanism.mechanism.linearReleasePeriodInDays *
+            (linearReleasePeriodInDays *
                 1 days)) + 1;
         uint256 totalReleasedTokens = totalPastPeriodsCount * affected_mechanism.linearReleaseTokensPerPeriod;
         if (totalReleasedTokens >= affected_mechanism.totalAffectedTokens) {
@@ -1049,9 +1128,86 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
         return (affected_mechanism.totalAffectedTokens - totalReleasedTokens);
     }
 
+    /**
+     * @notice this function calculates the remaining locked tokens by Locking Mechanism for the address at the moment..
+     * @dev for testing purposes, when 'IS DEVELOPMENT' was true, the function will be shifted to the present time by a value equal to CONTRACT_SHIFT_DAYS.
+     * @return uint256 return the current number of locked tokens.
+     */
+    function getRemainingBlockedTokensAtNowOf(address account) public view returns (uint256) {
+        // one storage slot, the wallets without locking stop here.
+        WalletBalanceLockingMechanism memory affected_mechanism = _walletsAffectedByLockingMechanism[account];
+        // startedDate will be calculated by the Owner at the moment of executing 'transferWithLocking' method.
+        //slither-disable-next-line incorrect-equality
+        if (affected_mechanism.startedDate == 0) {
+            //it means that account does not have any active locking mechanism.
+            return 0;
+        }
+        return _remainingBlockedTokensOf(affected_mechanism, _timeNow());
+    }
+
+    /**
+     * @dev deletes the lock record of the wallet (the storage refund goes to the caller), afterwards the wallet can be locked again by 'transferWithLocking'.
+     */
+    function _clearLockingMechanismOf(
+        address account,
+        WalletBalanceLockingMechanism memory affected_mechanism
+    ) internal {
+        delete _walletsAffectedByLockingMechanism[account];
+        emit LockingMechanismCleared(affected_mechanism.mechanismId, account);
+    }
+
+    /**
+     * @notice the results of 'getRemainingBlockedTokensAtNowOf', 'getRemainingSecondsToFinishingTheCliffOf', 'getLinearReleasePeriodAndAmountOf'
+     * and 'getLinearReleaseDividendAndDivisorOf' for every account of 'accounts' in one call, everyone can call this function.
+     * @dev the present time (and its CONTRACT_SHIFT_DAYS shift) is computed once for all of the accounts.
+     */
+    function getLockingStatusesOf(
+        address[] calldata accounts
+    ) public view returns (WalletLockingStatus[] memory statuses) {
+        uint256 timeNow = _timeNow();
+        statuses = new WalletLockingStatus[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; ) {
+            WalletBalanceLockingMechanism memory walletLocking = _walletsAffectedByLockingMechanism[
+                accounts[i]
+            ];
+            GeneralActiveBalanceLockingMechanismStructure storage _mechanism = balanceLockingMechanisms[
+                walletLocking.mechanismId
+            ];
+            WalletLockingStatus memory status = statuses[i];
+            uint256 cliffEndDate = walletLocking.startedDate + (_mechanism.cliffDurationInDays * 1 days);
+            if (timeNow < cliffEndDate) {
+                status.remainingSecondsToFinishingTheCliff = cliffEndDate - timeNow;
+            }
+            if (walletLocking.startedDate != 0) {
+                status.remainingBlockedTokens = _remainingBlockedTokensOf(walletLocking, timeNow);
+            }
+            status.linearReleasePeriodInDays = _mechanism.linearReleasePeriodInDays;
+            status.linearReleaseTokensPerPeriod = walletLocking.linearReleaseTokensPerPeriod;
+            status.linearReleaseDividend = _mechanism.linearReleaseDividend;
+            status.linearReleaseDivisor = _mechanism.linearReleaseDivisor;
+            unchecked {
+                ++i;
+            }
+        }
+    }
+
+    /**
+     * @notice deletes the lock record of a fully vested wallet, everyone can call this function.
+     */
+    function clearFullyVestedLockingMechanismOf(address account) public returns (bool) {
+        WalletBalanceLockingMechanism memory affected_mechanism = _walletsAffectedByLockingMechanism[account];
+        require(
+            affected_mechanism.startedDate != 0 && _remainingBlockedTokensOf(affected_mechanism, _timeNow()) == 0,
+            "TF 5"
+        );
+        _clearLockingMechanismOf(account, affected_mechanism);
+        return true;
+    }
+
     /**
      * @notice When 'lockingForUpgrade' is called at the beginning of the'_transfer,_mint and _burn' function, all of the transactions will be blocked.
      * @dev (balance of the sender - the amount of sending) must be Less than or equal to the returned value of the getRemainingBlockedTokensAtNowOf(from) function.
+     * the wallets without a lock record cost one storage read, the record of a fully vested wallet is deleted by its first transfer.
      */
     function _beforeTokenTransfer(
         address from,
@@ -1063,11 +1219,18 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
         if (from != address(0)) {
             uint256 balanceBeforeTransaction = super.balanceOf(from);
             require(balanceBeforeTransaction >= amount, "ERC20: transfer amount exceeds balance");
-            uint256 balanceAfterTransfer = balanceBeforeTransaction - amount;
-            require(
-                balanceAfterTransfer >= getRemainingBlockedTokensAtNowOf(from),
-                "you can not transfer more than available tokens"
-            );
+            WalletBalanceLockingMechanism memory affected_mechanism = _walletsAffectedByLockingMechanism[from];
+            if (affected_mechanism.startedDate != 0) {
+                uint256 remainingBlockedTokens = _remainingBlockedTokensOf(affected_mechanism, _timeNow());
+                if (remainingBlockedTokens == 0) {
+                    _clearLockingMechanismOf(from, affected_mechanism);
+                } else {
+                    require(
+                        balanceBeforeTransaction - amount >= remainingBlockedTokens,
+                        "you can not transfer more than available tokens"
+                    );
+                }
+            }
         }
         super._beforeTokenTransfer(from, to, amount);
     }
@@ -1090,13 +1253,15 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
 
     /**
      * @notice this function, actives the Locking Mechanism over user's wallet address.
+     * @dev '_mechanism' and 'mechanismId' are the in-memory copies of the active mechanism and 'lastMechanismId', so batches read the storage once.
+     * the amounts are bounded by the balance of the owner (<= MAX_SUPPLY < 2^96), a larger amount reverts the '_transfer' anyway.
      */
     function _initWalletBalanceLockingMechanismFor(
         address receiverAddress,
-        uint256 amount
+        uint256 amount,
+        GeneralActiveBalanceLockingMechanismStructure memory _mechanism,
+        uint256 mechanismId
     ) internal returns (WalletBalanceLockingMechanism memory) {
-        GeneralActiveBalanceLockingMechanismStructure
-            memory _mechanism = activeBalanceLockingMechanism;
         uint256 _linearReleaseTokensPerPeriod = 0;
         uint256 investAmount = amount;
 
@@ -1114,15 +1279,19 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
         ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
         */
         /* solhint-disable not-rely-on-time */
+        // the narrowing casts can not truncate:
+        // 'amount' is transferred from the balance of the owner in the same call, so it is at most MAX_SUPPLY (< 2^96) or the call reverts,
+        // the tokens per period are at most 'amount' (the dividend never exceeds the divisor),
+        // the timestamp fits into 40 bits until the year 36812 and 'initActiveBalanceLockingMechanism' keeps the mechanism ids below 2^24.
         WalletBalanceLockingMechanism memory balanceLocking = WalletBalanceLockingMechanism({
-            startedDate: block.timestamp,
-            totalAffectedTokens: amount,
-            linearReleaseTokensPerPeriod: _linearReleaseTokensPerPeriod,
-            mechanism: _mechanism
+            startedDate: uint40(block.timestamp),
+            totalAffectedTokens: uint96(amount),
+            linearReleaseTokensPerPeriod: uint96(_linearReleaseTokensPerPeriod),
+            mechanismId: uint24(mechanismId)
         });
         /* solhint-enable not-rely-on-time */
         emit InvestmentWithLockingMechanismScenario(
-            lastMechanismId,
+            mechanismId,
             receiverAddress,
             balanceLocking.startedDate,
             balanceLocking.linearReleaseTokensPerPeriod,
@@ -1134,16 +1303,171 @@ contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
 
     /**
      * @notice transferring tokens to the investors who Accepted terms of the contract for investing, Cliff and vesting schedule.
-     * @dev this function will calculate the Locking Mechanism of the tokens from current state of 'activeBalanceLockingMechanism' variable.
+     * @dev this function will calculate the Locking Mechanism of the tokens from the active mechanism of the 'balanceLockingMechanisms' registry.
      */
     function transferWithLocking(address to, uint256 amount) public onlyOwner returns (bool) {
         //minimum of transfer with locking is 10^5 wei.
         require(amount >= 1e5, "TF 2");
         require(isMechanismActivated, "LM is not activated.");
-        require(walletsAffectedByLockingMechanism[to].startedDate == 0, "TF 3");
-        walletsAffectedByLockingMechanism[to] = _initWalletBalanceLockingMechanismFor(to, amount);
+        require(_walletsAffectedByLockingMechanism[to].startedDate == 0, "TF 3");
+        uint256 _mechanismId = lastMechanismId;
+        _walletsAffectedByLockingMechanism[to] = _initWalletBalanceLockingMechanismFor(
+            to,
+            amount,
+            balanceLockingMechanisms[_mechanismId],
+            _mechanismId
+        );
 
         super._transfer(msg.sender, to, amount);
         return true;
     }
+
+    /**
+     * @notice batch variant of 'transferWithLocking', 'recipients[i]' receives 'amounts[i]' with the current Locking Mechanism.
+     * @dev the active Locking Mechanism is loaded into memory once for the whole batch, every recipient emits its own 'InvestmentWithLockingMechanismScenario' and 'Transfer' events.
+     */
+    function batchTransferWithLocking(
+        address[] calldata recipients,
+        uint256[] calldata amounts
+    ) public onlyOwner returns (bool) {
+        require(recipients.length == amounts.length, "TF 4");
+        require(isMechanismActivated, "LM is not activated.");
+        uint256 _mechanismId = lastMechanismId;
+        GeneralActiveBalanceLockingMechanismStructure
+            memory _mechanism = balanceLockingMechanisms[_mechanismId];
+        for (uint256 i = 0; i < recipients.length; ) {
+            address to = recipients[i];
+            uint256 amount = amounts[i];
+            //minimum of transfer with locking is 10^5 wei.
+            require(amount >= 1e5, "TF 2");
+            require(_walletsAffectedByLockingMechanism[to].startedDate == 0, "TF 3");
+            _walletsAffectedByLockingMechanism[to] = _initWalletBalanceLockingMechanismFor(
+                to,
+                amount,
+                _mechanism,
+                _mechanismId
+            );
+            super._transfer(msg.sender, to, amount);
+            unchecked {
+                ++i;
+            }
+        }
+        return true;
+    }
+
+    /**
+     * @notice commits the Merkle root of the allocations that can be claimed by 'claimLockedAllocation', a new root replaces the previous one.
+     * @dev the claimed tokens are transferred from the balance of the owner at the moment of the claim.
+     */
+    function commitAllocationsMerkleRoot(bytes32 merkleRoot) public onlyOwner {
+        allocationsMerkleRoot = merkleRoot;
+        emit AllocationsMerkleRootCommitted(merkleRoot);
+    }
+
+    /**
+     * @dev the leaf of an allocation, hashed twice so that an inner node of the tree can not be claimed as a leaf.
+     */
+    function _allocationLeaf(
+        address account,
+        uint256 amount,
+        uint256 mechanismId
+    ) internal pure returns (bytes32) {
+        return keccak256(bytes.concat(keccak256(abi.encode(account, amount, mechanismId))));
+    }
+
+    /**
+     * @dev the root of the tree that has 'leaf' with the 'proof' siblings, the pairs are hashed in sorted order.
+     */
+    function _merkleRootOf(bytes32 leaf, bytes32[] calldata proof) internal pure returns (bytes32 node) {
+        node = leaf;
+        for (uint256 i = 0; i < proof.length; ) {
+            bytes32 sibling = proof[i];
+            node = node < sibling
+                ? keccak256(abi.encodePacked(node, sibling))
+                : keccak256(abi.encodePacked(sibling, node));
+            unchecked {
+                ++i;
+            }
+        }
+    }
+
+    /// @notice whether the allocation is already claimed, everyone can call this function.
+    function isAllocationClaimed(
+        address account,
+        uint256 amount,
+        uint256 mechanismId
+    ) public view returns (bool) {
+        return _claimedAllocations[_allocationLeaf(account, amount, mechanismId)];
+    }
+
+    /**
+     * @notice the investor claims its allocation of the committed Merkle root, the tokens are locked by the mechanism of the allocation like 'transferWithLocking'.
+     * like 'transferWithLocking', nothing can be claimed while the Locking Mechanism is deactivated.
+     * @param proof is the sibling hashes of the allocation leaf from the bottom to the top of the tree.
+     */
+    function claimLockedAllocation(
+        uint256 amount,
+        uint256 mechanismId,
+        bytes32[] calldata proof
+    ) public returns (bool) {
+        //minimum of transfer with locking is 10^5 wei.
+        require(amount >= 1e5, "TF 2");
+        require(isMechanismActivated, "LM is not activated.");
+        require(mechanismId != 0 && mechanismId <= lastMechanismId, "TF 6");
+        require(_walletsAffectedByLockingMechanism[msg.sender].startedDate == 0, "TF 3");
+        bytes32 leaf = _allocationLeaf(msg.sender, amount, mechanismId);
+        require(!_claimedAllocations[leaf], "TF 7");
+        require(_merkleRootOf(leaf, proof) == allocationsMerkleRoot, "TF 8");
+        _claimedAllocations[leaf] = true;
+        _walletsAffectedByLockingMechanism[msg.sender] = _initWalletBalanceLockingMechanismFor(
+            msg.sender,
+            amount,
+            balanceLockingMechanisms[mechanismId],
+            mechanismId
+        );
+        super._transfer(owner(), msg.sender, amount);
+        return true;
+    }
+
+    /**
+     * @notice mints the balances of the holders of the previous QMatic contract (see 'contractLockingForUpgrade') and restores their Locking Mechanism states.
+     * only callable until 'finishMigration', every holder is minted once and its lock must be covered by its balance.
+     * @dev the mechanisms must be initialized in the order of the previous registry first, so the mechanism ids of the locks stay valid.
+     * a lock with zero 'startedDate' means that the holder has no lock record.
+     */
+    function batchMintMigratedHolders(MigratedHolder[] calldata holders) public onlyOwner returns (bool) {
+        require(!isMigrationFinished, "TF 9");
+        uint256 _lastMechanismId = lastMechanismId;
+        for (uint256 i = 0; i < holders.length; ) {
+            MigratedHolder calldata holder = holders[i];
+            WalletBalanceLockingMechanism memory lock = holder.lock;
+            require(super.balanceOf(holder.account) == 0, "TF 10");
+            if (lock.startedDate != 0) {
+                require(lock.mechanismId != 0 && lock.mechanismId <= _lastMechanismId, "TF 6");
+                require(_walletsAffectedByLockingMechanism[holder.account].startedDate == 0, "TF 3");
+                // the released part of the lock may be spent already, the still blocked tokens never.
+                require(_remainingBlockedTokensOf(lock, _timeNow()) <= holder.balance, "TF 11");
+                _walletsAffectedByLockingMechanism[holder.account] = lock;
+                emit InvestmentWithLockingMechanismScenario(
+                    lock.mechanismId,
+                    holder.account,
+                    lock.startedDate,
+                    lock.linearReleaseTokensPerPeriod,
+                    holder.amountOfInvestInQMatic,
+                    lock.totalAffectedTokens
+                );
+            }
+            _mint(holder.account, holder.balance);
+            unchecked {
+                ++i;
+            }
+        }
+        require(super.totalSupply() <= MAX_SUPPLY, "cannot mint more than max supply");
+        return true;
+    }
+
+    ///@notice closes 'batchMintMigratedHolders' forever, called by the owner after the imported holders are verified.
+    function finishMigration() public onlyOwner {
+        isMigrationFinished = true;
+    }
 }
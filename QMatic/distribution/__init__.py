@@ -0,0 +1,61 @@
+from typing import TYPE_CHECKING, Any
+
+from .allocations import Allocation, read_allocations
+from .journal import AllocationStatus, DistributionJournal, JournalEntry
+from .merkle import (
+    AllocationsMerkleTree,
+    allocation_leaf,
+    build_allocations_merkle_tree,
+    iter_allocation_proofs,
+    open_allocations_merkle_tree,
+    proof_of,
+    verify_allocation_proof,
+    write_allocation_proofs,
+)
+
+if TYPE_CHECKING:
+    from .pipeline import (
+        DistributionPipeline,
+        DistributionReport,
+        MirroredDistributionState,
+        distribute,
+    )
+
+# the pipeline sends through brownie, it is imported on first access so the Merkle tree and the journal import without it.
+_PIPELINE_NAMES: frozenset = frozenset(
+    {
+        "DistributionPipeline",
+        "DistributionReport",
+        "MirroredDistributionState",
+        "distribute",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PIPELINE_NAMES:
+        from . import pipeline
+
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = (
+    "Allocation",
+    "read_allocations",
+    "AllocationStatus",
+    "DistributionJournal",
+    "JournalEntry",
+    "DistributionPipeline",
+    "DistributionReport",
+    "MirroredDistributionState",
+    "distribute",
+    "AllocationsMerkleTree",
+    "allocation_leaf",
+    "build_allocations_merkle_tree",
+    "open_allocations_merkle_tree",
+    "proof_of",
+    "iter_allocation_proofs",
+    "write_allocation_proofs",
+    "verify_allocation_proof",
+)
@@ -0,0 +1,52 @@
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Union
+
+from pydantic import BaseModel
+
+TRUE_VALUES: frozenset = frozenset({"1", "true", "yes", "y"})
+
+
+class Allocation(BaseModel):
+    # position of the allocation in the source file, it identifies the allocation in the journal.
+    index: int
+    address: str
+    amount: int
+    with_locking: bool = True
+    # the Locking Mechanism of a claimable allocation (see `merkle.py`).
+    mechanism_id: Union[int, None] = None
+
+
+def _parse_bool(value: Union[str, bool, int, None]) -> bool:
+    if value is None or value == "":
+        return True
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def read_allocations(path: Union[str, Path]) -> Iterator[Allocation]:
+    """
+    streams the allocations of a CSV (address,amount[,with_locking][,mechanism_id] header) or a JSONL file.
+    `with_locking` is optional and defaults to true, `mechanism_id` is only needed by the claimable allocations.
+    """
+    path = Path(path)
+    with path.open(newline="") as source:
+        rows: Iterable[dict[str, Any]]
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            rows = (json.loads(line) for line in source if line.strip())
+        else:
+            rows = csv.DictReader(source)
+        for index, row in enumerate(rows):
+            yield Allocation(
+                index=index,
+                address=str(row["address"]).strip(),
+                amount=int(row["amount"]),
+                with_locking=_parse_bool(row.get("with_locking")),
+                mechanism_id=(
+                    int(row["mechanism_id"])
+                    if row.get("mechanism_id") not in (None, "")
+                    else None
+                ),
+            )
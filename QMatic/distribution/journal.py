@@ -0,0 +1,125 @@
+import json
+import os
+from enum import Enum
+from pathlib import Path
+from typing import Any, TextIO, Union
+
+from pydantic import BaseModel
+
+from .allocations import Allocation
+
+
+class AllocationStatus(str, Enum):
+    REJECTED = "rejected"
+    # the nonce is reserved and the transaction is about to be broadcast.
+    SENDING = "sending"
+    SENT = "sent"
+    CONFIRMED = "confirmed"
+    REVERTED = "reverted"
+
+
+FINAL_STATUSES: frozenset = frozenset(
+    {AllocationStatus.REJECTED, AllocationStatus.CONFIRMED, AllocationStatus.REVERTED}
+)
+
+
+class JournalEntry(BaseModel):
+    allocation: Allocation
+    status: AllocationStatus
+    nonce: Union[int, None] = None
+    tx_hash: Union[str, None] = None
+    msg: Union[str, None] = None
+
+
+class DistributionJournal:
+    """
+    append-only JSONL journal of a distribution.
+    the nonce of every transaction is written (and synced to the disk) before broadcasting it,
+    so a resumed distribution can tell which allocations may already be on the chain.
+    """
+
+    def __init__(self, path: Union[str, Path], fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self.start_block: Union[int, None] = None
+        self.entries: dict[int, JournalEntry] = {}
+        if self.path.exists():
+            self._load()
+        self._file: TextIO = self.path.open("a")
+
+    def _load(self) -> None:
+        with self.path.open() as source:
+            for line in source:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record["event"] == "started":
+                    if self.start_block is None:
+                        self.start_block = record["block_number"]
+                    continue
+                index = record["index"]
+                entry = self.entries.get(index)
+                if entry is None:
+                    entry = JournalEntry(
+                        allocation=Allocation(**record["allocation"]),
+                        status=record["event"],
+                    )
+                    self.entries[index] = entry
+                entry.status = AllocationStatus(record["event"])
+                for field in ("nonce", "tx_hash", "msg"):
+                    if field in record:
+                        setattr(entry, field, record[field])
+
+    def _write(self, record: dict[str, Any], sync: bool = False) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        if sync and self.fsync:
+            os.fsync(self._file.fileno())
+
+    def started(self, block_number: int) -> None:
+        if self.start_block is None:
+            self.start_block = block_number
+        self._write({"event": "started", "block_number": block_number}, sync=True)
+
+    def record(
+        self,
+        allocation: Allocation,
+        status: AllocationStatus,
+        **fields: Union[int, str, None],
+    ) -> JournalEntry:
+        entry = self.entries.get(allocation.index)
+        if entry is None:
+            entry = JournalEntry(allocation=allocation, status=status)
+            self.entries[allocation.index] = entry
+        entry.status = status
+        for field, value in fields.items():
+            setattr(entry, field, value)
+        self._write(
+            {
+                "event": status.value,
+                "index": allocation.index,
+                "allocation": allocation.dict(),
+                **fields,
+            },
+            sync=status == AllocationStatus.SENDING,
+        )
+        return entry
+
+    def unresolved_entries(self) -> list[JournalEntry]:
+        return sorted(
+            (
+                entry
+                for entry in self.entries.values()
+                if entry.status not in FINAL_STATUSES
+            ),
+            key=lambda entry: entry.nonce if entry.nonce is not None else -1,
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "DistributionJournal":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
@@ -0,0 +1,213 @@
+import json
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Sequence, Union
+
+from eth_hash.auto import keccak
+
+from .allocations import Allocation
+
+NODE_SIZE: int = 32
+# the leaves and the nodes are read and written by blocks of this many pairs.
+PAIRS_PER_BLOCK: int = 4_096
+
+
+class AllocationsMerkleTree(NamedTuple):
+    """
+    a tree of claimable allocations stored level by level in `directory` ('level_0.bin' are the leaves),
+    only one block of every level is in memory while the tree or the proofs are built.
+    the pairs are hashed in sorted order and the last node of an odd level moves up unchanged.
+    """
+
+    directory: Path
+    levels_size: tuple[int, ...]
+    root: bytes
+
+
+def allocation_leaf(address: str, amount: int, mechanism_id: int) -> bytes:
+    """
+    keccak256(bytes.concat(keccak256(abi.encode(account, amount, mechanismId)))) of the contract.
+    """
+    return keccak(
+        keccak(
+            bytes(12)
+            + bytes.fromhex(address[2:])
+            + amount.to_bytes(32, "big")
+            + mechanism_id.to_bytes(32, "big")
+        )
+    )
+
+
+def _parent(left: bytes, right: bytes) -> bytes:
+    return keccak(left + right) if left < right else keccak(right + left)
+
+
+def _level_path(directory: Path, level: int) -> Path:
+    return directory / f"level_{level}.bin"
+
+
+def _leaf_of(allocation: Allocation) -> bytes:
+    if allocation.mechanism_id is None:
+        raise ValueError(f"the allocation {allocation.index} has no mechanism_id")
+    return allocation_leaf(
+        allocation.address, allocation.amount, allocation.mechanism_id
+    )
+
+
+def _write_leaves(allocations: Iterable[Allocation], target: BinaryIO) -> int:
+    count = 0
+    block: list[bytes] = []
+    for allocation in allocations:
+        block.append(_leaf_of(allocation))
+        if len(block) == 2 * PAIRS_PER_BLOCK:
+            target.write(b"".join(block))
+            count += len(block)
+            block = []
+    target.write(b"".join(block))
+    return count + len(block)
+
+
+def _write_parents(source: BinaryIO, target: BinaryIO) -> int:
+    count = 0
+    while True:
+        block = source.read(2 * NODE_SIZE * PAIRS_PER_BLOCK)
+        if not block:
+            return count
+        nodes = [
+            block[start : start + NODE_SIZE]
+            for start in range(0, len(block), NODE_SIZE)
+        ]
+        parents = [
+            (
+                _parent(nodes[index], nodes[index + 1])
+                if index + 1 < len(nodes)
+                else nodes[index]
+            )
+            for index in range(0, len(nodes), 2)
+        ]
+        target.write(b"".join(parents))
+        count += len(parents)
+
+
+def build_allocations_merkle_tree(
+    allocations: Iterable[Allocation], directory: Union[str, Path]
+) -> AllocationsMerkleTree:
+    """
+    streams `allocations` into the leaves and hashes the tree level by level in `directory`,
+    the memory does not grow with the number of allocations.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with _level_path(directory, 0).open("wb") as target:
+        levels_size = [_write_leaves(allocations, target)]
+    if levels_size[0] == 0:
+        raise ValueError("there is no allocation")
+    while levels_size[-1] > 1:
+        level = len(levels_size)
+        with _level_path(directory, level - 1).open("rb") as source, _level_path(
+            directory, level
+        ).open("wb") as target:
+            levels_size.append(_write_parents(source, target))
+    return AllocationsMerkleTree(
+        directory=directory,
+        levels_size=tuple(levels_size),
+        root=_level_path(directory, len(levels_size) - 1).read_bytes(),
+    )
+
+
+def open_allocations_merkle_tree(directory: Union[str, Path]) -> AllocationsMerkleTree:
+    directory = Path(directory)
+    levels_size = [_level_path(directory, 0).stat().st_size // NODE_SIZE]
+    while levels_size[-1] > 1:
+        levels_size.append((levels_size[-1] + 1) // 2)
+    return AllocationsMerkleTree(
+        directory=directory,
+        levels_size=tuple(levels_size),
+        root=_level_path(directory, len(levels_size) - 1).read_bytes(),
+    )
+
+
+def proof_of(tree: AllocationsMerkleTree, index: int) -> list[bytes]:
+    """
+    the proof of the leaf `index`, read by one seek per level.
+    """
+    if not 0 <= index < tree.levels_size[0]:
+        raise ValueError(f"{index} is not a leaf of the tree")
+    proof = []
+    for level, size in enumerate(tree.levels_size[:-1]):
+        sibling = (index >> level) ^ 1
+        if sibling < size:
+            with _level_path(tree.directory, level).open("rb") as source:
+                source.seek(sibling * NODE_SIZE)
+                proof.append(source.read(NODE_SIZE))
+    return proof
+
+
+def _node_of_pair(pair: bytes, node: int) -> bytes:
+    start = (node & 1) * NODE_SIZE
+    return pair[start : start + NODE_SIZE]
+
+
+def iter_allocation_proofs(
+    tree: AllocationsMerkleTree, allocations: Iterable[Allocation]
+) -> Iterator[tuple[Allocation, list[bytes]]]:
+    """
+    the proof of every allocation, `allocations` must be in the order of the tree.
+    every level is read forward once and only the current pair of each level is kept.
+    """
+    levels = tree.levels_size[:-1]
+    sources = [
+        _level_path(tree.directory, level).open("rb") for level in range(len(levels))
+    ]
+    pairs: list[tuple[int, bytes]] = [(-1, b"")] * len(levels)
+    try:
+        for index, allocation in enumerate(allocations):
+            proof = []
+            for level, size in enumerate(levels):
+                node = index >> level
+                pair_index, pair = pairs[level]
+                if pair_index != node >> 1:
+                    pair_index, pair = node >> 1, sources[level].read(2 * NODE_SIZE)
+                    pairs[level] = (pair_index, pair)
+                if level == 0 and _node_of_pair(pair, node) != _leaf_of(allocation):
+                    raise ValueError(
+                        f"the allocation {allocation.index} is not the leaf {index}"
+                    )
+                if (node ^ 1) < size:
+                    proof.append(_node_of_pair(pair, node ^ 1))
+            yield allocation, proof
+    finally:
+        for source in sources:
+            source.close()
+
+
+def write_allocation_proofs(
+    tree: AllocationsMerkleTree,
+    allocations: Iterable[Allocation],
+    path: Union[str, Path],
+) -> int:
+    """
+    writes one JSON line per allocation with the arguments of 'claimLockedAllocation', returns the number of lines.
+    """
+    count = 0
+    with Path(path).open("w") as target:
+        for allocation, proof in iter_allocation_proofs(tree, allocations):
+            target.write(
+                json.dumps(
+                    {
+                        "address": allocation.address,
+                        "amount": str(allocation.amount),
+                        "mechanism_id": allocation.mechanism_id,
+                        "proof": ["0x" + node.hex() for node in proof],
+                    }
+                )
+                + "\n"
+            )
+            count += 1
+    return count
+
+
+def verify_allocation_proof(leaf: bytes, proof: Sequence[bytes], root: bytes) -> bool:
+    node = leaf
+    for sibling in proof:
+        node = _parent(node, sibling)
+    return node == root
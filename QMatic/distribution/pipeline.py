@@ -0,0 +1,409 @@
+import time
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, Union
+
+from brownie import web3
+from brownie.exceptions import VirtualMachineError
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+from brownie.network.transaction import TransactionReceipt
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from pydantic import BaseModel
+from web3.exceptions import TransactionNotFound
+
+from QMatic.adapters import (
+    balance_of,
+    batch_read_for_addresses,
+    mechanism_status,
+    remaining_blocked_tokens_at_now_of_address,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.schemas import WalletBalanceLockingMechanism
+from QMatic.schemas.messages import (
+    ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    LOCKING_MECHANISM_IS_NOT_ACTIVATED,
+    MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+)
+
+from .allocations import Allocation
+from .journal import AllocationStatus, DistributionJournal, JournalEntry
+
+# keccak256("Transfer(address,address,uint256)")
+TRANSFER_EVENT_TOPIC: str = (
+    "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+)
+DEFAULT_WINDOW_SIZE: int = 64
+DEFAULT_CHUNK_SIZE: int = 500
+# how long the pipeline waits for a transaction that holds a nonce under an unknown hash to be mined.
+DEFAULT_SETTLE_TIMEOUT_IN_SECONDS: float = 300.0
+NONCE_POLL_INTERVAL_IN_SECONDS: float = 1.0
+# the node errors of a transaction whose nonce is held by a pending or mined transaction.
+NONCE_IS_TAKEN_ERRORS: tuple[str, ...] = (
+    "already known",
+    "known transaction",
+    "replacement transaction underpriced",
+    "nonce too low",
+)
+
+
+class DistributionReport(BaseModel):
+    confirmed: int = 0
+    rejected: int = 0
+    reverted: int = 0
+    resumed: int = 0
+    skipped: int = 0
+
+
+class MirroredDistributionState(BaseModel):
+    """
+    local copy of the contract state that decides whether an allocation would revert.
+    """
+
+    available_balance: int
+    is_mechanism_activated: bool
+    # checksum addresses, the allocations may spell the same wallet in another case.
+    locked_addresses: set[str] = set()
+
+    def validate_allocation(
+        self, allocation: Allocation, is_already_locked: bool
+    ) -> Union[str, None]:
+        """
+        returns the revert message of the contract for an invalid allocation, None for a valid one.
+        """
+        if allocation.with_locking:
+            if allocation.amount < MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING:
+                return INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE
+            if not self.is_mechanism_activated:
+                return LOCKING_MECHANISM_IS_NOT_ACTIVATED
+            if (
+                is_already_locked
+                or to_checksum_address(allocation.address) in self.locked_addresses
+            ):
+                return WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM
+        if allocation.amount > self.available_balance:
+            return ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE
+        return None
+
+    def apply(self, allocation: Allocation) -> None:
+        self.available_balance -= allocation.amount
+        if allocation.with_locking:
+            self.locked_addresses.add(to_checksum_address(allocation.address))
+
+
+def _chunks(
+    allocations: Iterable[Allocation], chunk_size: int
+) -> Iterator[list[Allocation]]:
+    iterator = iter(allocations)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _address_topic(address: str) -> str:
+    return "0x" + address[2:].lower().rjust(64, "0")
+
+
+def _is_nonce_taken(error: ValueError) -> bool:
+    message = str(error).lower()
+    return any(node_error in message for node_error in NONCE_IS_TAKEN_ERRORS)
+
+
+class DistributionPipeline:
+    """
+    sends the allocations with locally managed nonces and keeps up to `window_size` transactions in flight.
+    every step is written to the journal, so a crashed distribution resumes without double-sending:
+    allocations whose nonce was consumed are only reconciled, the transactions still pending are awaited
+    and the others are resent with the same nonce.
+    a transaction that holds its nonce under an unknown hash and is not mined within `settle_timeout` seconds raises TimeoutError,
+    the distribution is resumed once it is mined or replaced.
+    """
+
+    def __init__(
+        self,
+        qmatic_contract: ProjectContract,
+        journal: DistributionJournal,
+        caller: Account,
+        multicall_contract: Union[ProjectContract, None] = None,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        gas_limit: Union[int, None] = None,
+        settle_timeout: float = DEFAULT_SETTLE_TIMEOUT_IN_SECONDS,
+    ) -> None:
+        self.qmatic_contract = qmatic_contract
+        self.journal = journal
+        self.caller = caller
+        self.multicall_contract = multicall_contract
+        self.window_size = window_size
+        self.chunk_size = chunk_size
+        self.gas_limit = gas_limit
+        self.settle_timeout = settle_timeout
+        self.report = DistributionReport()
+        # a None receipt is a transaction of a crashed run that holds the nonce under an unknown hash.
+        self.in_flight: deque[tuple[JournalEntry, Union[TransactionReceipt, None]]] = (
+            deque()
+        )
+        self.next_nonce = 0
+
+    def _mirror_state(self) -> MirroredDistributionState:
+        balance = balance_of(
+            qmatic_contract=self.qmatic_contract,
+            account_address=self.caller.address,
+            caller=self.caller,
+        )
+        locked = remaining_blocked_tokens_at_now_of_address(
+            qmatic_contract=self.qmatic_contract,
+            target_address=self.caller.address,
+            caller=self.caller,
+        )
+        return MirroredDistributionState(
+            available_balance=balance - locked,
+            is_mechanism_activated=mechanism_status(
+                qmatic_contract=self.qmatic_contract, caller=self.caller
+            ),
+        )
+
+    def _locked_addresses_of(self, allocations: list[Allocation]) -> set[str]:
+        """
+        the checksum addresses of the allocations that are already locked on the contract.
+        """
+        addresses = list(
+            {
+                allocation.address
+                for allocation in allocations
+                if allocation.with_locking
+            }
+        )
+        wallets: Iterable[tuple[str, WalletBalanceLockingMechanism]]
+        if self.multicall_contract is not None:
+            wallets = batch_read_for_addresses(
+                qmatic_contract=self.qmatic_contract,
+                multicall_contract=self.multicall_contract,
+                adapter=wallet_affected_by_locking_mechanism_state,
+                addresses=addresses,
+                caller=self.caller,
+            ).items()
+        else:
+            wallets = (
+                (
+                    address,
+                    wallet_affected_by_locking_mechanism_state(
+                        qmatic_contract=self.qmatic_contract,
+                        account_address=address,
+                        caller=self.caller,
+                    ),
+                )
+                for address in addresses
+            )
+        return {
+            to_checksum_address(address)
+            for address, wallet in wallets
+            if wallet.started_date != 0
+        }
+
+    def _was_transferred(self, allocation: Allocation) -> bool:
+        logs = web3.eth.get_logs(
+            {
+                "address": self.qmatic_contract.address,
+                "fromBlock": self.journal.start_block or 0,
+                "toBlock": "latest",
+                "topics": [
+                    TRANSFER_EVENT_TOPIC,
+                    _address_topic(self.caller.address),
+                    _address_topic(allocation.address),
+                ],
+            }
+        )
+        return any(
+            int.from_bytes(HexBytes(log["data"]), "big") == allocation.amount
+            for log in logs
+        )
+
+    def _was_confirmed(self, entry: JournalEntry) -> bool:
+        if entry.tx_hash is not None:
+            try:
+                return web3.eth.get_transaction_receipt(entry.tx_hash)["status"] == 1
+            except TransactionNotFound:
+                # the transaction is replaced by another one with the same nonce.
+                pass
+        return self._was_transferred(entry.allocation)
+
+    def _reconcile(self, entry: JournalEntry, confirmed_nonce: int) -> bool:
+        """
+        resolves an entry of a crashed run, returns False when its transaction has to be resent.
+        """
+        if entry.nonce is None or entry.nonce >= confirmed_nonce:
+            return False
+        if self._was_confirmed(entry):
+            self.journal.record(entry.allocation, AllocationStatus.CONFIRMED)
+            self.report.confirmed += 1
+        else:
+            self.journal.record(
+                entry.allocation,
+                AllocationStatus.REVERTED,
+                msg="nonce consumed without transfer",
+            )
+            self.report.reverted += 1
+        return True
+
+    def _is_pending(self, entry: JournalEntry) -> bool:
+        if entry.tx_hash is None:
+            return False
+        try:
+            web3.eth.get_transaction(entry.tx_hash)
+        except TransactionNotFound:
+            return False
+        return True
+
+    def _track(self, entry: JournalEntry, tx: Union[TransactionReceipt, None]) -> None:
+        self.in_flight.append((entry, tx))
+        while len(self.in_flight) >= self.window_size:
+            self._settle_oldest()
+
+    def _send(self, allocation: Allocation, nonce: int) -> None:
+        entry = self.journal.record(allocation, AllocationStatus.SENDING, nonce=nonce)
+        method = (
+            self.qmatic_contract.transferWithLocking
+            if allocation.with_locking
+            else self.qmatic_contract.transfer
+        )
+        try:
+            tx = method(
+                allocation.address,
+                allocation.amount,
+                {
+                    "from": self.caller,
+                    "nonce": nonce,
+                    "required_confs": 0,
+                    "gas_limit": self.gas_limit,
+                    "allow_revert": True,
+                },
+            )
+        except VirtualMachineError as error:
+            # the gas estimation reverted, nothing is broadcast and the nonce is still free.
+            if error.revert_type != "revert":
+                raise
+            self.journal.record(
+                allocation, AllocationStatus.REVERTED, msg=error.revert_msg
+            )
+            self.report.reverted += 1
+            return
+        except ValueError as error:
+            # a resent allocation whose transaction of the crashed run was broadcast before its hash was written.
+            if not _is_nonce_taken(error):
+                raise
+            self.next_nonce = max(self.next_nonce, nonce + 1)
+            self._track(entry, None)
+            return
+        self.journal.record(allocation, AllocationStatus.SENT, tx_hash=tx.txid)
+        self.next_nonce = max(self.next_nonce, nonce + 1)
+        self._track(entry, tx)
+
+    def _settle_taken_nonce(self, entry: JournalEntry) -> None:
+        if entry.nonce is None:
+            raise ValueError(
+                f"the allocation {entry.allocation.index} does not hold a nonce"
+            )
+        deadline = time.monotonic() + self.settle_timeout
+        while web3.eth.get_transaction_count(self.caller.address) <= entry.nonce:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"the nonce {entry.nonce} of the allocation {entry.allocation.index} "
+                    f"is not mined after {self.settle_timeout} seconds"
+                )
+            time.sleep(NONCE_POLL_INTERVAL_IN_SECONDS)
+        self._reconcile(entry, entry.nonce + 1)
+
+    def _settle_oldest(self) -> None:
+        entry, tx = self.in_flight.popleft()
+        if tx is None:
+            self._settle_taken_nonce(entry)
+            return
+        tx.wait(1)
+        if tx.status == 1:
+            self.journal.record(entry.allocation, AllocationStatus.CONFIRMED)
+            self.report.confirmed += 1
+        else:
+            self.journal.record(
+                entry.allocation, AllocationStatus.REVERTED, msg=tx.revert_msg
+            )
+            self.report.reverted += 1
+
+    def run(self, allocations: Iterable[Allocation]) -> DistributionReport:
+        self.journal.started(web3.eth.block_number)
+        confirmed_nonce = web3.eth.get_transaction_count(self.caller.address)
+        self.next_nonce = web3.eth.get_transaction_count(self.caller.address, "pending")
+        resend = [
+            entry
+            for entry in self.journal.unresolved_entries()
+            if not self._reconcile(entry, confirmed_nonce)
+        ]
+        state = self._mirror_state()
+        for entry in resend:
+            self.report.resumed += 1
+            state.apply(entry.allocation)
+            if self._is_pending(entry):
+                # broadcasting it again would be answered with 'already known', it is awaited instead.
+                self._track(
+                    entry,
+                    TransactionReceipt(
+                        entry.tx_hash, self.caller, silent=True, required_confs=0
+                    ),
+                )
+                continue
+            # the nonce is reused, so at most one transaction of the allocation can be included.
+            self._send(
+                entry.allocation,
+                entry.nonce if entry.nonce is not None else self.next_nonce,
+            )
+
+        for chunk in _chunks(allocations, self.chunk_size):
+            pending = [
+                allocation
+                for allocation in chunk
+                if allocation.index not in self.journal.entries
+            ]
+            self.report.skipped += len(chunk) - len(pending)
+            locked_addresses = self._locked_addresses_of(pending)
+            for allocation in pending:
+                revert_message = state.validate_allocation(
+                    allocation,
+                    to_checksum_address(allocation.address) in locked_addresses,
+                )
+                if revert_message is not None:
+                    self.journal.record(
+                        allocation, AllocationStatus.REJECTED, msg=revert_message
+                    )
+                    self.report.rejected += 1
+                    continue
+                state.apply(allocation)
+                self._send(allocation, self.next_nonce)
+
+        while self.in_flight:
+            self._settle_oldest()
+        return self.report
+
+
+def distribute(
+    qmatic_contract: ProjectContract,
+    allocations: Iterable[Allocation],
+    journal: DistributionJournal,
+    caller: Account,
+    multicall_contract: Union[ProjectContract, None] = None,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    gas_limit: Union[int, None] = None,
+    settle_timeout: float = DEFAULT_SETTLE_TIMEOUT_IN_SECONDS,
+) -> DistributionReport:
+    return DistributionPipeline(
+        qmatic_contract=qmatic_contract,
+        journal=journal,
+        caller=caller,
+        multicall_contract=multicall_contract,
+        window_size=window_size,
+        chunk_size=chunk_size,
+        gas_limit=gas_limit,
+        settle_timeout=settle_timeout,
+    ).run(allocations)
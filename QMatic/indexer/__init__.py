@@ -0,0 +1,9 @@
+from .indexer import EventIndexer, IndexedLog, decode_log
+from .store import IndexerStore
+
+__all__ = (
+    "EventIndexer",
+    "IndexedLog",
+    "decode_log",
+    "IndexerStore",
+)
@@ -0,0 +1,183 @@
+from typing import Any, NamedTuple, Union
+
+from brownie import ZERO_ADDRESS, web3
+from brownie.network.contract import ProjectContract
+from hexbytes import HexBytes
+from pydantic import BaseModel
+
+from QMatic.schemas.decoder import (
+    BALANCE_LOCKING_MECHANISM_UPDATE_LOG_TOPIC,
+    INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC,
+    LOCKING_MECHANISM_CLEARED_TOPIC,
+    TRANSFER_TOPIC,
+    UPGRADING_QMATIC_TOPIC,
+    decode_raw_log,
+)
+from QMatic.schemas.event import (
+    BalanceLockingMechanismUpdateLog,
+    InvestmentWithLockingMechanismScenario,
+    LockingMechanismCleared,
+    Transfer,
+    UpgradingQMatic,
+)
+
+from .store import IndexerStore
+
+DEFAULT_BLOCK_RANGE: int = 2_000
+DEFAULT_REORG_DEPTH: int = 64
+
+# topic0 of the events that change the materialized state.
+INDEXED_TOPICS: tuple[bytes, ...] = (
+    TRANSFER_TOPIC,
+    INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC,
+    LOCKING_MECHANISM_CLEARED_TOPIC,
+    BALANCE_LOCKING_MECHANISM_UPDATE_LOG_TOPIC,
+    UPGRADING_QMATIC_TOPIC,
+)
+
+
+class IndexedLog(NamedTuple):
+    block_number: int
+    log_index: int
+    event: BaseModel
+
+
+def decode_log(log: Any) -> IndexedLog:
+    decoded = decode_raw_log(log)
+    if decoded is None:
+        raise ValueError(f"not an indexed QMatic event: {log}")
+    return IndexedLog(
+        block_number=log["blockNumber"], log_index=log["logIndex"], event=decoded[1]
+    )
+
+
+def _block_hash(block_number: int) -> str:
+    return HexBytes(web3.eth.get_block(block_number)["hash"]).hex()
+
+
+class EventIndexer:
+    """
+    scans the QMatic logs in ranges of `block_range` blocks and materializes them into `store`.
+    the hashes of the last `reorg_depth` indexed blocks are kept, a reorg is rolled back to the common ancestor before syncing.
+    """
+
+    def __init__(
+        self,
+        qmatic_contract: ProjectContract,
+        store: IndexerStore,
+        block_range: int = DEFAULT_BLOCK_RANGE,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+        start_block: int = 0,
+    ) -> None:
+        self.address = qmatic_contract.address
+        self.store = store
+        self.block_range = block_range
+        self.reorg_depth = reorg_depth
+        self.start_block = start_block
+
+    def _common_ancestor(self, cursor: int, head: int) -> int:
+        for block_number in range(
+            min(cursor, head), max(cursor - self.reorg_depth, self.start_block) - 1, -1
+        ):
+            stored_hash = self.store.block_hash_of(block_number)
+            # the blocks without a stored hash are deeper than the reorg depth and final.
+            if stored_hash is None or stored_hash == _block_hash(block_number):
+                return block_number
+        raise RuntimeError(f"reorg is deeper than {self.reorg_depth} blocks")
+
+    def _rollback_reorg(self, head: int) -> None:
+        cursor = self.store.cursor
+        if cursor is None:
+            return
+        if cursor <= head and self.store.block_hash_of(cursor) in (
+            None,
+            _block_hash(cursor),
+        ):
+            return
+        self.store.rollback(self._common_ancestor(cursor, head))
+
+    def _fetch_logs(self, from_block: int, to_block: int) -> list[Any]:
+        return web3.eth.get_logs(
+            {
+                "address": self.address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [["0x" + topic.hex() for topic in INDEXED_TOPICS]],
+            }
+        )
+
+    def _apply(self, indexed_log: IndexedLog) -> None:
+        block_number, log_index, event = indexed_log
+        if isinstance(event, Transfer):
+            if event.from_address != ZERO_ADDRESS:
+                self.store.add_to_balance(
+                    block_number, event.from_address, -event.value
+                )
+            if event.to_address != ZERO_ADDRESS:
+                self.store.add_to_balance(block_number, event.to_address, event.value)
+        elif isinstance(event, InvestmentWithLockingMechanismScenario):
+            self.store.set_lock(
+                block_number,
+                event.account_address,
+                {
+                    "mechanism_id": event.mechanism_id,
+                    "started_date": event.started_date,
+                    "total_affected_tokens": event.total_affected_tokens,
+                    "linear_release_tokens_per_period": event.linear_release_tokens_per_period,
+                    "amount_of_invest_in_qmatic": event.amount_of_invest_in_qmatic,
+                },
+            )
+        elif isinstance(event, LockingMechanismCleared):
+            self.store.set_lock(block_number, event.account_address, None)
+        elif isinstance(event, BalanceLockingMechanismUpdateLog):
+            if event.is_active:
+                self.store.set_mechanism(
+                    block_number,
+                    event.mechanism_id,
+                    {
+                        "cliff_duration_in_days": event.cliff_duration_in_days,
+                        "linear_release_period_in_days": event.linear_release_period_in_days,
+                        "linear_release_dividend": event.linear_release_dividend,
+                        "linear_release_divisor": event.linear_release_divisor,
+                        "releasing_tge_dividend_on_100": event.releasing_tge__dividend_on_100,
+                        "is_active": 1,
+                    },
+                )
+            else:
+                self.store.deactivate_mechanism(block_number, event.mechanism_id)
+        elif isinstance(event, UpgradingQMatic):
+            self.store.add_upgrade(
+                block_number,
+                f"{block_number}:{log_index}",
+                {
+                    "new_token_contract_address": event.new_token_contract_address,
+                    "upgrade_date": event.upgrade_date,
+                    "event_report_url": event.event_report_url,
+                },
+            )
+
+    def sync(self, to_block: Union[int, None] = None) -> int:
+        """
+        indexes the blocks after the cursor up to `to_block` (the latest block by default), returns the number of applied logs.
+        every range is committed with its cursor, so an interrupted sync resumes from the last committed range.
+        """
+        head = web3.eth.block_number
+        last_block = head if to_block is None else min(to_block, head)
+        self._rollback_reorg(head)
+        cursor = self.store.cursor
+        from_block = self.start_block if cursor is None else cursor + 1
+        applied_logs = 0
+        while from_block <= last_block:
+            range_end = min(from_block + self.block_range - 1, last_block)
+            for log in self._fetch_logs(from_block, range_end):
+                self._apply(decode_log(log))
+                applied_logs += 1
+            for block_number in range(
+                max(from_block, range_end - self.reorg_depth), range_end + 1
+            ):
+                self.store.set_block_hash(block_number, _block_hash(block_number))
+            self.store.set_cursor(range_end)
+            self.store.prune(range_end - self.reorg_depth)
+            self.store.commit()
+            from_block = range_end + 1
+        return applied_logs
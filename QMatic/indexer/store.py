@@ -0,0 +1,366 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+from QMatic.schemas import (
+    GeneralActiveBalanceLockingMechanismStructure,
+    WalletBalanceLockingMechanism,
+)
+
+# uint256 values are stored as 32 bytes big-endian BLOBs, so SQLite compares them numerically.
+UINT256_COLUMNS: frozenset = frozenset(
+    {
+        "balance",
+        "total_affected_tokens",
+        "linear_release_tokens_per_period",
+        "amount_of_invest_in_qmatic",
+    }
+)
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS cursor (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS block_hashes (
+    block_number INTEGER PRIMARY KEY,
+    block_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS balances (
+    address TEXT PRIMARY KEY,
+    balance BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS balances_by_balance ON balances (balance);
+CREATE TABLE IF NOT EXISTS mechanisms (
+    mechanism_id INTEGER PRIMARY KEY,
+    cliff_duration_in_days INTEGER NOT NULL,
+    linear_release_period_in_days INTEGER NOT NULL,
+    linear_release_dividend INTEGER NOT NULL,
+    linear_release_divisor INTEGER NOT NULL,
+    releasing_tge_dividend_on_100 INTEGER NOT NULL,
+    is_active INTEGER NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS locks (
+    address TEXT PRIMARY KEY,
+    mechanism_id INTEGER NOT NULL,
+    started_date INTEGER NOT NULL,
+    total_affected_tokens BLOB NOT NULL,
+    linear_release_tokens_per_period BLOB NOT NULL,
+    amount_of_invest_in_qmatic BLOB NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS locks_by_mechanism ON locks (mechanism_id);
+CREATE TABLE IF NOT EXISTS upgrades (
+    log_position TEXT PRIMARY KEY,
+    new_token_contract_address TEXT NOT NULL,
+    upgrade_date INTEGER NOT NULL,
+    event_report_url TEXT NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS undo_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    block_number INTEGER NOT NULL,
+    table_name TEXT NOT NULL,
+    key_column TEXT NOT NULL,
+    key TEXT NOT NULL,
+    previous TEXT
+);
+CREATE INDEX IF NOT EXISTS undo_log_by_block ON undo_log (block_number);
+"""
+
+
+def to_uint256_blob(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def from_uint256_blob(value: bytes) -> int:
+    return int.from_bytes(value, "big")
+
+
+def _encode_row(row: dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            column: value.hex() if column in UINT256_COLUMNS else value
+            for column, value in row.items()
+        }
+    )
+
+
+def _decode_row(data: str) -> dict[str, Any]:
+    return {
+        column: bytes.fromhex(value) if column in UINT256_COLUMNS else value
+        for column, value in json.loads(data).items()
+    }
+
+
+class IndexerStore:
+    """
+    SQLite tables of balances, locks and mechanisms materialized from the QMatic events.
+    every change of a row is recorded in `undo_log` with the previous row, so the blocks of a reorg can be rolled back.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self.connection = sqlite3.connect(str(path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------ writes
+
+    def _get_row(
+        self, table_name: str, key_column: str, key: Any
+    ) -> Union[dict[str, Any], None]:
+        row = self.connection.execute(
+            f"SELECT * FROM {table_name} WHERE {key_column} = ?", (key,)
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def _set_row(
+        self,
+        block_number: int,
+        table_name: str,
+        key_column: str,
+        key: Any,
+        row: Union[dict[str, Any], None],
+    ) -> None:
+        """
+        replaces (or deletes, when `row` is None) the row of `key` and records the previous row for the rollback.
+        """
+        previous = self._get_row(table_name, key_column, key)
+        self.connection.execute(
+            "INSERT INTO undo_log (block_number, table_name, key_column, key, previous) VALUES (?, ?, ?, ?, ?)",
+            (
+                block_number,
+                table_name,
+                key_column,
+                json.dumps(key),
+                _encode_row(previous) if previous is not None else None,
+            ),
+        )
+        self._write_row(table_name, key_column, key, row)
+
+    def _write_row(
+        self,
+        table_name: str,
+        key_column: str,
+        key: Any,
+        row: Union[dict[str, Any], None],
+    ) -> None:
+        self.connection.execute(
+            f"DELETE FROM {table_name} WHERE {key_column} = ?", (key,)
+        )
+        if row is not None:
+            columns = ", ".join(row)
+            placeholders = ", ".join("?" for _ in row)
+            self.connection.execute(
+                f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})",
+                tuple(row.values()),
+            )
+
+    def add_to_balance(self, block_number: int, address: str, delta: int) -> None:
+        balance = self.balance_of(address) + delta
+        self._set_row(
+            block_number,
+            "balances",
+            "address",
+            address,
+            (
+                {"address": address, "balance": to_uint256_blob(balance)}
+                if balance != 0
+                else None
+            ),
+        )
+
+    def set_lock(
+        self, block_number: int, address: str, row: Union[dict[str, Any], None]
+    ) -> None:
+        if row is not None:
+            row = {
+                "address": address,
+                **{
+                    column: (
+                        to_uint256_blob(value) if column in UINT256_COLUMNS else value
+                    )
+                    for column, value in row.items()
+                },
+                "block_number": block_number,
+            }
+        self._set_row(block_number, "locks", "address", address, row)
+
+    def set_mechanism(
+        self, block_number: int, mechanism_id: int, row: dict[str, Any]
+    ) -> None:
+        self._set_row(
+            block_number,
+            "mechanisms",
+            "mechanism_id",
+            mechanism_id,
+            {"mechanism_id": mechanism_id, **row, "block_number": block_number},
+        )
+
+    def deactivate_mechanism(self, block_number: int, mechanism_id: int) -> None:
+        row = self._get_row("mechanisms", "mechanism_id", mechanism_id)
+        if row is not None:
+            self.set_mechanism(
+                block_number,
+                mechanism_id,
+                {
+                    column: value
+                    for column, value in row.items()
+                    if column not in ("mechanism_id", "block_number")
+                }
+                | {"is_active": 0},
+            )
+
+    def add_upgrade(
+        self, block_number: int, log_position: str, row: dict[str, Any]
+    ) -> None:
+        self._set_row(
+            block_number,
+            "upgrades",
+            "log_position",
+            log_position,
+            {"log_position": log_position, **row, "block_number": block_number},
+        )
+
+    # ------------------------------------------------------------------ cursor and reorgs
+
+    @property
+    def cursor(self) -> Union[int, None]:
+        """
+        the last indexed block, None before the first sync.
+        """
+        row = self.connection.execute(
+            "SELECT block_number FROM cursor WHERE id = 1"
+        ).fetchone()
+        return row["block_number"] if row is not None else None
+
+    def set_cursor(self, block_number: int) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO cursor (id, block_number) VALUES (1, ?)",
+            (block_number,),
+        )
+
+    def block_hash_of(self, block_number: int) -> Union[str, None]:
+        row = self.connection.execute(
+            "SELECT block_hash FROM block_hashes WHERE block_number = ?",
+            (block_number,),
+        ).fetchone()
+        return row["block_hash"] if row is not None else None
+
+    def set_block_hash(self, block_number: int, block_hash: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO block_hashes (block_number, block_hash) VALUES (?, ?)",
+            (block_number, block_hash),
+        )
+
+    def prune(self, below_block_number: int) -> None:
+        """
+        drops the rollback data of the blocks that are deeper than the reorg depth.
+        """
+        self.connection.execute(
+            "DELETE FROM undo_log WHERE block_number < ?", (below_block_number,)
+        )
+        self.connection.execute(
+            "DELETE FROM block_hashes WHERE block_number < ?", (below_block_number,)
+        )
+
+    def rollback(self, to_block_number: int) -> None:
+        """
+        restores the state at the end of `to_block_number`, the later blocks are forgotten.
+        """
+        undo_entries = self.connection.execute(
+            "SELECT * FROM undo_log WHERE block_number > ? ORDER BY id DESC",
+            (to_block_number,),
+        ).fetchall()
+        for entry in undo_entries:
+            self._write_row(
+                entry["table_name"],
+                entry["key_column"],
+                json.loads(entry["key"]),
+                (
+                    _decode_row(entry["previous"])
+                    if entry["previous"] is not None
+                    else None
+                ),
+            )
+        self.connection.execute(
+            "DELETE FROM undo_log WHERE block_number > ?", (to_block_number,)
+        )
+        self.connection.execute(
+            "DELETE FROM block_hashes WHERE block_number > ?", (to_block_number,)
+        )
+        self.set_cursor(to_block_number)
+        self.commit()
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # ------------------------------------------------------------------ reporting queries
+
+    def balance_of(self, address: str) -> int:
+        row = self.connection.execute(
+            "SELECT balance FROM balances WHERE address = ?", (address,)
+        ).fetchone()
+        return from_uint256_blob(row["balance"]) if row is not None else 0
+
+    def top_holders(self, limit: int = 10) -> list[tuple[str, int]]:
+        return [
+            (row["address"], from_uint256_blob(row["balance"]))
+            for row in self.connection.execute(
+                "SELECT address, balance FROM balances ORDER BY balance DESC LIMIT ?",
+                (limit,),
+            )
+        ]
+
+    def mechanism_of_id(
+        self, mechanism_id: int
+    ) -> GeneralActiveBalanceLockingMechanismStructure:
+        row = self._get_row("mechanisms", "mechanism_id", mechanism_id)
+        if row is None:
+            return GeneralActiveBalanceLockingMechanismStructure()
+        return GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=row["cliff_duration_in_days"],
+            linear_release_period_in_days=row["linear_release_period_in_days"],
+            linear_release_dividend=row["linear_release_dividend"],
+            linear_release_divisor=row["linear_release_divisor"],
+            releasing_tge_dividend_on_100=row["releasing_tge_dividend_on_100"],
+        )
+
+    def active_mechanism_id(self) -> Union[int, None]:
+        row = self.connection.execute(
+            "SELECT mechanism_id FROM mechanisms WHERE is_active = 1 ORDER BY mechanism_id DESC LIMIT 1"
+        ).fetchone()
+        return row["mechanism_id"] if row is not None else None
+
+    def lock_of(self, address: str) -> WalletBalanceLockingMechanism:
+        """
+        the same shape of `wallet_affected_by_locking_mechanism_state`, a wallet without lock has the default values.
+        """
+        row = self._get_row("locks", "address", address)
+        if row is None:
+            return WalletBalanceLockingMechanism(
+                mechanism=GeneralActiveBalanceLockingMechanismStructure()
+            )
+        return WalletBalanceLockingMechanism(
+            started_date=row["started_date"],
+            total_affected_tokens=from_uint256_blob(row["total_affected_tokens"]),
+            linear_release_tokens_per_period=from_uint256_blob(
+                row["linear_release_tokens_per_period"]
+            ),
+            mechanism=self.mechanism_of_id(row["mechanism_id"]),
+        )
+
+    def locked_addresses(self, mechanism_id: Union[int, None] = None) -> Iterator[str]:
+        if mechanism_id is None:
+            rows = self.connection.execute("SELECT address FROM locks ORDER BY address")
+        else:
+            rows = self.connection.execute(
+                "SELECT address FROM locks WHERE mechanism_id = ? ORDER BY address",
+                (mechanism_id,),
+            )
+        return (row["address"] for row in rows)
@@ -0,0 +1,19 @@
+from .harness import (
+    AdapterLatencyReport,
+    LoadLevelReport,
+    LoadTestReport,
+    TransactionGasReport,
+    run_load_test,
+)
+from .workload import InvestorsMirror, LoadTestConfig, Operation
+
+__all__ = (
+    "AdapterLatencyReport",
+    "LoadLevelReport",
+    "LoadTestReport",
+    "TransactionGasReport",
+    "run_load_test",
+    "InvestorsMirror",
+    "LoadTestConfig",
+    "Operation",
+)
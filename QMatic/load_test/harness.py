@@ -0,0 +1,283 @@
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+from brownie import Wei, accounts, history, web3
+from brownie.network.account import LocalAccount
+from brownie.network.contract import ProjectContract
+from pydantic import BaseModel
+
+from QMatic.adapters import (
+    approve_to_spend_tokens_by_agent,
+    batch_transfer_with_locking,
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    normal_transfer,
+    transfer_from_user_by_approved_agent,
+)
+from QMatic.constants import DEPLOYER_ACCOUNT_INDEX
+from QMatic.schemas import WalletBalanceLockingMechanism
+from QMatic.scripts.deploy import deploy_minted_qmatic_contract
+from QMatic.vesting.engine import ONE_DAY_IN_SECONDS
+
+from .workload import (
+    APPROVE,
+    TRANSFER,
+    TRANSFER_FROM,
+    InvestorsMirror,
+    LoadTestConfig,
+    Operation,
+)
+
+GAS_FUNDING_PER_ACTIVE_INVESTOR: int = Wei("0.1 ether")
+LATENCY_PERCENTILES: tuple[int, ...] = (50, 90, 99)
+ADAPTER_OF_OPERATION = {
+    TRANSFER: normal_transfer,
+    APPROVE: approve_to_spend_tokens_by_agent,
+    TRANSFER_FROM: transfer_from_user_by_approved_agent,
+}
+
+
+class LoadLevelReport(BaseModel):
+    days: int
+    concurrency: int
+    operations: int
+    reverted: int
+    seconds: float
+    transactions_per_second: float
+
+
+class AdapterLatencyReport(BaseModel):
+    adapter: str
+    calls: int
+    reverted: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class TransactionGasReport(BaseModel):
+    transaction_type: str
+    transactions: int
+    mean: float
+    min: int
+    max: int
+
+
+class LoadTestReport(BaseModel):
+    investors: int
+    seeding_seconds: float
+    levels: list[LoadLevelReport] = []
+    latencies: list[AdapterLatencyReport] = []
+    gas: list[TransactionGasReport] = []
+
+
+def _chunks(items: Iterable[int], chunk_size: int) -> Iterator[list[int]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _lock_investors(
+    qmatic_contract: ProjectContract,
+    investors: Sequence[LocalAccount],
+    mirror: InvestorsMirror,
+    config: LoadTestConfig,
+    rng: random.Random,
+) -> None:
+    """
+    locks the investors under every mechanism of `config` in turn, the mirror is built from the emitted events.
+    """
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    index_of_address = {
+        investor.address: index for index, investor in enumerate(investors)
+    }
+    for round_index, mechanism in enumerate(config.mechanisms):
+        initializing_active_balance_locking_mechanism(
+            qmatic_contract=qmatic_contract, entries=mechanism, caller=deployer_account
+        )
+        round_investors = range(round_index, len(investors), len(config.mechanisms))
+        for chunk in _chunks(round_investors, config.locking_batch_size):
+            events, revert_exception = batch_transfer_with_locking(
+                qmatic_contract=qmatic_contract,
+                recipients=[investors[index].address for index in chunk],
+                amounts=[
+                    rng.randint(config.min_locked_amount, config.max_locked_amount)
+                    for _ in chunk
+                ],
+                caller=deployer_account,
+            )
+            if revert_exception is not None:
+                raise RuntimeError(
+                    f"locking the investors reverted: {revert_exception.msg}"
+                )
+            if (
+                events is None
+                or events.investment_with_locking_mechanism_scenario is None
+            ):
+                raise RuntimeError("locking the investors emitted no investments")
+            for investment in events.investment_with_locking_mechanism_scenario:
+                mirror.lock(
+                    index_of_address[investment.account_address],
+                    investment.amount_of_invest_in_qmatic,
+                    WalletBalanceLockingMechanism(
+                        started_date=investment.started_date,
+                        total_affected_tokens=investment.total_affected_tokens,
+                        linear_release_tokens_per_period=investment.linear_release_tokens_per_period,
+                        mechanism=mechanism,
+                    ),
+                )
+
+
+def _execute(
+    qmatic_contract: ProjectContract,
+    investors: Sequence[LocalAccount],
+    operation: Operation,
+) -> tuple[float, bool]:
+    """
+    sends one operation through its adapter, returns its latency in seconds and whether it succeeded.
+    """
+    caller = investors[operation.caller]
+    started = time.perf_counter()
+    if operation.kind == TRANSFER:
+        _, revert_exception = normal_transfer(
+            qmatic_contract=qmatic_contract,
+            to=investors[operation.to].address,
+            amount=operation.amount,
+            caller=caller,
+        )
+    elif operation.kind == APPROVE:
+        _, revert_exception = approve_to_spend_tokens_by_agent(
+            qmatic_contract=qmatic_contract,
+            spender_address=investors[operation.to].address,
+            amount_spend=operation.amount,
+            caller=caller,
+        )
+    else:
+        _, revert_exception = transfer_from_user_by_approved_agent(
+            qmatic_contract=qmatic_contract,
+            from_address=investors[operation.owner_index].address,
+            to_address=investors[operation.to].address,
+            amount=operation.amount,
+            caller=caller,
+        )
+    return time.perf_counter() - started, revert_exception is None
+
+
+def _latency_reports(
+    latencies: dict[str, list[float]], reverted: dict[str, int]
+) -> list[AdapterLatencyReport]:
+    reports = []
+    for adapter, seconds in latencies.items():
+        p50, p90, p99 = np.percentile(seconds, LATENCY_PERCENTILES) * 1e3
+        reports.append(
+            AdapterLatencyReport(
+                adapter=adapter,
+                calls=len(seconds),
+                reverted=reverted[adapter],
+                p50_ms=p50,
+                p90_ms=p90,
+                p99_ms=p99,
+                max_ms=max(seconds) * 1e3,
+            )
+        )
+    return reports
+
+
+def _gas_reports(receipts: Iterable) -> list[TransactionGasReport]:
+    gas_of_type: dict[str, list[int]] = defaultdict(list)
+    for receipt in receipts:
+        # the ether funding of the investors has no contract function.
+        if receipt.fn_name is not None and receipt.status == 1:
+            gas_of_type[receipt.fn_name.split(".")[-1]].append(receipt.gas_used)
+    return [
+        TransactionGasReport(
+            transaction_type=transaction_type,
+            transactions=len(gas),
+            mean=sum(gas) / len(gas),
+            min=min(gas),
+            max=max(gas),
+        )
+        for transaction_type, gas in gas_of_type.items()
+    ]
+
+
+def run_load_test(config: LoadTestConfig = LoadTestConfig()) -> LoadTestReport:
+    """
+    deploys QMatic on the development chain, locks `config.investors_count` synthetic investors
+    and replays the workload of `config` for every day of `config.days_steps` (shifted by 'changeDateOfContract').
+    the generated accounts are removed from brownie's `accounts` afterwards.
+    """
+    rng = random.Random(config.seed)
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    started = time.perf_counter()
+    qmatic_contract = deploy_minted_qmatic_contract()
+    first_receipt_index = len(history)
+    investors = [accounts.add() for _ in range(config.investors_count)]
+    try:
+        active_investors = rng.sample(
+            range(len(investors)), config.active_investors_count
+        )
+        for index in active_investors:
+            deployer_account.transfer(investors[index], GAS_FUNDING_PER_ACTIVE_INVESTOR)
+        mirror = InvestorsMirror(len(investors))
+        _lock_investors(qmatic_contract, investors, mirror, config, rng)
+        report = LoadTestReport(
+            investors=len(investors), seeding_seconds=time.perf_counter() - started
+        )
+
+        latencies: dict[str, list[float]] = defaultdict(list)
+        reverted: dict[str, int] = defaultdict(int)
+        for days in config.days_steps:
+            development_push_date_of_contract(
+                qmatic_contract=qmatic_contract, days=days, caller=deployer_account
+            )
+            for concurrency in config.concurrency_levels:
+                # the next blocks are not older, so the operations valid at the latest block stay valid.
+                time_now = (
+                    web3.eth.get_block("latest").timestamp + days * ONE_DAY_IN_SECONDS
+                )
+                operations = mirror.generate_operations(
+                    rng,
+                    active_investors,
+                    config.operations_per_level,
+                    time_now,
+                    config.operation_mix,
+                )
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    results = list(
+                        executor.map(
+                            lambda operation: _execute(
+                                qmatic_contract, investors, operation
+                            ),
+                            operations,
+                        )
+                    )
+                seconds = time.perf_counter() - started
+                for operation, (latency, is_succeeded) in zip(operations, results):
+                    adapter = ADAPTER_OF_OPERATION[operation.kind].__name__
+                    latencies[adapter].append(latency)
+                    reverted[adapter] += not is_succeeded
+                mirror.settle(operations, [is_succeeded for _, is_succeeded in results])
+                report.levels.append(
+                    LoadLevelReport(
+                        days=days,
+                        concurrency=concurrency,
+                        operations=len(operations),
+                        reverted=sum(not is_succeeded for _, is_succeeded in results),
+                        seconds=seconds,
+                        transactions_per_second=len(operations) / seconds,
+                    )
+                )
+        report.latencies = _latency_reports(latencies, reverted)
+        report.gas = _gas_reports(history[first_receipt_index:])
+        return report
+    finally:
+        for investor in investors:
+            accounts.remove(investor)
@@ -0,0 +1,201 @@
+import random
+from collections import Counter
+from typing import NamedTuple, Sequence, Union
+
+from pydantic import BaseModel
+
+from QMatic.constants import MINIMUM_AMOUNT_TO_SELL, MONTH_IN_DAYS, YEAR_IN_DAYS
+from QMatic.schemas import (
+    GeneralActiveBalanceLockingMechanismStructure,
+    WalletBalanceLockingMechanism,
+)
+from QMatic.vesting import remaining_blocked_tokens_of
+
+TRANSFER: str = "transfer"
+APPROVE: str = "approve"
+TRANSFER_FROM: str = "transfer_from"
+
+# seed, private and public sale rounds.
+DEFAULT_LOAD_TEST_MECHANISMS: tuple[
+    GeneralActiveBalanceLockingMechanismStructure, ...
+] = (
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=6 * MONTH_IN_DAYS,
+        linear_release_period_in_days=1 * MONTH_IN_DAYS,
+        linear_release_dividend=5,
+        linear_release_divisor=100,
+        releasing_tge_dividend_on_100=5,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=3 * MONTH_IN_DAYS,
+        linear_release_period_in_days=1 * MONTH_IN_DAYS,
+        linear_release_dividend=1,
+        linear_release_divisor=10,
+        releasing_tge_dividend_on_100=15,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=1 * MONTH_IN_DAYS,
+        linear_release_period_in_days=1 * MONTH_IN_DAYS,
+        linear_release_dividend=25,
+        linear_release_divisor=100,
+        releasing_tge_dividend_on_100=25,
+    ),
+)
+
+
+class LoadTestConfig(BaseModel):
+    """
+    `investors_count` wallets are locked under `mechanisms` (round robin),
+    `active_investors_count` of them are funded with gas and send the replayed transactions.
+    the replay runs `operations_per_level` operations for every (day of `days_steps`, level of `concurrency_levels`) pair.
+    """
+
+    investors_count: int = 2_000
+    active_investors_count: int = 200
+    mechanisms: list[GeneralActiveBalanceLockingMechanismStructure] = list(
+        DEFAULT_LOAD_TEST_MECHANISMS
+    )
+    min_locked_amount: int = MINIMUM_AMOUNT_TO_SELL
+    max_locked_amount: int = 10 * MINIMUM_AMOUNT_TO_SELL
+    locking_batch_size: int = 200
+    days_steps: list[int] = [0, 3 * MONTH_IN_DAYS, 6 * MONTH_IN_DAYS, YEAR_IN_DAYS]
+    concurrency_levels: list[int] = [1, 8, 32]
+    operations_per_level: int = 200
+    operation_mix: dict[str, float] = {TRANSFER: 0.6, APPROVE: 0.2, TRANSFER_FROM: 0.2}
+    seed: int = 0
+
+
+class Operation(NamedTuple):
+    """
+    one replayed transaction over the indexes of the investors.
+    `caller` transfers to / approves `to`, a TRANSFER_FROM moves the tokens of `owner` to `to`.
+    """
+
+    kind: str
+    caller: int
+    to: int
+    amount: int
+    owner: Union[int, None] = None
+
+    @property
+    def owner_index(self) -> int:
+        """
+        the `owner` of a TRANSFER_FROM, the other kinds have none.
+        """
+        if self.owner is None:
+            raise ValueError(f"a {self.kind} operation has no owner")
+        return self.owner
+
+
+class InvestorsMirror:
+    """
+    local copy of the balances, locks and allowances of the investors, so the workload only contains valid operations.
+    the operations of one batch run concurrently, so a batch only spends what was settled before it:
+    the spent amounts are reserved while generating, the received tokens and new allowances are applied by `settle`.
+    """
+
+    def __init__(self, investors_count: int) -> None:
+        self.balances: list[int] = [0] * investors_count
+        self.wallets: list[Union[WalletBalanceLockingMechanism, None]] = [
+            None
+        ] * investors_count
+        self.allowances: dict[tuple[int, int], int] = {}
+
+    def lock(
+        self, index: int, amount: int, wallet: WalletBalanceLockingMechanism
+    ) -> None:
+        self.balances[index] += amount
+        self.wallets[index] = wallet
+
+    def available(self, index: int, time_now: int) -> int:
+        wallet = self.wallets[index]
+        if wallet is None:
+            return self.balances[index]
+        return self.balances[index] - remaining_blocked_tokens_of(wallet, time_now)
+
+    def generate_operations(
+        self,
+        rng: random.Random,
+        active_investors: Sequence[int],
+        count: int,
+        time_now: int,
+        operation_mix: dict[str, float],
+    ) -> list[Operation]:
+        """
+        `count` operations sent by `active_investors`, valid at `time_now` whatever their order of execution is.
+        """
+        kinds, weights = zip(*operation_mix.items())
+        reserved: Counter[int] = Counter()
+        reserved_allowances: Counter[tuple[int, int]] = Counter()
+        # an 'approve' overwrites the allowance, so a pair is either approved or spent in one batch.
+        approved_pairs: set[tuple[int, int]] = set()
+        operations: list[Operation] = []
+        for _ in range(count):
+            kind = rng.choices(kinds, weights)[0]
+            caller = rng.choice(active_investors)
+            to = rng.randrange(len(self.balances))
+            if kind == TRANSFER_FROM:
+                pairs = [
+                    pair
+                    for pair, allowance in self.allowances.items()
+                    if allowance > reserved_allowances[pair]
+                    and pair not in approved_pairs
+                ]
+                if pairs:
+                    owner, caller = rng.choice(pairs)
+                    amount = min(
+                        self.allowances[owner, caller]
+                        - reserved_allowances[owner, caller],
+                        self.available(owner, time_now) - reserved[owner],
+                    )
+                    if amount > 0:
+                        amount = rng.randint(1, amount)
+                        reserved[owner] += amount
+                        reserved_allowances[owner, caller] += amount
+                        operations.append(
+                            Operation(TRANSFER_FROM, caller, to, amount, owner)
+                        )
+                        continue
+                kind = APPROVE
+            if kind == APPROVE:
+                spender = rng.choice(active_investors)
+                pair = (caller, spender)
+                if (
+                    spender == caller
+                    or pair in approved_pairs
+                    or reserved_allowances[pair]
+                ):
+                    continue
+                approved_pairs.add(pair)
+                operations.append(
+                    Operation(
+                        APPROVE, caller, spender, rng.randint(1, MINIMUM_AMOUNT_TO_SELL)
+                    )
+                )
+                continue
+            spendable = self.available(caller, time_now) - reserved[caller]
+            if spendable <= 0:
+                continue
+            amount = rng.randint(1, max(1, spendable // 10))
+            reserved[caller] += amount
+            operations.append(Operation(TRANSFER, caller, to, amount))
+        return operations
+
+    def settle(
+        self, operations: Sequence[Operation], succeeded: Sequence[bool]
+    ) -> None:
+        """
+        applies the effects of the operations that were executed successfully.
+        """
+        for operation, is_succeeded in zip(operations, succeeded):
+            if not is_succeeded:
+                continue
+            if operation.kind == APPROVE:
+                self.allowances[operation.caller, operation.to] = operation.amount
+                continue
+            sender = operation.caller
+            if operation.kind == TRANSFER_FROM:
+                sender = operation.owner_index
+                self.allowances[sender, operation.caller] -= operation.amount
+            self.balances[sender] -= operation.amount
+            self.balances[operation.to] += operation.amount
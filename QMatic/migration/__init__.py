@@ -0,0 +1,20 @@
+from .codec import (
+    iter_migration_snapshot,
+    read_migration_snapshot_header,
+    verify_migration_snapshot,
+    write_migration_snapshot,
+)
+from .importer import MigrationReport, import_migration_snapshot, verify_migration
+from .snapshot import MigrationSnapshotHeader, build_migration_snapshot
+
+__all__ = (
+    "MigrationSnapshotHeader",
+    "build_migration_snapshot",
+    "write_migration_snapshot",
+    "read_migration_snapshot_header",
+    "iter_migration_snapshot",
+    "verify_migration_snapshot",
+    "MigrationReport",
+    "import_migration_snapshot",
+    "verify_migration",
+)
@@ -0,0 +1,180 @@
+import hashlib
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Union
+
+from QMatic.schemas import MigratedHolder
+
+from .snapshot import MigrationSnapshotHeader
+
+# file layout:
+#   MAGIC | header length (u32) | header (JSON) | chunks | end chunk (zero records) | sha256 of everything before it
+#   chunk: records count (u32) | records | crc32 of the records (u32)
+# the record fields are big-endian and as wide as the packed lock record of the contract (uint96 amounts, uint40 dates).
+MAGIC: bytes = b"QMSNAP01"
+RECORD_FIELDS: tuple[tuple[str, int], ...] = (
+    ("account", 20),
+    ("balance", 12),
+    ("amount_of_invest_in_qmatic", 12),
+    ("started_date", 5),
+    ("total_affected_tokens", 12),
+    ("linear_release_tokens_per_period", 12),
+    ("mechanism_id", 3),
+)
+RECORD_SIZE: int = sum(width for _, width in RECORD_FIELDS)
+DEFAULT_SNAPSHOT_CHUNK_SIZE: int = 10_000
+
+_U32 = struct.Struct(">I")
+
+
+def _encode_record(holder: MigratedHolder) -> bytes:
+    record = bytes.fromhex(holder.account[2:])
+    for field_name, width in RECORD_FIELDS[1:]:
+        value = getattr(holder, field_name)
+        if not 0 <= value < 1 << (8 * width):
+            raise ValueError(
+                f"{field_name} of {holder.account} does not fit in {width} bytes"
+            )
+        record += value.to_bytes(width, "big")
+    return record
+
+
+def _decode_record(record: bytes) -> MigratedHolder:
+    # eth_utils is imported on the first decoded snapshot, not with `QMatic.migration`.
+    from eth_utils.address import to_checksum_address
+
+    account_field_name, offset = RECORD_FIELDS[0]
+    values: dict[str, Any] = {account_field_name: to_checksum_address(record[:offset])}
+    for field_name, width in RECORD_FIELDS[1:]:
+        values[field_name] = int.from_bytes(record[offset : offset + width], "big")
+        offset += width
+    return MigratedHolder.construct(**values)
+
+
+class _HashingWriter:
+    def __init__(self, target: BinaryIO) -> None:
+        self.target = target
+        self.digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> None:
+        self.digest.update(data)
+        self.target.write(data)
+
+
+def _write_chunk(writer: _HashingWriter, records: list[bytes]) -> None:
+    payload = b"".join(records)
+    writer.write(_U32.pack(len(records)) + payload + _U32.pack(zlib.crc32(payload)))
+
+
+def write_migration_snapshot(
+    path: Union[str, Path],
+    header: MigrationSnapshotHeader,
+    holders: Iterable[MigratedHolder],
+    chunk_size: int = DEFAULT_SNAPSHOT_CHUNK_SIZE,
+) -> None:
+    """
+    streams `holders` into the chunked snapshot file, `header.holders_count` must be the number of `holders`.
+    """
+    encoded_header = header.json().encode()
+    holders_count = 0
+    with Path(path).open("wb") as target:
+        writer = _HashingWriter(target)
+        writer.write(MAGIC + _U32.pack(len(encoded_header)) + encoded_header)
+        records: list[bytes] = []
+        for holder in holders:
+            records.append(_encode_record(holder))
+            if len(records) == chunk_size:
+                _write_chunk(writer, records)
+                holders_count += len(records)
+                records = []
+        if records:
+            _write_chunk(writer, records)
+            holders_count += len(records)
+        _write_chunk(writer, [])
+        target.write(writer.digest.digest())
+    if holders_count != header.holders_count:
+        raise ValueError(
+            f"{holders_count} holders are written, the header counts {header.holders_count}"
+        )
+
+
+class _HashingReader:
+    def __init__(self, source: BinaryIO) -> None:
+        self.source = source
+        self.digest = hashlib.sha256()
+
+    def read_exactly(self, size: int) -> bytes:
+        data = self.source.read(size)
+        if len(data) != size:
+            raise ValueError("the snapshot is truncated")
+        self.digest.update(data)
+        return data
+
+
+def _read_header(reader: _HashingReader) -> MigrationSnapshotHeader:
+    if reader.read_exactly(len(MAGIC)) != MAGIC:
+        raise ValueError("not a migration snapshot")
+    (header_length,) = _U32.unpack(reader.read_exactly(_U32.size))
+    return MigrationSnapshotHeader.parse_raw(reader.read_exactly(header_length))
+
+
+def read_migration_snapshot_header(path: Union[str, Path]) -> MigrationSnapshotHeader:
+    with Path(path).open("rb") as source:
+        return _read_header(_HashingReader(source))
+
+
+def _iter_payloads(path: Union[str, Path]) -> Iterator[bytes]:
+    """
+    the records of every chunk, the checksum of a chunk is verified before it is yielded
+    and the checksum of the file after the last chunk.
+    """
+    with Path(path).open("rb") as source:
+        reader = _HashingReader(source)
+        _read_header(reader)
+        while True:
+            (records_count,) = _U32.unpack(reader.read_exactly(_U32.size))
+            if records_count == 0:
+                reader.read_exactly(_U32.size)
+                break
+            payload = reader.read_exactly(records_count * RECORD_SIZE)
+            (checksum,) = _U32.unpack(reader.read_exactly(_U32.size))
+            if zlib.crc32(payload) != checksum:
+                raise ValueError("the checksum of a snapshot chunk does not match")
+            yield payload
+        if source.read() != reader.digest.digest():
+            raise ValueError("the checksum of the snapshot does not match")
+
+
+def iter_migration_snapshot(path: Union[str, Path]) -> Iterator[list[MigratedHolder]]:
+    """
+    the holders of the snapshot chunk by chunk, a corrupted chunk raises ValueError before it is yielded.
+    """
+    for payload in _iter_payloads(path):
+        yield [
+            _decode_record(payload[offset : offset + RECORD_SIZE])
+            for offset in range(0, len(payload), RECORD_SIZE)
+        ]
+
+
+def verify_migration_snapshot(path: Union[str, Path]) -> MigrationSnapshotHeader:
+    """
+    reads the whole snapshot once, raises ValueError for a corrupted file or a header that does not match the holders.
+    """
+    header = read_migration_snapshot_header(path)
+    # the balance is the second field of a record.
+    balance_start = RECORD_FIELDS[0][1]
+    balance_end = balance_start + RECORD_FIELDS[1][1]
+    holders_count = 0
+    balances = 0
+    for payload in _iter_payloads(path):
+        holders_count += len(payload) // RECORD_SIZE
+        balances += sum(
+            int.from_bytes(
+                payload[offset + balance_start : offset + balance_end], "big"
+            )
+            for offset in range(0, len(payload), RECORD_SIZE)
+        )
+    if holders_count != header.holders_count or balances != header.total_supply:
+        raise ValueError("the holders of the snapshot do not match its header")
+    return header
@@ -0,0 +1,195 @@
+from pathlib import Path
+from typing import Union
+
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+from pydantic import BaseModel
+
+from QMatic.adapters import (
+    balance_locking_mechanism_of_id,
+    balance_of,
+    batch_mint_migrated_holders,
+    batch_read_for_addresses,
+    deactivate_balance_locking_mechanism,
+    initializing_active_balance_locking_mechanism,
+    last_mechanism_id,
+    mechanism_status,
+    total_supply,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.adapters.multicall import DEFAULT_MULTICALL_BATCH_SIZE
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure, MigratedHolder
+
+from .codec import iter_migration_snapshot, verify_migration_snapshot
+from .snapshot import MigrationSnapshotHeader
+
+DEFAULT_MIGRATION_BATCH_SIZE: int = 200
+
+
+class MigrationReport(BaseModel):
+    holders: int
+    locked_holders: int
+    transactions: int
+    total_supply: int
+
+
+def _replay_mechanisms(
+    header: MigrationSnapshotHeader,
+    successor_contract: ProjectContract,
+    caller: Account,
+) -> int:
+    """
+    initializes the mechanisms of the snapshot on `successor_contract` in the order of their ids,
+    the already initialized ones (of a resumed import) must be the same as the snapshot.
+    """
+    transactions = 0
+    initialized_count = last_mechanism_id(
+        qmatic_contract=successor_contract, caller=caller
+    )
+    if initialized_count > len(header.mechanisms):
+        raise RuntimeError("the successor has more mechanisms than the snapshot")
+    for mechanism_id, mechanism in enumerate(header.mechanisms, start=1):
+        if mechanism_id <= initialized_count:
+            if (
+                balance_locking_mechanism_of_id(
+                    qmatic_contract=successor_contract,
+                    mechanism_id=mechanism_id,
+                    caller=caller,
+                )
+                != mechanism
+            ):
+                raise RuntimeError(
+                    f"the mechanism {mechanism_id} of the successor is different"
+                )
+            continue
+        _, revert_exception = initializing_active_balance_locking_mechanism(
+            qmatic_contract=successor_contract, entries=mechanism, caller=caller
+        )
+        if revert_exception is not None:
+            raise RuntimeError(
+                f"initializing the mechanism {mechanism_id} reverted: {revert_exception.msg}"
+            )
+        transactions += 1
+    if not header.is_mechanism_activated and mechanism_status(
+        qmatic_contract=successor_contract, caller=caller
+    ):
+        deactivate_balance_locking_mechanism(
+            qmatic_contract=successor_contract, caller=caller
+        )
+        transactions += 1
+    return transactions
+
+
+def import_migration_snapshot(
+    path: Union[str, Path],
+    successor_contract: ProjectContract,
+    caller: Account,
+    batch_size: int = DEFAULT_MIGRATION_BATCH_SIZE,
+    first_holder: int = 0,
+    preflight: bool = False,
+) -> MigrationReport:
+    """
+    verifies the snapshot, replays the mechanisms registry and streams the holders into 'batchMintMigratedHolders' of `successor_contract`.
+    a failed batch raises RuntimeError with the index of its first holder, the import is resumed by passing it as `first_holder`.
+    the successor keeps accepting holders until `finish_migration`, which is called once `verify_migration` passes.
+    """
+    header = verify_migration_snapshot(path)
+    transactions = _replay_mechanisms(header, successor_contract, caller)
+    locked_holders = 0
+    holder_index = 0
+    batch: list[MigratedHolder] = []
+
+    def send(batch: list[MigratedHolder]) -> None:
+        _, revert_exception = batch_mint_migrated_holders(
+            qmatic_contract=successor_contract,
+            holders=batch,
+            caller=caller,
+            preflight=preflight,
+        )
+        if revert_exception is not None:
+            raise RuntimeError(
+                f"the batch of the holder {holder_index - len(batch)} reverted: {revert_exception.msg}"
+            )
+
+    for holders in iter_migration_snapshot(path):
+        for holder in holders:
+            holder_index += 1
+            if holder_index <= first_holder:
+                continue
+            batch.append(holder)
+            locked_holders += holder.started_date != 0
+            if len(batch) == batch_size:
+                send(batch)
+                transactions += 1
+                batch = []
+    if batch:
+        send(batch)
+        transactions += 1
+    return MigrationReport(
+        holders=header.holders_count - first_holder,
+        locked_holders=locked_holders,
+        transactions=transactions,
+        total_supply=header.total_supply,
+    )
+
+
+def verify_migration(
+    path: Union[str, Path],
+    successor_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    caller: Account,
+    batch_size: int = DEFAULT_MULTICALL_BATCH_SIZE,
+) -> list[str]:
+    """
+    the holders whose balance or lock record on `successor_contract` is different from the snapshot,
+    an empty list means that the successor holds exactly the snapshot.
+    """
+    header = verify_migration_snapshot(path)
+    mismatched: list[str] = []
+    for holders in iter_migration_snapshot(path):
+        addresses = [holder.account for holder in holders]
+        balances = batch_read_for_addresses(
+            qmatic_contract=successor_contract,
+            multicall_contract=multicall_contract,
+            adapter=balance_of,
+            addresses=addresses,
+            caller=caller,
+            batch_size=batch_size,
+        )
+        locks = batch_read_for_addresses(
+            qmatic_contract=successor_contract,
+            multicall_contract=multicall_contract,
+            adapter=wallet_affected_by_locking_mechanism_state,
+            addresses=addresses,
+            caller=caller,
+            batch_size=batch_size,
+        )
+        for holder in holders:
+            lock = locks[holder.account]
+            expected_mechanism = (
+                header.mechanisms[holder.mechanism_id - 1]
+                if holder.started_date != 0
+                else GeneralActiveBalanceLockingMechanismStructure()
+            )
+            if (
+                balances[holder.account],
+                lock.started_date,
+                lock.total_affected_tokens,
+                lock.linear_release_tokens_per_period,
+                lock.mechanism,
+            ) != (
+                holder.balance,
+                holder.started_date,
+                holder.total_affected_tokens,
+                holder.linear_release_tokens_per_period,
+                expected_mechanism,
+            ):
+                mismatched.append(holder.account)
+    if (
+        total_supply(qmatic_contract=successor_contract, caller=caller)
+        != header.total_supply
+    ):
+        raise RuntimeError(
+            "the total supply of the successor is different from the snapshot"
+        )
+    return mismatched
@@ -0,0 +1,223 @@
+from typing import Any, Union
+
+from brownie import web3
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+from pydantic import BaseModel
+
+from QMatic.adapters import (
+    balance_locking_mechanism_of_id,
+    balance_of,
+    batch_read,
+    batch_read_for_addresses,
+    last_mechanism_id,
+    mechanism_status,
+    total_supply,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.adapters.multicall import DEFAULT_MULTICALL_BATCH_SIZE
+from QMatic.schemas import (
+    GeneralActiveBalanceLockingMechanismStructure,
+    MigratedHolder,
+    RevertedMessage,
+    decode_raw_log,
+)
+from QMatic.schemas.decoder import (
+    INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC,
+    TRANSFER_TOPIC,
+    UPGRADING_QMATIC_TOPIC,
+)
+from QMatic.schemas.event import InvestmentWithLockingMechanismScenario, Transfer
+
+DEFAULT_SNAPSHOT_BLOCK_RANGE: int = 2_000
+
+SNAPSHOT_TOPICS: tuple[bytes, ...] = (
+    TRANSFER_TOPIC,
+    INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC,
+    UPGRADING_QMATIC_TOPIC,
+)
+
+
+class MigrationSnapshotHeader(BaseModel):
+    """
+    the contract-wide state of a snapshot, `mechanisms[i]` is the registry entry of the mechanism id i + 1.
+    """
+
+    source_address: str
+    new_qmatic_address: str
+    block_number: int
+    upgrade_date: int
+    total_supply: int
+    holders_count: int
+    is_mechanism_activated: bool
+    mechanisms: list[GeneralActiveBalanceLockingMechanismStructure]
+
+
+class _ScannedLogs:
+    def __init__(self) -> None:
+        # the holders in the order of their first incoming transfer.
+        self.holders: dict[str, None] = {}
+        self.investments: dict[str, InvestmentWithLockingMechanismScenario] = {}
+        self.upgrade_block: Union[int, None] = None
+        self.upgrade_log: Any = None
+
+
+def _scan_logs(
+    qmatic_contract: ProjectContract, start_block: int, block_range: int
+) -> _ScannedLogs:
+    """
+    the holders and the last investment of every account up to the 'UpgradingQMatic' block.
+    """
+    scanned = _ScannedLogs()
+    head = web3.eth.block_number
+    from_block = start_block
+    while from_block <= head and scanned.upgrade_block is None:
+        to_block = min(from_block + block_range - 1, head)
+        logs = web3.eth.get_logs(
+            {
+                "address": qmatic_contract.address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [["0x" + topic.hex() for topic in SNAPSHOT_TOPICS]],
+            }
+        )
+        for log in logs:
+            decoded = decode_raw_log(log)
+            if decoded is None:
+                continue
+            _, event = decoded
+            if isinstance(event, Transfer):
+                scanned.holders.setdefault(event.to_address)
+            elif isinstance(event, InvestmentWithLockingMechanismScenario):
+                scanned.investments[event.account_address] = event
+            else:
+                scanned.upgrade_block = log["blockNumber"]
+                scanned.upgrade_log = event
+                break
+        from_block = to_block + 1
+    return scanned
+
+
+def _raise_on_reverted(results: Any, what: str) -> None:
+    for result in results:
+        if isinstance(result, RevertedMessage):
+            raise RuntimeError(f"reading {what} reverted: {result.msg}")
+
+
+def build_migration_snapshot(
+    qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    caller: Account,
+    start_block: int = 0,
+    block_range: int = DEFAULT_SNAPSHOT_BLOCK_RANGE,
+    batch_size: int = DEFAULT_MULTICALL_BATCH_SIZE,
+) -> tuple[MigrationSnapshotHeader, list[MigratedHolder]]:
+    """
+    the balance and the lock record of every holder of a contract that is locked by 'contractLockingForUpgrade'.
+    the holders and the mechanism ids come from the logs, the state is read through `multicall_contract` at the pause block,
+    so the lock records cleared after the pause are still migrated. `multicall_contract` must be deployed before the pause block.
+    """
+    scanned = _scan_logs(qmatic_contract, start_block, block_range)
+    if scanned.upgrade_block is None:
+        raise RuntimeError(f"{qmatic_contract.address} is not locked for upgrade")
+    block_number = scanned.upgrade_block
+
+    contract_state = batch_read(
+        qmatic_contract=qmatic_contract,
+        multicall_contract=multicall_contract,
+        requests=[
+            (total_supply, None),
+            (last_mechanism_id, None),
+            (mechanism_status, None),
+        ],
+        caller=caller,
+        block_identifier=block_number,
+    )
+    _raise_on_reverted(contract_state, "the contract state")
+    supply, mechanisms_count, is_mechanism_activated = contract_state
+    mechanisms = batch_read(
+        qmatic_contract=qmatic_contract,
+        multicall_contract=multicall_contract,
+        requests=[
+            (balance_locking_mechanism_of_id, mechanism_id)
+            for mechanism_id in range(1, mechanisms_count + 1)
+        ],
+        caller=caller,
+        batch_size=batch_size,
+        block_identifier=block_number,
+    )
+    _raise_on_reverted(mechanisms, "the mechanisms registry")
+
+    addresses = list(scanned.holders)
+    balances = batch_read_for_addresses(
+        qmatic_contract=qmatic_contract,
+        multicall_contract=multicall_contract,
+        adapter=balance_of,
+        addresses=addresses,
+        caller=caller,
+        batch_size=batch_size,
+        block_identifier=block_number,
+    )
+    _raise_on_reverted(balances.values(), "the balances")
+    locks = batch_read_for_addresses(
+        qmatic_contract=qmatic_contract,
+        multicall_contract=multicall_contract,
+        adapter=wallet_affected_by_locking_mechanism_state,
+        addresses=addresses,
+        caller=caller,
+        batch_size=batch_size,
+        block_identifier=block_number,
+    )
+    _raise_on_reverted(locks.values(), "the lock records")
+
+    holders: list[MigratedHolder] = []
+    for address in addresses:
+        lock = locks[address]
+        if lock.started_date == 0:
+            if balances[address] != 0:
+                holders.append(
+                    MigratedHolder.construct(
+                        account=address,
+                        balance=balances[address],
+                        amount_of_invest_in_qmatic=0,
+                        started_date=0,
+                        total_affected_tokens=0,
+                        linear_release_tokens_per_period=0,
+                        mechanism_id=0,
+                    )
+                )
+            continue
+        investment = scanned.investments.get(address)
+        if (
+            investment is None
+            or investment.started_date != lock.started_date
+            or mechanisms[investment.mechanism_id - 1] != lock.mechanism
+        ):
+            raise RuntimeError(f"the lock record of {address} does not match its logs")
+        holders.append(
+            MigratedHolder.construct(
+                account=address,
+                balance=balances[address],
+                amount_of_invest_in_qmatic=investment.amount_of_invest_in_qmatic,
+                started_date=lock.started_date,
+                total_affected_tokens=lock.total_affected_tokens,
+                linear_release_tokens_per_period=lock.linear_release_tokens_per_period,
+                mechanism_id=investment.mechanism_id,
+            )
+        )
+
+    if sum(holder.balance for holder in holders) != supply:
+        raise RuntimeError(
+            "the balances of the holders do not add up to the total supply"
+        )
+    header = MigrationSnapshotHeader(
+        source_address=qmatic_contract.address,
+        new_qmatic_address=scanned.upgrade_log.new_token_contract_address,
+        block_number=block_number,
+        upgrade_date=scanned.upgrade_log.upgrade_date,
+        total_supply=supply,
+        holders_count=len(holders),
+        is_mechanism_activated=is_mechanism_activated,
+        mechanisms=mechanisms,
+    )
+    return header, holders
@@ -1,17 +1,34 @@
 from .base import RevertedMessage
+from .compact import to_compact, to_model
+from .decoder import (
+    compact_events_from_logs,
+    decode_raw_log,
+    decode_raw_log_compact,
+    events_from_logs,
+)
 from .event import Events
 from .struct import (
     AttachedLockingMechanismReleasingPeriodStructure,
     GeneralActiveBalanceLockingMechanismStructure,
     LinearReleaseShareStructure,
+    MigratedHolder,
     WalletBalanceLockingMechanism,
+    WalletLockingStatus,
 )
 
 __all__ = (
     "RevertedMessage",
     "Events",
+    "decode_raw_log",
+    "events_from_logs",
+    "decode_raw_log_compact",
+    "compact_events_from_logs",
+    "to_compact",
+    "to_model",
     "GeneralActiveBalanceLockingMechanismStructure",
     "WalletBalanceLockingMechanism",
+    "MigratedHolder",
     "LinearReleaseShareStructure",
     "AttachedLockingMechanismReleasingPeriodStructure",
+    "WalletLockingStatus",
 )
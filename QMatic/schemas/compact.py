@@ -0,0 +1,151 @@
+from typing import Any, NamedTuple, Union
+
+from pydantic import BaseModel
+
+from .defaults import (
+    BOOL_DEFAULT_VALUE,
+    BYTES32_DEFAULT_VALUE,
+    INT_DEFAULT_VALUE,
+    STRING_DEFAULT,
+    ZERO_ADDRESS,
+)
+from .event import (
+    AllocationsMerkleRootCommitted,
+    Approval,
+    BalanceLockingMechanismUpdateLog,
+    InvestmentWithLockingMechanismScenario,
+    LockingMechanismCleared,
+    Transfer,
+    UpgradingQMatic,
+)
+from .struct import (
+    AttachedLockingMechanismReleasingPeriodStructure,
+    GeneralActiveBalanceLockingMechanismStructure,
+    LinearReleaseShareStructure,
+    WalletBalanceLockingMechanism,
+)
+
+# tuple versions of the schemas for the hot paths (millions of logs or RPC results).
+# the fields have the names and the order of the pydantic models, an instance has no `__dict__` and no validation.
+# `tuple.__new__(CompactX, values)` is the trusted constructor for the values that already came from the ABI decoder,
+# it skips the argument handling of `CompactX(...)`.
+
+
+class CompactGeneralActiveBalanceLockingMechanismStructure(NamedTuple):
+    cliff_duration_in_days: int = INT_DEFAULT_VALUE
+    linear_release_period_in_days: int = INT_DEFAULT_VALUE
+    linear_release_dividend: int = INT_DEFAULT_VALUE
+    linear_release_divisor: int = INT_DEFAULT_VALUE
+    releasing_tge_dividend_on_100: int = INT_DEFAULT_VALUE
+
+
+class CompactWalletBalanceLockingMechanism(NamedTuple):
+    started_date: int = INT_DEFAULT_VALUE
+    total_affected_tokens: int = INT_DEFAULT_VALUE
+    linear_release_tokens_per_period: int = INT_DEFAULT_VALUE
+    mechanism: Union[CompactGeneralActiveBalanceLockingMechanismStructure, None] = None
+
+
+class CompactLinearReleaseShareStructure(NamedTuple):
+    divisor: int = INT_DEFAULT_VALUE
+    dividend: int = INT_DEFAULT_VALUE
+
+
+class CompactAttachedLockingMechanismReleasingPeriodStructure(NamedTuple):
+    period_in_days: int = INT_DEFAULT_VALUE
+    release_amount_per_period: int = INT_DEFAULT_VALUE
+
+
+class CompactBalanceLockingMechanismUpdateLog(NamedTuple):
+    mechanism_id: int = INT_DEFAULT_VALUE
+    cliff_duration_in_days: int = INT_DEFAULT_VALUE
+    linear_release_period_in_days: int = INT_DEFAULT_VALUE
+    linear_release_dividend: int = INT_DEFAULT_VALUE
+    linear_release_divisor: int = INT_DEFAULT_VALUE
+    releasing_tge__dividend_on_100: int = INT_DEFAULT_VALUE
+    is_active: bool = BOOL_DEFAULT_VALUE
+
+
+class CompactUpgradingQMatic(NamedTuple):
+    new_token_contract_address: str = ZERO_ADDRESS
+    upgrade_date: int = INT_DEFAULT_VALUE
+    event_report_url: str = STRING_DEFAULT
+
+
+class CompactInvestmentWithLockingMechanismScenario(NamedTuple):
+    mechanism_id: int = INT_DEFAULT_VALUE
+    account_address: str = ZERO_ADDRESS
+    started_date: int = INT_DEFAULT_VALUE
+    linear_release_tokens_per_period: int = INT_DEFAULT_VALUE
+    amount_of_invest_in_qmatic: int = INT_DEFAULT_VALUE
+    total_affected_tokens: int = INT_DEFAULT_VALUE
+
+
+class CompactLockingMechanismCleared(NamedTuple):
+    mechanism_id: int = INT_DEFAULT_VALUE
+    account_address: str = ZERO_ADDRESS
+
+
+class CompactAllocationsMerkleRootCommitted(NamedTuple):
+    merkle_root: str = BYTES32_DEFAULT_VALUE
+
+
+class CompactTransfer(NamedTuple):
+    from_address: str = ZERO_ADDRESS
+    to_address: str = ZERO_ADDRESS
+    value: int = INT_DEFAULT_VALUE
+
+
+class CompactApproval(NamedTuple):
+    owner: str = ZERO_ADDRESS
+    spender: str = ZERO_ADDRESS
+    value: int = INT_DEFAULT_VALUE
+
+
+# compact class -> pydantic model
+MODEL_OF_COMPACT: dict[type[NamedTuple], type[BaseModel]] = {
+    CompactGeneralActiveBalanceLockingMechanismStructure: GeneralActiveBalanceLockingMechanismStructure,
+    CompactWalletBalanceLockingMechanism: WalletBalanceLockingMechanism,
+    CompactLinearReleaseShareStructure: LinearReleaseShareStructure,
+    CompactAttachedLockingMechanismReleasingPeriodStructure: AttachedLockingMechanismReleasingPeriodStructure,
+    CompactBalanceLockingMechanismUpdateLog: BalanceLockingMechanismUpdateLog,
+    CompactUpgradingQMatic: UpgradingQMatic,
+    CompactInvestmentWithLockingMechanismScenario: InvestmentWithLockingMechanismScenario,
+    CompactLockingMechanismCleared: LockingMechanismCleared,
+    CompactAllocationsMerkleRootCommitted: AllocationsMerkleRootCommitted,
+    CompactTransfer: Transfer,
+    CompactApproval: Approval,
+}
+COMPACT_OF_MODEL: dict[type[BaseModel], type[NamedTuple]] = {
+    model: compact for compact, model in MODEL_OF_COMPACT.items()
+}
+
+
+# compact class -> its fields that hold a nested compact schema
+NESTED_FIELDS: dict[type[NamedTuple], tuple[str, ...]] = {
+    CompactWalletBalanceLockingMechanism: ("mechanism",),
+}
+
+
+def to_model(compact: Any) -> BaseModel:
+    """
+    the pydantic model of a compact schema, built without validation (`construct`).
+    """
+    values = compact._asdict()
+    for field_name in NESTED_FIELDS.get(type(compact), ()):
+        if values[field_name] is not None:
+            values[field_name] = to_model(values[field_name])
+    return MODEL_OF_COMPACT[type(compact)].construct(**values)
+
+
+def to_compact(model: BaseModel) -> Any:
+    """
+    the compact schema of a pydantic model.
+    """
+    compact_class = COMPACT_OF_MODEL[type(model)]
+    return compact_class._make(
+        to_compact(value) if type(value) in COMPACT_OF_MODEL else value
+        for value in (
+            getattr(model, field_name) for field_name in compact_class._fields
+        )
+    )
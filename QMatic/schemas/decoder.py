@@ -0,0 +1,210 @@
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, Union
+
+from pydantic import BaseModel
+
+from .compact import (
+    CompactAllocationsMerkleRootCommitted,
+    CompactApproval,
+    CompactBalanceLockingMechanismUpdateLog,
+    CompactInvestmentWithLockingMechanismScenario,
+    CompactLockingMechanismCleared,
+    CompactTransfer,
+    CompactUpgradingQMatic,
+    MODEL_OF_COMPACT,
+)
+from .event import Events
+
+# keccak256 of the event signatures.
+TRANSFER_TOPIC: bytes = bytes.fromhex(
+    "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+)
+APPROVAL_TOPIC: bytes = bytes.fromhex(
+    "8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+)
+INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC: bytes = bytes.fromhex(
+    "4504bfdd95a0c950344e90a1b144d8d86b700efb8ad06c2da9d6b09fb149f24f"
+)
+BALANCE_LOCKING_MECHANISM_UPDATE_LOG_TOPIC: bytes = bytes.fromhex(
+    "939263c4b477beca28fca9e97fbb32507544ef5493aaece678b777da94e9b08d"
+)
+UPGRADING_QMATIC_TOPIC: bytes = bytes.fromhex(
+    "3d3e26af052cc6349707403a1cbca79dd82c2d4beee523bd022b855508fc45d0"
+)
+LOCKING_MECHANISM_CLEARED_TOPIC: bytes = bytes.fromhex(
+    "984fd5b2bebf3da2419897a2ff7f64e7a2d3b6addf5af991e24556cac74f702a"
+)
+ALLOCATIONS_MERKLE_ROOT_COMMITTED_TOPIC: bytes = bytes.fromhex(
+    "753afaef42aedec27ae6af5686b46f75c7b4c63055b0e9cd9c777b117d00e217"
+)
+
+
+def _to_bytes(value: Union[bytes, str]) -> bytes:
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+@lru_cache(maxsize=65_536)
+def _address(word: bytes) -> str:
+    # the holders repeat a lot, so the checksum (one keccak per address) is cached.
+    # eth_utils is imported on the first decoded address, not with `QMatic.schemas`.
+    from eth_utils.address import to_checksum_address
+
+    return to_checksum_address(word[-20:])
+
+
+def _uint(data: bytes, index: int) -> int:
+    return int.from_bytes(data[32 * index : 32 * (index + 1)], "big")
+
+
+def _decode_transfer(topics: list[bytes], data: bytes) -> tuple:
+    return _address(topics[1]), _address(topics[2]), _uint(data, 0)
+
+
+def _decode_approval(topics: list[bytes], data: bytes) -> tuple:
+    return _address(topics[1]), _address(topics[2]), _uint(data, 0)
+
+
+def _decode_investment_with_locking_mechanism_scenario(
+    topics: list[bytes], data: bytes
+) -> tuple:
+    return (
+        int.from_bytes(topics[1], "big"),
+        _address(topics[2]),
+        _uint(data, 0),
+        _uint(data, 1),
+        _uint(data, 2),
+        _uint(data, 3),
+    )
+
+
+def _decode_balance_locking_mechanism_update_log(
+    topics: list[bytes], data: bytes
+) -> tuple:
+    return (
+        int.from_bytes(topics[1], "big"),
+        _uint(data, 0),
+        _uint(data, 1),
+        _uint(data, 2),
+        _uint(data, 3),
+        _uint(data, 4),
+        topics[2][-1] == 1,
+    )
+
+
+def _decode_upgrading_qmatic(topics: list[bytes], data: bytes) -> tuple:
+    # the string is a (offset, length, bytes) tail of the data.
+    offset = _uint(data, 2)
+    length = int.from_bytes(data[offset : offset + 32], "big")
+    return (
+        _address(data[:32]),
+        _uint(data, 1),
+        data[offset + 32 : offset + 32 + length].decode("utf-8"),
+    )
+
+
+def _decode_locking_mechanism_cleared(topics: list[bytes], data: bytes) -> tuple:
+    return int.from_bytes(topics[1], "big"), _address(topics[2])
+
+
+def _decode_allocations_merkle_root_committed(
+    topics: list[bytes], data: bytes
+) -> tuple:
+    return ("0x" + topics[1].hex(),)
+
+
+# topic0 -> (field of Events, compact schema, decoder of the topics and the data into the fields of the schema)
+EVENT_DECODERS: dict[
+    bytes, tuple[str, type[NamedTuple], Callable[[list[bytes], bytes], tuple]]
+] = {
+    TRANSFER_TOPIC: ("transfer", CompactTransfer, _decode_transfer),
+    APPROVAL_TOPIC: ("approval", CompactApproval, _decode_approval),
+    INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC: (
+        "investment_with_locking_mechanism_scenario",
+        CompactInvestmentWithLockingMechanismScenario,
+        _decode_investment_with_locking_mechanism_scenario,
+    ),
+    BALANCE_LOCKING_MECHANISM_UPDATE_LOG_TOPIC: (
+        "balance_locking_mechanism_update_log",
+        CompactBalanceLockingMechanismUpdateLog,
+        _decode_balance_locking_mechanism_update_log,
+    ),
+    UPGRADING_QMATIC_TOPIC: (
+        "contract_upgrade",
+        CompactUpgradingQMatic,
+        _decode_upgrading_qmatic,
+    ),
+    LOCKING_MECHANISM_CLEARED_TOPIC: (
+        "locking_mechanism_cleared",
+        CompactLockingMechanismCleared,
+        _decode_locking_mechanism_cleared,
+    ),
+    ALLOCATIONS_MERKLE_ROOT_COMMITTED_TOPIC: (
+        "allocations_merkle_root_committed",
+        CompactAllocationsMerkleRootCommitted,
+        _decode_allocations_merkle_root_committed,
+    ),
+}
+
+
+def _decode(log: Mapping[str, Any]) -> Union[tuple[str, type[NamedTuple], tuple], None]:
+    topics = [_to_bytes(topic) for topic in log["topics"]]
+    if not topics or topics[0] not in EVENT_DECODERS:
+        return None
+    field_name, compact_class, decoder = EVENT_DECODERS[topics[0]]
+    return field_name, compact_class, decoder(topics, _to_bytes(log["data"]))
+
+
+def decode_raw_log_compact(log: Mapping[str, Any]) -> Union[tuple[str, tuple], None]:
+    """
+    decodes a raw log of QMatic into its `Events` field name and compact schema (see `compact.py`).
+    None will be returned for the logs of the other events.
+    """
+    decoded = _decode(log)
+    if decoded is None:
+        return None
+    field_name, compact_class, values = decoded
+    return field_name, tuple.__new__(compact_class, values)
+
+
+def decode_raw_log(log: Mapping[str, Any]) -> Union[tuple[str, BaseModel], None]:
+    """
+    decodes a raw (eth_getLogs / receipt) log of QMatic into its `Events` field name and event model.
+    None will be returned for the logs of the other events.
+    the fields are sliced from the topics and the data words without pydantic validation.
+    """
+    decoded = _decode(log)
+    if decoded is None:
+        return None
+    field_name, compact_class, values = decoded
+    return field_name, MODEL_OF_COMPACT[compact_class].construct(
+        **dict(zip(compact_class._fields, values))
+    )
+
+
+def events_from_logs(logs: Iterable[Mapping[str, Any]]) -> Events:
+    """
+    drop-in alternative of `Events.from_tx(tx.events)` that works on the raw logs (e.g. `tx.logs`).
+    """
+    # the values are lists of the event models of their fields, `construct` does not check them.
+    decoded_events: dict[str, Any] = {}
+    for log in logs:
+        decoded = decode_raw_log(log)
+        if decoded is not None:
+            decoded_events.setdefault(decoded[0], []).append(decoded[1])
+    return Events.construct(**decoded_events)
+
+
+def compact_events_from_logs(
+    logs: Iterable[Mapping[str, Any]]
+) -> dict[str, list[tuple]]:
+    """
+    the compact schemas of the raw logs grouped by the `Events` field names, for the log streams that do not need the models.
+    """
+    decoded_events: dict[str, list[tuple]] = {}
+    for log in logs:
+        decoded = decode_raw_log_compact(log)
+        if decoded is not None:
+            decoded_events.setdefault(decoded[0], []).append(decoded[1])
+    return decoded_events
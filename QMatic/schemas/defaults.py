@@ -0,0 +1,6 @@
+# the default values of the schemas, kept free of brownie so `QMatic.schemas` imports with pydantic only.
+ZERO_ADDRESS: str = "0x0000000000000000000000000000000000000000"
+INT_DEFAULT_VALUE: int = 0
+BOOL_DEFAULT_VALUE: bool = False
+STRING_DEFAULT: str = "https://QPOKER.io/"
+BYTES32_DEFAULT_VALUE: str = "0x" + "00" * 32
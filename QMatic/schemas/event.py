@@ -1,9 +1,14 @@
 from typing import Union
 
-from brownie import ZERO_ADDRESS
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 
-from QMatic.tests.constants import BOOL_DEFAULT_VALUE, INT_DEFAULT_VALUE, STRING_DEFAULT
+from .defaults import (
+    BOOL_DEFAULT_VALUE,
+    BYTES32_DEFAULT_VALUE,
+    INT_DEFAULT_VALUE,
+    STRING_DEFAULT,
+    ZERO_ADDRESS,
+)
 
 
 class BalanceLockingMechanismUpdateLog(BaseModel):
@@ -41,6 +46,20 @@ class InvestmentWithLockingMechanismScenario(BaseModel):
     total_affected_tokens: int = Field(INT_DEFAULT_VALUE, alias="totalAffectedTokens")
 
 
+class LockingMechanismCleared(BaseModel):
+    mechanism_id: int = Field(INT_DEFAULT_VALUE, alias="mechanismId")
+    account_address: str = Field(ZERO_ADDRESS, alias="account")
+
+
+class AllocationsMerkleRootCommitted(BaseModel):
+    merkle_root: str = Field(BYTES32_DEFAULT_VALUE, alias="merkleRoot")
+
+    @validator("merkle_root", pre=True)
+    def _to_hex_string(cls, value: Union[bytes, str]) -> str:
+        # brownie decodes bytes32 as `HexString` (bytes), the models keep the '0x' prefixed lowercase hex.
+        return "0x" + bytes(value).hex() if isinstance(value, bytes) else value.lower()
+
+
 class Transfer(BaseModel):
     from_address: str = Field(ZERO_ADDRESS, alias="from")
     to_address: str = Field(ZERO_ADDRESS, alias="to")
@@ -66,6 +85,12 @@ class Events(BaseModel):
         None, alias="UpgradingQMatic"
     )
     approval: Union[list[Approval], None] = Field(None, alias="Approval")
+    locking_mechanism_cleared: Union[list[LockingMechanismCleared], None] = Field(
+        None, alias="LockingMechanismCleared"
+    )
+    allocations_merkle_root_committed: Union[
+        list[AllocationsMerkleRootCommitted], None
+    ] = Field(None, alias="AllocationsMerkleRootCommitted")
 
     @classmethod
     def from_tx(cls, obj_in: dict) -> "Events":
@@ -0,0 +1,19 @@
+# the revert messages of the QMatic contract, kept free of brownie so the runtime packages can check them.
+INVALID_LINEAR_RELEASE_DIVISOR_MESSAGE: str = "TF"
+INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE: str = "TF 2"
+LOCKING_MECHANISM_IS_NOT_ACTIVATED: str = "LM is not activated."
+WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM: str = "TF 3"
+BATCH_LENGTHS_MISMATCH_MESSAGE: str = "TF 4"
+WALLET_IS_NOT_FULLY_VESTED: str = "TF 5"
+UNKNOWN_MECHANISM_ID: str = "TF 6"
+ALLOCATION_IS_ALREADY_CLAIMED: str = "TF 7"
+INVALID_ALLOCATION_PROOF: str = "TF 8"
+MIGRATION_IS_FINISHED: str = "TF 9"
+MIGRATED_HOLDER_ALREADY_HAS_BALANCE: str = "TF 10"
+MIGRATED_LOCK_EXCEEDS_BALANCE: str = "TF 11"
+MECHANISM_IDS_ARE_EXHAUSTED: str = "TF 12"
+MEANINGLESS_LOCKING_MECHANISM_ERROR_MESSAGE: str = "meaningless locking"
+INVALID_LINEAR_RELEASE_PERIOD_IN_DAYS_MESSAGE: str = "LRPDID division on 0"
+ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE: str = "ERC20: transfer amount exceeds balance"
+# 'transferWithLocking' requires at least 10^5 wei.
+MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING: int = 100_000
@@ -1,9 +1,13 @@
 from typing import Union
 
-from brownie import ZERO_ADDRESS
 from pydantic import BaseModel, Field
 
-from QMatic.tests.constants import BOOL_DEFAULT_VALUE, INT_DEFAULT_VALUE, STRING_DEFAULT
+from .defaults import (
+    BOOL_DEFAULT_VALUE,
+    INT_DEFAULT_VALUE,
+    STRING_DEFAULT,
+    ZERO_ADDRESS,
+)
 
 
 class GeneralActiveBalanceLockingMechanismStructure(BaseModel):
@@ -21,6 +25,20 @@ class WalletBalanceLockingMechanism(BaseModel):
     mechanism: Union[GeneralActiveBalanceLockingMechanismStructure, None] = None
 
 
+class MigratedHolder(BaseModel):
+    """
+    one holder of the previous QMatic contract for `batchMintMigratedHolders`, `started_date == 0` means no lock record.
+    """
+
+    account: str = ZERO_ADDRESS
+    balance: int = INT_DEFAULT_VALUE
+    amount_of_invest_in_qmatic: int = INT_DEFAULT_VALUE
+    started_date: int = INT_DEFAULT_VALUE
+    total_affected_tokens: int = INT_DEFAULT_VALUE
+    linear_release_tokens_per_period: int = INT_DEFAULT_VALUE
+    mechanism_id: int = INT_DEFAULT_VALUE
+
+
 class LinearReleaseShareStructure(BaseModel):
     divisor: int = INT_DEFAULT_VALUE
     dividend: int = INT_DEFAULT_VALUE
@@ -29,3 +47,16 @@ class LinearReleaseShareStructure(BaseModel):
 class AttachedLockingMechanismReleasingPeriodStructure(BaseModel):
     period_in_days: int = INT_DEFAULT_VALUE
     release_amount_per_period: int = INT_DEFAULT_VALUE
+
+
+class WalletLockingStatus(BaseModel):
+    """
+    one entry of `getLockingStatusesOf`: the results of the four single-account lock getters.
+    """
+
+    remaining_blocked_tokens: int = INT_DEFAULT_VALUE
+    remaining_seconds_to_finishing_the_cliff: int = INT_DEFAULT_VALUE
+    period_in_days: int = INT_DEFAULT_VALUE
+    release_amount_per_period: int = INT_DEFAULT_VALUE
+    dividend: int = INT_DEFAULT_VALUE
+    divisor: int = INT_DEFAULT_VALUE
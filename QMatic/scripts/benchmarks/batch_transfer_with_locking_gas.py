@@ -0,0 +1,70 @@
+from brownie import accounts, chain, history, network
+from brownie._config import CONFIG
+
+from QMatic.adapters import batch_transfer_with_locking, transfer_with_locking
+from QMatic.constants import DEPLOYER_ACCOUNT_INDEX, MINIMUM_AMOUNT_TO_SELL
+from QMatic.scripts.deploy import deploy_locking_mechanism_first_round_qmatic_contract
+
+BATCH_SIZES: tuple[int, ...] = (1, 10, 100, 500)
+# the 500 recipients batch does not fit in the default 12M gas block of ganache.
+BENCHMARK_BLOCK_GAS_LIMIT: int = 120_000_000
+
+
+def _relaunch_development_chain(block_gas_limit: int) -> None:
+    # only the chain of this script gets the larger blocks, the tests keep the default block gas limit.
+    network.disconnect()
+    CONFIG.networks["development"]["cmd_settings"]["gas_limit"] = block_gas_limit
+    network.connect("development")
+
+
+def _recipients(count: int) -> list[str]:
+    # fresh addresses, every recipient pays the cold storage writes of a new investor.
+    return [accounts.add().address for _ in range(count)]
+
+
+def _single_transfers_gas(count: int) -> int:
+    qmatic_contract = deploy_locking_mechanism_first_round_qmatic_contract()
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    gas_used = 0
+    for recipient in _recipients(count):
+        transfer_with_locking(
+            qmatic_contract=qmatic_contract,
+            to=recipient,
+            amount=MINIMUM_AMOUNT_TO_SELL,
+            caller=deployer_account,
+        )
+        gas_used += history[-1].gas_used
+    chain.reset()
+    return gas_used
+
+
+def _batch_transfer_gas(count: int) -> int:
+    qmatic_contract = deploy_locking_mechanism_first_round_qmatic_contract()
+    _, revert_exception = batch_transfer_with_locking(
+        qmatic_contract=qmatic_contract,
+        recipients=_recipients(count),
+        amounts=[MINIMUM_AMOUNT_TO_SELL] * count,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    assert revert_exception is None, revert_exception
+    gas_used = history[-1].gas_used
+    chain.reset()
+    return gas_used
+
+
+def main() -> None:
+    """
+    per-recipient gas of 'transferWithLocking' against 'batchTransferWithLocking'.
+    the batch of 500 does not fit in a 30M gas block of polygon, the development chain is
+    relaunched with a larger block gas limit to measure it anyway.
+    """
+    _relaunch_development_chain(BENCHMARK_BLOCK_GAS_LIMIT)
+    print(
+        f"{'recipients':>10}  {'single (gas/recipient)':>22}  {'batch (gas/recipient)':>21}  {'saving':>7}"
+    )
+    for size in BATCH_SIZES:
+        single = _single_transfers_gas(size) / size
+        batch = _batch_transfer_gas(size) / size
+        print(
+            f"{size:>10}  {single:>22,.0f}  {batch:>21,.0f}  {1 - batch / single:>7.1%}"
+        )
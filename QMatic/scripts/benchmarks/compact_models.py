@@ -0,0 +1,78 @@
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, NamedTuple
+
+from QMatic.schemas.compact import CompactTransfer
+from QMatic.schemas.event import Transfer
+
+INSTANCES_COUNT: int = 200_000
+# the class as the decoder holds it, mypy does not match `tuple.__new__` to the field types of CompactTransfer itself.
+TRUSTED_COMPACT_TRANSFER: type[NamedTuple] = CompactTransfer
+
+# (from, to, value) -> instance
+CONSTRUCTORS: dict[str, Callable[[str, str, int], Any]] = {
+    "pydantic model (validated)": lambda from_address, to_address, value: Transfer.parse_obj(
+        {"from": from_address, "to": to_address, "value": value}
+    ),
+    "pydantic model (construct)": lambda from_address, to_address, value: Transfer.construct(
+        from_address=from_address, to_address=to_address, value=value
+    ),
+    "compact (CompactTransfer(...))": CompactTransfer,
+    "compact (trusted, tuple.__new__)": lambda from_address, to_address, value: tuple.__new__(
+        TRUSTED_COMPACT_TRANSFER, (from_address, to_address, value)
+    ),
+}
+
+
+def _measure(
+    constructor: Callable[[str, str, int], Any], rows: list[tuple[str, str, int]]
+) -> tuple[float, int, int]:
+    """
+    construction time in seconds, allocated blocks and bytes that are kept by the instances.
+    """
+    gc.collect()
+    started = time.perf_counter()
+    instances = [constructor(*row) for row in rows]
+    elapsed = time.perf_counter() - started
+    del instances
+    gc.collect()
+    tracemalloc.start()
+    instances = [constructor(*row) for row in rows]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    statistics = snapshot.statistics("filename")
+    del instances
+    return (
+        elapsed,
+        sum(statistic.count for statistic in statistics),
+        sum(statistic.size for statistic in statistics),
+    )
+
+
+def main() -> None:
+    """
+    construction time and memory of `Transfer` as a pydantic model against its compact (tuple) schema.
+    """
+    generator = random.Random(0)
+    addresses = ["0x" + generator.randbytes(20).hex() for _ in range(1_000)]
+    rows = [
+        (
+            generator.choice(addresses),
+            generator.choice(addresses),
+            generator.getrandbits(90),
+        )
+        for _ in range(INSTANCES_COUNT)
+    ]
+    print(f"{INSTANCES_COUNT:,} Transfer instances")
+    print(f"{'constructor':<36}{'instances/s':>14}{'blocks':>12}{'bytes/instance':>16}")
+    for name, constructor in CONSTRUCTORS.items():
+        elapsed, blocks, size = _measure(constructor, rows)
+        print(
+            f"{name:<36}{INSTANCES_COUNT / elapsed:>14,.0f}{blocks:>12,}{size / INSTANCES_COUNT:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import time
+from typing import Any, Callable
+
+from QMatic.schemas import events_from_logs
+from QMatic.scripts.synthetic_logs import generic_events_from_logs, synthetic_logs
+
+LOGS_COUNT: int = 100_000
+
+
+def _throughput(decoder: Callable[[list[dict[str, Any]]], Any], logs: list) -> float:
+    started = time.perf_counter()
+    decoder(logs)
+    return len(logs) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """
+    logs per second of the generic decoding (eth-event + validated pydantic models through aliases)
+    against the raw-log decoder, over a synthetic mix of QMatic logs.
+    """
+    logs = synthetic_logs(LOGS_COUNT)
+    generic = _throughput(generic_events_from_logs, logs)
+    raw = _throughput(events_from_logs, logs)
+    print(f"{LOGS_COUNT:,} synthetic logs")
+    print(f"generic decoder  {generic:>12,.0f} logs/s")
+    print(f"raw-log decoder  {raw:>12,.0f} logs/s")
+    print(f"speedup          {raw / generic:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
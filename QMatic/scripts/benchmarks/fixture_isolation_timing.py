@@ -0,0 +1,44 @@
+import time
+
+from brownie import chain
+
+from QMatic.scripts.deploy import deploy_locking_mechanism_first_round_qmatic_contract
+
+ITERATIONS: int = 30
+
+
+def _redeploying_per_test() -> float:
+    """
+    the previous fixtures: deploy, mint and initialize the mechanism for every test and reset the chain afterwards.
+    """
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        deploy_locking_mechanism_first_round_qmatic_contract()
+        chain.reset()
+    return time.perf_counter() - started
+
+
+def _snapshot_and_revert_per_test() -> float:
+    """
+    the current fixtures: seed the contract once and revert to the snapshot after every test.
+    """
+    started = time.perf_counter()
+    deploy_locking_mechanism_first_round_qmatic_contract()
+    chain.snapshot()
+    for _ in range(ITERATIONS):
+        chain.revert()
+    chain.reset()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    redeploying = _redeploying_per_test()
+    reverting = _snapshot_and_revert_per_test()
+    print(f"{ITERATIONS} tests using 'locking_mechanism_first_round_qmatic_contract'")
+    print(
+        f"redeploying per test      {redeploying:>8.2f} s  {redeploying / ITERATIONS * 1e3:>8.1f} ms/test"
+    )
+    print(
+        f"snapshot/revert per test  {reverting:>8.2f} s  {reverting / ITERATIONS * 1e3:>8.1f} ms/test"
+    )
+    print(f"speedup                   {redeploying / reverting:>8.1f}x")
@@ -0,0 +1,336 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from brownie import accounts, chain, history
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    approve_to_spend_tokens_by_agent,
+    batch_transfer_with_locking,
+    clear_fully_vested_locking_mechanism_of,
+    contract_locking_for_upgrade,
+    deactivate_balance_locking_mechanism,
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    mint,
+    normal_transfer,
+    transfer_from_user_by_approved_agent,
+    transfer_with_locking,
+)
+from QMatic.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+    YEAR_IN_DAYS,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.scripts.deploy import deploy_locking_mechanism_first_round_qmatic_contract
+
+BASELINE_PATH: Path = Path(__file__).with_name("gas_baseline.json")
+# the gas of a call is deterministic, so any increase above the rounding of a compiler change is a regression.
+DEFAULT_REGRESSION_THRESHOLD: float = 0.01
+MIGRATION_REPORT_URL: str = "https://qpoker.io/migration"
+LOCKED_AMOUNT: int = 100 * MINIMUM_AMOUNT_TO_SELL
+# days after 'transferWithLocking' of the first round mechanism (3 months cliff, 15% TGE, 10% per month).
+IN_CLIFF_DAYS: int = 1 * MONTH_IN_DAYS
+MID_VESTING_DAYS: int = 6 * MONTH_IN_DAYS
+FULLY_VESTED_DAYS: int = 2 * YEAR_IN_DAYS
+
+# a scenario sends its setup transactions and then the measured call, the gas of its last transaction is recorded.
+GasScenario = Callable[[ProjectContract, Account, Account], Any]
+
+
+def _locked_investor(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+    days: int,
+) -> None:
+    transfer_with_locking(
+        qmatic_contract=qmatic_contract,
+        to=investor_account.address,
+        amount=LOCKED_AMOUNT,
+        caller=deployer_account,
+    )
+    development_push_date_of_contract(
+        qmatic_contract=qmatic_contract, days=days, caller=deployer_account
+    )
+
+
+def _transfer_from_locked_sender(days: int) -> GasScenario:
+    def scenario(
+        qmatic_contract: ProjectContract,
+        deployer_account: Account,
+        investor_account: Account,
+    ) -> Any:
+        _locked_investor(qmatic_contract, deployer_account, investor_account, days)
+        # ONE_WEI is within the TGE share, so the sender can transfer it at any point of the vesting.
+        return normal_transfer(
+            qmatic_contract=qmatic_contract,
+            to=deployer_account.address,
+            amount=ONE_WEI,
+            caller=investor_account,
+        )
+
+    return scenario
+
+
+def _clear_fully_vested(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    _locked_investor(
+        qmatic_contract, deployer_account, investor_account, FULLY_VESTED_DAYS
+    )
+    return clear_fully_vested_locking_mechanism_of(
+        qmatic_contract=qmatic_contract,
+        target_address=investor_account.address,
+        caller=deployer_account,
+    )
+
+
+def _batch_transfer_with_locking(
+    qmatic_contract: ProjectContract, deployer_account: Account, _: Account
+) -> Any:
+    recipients = [account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]]
+    return batch_transfer_with_locking(
+        qmatic_contract=qmatic_contract,
+        recipients=recipients,
+        amounts=[MINIMUM_AMOUNT_TO_SELL] * len(recipients),
+        caller=deployer_account,
+    )
+
+
+def _mint(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    return mint(
+        qmatic_contract=qmatic_contract,
+        to=investor_account.address,
+        amount=ONE_WEI,
+        caller=deployer_account,
+    )
+
+
+def _init_active_balance_locking_mechanism(
+    qmatic_contract: ProjectContract, deployer_account: Account, _: Account
+) -> Any:
+    return initializing_active_balance_locking_mechanism(
+        qmatic_contract=qmatic_contract,
+        entries=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=6 * MONTH_IN_DAYS,
+            linear_release_period_in_days=1 * MONTH_IN_DAYS,
+            linear_release_dividend=5,
+            linear_release_divisor=100,
+            releasing_tge_dividend_on_100=10,
+        ),
+        caller=deployer_account,
+    )
+
+
+def _deactivate_balance_locking_mechanism(
+    qmatic_contract: ProjectContract, deployer_account: Account, _: Account
+) -> Any:
+    return deactivate_balance_locking_mechanism(
+        qmatic_contract=qmatic_contract, caller=deployer_account
+    )
+
+
+def _contract_locking_for_upgrade(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    return contract_locking_for_upgrade(
+        qmatic_contract=qmatic_contract,
+        new_qmatic_address=investor_account.address,
+        report_url=MIGRATION_REPORT_URL,
+        caller=deployer_account,
+    )
+
+
+def _approve(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    return approve_to_spend_tokens_by_agent(
+        qmatic_contract=qmatic_contract,
+        spender_address=investor_account.address,
+        amount_spend=ONE_WEI,
+        caller=deployer_account,
+    )
+
+
+def _transfer_from(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    _approve(qmatic_contract, deployer_account, investor_account)
+    return transfer_from_user_by_approved_agent(
+        qmatic_contract=qmatic_contract,
+        from_address=deployer_account.address,
+        to_address=investor_account.address,
+        amount=ONE_WEI,
+        caller=investor_account,
+    )
+
+
+def _transfer_with_locking(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    return transfer_with_locking(
+        qmatic_contract=qmatic_contract,
+        to=investor_account.address,
+        amount=LOCKED_AMOUNT,
+        caller=deployer_account,
+    )
+
+
+def _transfer_from_unlocked_sender(
+    qmatic_contract: ProjectContract,
+    deployer_account: Account,
+    investor_account: Account,
+) -> Any:
+    return normal_transfer(
+        qmatic_contract=qmatic_contract,
+        to=investor_account.address,
+        amount=ONE_WEI,
+        caller=deployer_account,
+    )
+
+
+GAS_SCENARIOS: dict[str, GasScenario] = {
+    "mint": _mint,
+    "initActiveBalanceLockingMechanism": _init_active_balance_locking_mechanism,
+    "deactivateBalanceLockingMechanism": _deactivate_balance_locking_mechanism,
+    "contractLockingForUpgrade": _contract_locking_for_upgrade,
+    "approve": _approve,
+    "transferFrom": _transfer_from,
+    "transferWithLocking": _transfer_with_locking,
+    "batchTransferWithLocking (every investor account)": _batch_transfer_with_locking,
+    "clearFullyVestedLockingMechanismOf": _clear_fully_vested,
+    "transfer (unlocked sender)": _transfer_from_unlocked_sender,
+    "transfer (in-cliff sender)": _transfer_from_locked_sender(IN_CLIFF_DAYS),
+    "transfer (mid-vesting sender)": _transfer_from_locked_sender(MID_VESTING_DAYS),
+    # the first transfer of a fully vested sender deletes its lock record.
+    "transfer (fully vested sender)": _transfer_from_locked_sender(FULLY_VESTED_DAYS),
+}
+
+
+def measure_gas() -> dict[str, int]:
+    """
+    gas used by the measured call of every scenario, each one starts from the same freshly seeded contract.
+    """
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_account = accounts[INVESTOR_ACCOUNT_INDEX]
+    qmatic_contract = deploy_locking_mechanism_first_round_qmatic_contract()
+    chain.snapshot()
+    gas_used: dict[str, int] = {}
+    for name, scenario in GAS_SCENARIOS.items():
+        _, revert_exception = scenario(
+            qmatic_contract, deployer_account, investor_account
+        )
+        assert revert_exception is None, f"{name}: {revert_exception}"
+        gas_used[name] = history[-1].gas_used
+        chain.revert()
+    chain.reset()
+    return gas_used
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, int]:
+    if not path.exists():
+        raise FileNotFoundError(
+            f"no gas baseline is stored at {path}, "
+            "record it with `brownie run benchmarks/gas_regression update_baseline`"
+        )
+    return json.loads(path.read_text())
+
+
+def save_baseline(gas_used: dict[str, int], path: Path = BASELINE_PATH) -> None:
+    path.write_text(json.dumps(gas_used, indent=2) + "\n")
+
+
+def regressions(
+    gas_used: dict[str, int], baseline: dict[str, int], threshold: float
+) -> dict[str, tuple[int, int]]:
+    """
+    the (baseline, current) gas of the scenarios that cost more than `threshold` above their baseline.
+    """
+    return {
+        name: (baseline[name], gas)
+        for name, gas in gas_used.items()
+        if name in baseline and gas > baseline[name] * (1 + threshold)
+    }
+
+
+def unmatched_scenarios(
+    gas_used: dict[str, int], baseline: dict[str, int]
+) -> tuple[list[str], list[str]]:
+    """
+    the (added, removed) scenarios: measured without a baseline and stored in the baseline without a measurement.
+    """
+    added = [name for name in gas_used if name not in baseline]
+    removed = [name for name in baseline if name not in gas_used]
+    return added, removed
+
+
+def _print_report(gas_used: dict[str, int], baseline: dict[str, int]) -> None:
+    print(f"{'call':<52}{'baseline':>10}{'gas':>10}{'change':>9}")
+    for name, gas in gas_used.items():
+        if name in baseline:
+            change = f"{gas / baseline[name] - 1:>+9.2%}"
+            print(f"{name:<52}{baseline[name]:>10,}{gas:>10,}{change}")
+        else:
+            print(f"{name:<52}{'-':>10}{gas:>10,}{'new':>9}")
+    for name in baseline:
+        if name not in gas_used:
+            print(f"{name:<52}{baseline[name]:>10,}{'-':>10}{'removed':>9}")
+
+
+def update_baseline() -> None:
+    """
+    measures every scenario and overwrites the stored baseline.
+    """
+    gas_used = measure_gas()
+    _print_report(gas_used, load_baseline() if BASELINE_PATH.exists() else {})
+    save_baseline(gas_used)
+    print(f"baseline is written to {BASELINE_PATH}")
+
+
+def main(threshold: Union[str, float] = DEFAULT_REGRESSION_THRESHOLD) -> None:
+    """
+    gas of every QMatic entry point against the stored baseline, fails when one of them regresses more than `threshold`.
+    a missing baseline is an error, only `update_baseline` writes it, a scenario added or removed since the baseline fails as well.
+    """
+    threshold = float(threshold)
+    baseline = load_baseline()
+    gas_used = measure_gas()
+    _print_report(gas_used, baseline)
+    failures: list[str] = []
+    regressed = regressions(gas_used, baseline, threshold)
+    if regressed:
+        failures.append(
+            f"gas regressions above {threshold:.2%}: "
+            + ", ".join(
+                f"{name} {before:,} -> {after:,}"
+                for name, (before, after) in regressed.items()
+            )
+        )
+    added, removed = unmatched_scenarios(gas_used, baseline)
+    if added:
+        failures.append("scenarios without a baseline: " + ", ".join(added))
+    if removed:
+        failures.append("baseline scenarios no longer measured: " + ", ".join(removed))
+    if failures:
+        raise AssertionError("; ".join(failures))
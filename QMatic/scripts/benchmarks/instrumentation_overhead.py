@@ -0,0 +1,65 @@
+import time
+from typing import Any, Callable
+
+from brownie import accounts, chain
+
+from QMatic.adapters import balance_of
+from QMatic.adapters.instrumentation import HistogramSink, Instrumentation
+from QMatic.constants import DEPLOYER_ACCOUNT_INDEX
+from QMatic.scripts.deploy import deploy_minted_qmatic_contract
+
+NO_OP_CALLS: int = 1_000_000
+BALANCE_OF_CALLS: int = 2_000
+# the disabled wrapper must cost less than this share of one balance_of 'eth_call'.
+MAX_DISABLED_OVERHEAD: float = 0.01
+
+
+def _no_op(qmatic_contract: Any, account_address: str, caller: Any) -> None:
+    return None
+
+
+def _seconds_per_call(adapter: Callable[..., Any], args: tuple, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        adapter(*args)
+    return (time.perf_counter() - started) / calls
+
+
+def main() -> None:
+    """
+    cost of the instrumentation wrapper without sinks (disabled) and with an in-memory histogram (enabled).
+    """
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    qmatic_contract = deploy_minted_qmatic_contract()
+    args = (qmatic_contract, deployer_account.address, deployer_account)
+    instrumentation = Instrumentation()
+
+    # the wrapper alone, around a function that does nothing.
+    no_op = {"raw": _seconds_per_call(_no_op, args, NO_OP_CALLS)}
+    no_op["disabled"] = _seconds_per_call(
+        instrumentation.wrap(_no_op), args, NO_OP_CALLS
+    )
+    balance = {"raw": _seconds_per_call(balance_of, args, BALANCE_OF_CALLS)}
+    balance["disabled"] = _seconds_per_call(
+        instrumentation.wrap(balance_of), args, BALANCE_OF_CALLS
+    )
+
+    instrumentation.add_sink(HistogramSink())
+    no_op["enabled"] = _seconds_per_call(
+        instrumentation.wrap(_no_op), args, NO_OP_CALLS // 10
+    )
+    balance["enabled"] = _seconds_per_call(
+        instrumentation.wrap(balance_of), args, BALANCE_OF_CALLS
+    )
+    instrumentation.close()
+    chain.reset()
+
+    print(f"{'':<10}{'no-op (ns/call)':>18}{'balance_of (µs/call)':>24}")
+    for mode in ("raw", "disabled", "enabled"):
+        print(f"{mode:<10}{no_op[mode] * 1e9:>18,.0f}{balance[mode] * 1e6:>24,.1f}")
+    disabled_overhead = (no_op["disabled"] - no_op["raw"]) / balance["raw"]
+    print(
+        f"disabled wrapper: {disabled_overhead:.4%} of one balance_of call"
+        f" (limit {MAX_DISABLED_OVERHEAD:.0%})"
+    )
+    assert disabled_overhead < MAX_DISABLED_OVERHEAD
@@ -0,0 +1,52 @@
+from typing import Union
+
+from QMatic.load_test import LoadTestConfig, LoadTestReport, run_load_test
+
+
+def print_load_test_report(report: LoadTestReport) -> None:
+    print(
+        f"{report.investors:,} locked investors, seeded in {report.seeding_seconds:.1f} s"
+    )
+    print()
+    print(
+        f"{'day':>5}{'concurrency':>13}{'operations':>12}{'reverted':>10}{'tx/s':>10}"
+    )
+    for level in report.levels:
+        print(
+            f"{level.days:>5}{level.concurrency:>13}{level.operations:>12}"
+            f"{level.reverted:>10}{level.transactions_per_second:>10.1f}"
+        )
+    print()
+    print(
+        f"{'adapter':<38}{'calls':>7}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    for latency in report.latencies:
+        print(
+            f"{latency.adapter:<38}{latency.calls:>7}{latency.p50_ms:>9.1f}"
+            f"{latency.p90_ms:>9.1f}{latency.p99_ms:>9.1f}{latency.max_ms:>9.1f}"
+        )
+    print()
+    print(f"{'transaction':<38}{'count':>7}{'mean gas':>11}{'min':>10}{'max':>10}")
+    for gas in report.gas:
+        print(
+            f"{gas.transaction_type:<38}{gas.transactions:>7}{gas.mean:>11,.0f}"
+            f"{gas.min:>10,}{gas.max:>10,}"
+        )
+
+
+def main(
+    investors_count: Union[str, int] = 2_000,
+    active_investors_count: Union[str, int] = 200,
+) -> None:
+    """
+    throughput per concurrency level, latency percentiles per adapter and gas per transaction type
+    of a replayed investor workload over the vesting schedule.
+    """
+    print_load_test_report(
+        run_load_test(
+            LoadTestConfig(
+                investors_count=int(investors_count),
+                active_investors_count=int(active_investors_count),
+            )
+        )
+    )
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+from brownie import accounts, chain, history
+from brownie.network.contract import ProjectContract
+from brownie.project import compile_source
+
+from QMatic.adapters import (
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    mint,
+    normal_transfer,
+    transfer_with_locking,
+)
+from QMatic.constants import (
+    DEFAULT_MINT_AMOUNT,
+    DEPLOYER_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.scripts.deploy import deploy_locking_mechanism_first_round_qmatic_contract
+
+# the flattened QMatic before the registry, its wallets copy the 5-word mechanism into 8 slots each.
+PREVIOUS_LAYOUT_SOURCE_PATH: Path = (
+    Path(__file__).with_name("previous_layout") / "QMatic.sol"
+)
+
+
+def _deploy_previous_layout_qmatic_contract() -> ProjectContract:
+    source = PREVIOUS_LAYOUT_SOURCE_PATH.read_text()
+    # the same compiler settings as `brownie-config.yaml`.
+    previous_project = compile_source(
+        source, solc_version="0.8.17", optimize=True, runs=1000
+    )
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    qmatic_contract = previous_project.QMatic.deploy(True, {"from": deployer_account})
+    mint(
+        qmatic_contract=qmatic_contract,
+        to=deployer_account.address,
+        amount=DEFAULT_MINT_AMOUNT,
+        caller=deployer_account,
+    )
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=qmatic_contract,
+        entries=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=3 * MONTH_IN_DAYS,
+            linear_release_period_in_days=1 * MONTH_IN_DAYS,
+            linear_release_dividend=1,
+            linear_release_divisor=10,
+            releasing_tge_dividend_on_100=15,
+        ),
+        caller=deployer_account,
+    )
+    return qmatic_contract
+
+
+def _locking_storage_gas(qmatic_contract: ProjectContract) -> dict[str, int]:
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_account = accounts[1]
+    gas_used: dict[str, int] = {}
+
+    transfer_with_locking(
+        qmatic_contract=qmatic_contract,
+        to=investor_account.address,
+        amount=100 * MINIMUM_AMOUNT_TO_SELL,
+        caller=deployer_account,
+    )
+    gas_used["transferWithLocking"] = history[-1].gas_used
+
+    # after the cliff, a part of the tokens is released and can be transferred.
+    development_push_date_of_contract(
+        qmatic_contract=qmatic_contract,
+        days=6 * MONTH_IN_DAYS,
+        caller=deployer_account,
+    )
+    normal_transfer(
+        qmatic_contract=qmatic_contract,
+        to=accounts[2].address,
+        amount=ONE_WEI,
+        caller=investor_account,
+    )
+    gas_used["transfer from a locked wallet"] = history[-1].gas_used
+
+    normal_transfer(
+        qmatic_contract=qmatic_contract,
+        to=accounts[3].address,
+        amount=ONE_WEI,
+        caller=deployer_account,
+    )
+    gas_used["transfer from an unlocked wallet"] = history[-1].gas_used
+    chain.reset()
+    return gas_used
+
+
+def main() -> None:
+    """
+    measured gas of the calls that touch the per-wallet locking storage,
+    the previous layout (8 slots per wallet) against the registry layout (1 packed slot per wallet).
+    """
+    previous = _locking_storage_gas(_deploy_previous_layout_qmatic_contract())
+    registry = _locking_storage_gas(
+        deploy_locking_mechanism_first_round_qmatic_contract()
+    )
+
+    print(f"{'call':<34}{'previous':>10}{'registry':>10}{'saving':>9}")
+    for call, gas in registry.items():
+        print(
+            f"{call:<34}{previous[call]:>10,}{gas:>10,}{1 - gas / previous[call]:>9.1%}"
+        )
@@ -0,0 +1,92 @@
+import csv
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from QMatic.distribution import (
+    build_allocations_merkle_tree,
+    proof_of,
+    read_allocations,
+    verify_allocation_proof,
+    write_allocation_proofs,
+)
+from QMatic.distribution.merkle import NODE_SIZE
+
+ALLOCATIONS_COUNT: int = 1_000_000
+PROOF_LOOKUPS_COUNT: int = 1_000
+
+
+def _write_allocations_file(path: Path) -> None:
+    random.seed(0)
+    with path.open("w", newline="") as target:
+        writer = csv.writer(target)
+        writer.writerow(["address", "amount", "mechanism_id"])
+        for _ in range(ALLOCATIONS_COUNT):
+            writer.writerow(
+                [
+                    "0x" + os.urandom(20).hex(),
+                    random.randint(100 * 10**18, 7_000 * 10**18),
+                    random.randint(1, 3),
+                ]
+            )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        allocations_path = Path(directory) / "allocations.csv"
+        _write_allocations_file(allocations_path)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        tree = build_allocations_merkle_tree(
+            read_allocations(allocations_path), Path(directory) / "tree"
+        )
+        building = time.perf_counter() - started
+        _, building_peak = tracemalloc.get_traced_memory()
+
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        proofs_count = write_allocation_proofs(
+            tree,
+            read_allocations(allocations_path),
+            Path(directory) / "proofs.jsonl",
+        )
+        proving = time.perf_counter() - started
+        _, proving_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        leaves = (Path(directory) / "tree" / "level_0.bin").read_bytes()
+        started = time.perf_counter()
+        for index in random.sample(range(ALLOCATIONS_COUNT), PROOF_LOOKUPS_COUNT):
+            assert verify_allocation_proof(
+                leaves[index * NODE_SIZE : (index + 1) * NODE_SIZE],
+                proof_of(tree, index),
+                tree.root,
+            )
+        random_access = time.perf_counter() - started
+        proofs_size = (Path(directory) / "proofs.jsonl").stat().st_size
+        tree_size = sum(
+            path.stat().st_size for path in (Path(directory) / "tree").iterdir()
+        )
+
+    assert proofs_count == ALLOCATIONS_COUNT
+    print(f"{ALLOCATIONS_COUNT:,} allocations, depth {len(tree.levels_size) - 1}")
+    print(f"root 0x{tree.root.hex()}")
+    print(
+        f"build_allocations_merkle_tree  {building:>8.1f} s  peak {building_peak / 2**20:>6.1f} MiB"
+        f"  tree files {tree_size / 2**20:,.0f} MiB"
+    )
+    print(
+        f"write_allocation_proofs        {proving:>8.1f} s  peak {proving_peak / 2**20:>6.1f} MiB"
+        f"  proofs file {proofs_size / 2**20:,.0f} MiB"
+    )
+    print(
+        f"proof_of + verify_allocation_proof  {random_access / PROOF_LOOKUPS_COUNT * 10**6:>8.1f} µs/proof"
+    )
+
+
+if __name__ == "__main__":
+    main()
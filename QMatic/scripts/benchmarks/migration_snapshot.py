@@ -0,0 +1,95 @@
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from eth_utils.address import to_checksum_address
+
+from QMatic.migration import (
+    MigrationSnapshotHeader,
+    iter_migration_snapshot,
+    verify_migration_snapshot,
+    write_migration_snapshot,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure, MigratedHolder
+
+HOLDERS_COUNT: int = 200_000
+# one of every LOCKED_EVERY holders has a lock record.
+LOCKED_EVERY: int = 3
+
+
+def _holders() -> list[MigratedHolder]:
+    random.seed(0)
+    holders = []
+    for index in range(HOLDERS_COUNT):
+        total_affected_tokens = random.randint(100 * 10**18, 7_000 * 10**18)
+        is_locked = index % LOCKED_EVERY == 0
+        holders.append(
+            MigratedHolder.construct(
+                account=to_checksum_address(os.urandom(20)),
+                balance=random.randint(10**18, 10_000 * 10**18),
+                amount_of_invest_in_qmatic=total_affected_tokens if is_locked else 0,
+                started_date=1_672_531_200 + index if is_locked else 0,
+                total_affected_tokens=total_affected_tokens if is_locked else 0,
+                linear_release_tokens_per_period=(
+                    total_affected_tokens // 10 if is_locked else 0
+                ),
+                mechanism_id=1 if is_locked else 0,
+            )
+        )
+    return holders
+
+
+def main() -> None:
+    holders = _holders()
+    header = MigrationSnapshotHeader(
+        source_address=to_checksum_address(os.urandom(20)),
+        new_qmatic_address=to_checksum_address(os.urandom(20)),
+        block_number=1,
+        upgrade_date=1_700_000_000,
+        total_supply=sum(holder.balance for holder in holders),
+        holders_count=len(holders),
+        is_mechanism_activated=False,
+        mechanisms=[GeneralActiveBalanceLockingMechanismStructure()],
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "snapshot.bin"
+        started = time.perf_counter()
+        write_migration_snapshot(path, header, holders)
+        writing = time.perf_counter() - started
+
+        started = time.perf_counter()
+        verify_migration_snapshot(path)
+        verifying = time.perf_counter() - started
+
+        started = time.perf_counter()
+        streamed = sum(len(chunk) for chunk in iter_migration_snapshot(path))
+        streaming = time.perf_counter() - started
+        snapshot_size = path.stat().st_size
+
+        json_path = Path(directory) / "snapshot.jsonl"
+        started = time.perf_counter()
+        with json_path.open("w") as target:
+            for holder in holders:
+                target.write(json.dumps(holder.dict()) + "\n")
+        json_writing = time.perf_counter() - started
+        json_size = json_path.stat().st_size
+
+    assert streamed == HOLDERS_COUNT
+    print(f"{HOLDERS_COUNT:,} holders, 1 of {LOCKED_EVERY} locked")
+    print(
+        f"write_migration_snapshot      {writing:>8.2f} s  {snapshot_size / 2**20:>7.1f} MiB"
+        f"  {snapshot_size / HOLDERS_COUNT:>5.1f} B/holder"
+    )
+    print(f"verify_migration_snapshot     {verifying:>8.2f} s")
+    print(f"iter_migration_snapshot       {streaming:>8.2f} s")
+    print(
+        f"JSON lines (for comparison)   {json_writing:>8.2f} s  {json_size / 2**20:>7.1f} MiB"
+        f"  {json_size / HOLDERS_COUNT:>5.1f} B/holder"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1149 @@
+// SPDX-License-Identifier: MIT
+// File: @openzeppelin/contracts/token/ERC20/IERC20.sol
+
+// OpenZeppelin Contracts (last updated v4.6.0) (token/ERC20/IERC20.sol)
+
+pragma solidity ^0.8.0;
+
+/**
+ * @dev Interface of the ERC20 standard as defined in the EIP.
+ */
+interface IERC20 {
+    /**
+     * @dev Emitted when `value` tokens are moved from one account (`from`) to
+     * another (`to`).
+     *
+     * Note that `value` may be zero.
+     */
+    event Transfer(address indexed from, address indexed to, uint256 value);
+
+    /**
+     * @dev Emitted when the allowance of a `spender` for an `owner` is set by
+     * a call to {approve}. `value` is the new allowance.
+     */
+    event Approval(address indexed owner, address indexed spender, uint256 value);
+
+    /**
+     * @dev Returns the amount of tokens in existence.
+     */
+    function totalSupply() external view returns (uint256);
+
+    /**
+     * @dev Returns the amount of tokens owned by `account`.
+     */
+    function balanceOf(address account) external view returns (uint256);
+
+    /**
+     * @dev Moves `amount` tokens from the caller's account to `to`.
+     *
+     * Returns a boolean value indicating whether the operation succeeded.
+     *
+     * Emits a {Transfer} event.
+     */
+    function transfer(address to, uint256 amount) external returns (bool);
+
+    /**
+     * @dev Returns the remaining number of tokens that `spender` will be
+     * allowed to spend on behalf of `owner` through {transferFrom}. This is
+     * zero by default.
+     *
+     * This value changes when {approve} or {transferFrom} are called.
+     */
+    function allowance(address owner, address spender) external view returns (uint256);
+
+    /**
+     * @dev Sets `amount` as the allowance of `spender` over the caller's tokens.
+     *
+     * Returns a boolean value indicating whether the operation succeeded.
+     *
+     * IMPORTANT: Beware that changing an allowance with this method brings the risk
+     * that someone may use both the old and the new allowance by unfortunate
+     * transaction ordering. One possible solution to mitigate this race
+     * condition is to first reduce the spender's allowance to 0 and set the
+     * desired value afterwards:
+     * https://github.com/ethereum/EIPs/issues/20#issuecomment-263524729
+     *
+     * Emits an {Approval} event.
+     */
+    function approve(address spender, uint256 amount) external returns (bool);
+
+    /**
+     * @dev Moves `amount` tokens from `from` to `to` using the
+     * allowance mechanism. `amount` is then deducted from the caller's
+     * allowance.
+     *
+     * Returns a boolean value indicating whether the operation succeeded.
+     *
+     * Emits a {Transfer} event.
+     */
+    function transferFrom(
+        address from,
+        address to,
+        uint256 amount
+    ) external returns (bool);
+}
+
+// File: @openzeppelin/contracts/token/ERC20/extensions/IERC20Metadata.sol
+
+// 
+// OpenZeppelin Contracts v4.4.1 (token/ERC20/extensions/IERC20Metadata.sol)
+
+pragma solidity ^0.8.0;
+
+/**
+ * @dev Interface for the optional metadata functions from the ERC20 standard.
+ *
+ * _Available since v4.1._
+ */
+interface IERC20Metadata is IERC20 {
+    /**
+     * @dev Returns the name of the token.
+     */
+    function name() external view returns (string memory);
+
+    /**
+     * @dev Returns the symbol of the token.
+     */
+    function symbol() external view returns (string memory);
+
+    /**
+     * @dev Returns the decimals places of the token.
+     */
+    function decimals() external view returns (uint8);
+}
+
+// File: @openzeppelin/contracts/utils/Context.sol
+
+// 
+// OpenZeppelin Contracts v4.4.1 (utils/Context.sol)
+
+pragma solidity ^0.8.0;
+
+/**
+ * @dev Provides information about the current execution context, including the
+ * sender of the transaction and its data. While these are generally available
+ * via msg.sender and msg.data, they should not be accessed in such a direct
+ * manner, since when dealing with meta-transactions the account sending and
+ * paying for execution may not be the actual sender (as far as an application
+ * is concerned).
+ *
+ * This contract is only required for intermediate, library-like contracts.
+ */
+abstract contract Context {
+    function _msgSender() internal view virtual returns (address) {
+        return msg.sender;
+    }
+
+    function _msgData() internal view virtual returns (bytes calldata) {
+        return msg.data;
+    }
+}
+
+// File: @openzeppelin/contracts/token/ERC20/ERC20.sol
+
+// 
+// OpenZeppelin Contracts (last updated v4.7.0) (token/ERC20/ERC20.sol)
+
+pragma solidity ^0.8.0;
+
+
+
+/**
+ * @dev Implementation of the {IERC20} interface.
+ *
+ * This implementation is agnostic to the way tokens are created. This means
+ * that a supply mechanism has to be added in a derived contract using {_mint}.
+ * For a generic mechanism see {ERC20PresetMinterPauser}.
+ *
+ * TIP: For a detailed writeup see our guide
+ * https://forum.zeppelin.solutions/t/how-to-implement-erc20-supply-mechanisms/226[How
+ * to implement supply mechanisms].
+ *
+ * We have followed general OpenZeppelin Contracts guidelines: functions revert
+ * instead returning `false` on failure. This behavior is nonetheless
+ * conventional and does not conflict with the expectations of ERC20
+ * applications.
+ *
+ * Additionally, an {Approval} event is emitted on calls to {transferFrom}.
+ * This allows applications to reconstruct the allowance for all accounts just
+ * by listening to said events. Other implementations of the EIP may not emit
+ * these events, as it isn't required by the specification.
+ *
+ * Finally, the non-standard {decreaseAllowance} and {increaseAllowance}
+ * functions have been added to mitigate the well-known issues around setting
+ * allowances. See {IERC20-approve}.
+ */
+contract ERC20 is Context, IERC20, IERC20Metadata {
+    mapping(address => uint256) private _balances;
+
+    mapping(address => mapping(address => uint256)) private _allowances;
+
+    uint256 private _totalSupply;
+
+    string private _name;
+    string private _symbol;
+
+    /**
+     * @dev Sets the values for {name} and {symbol}.
+     *
+     * The default value of {decimals} is 18. To select a different value for
+     * {decimals} you should overload it.
+     *
+     * All two of these values are immutable: they can only be set once during
+     * construction.
+     */
+    constructor(string memory name_, string memory symbol_) {
+        _name = name_;
+        _symbol = symbol_;
+    }
+
+    /**
+     * @dev Returns the name of the token.
+     */
+    function name() public view virtual override returns (string memory) {
+        return _name;
+    }
+
+    /**
+     * @dev Returns the symbol of the token, usually a shorter version of the
+     * name.
+     */
+    function symbol() public view virtual override returns (string memory) {
+        return _symbol;
+    }
+
+    /**
+     * @dev Returns the number of decimals used to get its user representation.
+     * For example, if `decimals` equals `2`, a balance of `505` tokens should
+     * be displayed to a user as `5.05` (`505 / 10 ** 2`).
+     *
+     * Tokens usually opt for a value of 18, imitating the relationship between
+     * Ether and Wei. This is the value {ERC20} uses, unless this function is
+     * overridden;
+     *
+     * NOTE: This information is only used for _display_ purposes: it in
+     * no way affects any of the arithmetic of the contract, including
+     * {IERC20-balanceOf} and {IERC20-transfer}.
+     */
+    function decimals() public view virtual override returns (uint8) {
+        return 18;
+    }
+
+    /**
+     * @dev See {IERC20-totalSupply}.
+     */
+    function totalSupply() public view virtual override returns (uint256) {
+        return _totalSupply;
+    }
+
+    /**
+     * @dev See {IERC20-balanceOf}.
+     */
+    function balanceOf(address account) public view virtual override returns (uint256) {
+        return _balances[account];
+    }
+
+    /**
+     * @dev See {IERC20-transfer}.
+     *
+     * Requirements:
+     *
+     * - `to` cannot be the zero address.
+     * - the caller must have a balance of at least `amount`.
+     */
+    function transfer(address to, uint256 amount) public virtual override returns (bool) {
+        address owner = _msgSender();
+        _transfer(owner, to, amount);
+        return true;
+    }
+
+    /**
+     * @dev See {IERC20-allowance}.
+     */
+    function allowance(address owner, address spender) public view virtual override returns (uint256) {
+        return _allowances[owner][spender];
+    }
+
+    /**
+     * @dev See {IERC20-approve}.
+     *
+     * NOTE: If `amount` is the maximum `uint256`, the allowance is not updated on
+     * `transferFrom`. This is semantically equivalent to an infinite approval.
+     *
+     * Requirements:
+     *
+     * - `spender` cannot be the zero address.
+     */
+    function approve(address spender, uint256 amount) public virtual override returns (bool) {
+        address owner = _msgSender();
+        _approve(owner, spender, amount);
+        return true;
+    }
+
+    /**
+     * @dev See {IERC20-transferFrom}.
+     *
+     * Emits an {Approval} event indicating the updated allowance. This is not
+     * required by the EIP. See the note at the beginning of {ERC20}.
+     *
+     * NOTE: Does not update the allowance if the current allowance
+     * is the maximum `uint256`.
+     *
+     * Requirements:
+     *
+     * - `from` and `to` cannot be the zero address.
+     * - `from` must have a balance of at least `amount`.
+     * - the caller must have allowance for ``from``'s tokens of at least
+     * `amount`.
+     */
+    function transferFrom(
+        address from,
+        address to,
+        uint256 amount
+    ) public virtual override returns (bool) {
+        address spender = _msgSender();
+        _spendAllowance(from, spender, amount);
+        _transfer(from, to, amount);
+        return true;
+    }
+
+    /**
+     * @dev Atomically increases the allowance granted to `spender` by the caller.
+     *
+     * This is an alternative to {approve} that can be used as a mitigation for
+     * problems described in {IERC20-approve}.
+     *
+     * Emits an {Approval} event indicating the updated allowance.
+     *
+     * Requirements:
+     *
+     * - `spender` cannot be the zero address.
+     */
+    function increaseAllowance(address spender, uint256 addedValue) public virtual returns (bool) {
+        address owner = _msgSender();
+        _approve(owner, spender, allowance(owner, spender) + addedValue);
+        return true;
+    }
+
+    /**
+     * @dev Atomically decreases the allowance granted to `spender` by the caller.
+     *
+     * This is an alternative to {approve} that can be used as a mitigation for
+     * problems described in {IERC20-approve}.
+     *
+     * Emits an {Approval} event indicating the updated allowance.
+     *
+     * Requirements:
+     *
+     * - `spender` cannot be the zero address.
+     * - `spender` must have allowance for the caller of at least
+     * `subtractedValue`.
+     */
+    function decreaseAllowance(address spender, uint256 subtractedValue) public virtual returns (bool) {
+        address owner = _msgSender();
+        uint256 currentAllowance = allowance(owner, spender);
+        require(currentAllowance >= subtractedValue, "ERC20: decreased allowance below zero");
+        unchecked {
+            _approve(owner, spender, currentAllowance - subtractedValue);
+        }
+
+        return true;
+    }
+
+    /**
+     * @dev Moves `amount` of tokens from `from` to `to`.
+     *
+     * This internal function is equivalent to {transfer}, and can be used to
+     * e.g. implement automatic token fees, slashing mechanisms, etc.
+     *
+     * Emits a {Transfer} event.
+     *
+     * Requirements:
+     *
+     * - `from` cannot be the zero address.
+     * - `to` cannot be the zero address.
+     * - `from` must have a balance of at least `amount`.
+     */
+    function _transfer(
+        address from,
+        address to,
+        uint256 amount
+    ) internal virtual {
+        require(from != address(0), "ERC20: transfer from the zero address");
+        require(to != address(0), "ERC20: transfer to the zero address");
+
+        _beforeTokenTransfer(from, to, amount);
+
+        uint256 fromBalance = _balances[from];
+        require(fromBalance >= amount, "ERC20: transfer amount exceeds balance");
+        unchecked {
+            _balances[from] = fromBalance - amount;
+        }
+        _balances[to] += amount;
+
+        emit Transfer(from, to, amount);
+
+        _afterTokenTransfer(from, to, amount);
+    }
+
+    /** @dev Creates `amount` tokens and assigns them to `account`, increasing
+     * the total supply.
+     *
+     * Emits a {Transfer} event with `from` set to the zero address.
+     *
+     * Requirements:
+     *
+     * - `account` cannot be the zero address.
+     */
+    function _mint(address account, uint256 amount) internal virtual {
+        require(account != address(0), "ERC20: mint to the zero address");
+
+        _beforeTokenTransfer(address(0), account, amount);
+
+        _totalSupply += amount;
+        _balances[account] += amount;
+        emit Transfer(address(0), account, amount);
+
+        _afterTokenTransfer(address(0), account, amount);
+    }
+
+    /**
+     * @dev Destroys `amount` tokens from `account`, reducing the
+     * total supply.
+     *
+     * Emits a {Transfer} event with `to` set to the zero address.
+     *
+     * Requirements:
+     *
+     * - `account` cannot be the zero address.
+     * - `account` must have at least `amount` tokens.
+     */
+    function _burn(address account, uint256 amount) internal virtual {
+        require(account != address(0), "ERC20: burn from the zero address");
+
+        _beforeTokenTransfer(account, address(0), amount);
+
+        uint256 accountBalance = _balances[account];
+        require(accountBalance >= amount, "ERC20: burn amount exceeds balance");
+        unchecked {
+            _balances[account] = accountBalance - amount;
+        }
+        _totalSupply -= amount;
+
+        emit Transfer(account, address(0), amount);
+
+        _afterTokenTransfer(account, address(0), amount);
+    }
+
+    /**
+     * @dev Sets `amount` as the allowance of `spender` over the `owner` s tokens.
+     *
+     * This internal function is equivalent to `approve`, and can be used to
+     * e.g. set automatic allowances for certain subsystems, etc.
+     *
+     * Emits an {Approval} event.
+     *
+     * Requirements:
+     *
+     * - `owner` cannot be the zero address.
+     * - `spender` cannot be the zero address.
+     */
+    function _approve(
+        address owner,
+        address spender,
+        uint256 amount
+    ) internal virtual {
+        require(owner != address(0), "ERC20: approve from the zero address");
+        require(spender != address(0), "ERC20: approve to the zero address");
+
+        _allowances[owner][spender] = amount;
+        emit Approval(owner, spender, amount);
+    }
+
+    /**
+     * @dev Updates `owner` s allowance for `spender` based on spent `amount`.
+     *
+     * Does not update the allowance amount in case of infinite allowance.
+     * Revert if not enough allowance is available.
+     *
+     * Might emit an {Approval} event.
+     */
+    function _spendAllowance(
+        address owner,
+        address spender,
+        uint256 amount
+    ) internal virtual {
+        uint256 currentAllowance = allowance(owner, spender);
+        if (currentAllowance != type(uint256).max) {
+            require(currentAllowance >= amount, "ERC20: insufficient allowance");
+            unchecked {
+                _approve(owner, spender, currentAllowance - amount);
+            }
+        }
+    }
+
+    /**
+     * @dev Hook that is called before any transfer of tokens. This includes
+     * minting and burning.
+     *
+     * Calling conditions:
+     *
+     * - when `from` and `to` are both non-zero, `amount` of ``from``'s tokens
+     * will be transferred to `to`.
+     * - when `from` is zero, `amount` tokens will be minted for `to`.
+     * - when `to` is zero, `amount` of ``from``'s tokens will be burned.
+     * - `from` and `to` are never both zero.
+     *
+     * To learn more about hooks, head to xref:ROOT:extending-contracts.adoc#using-hooks[Using Hooks].
+     */
+    function _beforeTokenTransfer(
+        address from,
+        address to,
+        uint256 amount
+    ) internal virtual {}
+
+    /**
+     * @dev Hook that is called after any transfer of tokens. This includes
+     * minting and burning.
+     *
+     * Calling conditions:
+     *
+     * - when `from` and `to` are both non-zero, `amount` of ``from``'s tokens
+     * has been transferred to `to`.
+     * - when `from` is zero, `amount` tokens have been minted for `to`.
+     * - when `to` is zero, `amount` of ``from``'s tokens have been burned.
+     * - `from` and `to` are never both zero.
+     *
+     * To learn more about hooks, head to xref:ROOT:extending-contracts.adoc#using-hooks[Using Hooks].
+     */
+    function _afterTokenTransfer(
+        address from,
+        address to,
+        uint256 amount
+    ) internal virtual {}
+}
+
+// File: @openzeppelin/contracts/token/ERC20/extensions/ERC20Burnable.sol
+
+// 
+// OpenZeppelin Contracts (last updated v4.5.0) (token/ERC20/extensions/ERC20Burnable.sol)
+
+pragma solidity ^0.8.0;
+
+
+/**
+ * @dev Extension of {ERC20} that allows token holders to destroy both their own
+ * tokens and those that they have an allowance for, in a way that can be
+ * recognized off-chain (via event analysis).
+ */
+abstract contract ERC20Burnable is Context, ERC20 {
+    /**
+     * @dev Destroys `amount` tokens from the caller.
+     *
+     * See {ERC20-_burn}.
+     */
+    function burn(uint256 amount) public virtual {
+        _burn(_msgSender(), amount);
+    }
+
+    /**
+     * @dev Destroys `amount` tokens from `account`, deducting from the caller's
+     * allowance.
+     *
+     * See {ERC20-_burn} and {ERC20-allowance}.
+     *
+     * Requirements:
+     *
+     * - the caller must have allowance for ``accounts``'s tokens of at least
+     * `amount`.
+     */
+    function burnFrom(address account, uint256 amount) public virtual {
+        _spendAllowance(account, _msgSender(), amount);
+        _burn(account, amount);
+    }
+}
+
+// File: @openzeppelin/contracts/security/Pausable.sol
+
+// 
+// OpenZeppelin Contracts (last updated v4.7.0) (security/Pausable.sol)
+
+pragma solidity ^0.8.0;
+
+/**
+ * @dev Contract module which allows children to implement an emergency stop
+ * mechanism that can be triggered by an authorized account.
+ *
+ * This module is used through inheritance. It will make available the
+ * modifiers `whenNotPaused` and `whenPaused`, which can be applied to
+ * the functions of your contract. Note that they will not be pausable by
+ * simply including this module, only once the modifiers are put in place.
+ */
+abstract contract Pausable is Context {
+    /**
+     * @dev Emitted when the pause is triggered by `account`.
+     */
+    event Paused(address account);
+
+    /**
+     * @dev Emitted when the pause is lifted by `account`.
+     */
+    event Unpaused(address account);
+
+    bool private _paused;
+
+    /**
+     * @dev Initializes the contract in unpaused state.
+     */
+    constructor() {
+        _paused = false;
+    }
+
+    /**
+     * @dev Modifier to make a function callable only when the contract is not paused.
+     *
+     * Requirements:
+     *
+     * - The contract must not be paused.
+     */
+    modifier whenNotPaused() {
+        _requireNotPaused();
+        _;
+    }
+
+    /**
+     * @dev Modifier to make a function callable only when the contract is paused.
+     *
+     * Requirements:
+     *
+     * - The contract must be paused.
+     */
+    modifier whenPaused() {
+        _requirePaused();
+        _;
+    }
+
+    /**
+     * @dev Returns true if the contract is paused, and false otherwise.
+     */
+    function paused() public view virtual returns (bool) {
+        return _paused;
+    }
+
+    /**
+     * @dev Throws if the contract is paused.
+     */
+    function _requireNotPaused() internal view virtual {
+        require(!paused(), "Pausable: paused");
+    }
+
+    /**
+     * @dev Throws if the contract is not paused.
+     */
+    function _requirePaused() internal view virtual {
+        require(paused(), "Pausable: not paused");
+    }
+
+    /**
+     * @dev Triggers stopped state.
+     *
+     * Requirements:
+     *
+     * - The contract must not be paused.
+     */
+    function _pause() internal virtual whenNotPaused {
+        _paused = true;
+        emit Paused(_msgSender());
+    }
+
+    /**
+     * @dev Returns to normal state.
+     *
+     * Requirements:
+     *
+     * - The contract must be paused.
+     */
+    function _unpause() internal virtual whenPaused {
+        _paused = false;
+        emit Unpaused(_msgSender());
+    }
+}
+
+// File: @openzeppelin/contracts/access/Ownable.sol
+
+// 
+// OpenZeppelin Contracts (last updated v4.7.0) (access/Ownable.sol)
+
+pragma solidity ^0.8.0;
+
+/**
+ * @dev Contract module which provides a basic access control mechanism, where
+ * there is an account (an owner) that can be granted exclusive access to
+ * specific functions.
+ *
+ * By default, the owner account will be the one that deploys the contract. This
+ * can later be changed with {transferOwnership}.
+ *
+ * This module is used through inheritance. It will make available the modifier
+ * `onlyOwner`, which can be applied to your functions to restrict their use to
+ * the owner.
+ */
+abstract contract Ownable is Context {
+    address private _owner;
+
+    event OwnershipTransferred(address indexed previousOwner, address indexed newOwner);
+
+    /**
+     * @dev Initializes the contract setting the deployer as the initial owner.
+     */
+    constructor() {
+        _transferOwnership(_msgSender());
+    }
+
+    /**
+     * @dev Throws if called by any account other than the owner.
+     */
+    modifier onlyOwner() {
+        _checkOwner();
+        _;
+    }
+
+    /**
+     * @dev Returns the address of the current owner.
+     */
+    function owner() public view virtual returns (address) {
+        return _owner;
+    }
+
+    /**
+     * @dev Throws if the sender is not the owner.
+     */
+    function _checkOwner() internal view virtual {
+        require(owner() == _msgSender(), "Ownable: caller is not the owner");
+    }
+
+    /**
+     * @dev Leaves the contract without owner. It will not be possible to call
+     * `onlyOwner` functions anymore. Can only be called by the current owner.
+     *
+     * NOTE: Renouncing ownership will leave the contract without an owner,
+     * thereby removing any functionality that is only available to the owner.
+     */
+    function renounceOwnership() public virtual onlyOwner {
+        _transferOwnership(address(0));
+    }
+
+    /**
+     * @dev Transfers ownership of the contract to a new account (`newOwner`).
+     * Can only be called by the current owner.
+     */
+    function transferOwnership(address newOwner) public virtual onlyOwner {
+        require(newOwner != address(0), "Ownable: new owner is the zero address");
+        _transferOwnership(newOwner);
+    }
+
+    /**
+     * @dev Transfers ownership of the contract to a new account (`newOwner`).
+     * Internal function without access restriction.
+     */
+    function _transferOwnership(address newOwner) internal virtual {
+        address oldOwner = _owner;
+        _owner = newOwner;
+        emit OwnershipTransferred(oldOwner, newOwner);
+    }
+}
+
+// File: contracts/QMatic.sol
+
+// 
+pragma solidity 0.8.17;
+
+
+
+
+/// @custom:contract-official-git-repository https://github.com/QPoker/QMatic
+/// @custom:version 1.0.0
+contract QMatic is ERC20, ERC20Burnable, Pausable, Ownable {
+    /**
+     * @notice at the time that QPoker project wants to migrate to new $QMatic this event will emitted
+     * -param newQMaticAddress is the address of new $QMatic contract everyone can find it on https://polygonscan.com/token/{newQMaticAddress}
+     * -param upgradeDate is the block.timestamp of the moment of calling 'lockingForUpgrade' method
+     * -param eventReportUrl is the url of the migration paper
+     */
+    event UpgradingQMatic(address newQMaticAddress, uint256 upgradeDate, string eventReportUrl);
+
+    event BalanceLockingMechanismUpdateLog(
+        uint256 indexed mechanismId,
+        uint256 cliffDurationInDays,
+        uint256 linearReleasePeriodInDays,
+        uint256 linearReleaseDividend,
+        uint256 linearReleaseDivisor,
+        uint256 releasingTGEDividendOn100,
+        bool indexed isActive
+    );
+
+    ///@dev will be emitted by '_initWalletBalanceLockingMechanismFor' method to log assigned locking mechanism to the 'account' address.
+    event InvestmentWithLockingMechanismScenario(
+        uint256 indexed mechanismId,
+        address indexed account,
+        uint256 startedDate,
+        uint256 linearReleaseTokensPerPeriod,
+        uint256 amountOfInvestInQMatic,
+        uint256 totalAffectedTokens
+    );
+
+    /**
+     * @dev the main struct to store balance locking mechanism states of the wallet addresses
+     */
+    struct WalletBalanceLockingMechanism {
+        uint256 startedDate;
+        uint256 totalAffectedTokens;
+        uint256 linearReleaseTokensPerPeriod;
+        GeneralActiveBalanceLockingMechanismStructure mechanism;
+    }
+    struct GeneralActiveBalanceLockingMechanismStructure {
+        uint256 cliffDurationInDays;
+        uint256 linearReleasePeriodInDays;
+        uint256 linearReleaseDividend;
+        uint256 linearReleaseDivisor;
+        uint256 releasingTGEDividendOn100;
+    }
+    /// @notice max supply of QMatic is 4.6 billion tokens with 18 decimals
+    uint256 public constant MAX_SUPPLY = 46 * 1e26;
+    uint256 public lastMechanismId = 0;
+    bool public isMechanismActivated;
+    bool public  IS_DEVELOPMENT = false;
+    bool public is_migrated = false;
+    uint256 public CONTRACT_SHIFT_DAYS;
+    mapping(address => WalletBalanceLockingMechanism) public walletsAffectedByLockingMechanism;
+    GeneralActiveBalanceLockingMechanismStructure public activeBalanceLockingMechanism;
+    constructor(bool is_development) ERC20("QMatic", "QMATIC") {
+        // for deployment this line will be commented.
+        IS_DEVELOPMENT = is_development;
+    }
+
+
+
+    /**
+     * @dev after merging, name will be changed to 'Deprecated $QMATIC'.
+     */
+    function name() public view override returns (string memory) {
+        if (is_migrated) {
+            // contract is migrated.
+            return "Deprecated $QMATIC";
+        } else {
+            return super.name();
+        }
+    }
+
+    /// @notice initializing the Locking Mechanism.
+    function initActiveBalanceLockingMechanism(
+        uint256 cliffDurationInDays,
+        uint256 linearReleasePeriodInDays,
+        uint256 linearReleaseDividend,
+        uint256 linearReleaseDivisor,
+        uint256 releasingTGEDividendOn100
+    ) public onlyOwner {
+        // if linearReleaseDividend was equal to 0 it means the locking mechanism has just a cliff strategy to lock
+        if (linearReleaseDividend != 0) {
+            // linearReleaseDivisor must be power of 10 between [10,10^5]
+            // this requirement also covers  require(linearReleaseDivisor != 0, "division on 0");
+            require(
+                (linearReleaseDivisor == 1e1 && linearReleaseDividend <= 1e1) ||
+                    (linearReleaseDivisor == 1e2 && linearReleaseDividend <= 1e2) ||
+                    (linearReleaseDivisor == 1e3 && linearReleaseDividend <= 1e3) ||
+                    (linearReleaseDivisor == 1e4 && linearReleaseDividend <= 1e4) ||
+                    (linearReleaseDivisor == 1e5 && linearReleaseDividend <= 1e5),
+                "TF"
+            );
+            require(linearReleasePeriodInDays != 0, "LRPDID division on 0");
+        } else {
+            // if linearReleaseDividend was equal to 0 and also cliffDurationInDays was equal to 0, it's meaningless locking mechanism and will not accepted by the QMatic smart contract.
+            require(cliffDurationInDays != 0, "meaningless locking");
+            linearReleaseDivisor = 0;
+            linearReleasePeriodInDays = 0;
+        }
+
+        lastMechanismId = lastMechanismId + 1;
+        activeBalanceLockingMechanism = GeneralActiveBalanceLockingMechanismStructure({
+            cliffDurationInDays: cliffDurationInDays,
+            linearReleasePeriodInDays: linearReleasePeriodInDays,
+            linearReleaseDividend: linearReleaseDividend,
+            linearReleaseDivisor: linearReleaseDivisor,
+            releasingTGEDividendOn100: releasingTGEDividendOn100
+        });
+        isMechanismActivated = true;
+        emit BalanceLockingMechanismUpdateLog(
+            lastMechanismId,
+            cliffDurationInDays,
+            linearReleasePeriodInDays,
+            linearReleaseDividend,
+            linearReleaseDivisor,
+            releasingTGEDividendOn100,
+            isMechanismActivated
+        );
+    }
+
+    ///@notice removes the active Locking Mechanism.
+    function deactivateBalanceLockingMechanism() public onlyOwner {
+        GeneralActiveBalanceLockingMechanismStructure
+            memory _mechanism = activeBalanceLockingMechanism;
+        activeBalanceLockingMechanism = GeneralActiveBalanceLockingMechanismStructure({
+            cliffDurationInDays: 0,
+            linearReleasePeriodInDays: 0,
+            linearReleaseDividend: 0,
+            linearReleaseDivisor: 0,
+            releasingTGEDividendOn100: 0
+        });
+        isMechanismActivated = false;
+        emit BalanceLockingMechanismUpdateLog(
+            lastMechanismId,
+            _mechanism.cliffDurationInDays,
+            _mechanism.linearReleasePeriodInDays,
+            _mechanism.linearReleaseDividend,
+            _mechanism.linearReleaseDivisor,
+            _mechanism.releasingTGEDividendOn100,
+            isMechanismActivated
+        );
+    }
+
+    /**
+     * @notice QPoker project will announce the migration event date through QPoker official social media channels. This function will be called by the QPoker contract owner and after executing, The $QMatic transactions will be locked forever, and whole user's data will be migrated to the new $QMatic contract by QPoker services.
+     * @dev QPoker project uses Migration Methods for upgrading.
+     * @param newQMaticAddress is the address of new deployed QMatic smart contract on the polygon mainnet
+     * @param reportURL is the URL address of the announcement and required instructions for migration(if it was nesseccary)
+     */
+    function contractLockingForUpgrade(
+        address newQMaticAddress,
+        string memory reportURL
+    ) public onlyOwner {
+        _pause();
+        is_migrated = true;
+        /*
+        ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
+        */
+        /* solhint-disable not-rely-on-time */
+        emit UpgradingQMatic(newQMaticAddress, block.timestamp, reportURL);
+        /* solhint-enable not-rely-on-time */
+    }
+
+    /**
+     * @notice standard minting (only owner of the smart contract has access to mint)
+     * @dev mint function never can mint tokens more than Max Supply.
+     */
+
+    function mint(address to, uint256 amount) public onlyOwner {
+        require(amount + super.totalSupply() <= MAX_SUPPLY, "cannot mint more than max supply");
+        _mint(to, amount);
+    }
+
+    /**
+     * @notice 10% ==> 0.1 and 0.1 is 10/100 so 10 is dividend and 100 is divisor (reason: in solidity we do not have decimal numbers)
+     * @param account is the wallet address that caller wants to get information about it.
+     */
+    function getLinearReleaseDividendAndDivisorOf(
+        address account
+    ) public view returns (uint256 dividend, uint256 divisor) {
+        dividend = walletsAffectedByLockingMechanism[account].mechanism.linearReleaseDividend;
+        divisor = walletsAffectedByLockingMechanism[account].mechanism.linearReleaseDivisor;
+    }
+
+    /**
+     * @notice for getting information about linear release period (in days) and linear release tokens per period (In Wei), The 18 end digits are decimals. Everyone can call this function.
+     * @return periodInDays is the number of days to tick one period.
+     * @return  releaseAmountPerPeriod is the number of tokens that will be released after every periods tick.
+     */
+    function getLinearReleasePeriodAndAmountOf(
+        address account
+    ) public view returns (uint256 periodInDays, uint256 releaseAmountPerPeriod) {
+        periodInDays = walletsAffectedByLockingMechanism[account]
+            .mechanism
+            .linearReleasePeriodInDays;
+
+        releaseAmountPerPeriod = walletsAffectedByLockingMechanism[account]
+            .linearReleaseTokensPerPeriod;
+    }
+
+    /**
+     * @notice to get the information about ending of the Cliff everyone can call this function.
+     * @return uint256 the result amount is in seconds, to avoid calculation discrepancies..
+     */
+    function getRemainingSecondsToFinishingTheCliffOf(
+        address account
+    ) public view returns (uint256) {
+        uint256 startDate = walletsAffectedByLockingMechanism[account].startedDate;
+        uint256 cliffDays = walletsAffectedByLockingMechanism[account]
+            .mechanism
+            .cliffDurationInDays;
+        uint256 cliffEndDate = startDate + (cliffDays * 1 days);
+
+        /*
+        ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
+        */
+        /* solhint-disable not-rely-on-time */
+        uint256 timeNow = block.timestamp;
+        if (IS_DEVELOPMENT) {
+            // for development testing purpose
+            timeNow = timeNow + (CONTRACT_SHIFT_DAYS * 1 days);
+        }
+        /* solhint-enable not-rely-on-time */
+        // if timeNow were grater or equals to cliffEndDate it means that the cliff is finished.
+        if (timeNow >= cliffEndDate) {
+            return 0;
+        }
+        uint256 remainingSeconds = cliffEndDate - timeNow;
+        return remainingSeconds;
+    }
+
+
+    /**
+     * @notice this function calculates the remaining locked tokens by Locking Mechanism for the address at the moment..
+     * @dev for testing purposes, when 'IS DEVELOPMENT' was true, the function will be shifted to the present time by a value equal to CONTRACT_SHIFT_DAYS.
+     * @return uint256 return the current number of locked tokens.
+     */
+    function getRemainingBlockedTokensAtNowOf(address account) public view returns (uint256) {
+        WalletBalanceLockingMechanism memory affected_mechanism = walletsAffectedByLockingMechanism[account];
+        uint256 startedDate = affected_mechanism.startedDate;
+        // startedDate will be calculated by the Owner at the moment of executing 'transferWithLocking' method.
+        //slither-disable-next-line incorrect-equality
+        if (startedDate == 0) {
+            //it means that account does not have any active locking mechanism.
+            return 0;
+        }
+
+        /*
+        ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
+        */
+        /* solhint-disable not-rely-on-time */
+        uint256 timeNow = block.timestamp;
+        /* solhint-enable not-rely-on-time */
+
+        if (IS_DEVELOPMENT) {
+            // for development testing purpose
+            timeNow = timeNow + (CONTRACT_SHIFT_DAYS * 1 days);
+        }
+
+        uint256 cliffEndDate = startedDate +
+            (affected_mechanism.mechanism.cliffDurationInDays * 1 days);
+
+
+        if (timeNow < cliffEndDate) {
+            //it's still in cliff
+            return affected_mechanism.totalAffectedTokens;
+        }
+
+        if(affected_mechanism.mechanism.linearReleasePeriodInDays == 0){
+            return 0;
+        }
+
+
+        // one part 'releasingTokenPerPeriodTick' will release when cliff ends.
+        uint256 totalPastPeriodsCount = ((timeNow - cliffEndDate) /
+            (affected_mechanism.mechanism.linearReleasePeriodInDays *
+                1 days)) + 1;
+        uint256 totalReleasedTokens = totalPastPeriodsCount * affected_mechanism.linearReleaseTokensPerPeriod;
+        if (totalReleasedTokens >= affected_mechanism.totalAffectedTokens) {
+            // the locking duration is finished.
+            return 0;
+        }
+        return (affected_mechanism.totalAffectedTokens - totalReleasedTokens);
+    }
+
+    /**
+     * @notice When 'lockingForUpgrade' is called at the beginning of the'_transfer,_mint and _burn' function, all of the transactions will be blocked.
+     * @dev (balance of the sender - the amount of sending) must be Less than or equal to the returned value of the getRemainingBlockedTokensAtNowOf(from) function.
+     */
+    function _beforeTokenTransfer(
+        address from,
+        address to,
+        uint256 amount
+    ) internal override whenNotPaused {
+        // whenever mint function executes, 'from' value will be address (0) and the balance of address (0) is always zero. therefore we will face Integer overflow.
+        //we excluded  (address(from) == address(0)) condition from Locking Mechanism process to avoid Integer overflow.
+        if (from != address(0)) {
+            uint256 balanceBeforeTransaction = super.balanceOf(from);
+            require(balanceBeforeTransaction >= amount, "ERC20: transfer amount exceeds balance");
+            uint256 balanceAfterTransfer = balanceBeforeTransaction - amount;
+            require(
+                balanceAfterTransfer >= getRemainingBlockedTokensAtNowOf(from),
+                "you can not transfer more than available tokens"
+            );
+        }
+        super._beforeTokenTransfer(from, to, amount);
+    }
+
+    /**
+     * @notice 'changeDateOfContract' shifts the active date of contract (Development Only).
+     */
+    function changeDateOfContract(uint256 shiftDays) public onlyOwner {
+        require(IS_DEVELOPMENT, "development only");
+        CONTRACT_SHIFT_DAYS = shiftDays;
+    }
+
+    /**
+     * @notice 'turnDevelopmentModeOff' turns the development mode off (Development Only).
+     */
+    function turnDevelopmentModeOff() public onlyOwner {
+        require(IS_DEVELOPMENT, "development only");
+        IS_DEVELOPMENT = false;
+    }
+
+    /**
+     * @notice this function, actives the Locking Mechanism over user's wallet address.
+     */
+    function _initWalletBalanceLockingMechanismFor(
+        address receiverAddress,
+        uint256 amount
+    ) internal returns (WalletBalanceLockingMechanism memory) {
+        GeneralActiveBalanceLockingMechanismStructure
+            memory _mechanism = activeBalanceLockingMechanism;
+        uint256 _linearReleaseTokensPerPeriod = 0;
+        uint256 investAmount = amount;
+
+        uint256 TGERelease = ((amount * _mechanism.releasingTGEDividendOn100) / 100);
+        // calculating number of tokens by subtracting it from the TGE amount.
+        amount = amount - TGERelease;
+        if (_mechanism.linearReleaseDividend != 0) {
+            uint256 _linearReleaseTokensPerPeriodDividend = (amount *
+                _mechanism.linearReleaseDividend);
+            _linearReleaseTokensPerPeriod =
+                _linearReleaseTokensPerPeriodDividend /
+                _mechanism.linearReleaseDivisor;
+        }
+        /*
+        ethereum.stackexchange.com/questions/5924/how-do-ethereum-mining-nodes-maintain-a-time-consistent-with-the-network
+        */
+        /* solhint-disable not-rely-on-time */
+        WalletBalanceLockingMechanism memory balanceLocking = WalletBalanceLockingMechanism({
+            startedDate: block.timestamp,
+            totalAffectedTokens: amount,
+            linearReleaseTokensPerPeriod: _linearReleaseTokensPerPeriod,
+            mechanism: _mechanism
+        });
+        /* solhint-enable not-rely-on-time */
+        emit InvestmentWithLockingMechanismScenario(
+            lastMechanismId,
+            receiverAddress,
+            balanceLocking.startedDate,
+            balanceLocking.linearReleaseTokensPerPeriod,
+            investAmount,
+            balanceLocking.totalAffectedTokens
+        );
+        return balanceLocking;
+    }
+
+    /**
+     * @notice transferring tokens to the investors who Accepted terms of the contract for investing, Cliff and vesting schedule.
+     * @dev this function will calculate the Locking Mechanism of the tokens from current state of 'activeBalanceLockingMechanism' variable.
+     */
+    function transferWithLocking(address to, uint256 amount) public onlyOwner returns (bool) {
+        //minimum of transfer with locking is 10^5 wei.
+        require(amount >= 1e5, "TF 2");
+        require(isMechanismActivated, "LM is not activated.");
+        require(walletsAffectedByLockingMechanism[to].startedDate == 0, "TF 3");
+        walletsAffectedByLockingMechanism[to] = _initWalletBalanceLockingMechanismFor(to, amount);
+
+        super._transfer(msg.sender, to, amount);
+        return true;
+    }
+}
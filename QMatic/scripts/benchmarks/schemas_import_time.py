@@ -0,0 +1,40 @@
+import statistics
+import subprocess
+import sys
+
+RUNS: int = 10
+
+# measured in a fresh interpreter per run, so nothing is already in `sys.modules`.
+IMPORTS: dict[str, str] = {
+    "QMatic.schemas": "import QMatic.schemas",
+    "brownie (previously pulled in by the schemas)": "import brownie",
+    "QMatic.adapters": "import QMatic.adapters",
+}
+TIMED_IMPORT: str = (
+    "import time; started = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def import_time_of(statement: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", TIMED_IMPORT.format(statement=statement)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def main() -> None:
+    """
+    cold import time of the schemas (stdlib + pydantic only) vs the brownie-dependent modules.
+    """
+    print(f"{'import':<48}{'median ms':>12}{'min ms':>10}")
+    for name, statement in IMPORTS.items():
+        timings = [import_time_of(statement) * 1_000 for _ in range(RUNS)]
+        print(f"{name:<48}{statistics.median(timings):>12.1f}{min(timings):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from brownie import accounts, chain, web3
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import AsyncJsonRpcTransport, TransactionPipeline, normal_transfer
+from QMatic.constants import DEPLOYER_ACCOUNT_INDEX, ONE_WEI
+from QMatic.scripts.deploy import deploy_minted_qmatic_contract
+
+TRANSACTIONS_COUNT: int = 200
+MAX_IN_FLIGHT: int = 64
+
+
+async def _send_with_pipeline(
+    qmatic_contract: ProjectContract, caller: Account, recipients: list[str]
+) -> list:
+    async with AsyncJsonRpcTransport(web3.provider.endpoint_uri) as transport:
+        return await TransactionPipeline(
+            transport,
+            qmatic_contract,
+            caller,
+            max_in_flight=MAX_IN_FLIGHT,
+            poll_interval_in_seconds=0.05,
+        ).send_many([("transfer", (recipient, ONE_WEI)) for recipient in recipients])
+
+
+def main() -> None:
+    """
+    treasury transfers per second: the adapter waiting for every receipt vs the nonce-managed pipeline.
+    """
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    qmatic_contract = deploy_minted_qmatic_contract()
+    recipients = [
+        accounts[index % 9 + 1].address for index in range(TRANSACTIONS_COUNT)
+    ]
+
+    started = time.perf_counter()
+    for recipient in recipients:
+        normal_transfer(
+            qmatic_contract=qmatic_contract,
+            to=recipient,
+            amount=ONE_WEI,
+            caller=deployer_account,
+        )
+    sequential = TRANSACTIONS_COUNT / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    outcomes = asyncio.run(
+        _send_with_pipeline(qmatic_contract, deployer_account, recipients)
+    )
+    pipelined = TRANSACTIONS_COUNT / (time.perf_counter() - started)
+    assert all(revert_exception is None for _, revert_exception in outcomes)
+    chain.reset()
+
+    print(f"{TRANSACTIONS_COUNT} transfers")
+    print(f"adapter (one receipt at a time)  {sequential:>10,.1f} tx/s")
+    print(f"pipeline ({MAX_IN_FLIGHT} in flight)           {pipelined:>10,.1f} tx/s")
+    print(f"speedup                          {pipelined / sequential:>10.1f}x")
@@ -0,0 +1,128 @@
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.vesting import (
+    build_unlock_schedule,
+    build_wallet_locking_arrays,
+    init_wallet_balance_locking_mechanism,
+    project_unlocks,
+    remaining_blocked_tokens_limbs,
+    write_unlock_projection,
+)
+from QMatic.vesting.engine import ONE_DAY_IN_SECONDS
+
+WALLETS_COUNT: int = 1_000_000
+# the per-day evaluation is measured on a sample and extrapolated to WALLETS_COUNT.
+PER_DAY_SAMPLE_WALLETS_COUNT: int = 20_000
+HORIZON_IN_DAYS: int = 2 * 365
+FIRST_STARTED_DATE: int = 1_672_531_200
+TOTAL_SUPPLY: int = 4_600_000_000 * 10**18
+MECHANISMS = [
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=180,
+        linear_release_period_in_days=30,
+        linear_release_dividend=5,
+        linear_release_divisor=100,
+        releasing_tge_dividend_on_100=5,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=90,
+        linear_release_period_in_days=30,
+        linear_release_dividend=1,
+        linear_release_divisor=10,
+        releasing_tge_dividend_on_100=15,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=180,
+        linear_release_period_in_days=0,
+        linear_release_dividend=0,
+        linear_release_divisor=0,
+        releasing_tge_dividend_on_100=0,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=0,
+        linear_release_period_in_days=7,
+        linear_release_dividend=333,
+        linear_release_divisor=10_000,
+        releasing_tge_dividend_on_100=5,
+    ),
+]
+
+
+def _per_day_seconds(wallets: list, days: np.ndarray) -> float:
+    """
+    the brute-force alternative: the remaining tokens of every wallet at every day, summed per day.
+    """
+    wallet_locking_arrays = build_wallet_locking_arrays(wallets)
+    started = time.perf_counter()
+    for day in days:
+        remaining_blocked_tokens_limbs(wallet_locking_arrays, np.array([day])).sum(
+            axis=1, dtype=np.uint64
+        )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    random.seed(0)
+    # every sale batch of 500 wallets shares the timestamp of its block.
+    wallets = [
+        init_wallet_balance_locking_mechanism(
+            amount=random.randint(100 * 10**18, 7_000 * 10**18),
+            mechanism=MECHANISMS[index // 500 % len(MECHANISMS)],
+            started_date=FIRST_STARTED_DATE + index // 500 * 60,
+        )
+        for index in range(WALLETS_COUNT)
+    ]
+    start_date = FIRST_STARTED_DATE
+    end_date = start_date + HORIZON_IN_DAYS * ONE_DAY_IN_SECONDS
+
+    started = time.perf_counter()
+    schedule = build_unlock_schedule(wallets)
+    building = time.perf_counter() - started
+
+    started = time.perf_counter()
+    projection = project_unlocks(schedule, start_date, end_date)
+    event_points = time.perf_counter() - started
+
+    started = time.perf_counter()
+    daily_projection = project_unlocks(
+        schedule, start_date, end_date, bucket_in_seconds=ONE_DAY_IN_SECONDS
+    )
+    daily = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "unlock_calendar.npz"
+        started = time.perf_counter()
+        write_unlock_projection(daily_projection, path, total_supply=TOTAL_SUPPLY)
+        writing = time.perf_counter() - started
+        file_size = path.stat().st_size
+
+    days = start_date + np.arange(1, HORIZON_IN_DAYS + 1) * ONE_DAY_IN_SECONDS
+    per_day = (
+        _per_day_seconds(wallets[:PER_DAY_SAMPLE_WALLETS_COUNT], days)
+        * WALLETS_COUNT
+        / PER_DAY_SAMPLE_WALLETS_COUNT
+    )
+
+    print(f"{WALLETS_COUNT:,} wallets, {HORIZON_IN_DAYS} days horizon")
+    print(
+        f"unlock events in the horizon      {projection.unlocking_wallets.sum():>12,}"
+    )
+    print(f"event points                      {len(projection.unlock_date):>12,}")
+    print(f"build_unlock_schedule             {building:>10.2f} s")
+    print(f"project_unlocks (event points)    {event_points:>10.2f} s")
+    print(f"project_unlocks (daily buckets)   {daily:>10.2f} s")
+    print(
+        f"write_unlock_projection (.npz)    {writing * 1e3:>10.1f} ms  {file_size / 1024:,.0f} KiB"
+    )
+    print(f"per-day evaluation (extrapolated) {per_day:>10.2f} s")
+    print(f"speedup over per-day evaluation   {per_day / event_points:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
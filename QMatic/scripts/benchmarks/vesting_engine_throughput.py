@@ -0,0 +1,86 @@
+import random
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.vesting import (
+    build_wallet_locking_arrays,
+    init_wallet_balance_locking_mechanism,
+    remaining_blocked_tokens,
+    remaining_blocked_tokens_limbs,
+)
+
+WALLETS_COUNT: int = 20_000
+DAYS_COUNT: int = 365
+FIRST_STARTED_DATE: int = 1_672_531_200
+MECHANISMS = [
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=90,
+        linear_release_period_in_days=30,
+        linear_release_dividend=1,
+        linear_release_divisor=10,
+        releasing_tge_dividend_on_100=15,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=180,
+        linear_release_period_in_days=0,
+        linear_release_dividend=0,
+        linear_release_divisor=0,
+        releasing_tge_dividend_on_100=0,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=0,
+        linear_release_period_in_days=7,
+        linear_release_dividend=333,
+        linear_release_divisor=10_000,
+        releasing_tge_dividend_on_100=5,
+    ),
+]
+
+
+def _measure(
+    label: str, queries_count: int, function: Callable[..., Any], *args: Any
+) -> None:
+    started = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<40} {elapsed * 1e3:>9.1f} ms  {queries_count / elapsed / 1e6:>7.2f} M queries/s"
+    )
+
+
+def main() -> None:
+    random.seed(0)
+    wallets = [
+        init_wallet_balance_locking_mechanism(
+            amount=random.randint(10**5, 10**27),
+            mechanism=random.choice(MECHANISMS),
+            started_date=FIRST_STARTED_DATE + random.randint(0, 90 * 86400),
+        )
+        for _ in range(WALLETS_COUNT)
+    ]
+    wallet_locking_arrays = build_wallet_locking_arrays(wallets)
+    timestamps = FIRST_STARTED_DATE + np.arange(DAYS_COUNT, dtype=np.int64) * 86400
+    queries_count = WALLETS_COUNT * DAYS_COUNT
+
+    print(f"{WALLETS_COUNT} wallets x {DAYS_COUNT} timestamps")
+    _measure(
+        "remaining_blocked_tokens_limbs",
+        queries_count,
+        remaining_blocked_tokens_limbs,
+        wallet_locking_arrays,
+        timestamps,
+    )
+    _measure(
+        "remaining_blocked_tokens (python ints)",
+        queries_count,
+        remaining_blocked_tokens,
+        wallet_locking_arrays,
+        timestamps,
+    )
+
+
+if __name__ == "__main__":
+    main()
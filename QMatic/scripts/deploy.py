@@ -0,0 +1,37 @@
+from brownie import QMatic, accounts
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import initializing_active_balance_locking_mechanism, mint
+from QMatic.constants import (
+    DEFAULT_MINT_AMOUNT,
+    DEPLOYER_ACCOUNT_INDEX,
+    MONTH_IN_DAYS,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+
+
+def deploy_minted_qmatic_contract() -> ProjectContract:
+    qmatic_contract = QMatic.deploy(True, {"from": accounts[DEPLOYER_ACCOUNT_INDEX]})
+    mint(
+        qmatic_contract=qmatic_contract,
+        to=accounts[DEPLOYER_ACCOUNT_INDEX].address,
+        amount=DEFAULT_MINT_AMOUNT,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    return qmatic_contract
+
+
+def deploy_locking_mechanism_first_round_qmatic_contract() -> ProjectContract:
+    qmatic_contract = deploy_minted_qmatic_contract()
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=qmatic_contract,
+        entries=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=3 * MONTH_IN_DAYS,
+            linear_release_period_in_days=1 * MONTH_IN_DAYS,
+            linear_release_dividend=1,
+            linear_release_divisor=10,
+            releasing_tge_dividend_on_100=15,
+        ),
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    return qmatic_contract
@@ -0,0 +1,223 @@
+import random
+from typing import Any
+
+import eth_event
+from eth_utils.address import to_checksum_address
+
+from QMatic.schemas import Events
+from QMatic.schemas.decoder import (
+    APPROVAL_TOPIC,
+    BALANCE_LOCKING_MECHANISM_UPDATE_LOG_TOPIC,
+    INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC,
+    LOCKING_MECHANISM_CLEARED_TOPIC,
+    TRANSFER_TOPIC,
+    UPGRADING_QMATIC_TOPIC,
+)
+
+# the event ABIs of QMatic, used to decode the synthetic logs with the generic decoder.
+EVENT_ABIS: list[dict[str, Any]] = [
+    {
+        "type": "event",
+        "anonymous": False,
+        "name": name,
+        "inputs": [
+            {"name": input_name, "type": input_type, "indexed": indexed}
+            for input_name, input_type, indexed in inputs
+        ],
+    }
+    for name, inputs in {
+        "Transfer": [
+            ("from", "address", True),
+            ("to", "address", True),
+            ("value", "uint256", False),
+        ],
+        "Approval": [
+            ("owner", "address", True),
+            ("spender", "address", True),
+            ("value", "uint256", False),
+        ],
+        "InvestmentWithLockingMechanismScenario": [
+            ("mechanismId", "uint256", True),
+            ("account", "address", True),
+            ("startedDate", "uint256", False),
+            ("linearReleaseTokensPerPeriod", "uint256", False),
+            ("amountOfInvestInQMatic", "uint256", False),
+            ("totalAffectedTokens", "uint256", False),
+        ],
+        "BalanceLockingMechanismUpdateLog": [
+            ("mechanismId", "uint256", True),
+            ("cliffDurationInDays", "uint256", False),
+            ("linearReleasePeriodInDays", "uint256", False),
+            ("linearReleaseDividend", "uint256", False),
+            ("linearReleaseDivisor", "uint256", False),
+            ("releasingTGEDividendOn100", "uint256", False),
+            ("isActive", "bool", True),
+        ],
+        "UpgradingQMatic": [
+            ("newQMaticAddress", "address", False),
+            ("upgradeDate", "uint256", False),
+            ("eventReportUrl", "string", False),
+        ],
+        "LockingMechanismCleared": [
+            ("mechanismId", "uint256", True),
+            ("account", "address", True),
+        ],
+    }.items()
+]
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _address_word(address: str) -> bytes:
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+def _log(topics: list[bytes], data: bytes) -> dict[str, Any]:
+    return {
+        "address": "0x" + "11" * 20,
+        "topics": topics,
+        "data": data,
+        "blockNumber": 1,
+        "logIndex": 0,
+    }
+
+
+def transfer_log(from_address: str, to_address: str, value: int) -> dict[str, Any]:
+    return _log(
+        [TRANSFER_TOPIC, _address_word(from_address), _address_word(to_address)],
+        _word(value),
+    )
+
+
+def approval_log(owner: str, spender: str, value: int) -> dict[str, Any]:
+    return _log(
+        [APPROVAL_TOPIC, _address_word(owner), _address_word(spender)], _word(value)
+    )
+
+
+def investment_with_locking_mechanism_scenario_log(
+    mechanism_id: int,
+    account: str,
+    started_date: int,
+    linear_release_tokens_per_period: int,
+    amount_of_invest_in_qmatic: int,
+    total_affected_tokens: int,
+) -> dict[str, Any]:
+    return _log(
+        [
+            INVESTMENT_WITH_LOCKING_MECHANISM_SCENARIO_TOPIC,
+            _word(mechanism_id),
+            _address_word(account),
+        ],
+        _word(started_date)
+        + _word(linear_release_tokens_per_period)
+        + _word(amount_of_invest_in_qmatic)
+        + _word(total_affected_tokens),
+    )
+
+
+def balance_locking_mechanism_update_log(
+    mechanism_id: int, values: tuple[int, int, int, int, int], is_active: bool
+) -> dict[str, Any]:
+    return _log(
+        [
+            BALANCE_LOCKING_MECHANISM_UPDATE_LOG_TOPIC,
+            _word(mechanism_id),
+            _word(int(is_active)),
+        ],
+        b"".join(_word(value) for value in values),
+    )
+
+
+def upgrading_qmatic_log(
+    new_qmatic_address: str, upgrade_date: int, event_report_url: str
+) -> dict[str, Any]:
+    url = event_report_url.encode("utf-8")
+    return _log(
+        [UPGRADING_QMATIC_TOPIC],
+        _address_word(new_qmatic_address)
+        + _word(upgrade_date)
+        + _word(3 * 32)
+        + _word(len(url))
+        + url.ljust((len(url) + 31) // 32 * 32, b"\0"),
+    )
+
+
+def locking_mechanism_cleared_log(mechanism_id: int, account: str) -> dict[str, Any]:
+    return _log(
+        [LOCKING_MECHANISM_CLEARED_TOPIC, _word(mechanism_id), _address_word(account)],
+        b"",
+    )
+
+
+def synthetic_logs(
+    count: int, holders: int = 1_000, seed: int = 0
+) -> list[dict[str, Any]]:
+    """
+    a realistic mix of QMatic logs: mostly transfers, some approvals and locks, a few mechanism updates.
+    """
+    generator = random.Random(seed)
+    addresses = ["0x" + generator.randbytes(20).hex() for _ in range(holders)]
+    logs: list[dict[str, Any]] = []
+    for index in range(count):
+        kind = generator.random()
+        if kind < 0.80:
+            logs.append(
+                transfer_log(
+                    generator.choice(addresses),
+                    generator.choice(addresses),
+                    generator.getrandbits(90),
+                )
+            )
+        elif kind < 0.90:
+            logs.append(
+                approval_log(
+                    generator.choice(addresses),
+                    generator.choice(addresses),
+                    generator.getrandbits(90),
+                )
+            )
+        elif kind < 0.99:
+            amount = generator.getrandbits(90)
+            logs.append(
+                investment_with_locking_mechanism_scenario_log(
+                    1,
+                    generator.choice(addresses),
+                    1_680_000_000 + index,
+                    amount // 10,
+                    amount,
+                    amount - amount * 15 // 100,
+                )
+            )
+        elif kind < 0.995:
+            logs.append(
+                balance_locking_mechanism_update_log(
+                    index, (90, 30, 1, 10, 15), generator.random() < 0.5
+                )
+            )
+        else:
+            logs.append(locking_mechanism_cleared_log(1, generator.choice(addresses)))
+    return logs
+
+
+def generic_events_from_logs(logs: list[dict[str, Any]]) -> Events:
+    """
+    the generic decoding path: eth-event decoding and validated models through the aliases of `Events.from_tx`.
+    """
+    topic_map = eth_event.get_topic_map(EVENT_ABIS)
+    events: dict[str, list[dict[str, Any]]] = {}
+    for log in logs:
+        decoded = eth_event.decode_log(log, topic_map)
+        events.setdefault(decoded["name"], []).append(
+            {
+                item["name"]: (
+                    to_checksum_address(item["value"])
+                    if item["type"] == "address"
+                    else item["value"]
+                )
+                for item in decoded["data"]
+            }
+        )
+    return Events.from_tx(events)
@@ -1,51 +1,82 @@
-from typing import Generator
+from typing import Generator, NamedTuple
 
 import pytest
-from brownie import QMatic, accounts, chain
+from brownie import Multicall, QMatic, accounts, chain
 from brownie.network.contract import ProjectContract
 
-from QMatic.adapters import initializing_active_balance_locking_mechanism, mint
-from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.scripts.deploy import (
+    deploy_locking_mechanism_first_round_qmatic_contract,
+    deploy_minted_qmatic_contract,
+)
 
-from .constants import DEFAULT_MINT_AMOUNT, DEPLOYER_ACCOUNT_INDEX, MONTH_IN_DAYS
+from .constants import DEPLOYER_ACCOUNT_INDEX
+
+
+class SeededContracts(NamedTuple):
+    """
+    every contract is its own deployment, unlike the per-test fixtures that derived `minted_qmatic_contract`
+    and `locking_mechanism_first_round_qmatic_contract` from `qmatic_contract`:
+    a test that requests several of them gets independent contracts.
+    """
+
+    development: ProjectContract
+    production: ProjectContract
+    minted: ProjectContract
+    locking_mechanism_first_round: ProjectContract
+    multicall: ProjectContract
+
+
+@pytest.fixture(scope="module")
+def seeded_contracts(module_isolation: None) -> SeededContracts:
+    """
+    deploys every pre-seeded contract state once per module,
+    `isolation` reverts the chain to this state after each test.
+    """
+    return SeededContracts(
+        development=QMatic.deploy(True, {"from": accounts[DEPLOYER_ACCOUNT_INDEX]}),
+        production=QMatic.deploy(False, {"from": accounts[DEPLOYER_ACCOUNT_INDEX]}),
+        minted=deploy_minted_qmatic_contract(),
+        locking_mechanism_first_round=deploy_locking_mechanism_first_round_qmatic_contract(),
+        multicall=Multicall.deploy({"from": accounts[DEPLOYER_ACCOUNT_INDEX]}),
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation: None) -> Generator[None, None, None]:
+    """
+    fails a test that replaced the snapshot of `fn_isolation` (a plain `chain.snapshot()`),
+    its changes would leak into the next tests of the module, `tests/isolation.py` has the nested snapshot.
+    """
+    snapshot_id = chain._snapshot_id
+    yield
+    if chain._snapshot_id != snapshot_id:
+        raise RuntimeError(
+            "the test replaced the isolation snapshot, use 'nested_snapshot' instead of 'chain.snapshot'"
+        )
 
 
 @pytest.fixture
-def qmatic_contract() -> Generator[ProjectContract, None, None]:
-    yield QMatic.deploy(True, {"from": accounts[DEPLOYER_ACCOUNT_INDEX]})
-    chain.reset()
+def qmatic_contract(seeded_contracts: SeededContracts) -> ProjectContract:
+    return seeded_contracts.development
 
 
 @pytest.fixture
-def production_qmatic_contract() -> Generator[ProjectContract, None, None]:
-    yield QMatic.deploy(False, {"from": accounts[DEPLOYER_ACCOUNT_INDEX]})
-    chain.reset()
+def production_qmatic_contract(seeded_contracts: SeededContracts) -> ProjectContract:
+    return seeded_contracts.production
 
 
 @pytest.fixture
-def minted_qmatic_contract(qmatic_contract: ProjectContract) -> ProjectContract:
-    mint(
-        qmatic_contract=qmatic_contract,
-        to=accounts[DEPLOYER_ACCOUNT_INDEX].address,
-        amount=DEFAULT_MINT_AMOUNT,
-        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
-    )
-    return qmatic_contract
+def minted_qmatic_contract(seeded_contracts: SeededContracts) -> ProjectContract:
+    return seeded_contracts.minted
 
 
 @pytest.fixture
 def locking_mechanism_first_round_qmatic_contract(
-    minted_qmatic_contract: ProjectContract,
+    seeded_contracts: SeededContracts,
 ) -> ProjectContract:
-    initializing_active_balance_locking_mechanism(
-        qmatic_contract=minted_qmatic_contract,
-        entries=GeneralActiveBalanceLockingMechanismStructure(
-            cliff_duration_in_days=3 * MONTH_IN_DAYS,
-            linear_release_period_in_days=1 * MONTH_IN_DAYS,
-            linear_release_dividend=1,
-            linear_release_divisor=10,
-            releasing_tge_dividend_on_100=15,
-        ),
-        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
-    )
-    return minted_qmatic_contract
+    return seeded_contracts.locking_mechanism_first_round
+
+
+@pytest.fixture
+def multicall_contract(seeded_contracts: SeededContracts) -> ProjectContract:
+    return seeded_contracts.multicall
@@ -0,0 +1,21 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from brownie import chain
+
+
+@contextmanager
+def nested_snapshot() -> Iterator[None]:
+    """
+    reverts the chain (and brownie's history and time offset) to its state at entering.
+    brownie keeps a single snapshot id, a plain `chain.snapshot()` inside a test would move the snapshot of `fn_isolation`
+    to the middle of the test, so the id of the outer snapshot is restored after the revert.
+    the outer snapshot was taken earlier, reverting the inner one keeps it valid on the local chain.
+    """
+    outer_snapshot_id = chain._snapshot_id
+    chain.snapshot()
+    try:
+        yield
+    finally:
+        chain.revert()
+        chain._snapshot_id = outer_snapshot_id
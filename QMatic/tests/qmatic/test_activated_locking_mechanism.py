@@ -6,6 +6,7 @@ from brownie.network.contract import ProjectContract
 
 from QMatic.adapters import (
     active_balance_locking_mechanism,
+    balance_locking_mechanism_of_id,
     balance_of,
     contract_locking_for_upgrade,
     initializing_active_balance_locking_mechanism,
@@ -13,8 +14,10 @@ from QMatic.adapters import (
     normal_transfer,
     remaining_blocked_tokens_at_now_of_address,
     transfer_with_locking,
+    batch_transfer_with_locking,
     deactivate_balance_locking_mechanism,
     turn_development_mode_off,
+    wallet_affected_by_locking_mechanism_state,
 )
 from QMatic.schemas import (
     Events,
@@ -34,6 +37,11 @@ from QMatic.tests.constants import (
     MEANINGLESS_LOCKING_MECHANISM_ERROR_MESSAGE,
     INVALID_LINEAR_RELEASE_PERIOD_IN_DAYS_MESSAGE,
     INT_DEFAULT_VALUE,
+    BATCH_LENGTHS_MISMATCH_MESSAGE,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    LOCKING_MECHANISM_IS_NOT_ACTIVATED,
+    MINIMUM_AMOUNT_TO_SELL,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
 )
 
 
@@ -464,3 +472,171 @@ def test_transfer_invalid_amount_from_active_locking_mechanism_affected_wallet_p
         caller=investor_account,
     )
     assert locked_amount == expected_locked_tokens
+
+
+def test_batch_transfer_with_locking_emits_the_events_of_every_recipient(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    recipients = [accounts[index].address for index in range(1, 6)]
+    amounts = [MINIMUM_AMOUNT_TO_SELL * index for index in range(1, 6)]
+    events, revert_exception = batch_transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        recipients=recipients,
+        amounts=amounts,
+        caller=deployer_account,
+    )
+    assert revert_exception is None
+    assert events is not None
+    assert events.transfer is not None
+    assert events.investment_with_locking_mechanism_scenario is not None
+    assert [event.to_address for event in events.transfer] == recipients
+    assert [event.value for event in events.transfer] == amounts
+    for recipient, amount, scenario in zip(
+        recipients, amounts, events.investment_with_locking_mechanism_scenario
+    ):
+        # every recipient must be locked exactly like a single 'transferWithLocking'.
+        total_affected_tokens = amount - (
+            (amount * VALID_LOCKING_MECHANISM_FIRST_ROUND.releasing_tge_dividend_on_100)
+            // 100
+        )
+        assert scenario.mechanism_id == 1
+        assert scenario.account_address == recipient
+        assert scenario.amount_of_invest_in_qmatic == amount
+        assert scenario.total_affected_tokens == total_affected_tokens
+        assert (
+            scenario.linear_release_tokens_per_period
+            == (
+                VALID_LOCKING_MECHANISM_FIRST_ROUND.linear_release_dividend
+                * total_affected_tokens
+            )
+            // VALID_LOCKING_MECHANISM_FIRST_ROUND.linear_release_divisor
+        )
+        assert (
+            remaining_blocked_tokens_at_now_of_address(
+                qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+                target_address=recipient,
+                caller=deployer_account,
+            )
+            == total_affected_tokens
+        )
+
+
+@pytest.mark.parametrize(
+    "recipients_indexes, amounts, msg",
+    [
+        ([1, 2], [MINIMUM_AMOUNT_TO_SELL], BATCH_LENGTHS_MISMATCH_MESSAGE),
+        (
+            [1, 2],
+            [MINIMUM_AMOUNT_TO_SELL, ONE_WEI // 10**14],
+            INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+        ),
+        (
+            [1, 1],
+            [MINIMUM_AMOUNT_TO_SELL, MINIMUM_AMOUNT_TO_SELL],
+            WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+        ),
+    ],
+)
+def test_batch_transfer_with_locking_reverts_the_whole_batch(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    recipients_indexes: list[int],
+    amounts: list[int],
+    msg: str,
+) -> None:
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    events, revert_exception = batch_transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        recipients=[accounts[index].address for index in recipients_indexes],
+        amounts=amounts,
+        caller=deployer_account,
+    )
+    assert_has_reverted_message(events, revert_exception, msg)
+    assert (
+        balance_of(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            account_address=accounts[1].address,
+            caller=deployer_account,
+        )
+        == 0
+    )
+
+
+def test_batch_transfer_with_locking_on_deactivated_locking_mechanism(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    events, revert_exception = batch_transfer_with_locking(
+        qmatic_contract=minted_qmatic_contract,
+        recipients=[accounts[1].address],
+        amounts=[MINIMUM_AMOUNT_TO_SELL],
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    assert_has_reverted_message(
+        events, revert_exception, LOCKING_MECHANISM_IS_NOT_ACTIVATED
+    )
+
+
+def test_locked_wallet_keeps_its_mechanism_of_the_registry(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_account = accounts[INVESTOR_ACCOUNT_INDEX]
+    transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=investor_account.address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        caller=deployer_account,
+    )
+    second_round = GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=MONTH_IN_DAYS,
+        linear_release_period_in_days=MONTH_IN_DAYS,
+        linear_release_dividend=1,
+        linear_release_divisor=100,
+        releasing_tge_dividend_on_100=0,
+    )
+    deactivate_balance_locking_mechanism(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        caller=deployer_account,
+    )
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        entries=second_round,
+        caller=deployer_account,
+    )
+    assert (
+        balance_locking_mechanism_of_id(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            mechanism_id=1,
+            caller=deployer_account,
+        )
+        == VALID_LOCKING_MECHANISM_FIRST_ROUND
+    )
+    assert (
+        balance_locking_mechanism_of_id(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            mechanism_id=2,
+            caller=deployer_account,
+        )
+        == second_round
+    )
+    wallet_state = wallet_affected_by_locking_mechanism_state(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        account_address=investor_account.address,
+        caller=deployer_account,
+    )
+    assert wallet_state.mechanism == VALID_LOCKING_MECHANISM_FIRST_ROUND
+    assert wallet_state.total_affected_tokens == MINIMUM_AMOUNT_TO_SELL - (
+        (
+            MINIMUM_AMOUNT_TO_SELL
+            * VALID_LOCKING_MECHANISM_FIRST_ROUND.releasing_tge_dividend_on_100
+        )
+        // 100
+    )
+    assert (
+        wallet_affected_by_locking_mechanism_state(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            account_address=accounts[2].address,
+            caller=deployer_account,
+        ).mechanism
+        == GeneralActiveBalanceLockingMechanismStructure()
+    )
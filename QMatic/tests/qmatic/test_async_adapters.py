@@ -0,0 +1,145 @@
+import asyncio
+
+from brownie import accounts, web3
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    AsyncJsonRpcTransport,
+    active_balance_locking_mechanism,
+    async_contract_functions,
+    balance_of,
+    max_supply,
+    remaining_blocked_tokens_at_now_of_address,
+    transfer_with_locking,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.schemas import RevertedMessage
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING,
+    MINIMUM_AMOUNT_TO_SELL,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+)
+
+
+def test_async_reads_return_the_same_results_as_the_sync_adapters(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    for index, investor_address in enumerate(investor_addresses):
+        transfer_with_locking(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL * (index + 1),
+            caller=deployer_account,
+        )
+
+    async def read() -> tuple:
+        async with AsyncJsonRpcTransport(web3.provider.endpoint_uri) as transport:
+            return await asyncio.gather(
+                async_contract_functions.max_supply(
+                    transport,
+                    locking_mechanism_first_round_qmatic_contract,
+                    deployer_account,
+                ),
+                async_contract_functions.active_balance_locking_mechanism(
+                    transport,
+                    locking_mechanism_first_round_qmatic_contract,
+                    deployer_account,
+                ),
+                *(
+                    async_contract_functions.read_for_addresses(
+                        transport,
+                        locking_mechanism_first_round_qmatic_contract,
+                        adapter,
+                        investor_addresses,
+                        deployer_account,
+                        concurrency=4,
+                    )
+                    for adapter in (
+                        async_contract_functions.balance_of,
+                        async_contract_functions.wallet_affected_by_locking_mechanism_state,
+                        async_contract_functions.remaining_blocked_tokens_at_now_of_address,
+                    )
+                ),
+            )
+
+    supply, mechanism, *results_for_addresses = asyncio.run(read())
+    assert supply == max_supply(
+        locking_mechanism_first_round_qmatic_contract, deployer_account
+    )
+    assert mechanism == active_balance_locking_mechanism(
+        locking_mechanism_first_round_qmatic_contract, deployer_account
+    )
+    for adapter, results in zip(
+        (
+            balance_of,
+            wallet_affected_by_locking_mechanism_state,
+            remaining_blocked_tokens_at_now_of_address,
+        ),
+        results_for_addresses,
+    ):
+        assert list(results) == investor_addresses
+        for address, result in results.items():
+            assert result == adapter(
+                locking_mechanism_first_round_qmatic_contract, address, deployer_account
+            )
+
+
+def test_async_transfer_with_locking_returns_events_and_reverted_messages(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_address = accounts[INVESTOR_ACCOUNT_INDEX].address
+
+    async def transfer(amount: int) -> tuple:
+        async with AsyncJsonRpcTransport(web3.provider.endpoint_uri) as transport:
+            return await async_contract_functions.transfer_with_locking(
+                transport,
+                locking_mechanism_first_round_qmatic_contract,
+                investor_address,
+                amount,
+                deployer_account,
+            )
+
+    events, revert_exception = asyncio.run(
+        transfer(MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING - 1)
+    )
+    assert events is None
+    assert revert_exception == RevertedMessage(
+        msg=INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE
+    )
+
+    events, revert_exception = asyncio.run(transfer(MINIMUM_AMOUNT_TO_SELL))
+    assert revert_exception is None
+    assert events.transfer[0].to_address == investor_address
+    assert events.transfer[0].value == MINIMUM_AMOUNT_TO_SELL
+    investment = events.investment_with_locking_mechanism_scenario[0]
+    wallet_state = wallet_affected_by_locking_mechanism_state(
+        locking_mechanism_first_round_qmatic_contract,
+        investor_address,
+        deployer_account,
+    )
+    assert investment.account_address == investor_address
+    assert investment.started_date == wallet_state.started_date
+    assert investment.total_affected_tokens == wallet_state.total_affected_tokens
+    assert (
+        balance_of(
+            locking_mechanism_first_round_qmatic_contract,
+            investor_address,
+            deployer_account,
+        )
+        == MINIMUM_AMOUNT_TO_SELL
+    )
+
+    events, revert_exception = asyncio.run(transfer(MINIMUM_AMOUNT_TO_SELL))
+    assert events is None
+    assert revert_exception == RevertedMessage(
+        msg=WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM
+    )
@@ -0,0 +1,281 @@
+import json
+from pathlib import Path
+from threading import Timer
+
+import pytest
+from brownie import accounts, web3
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import balance_of, wallet_affected_by_locking_mechanism_state
+from QMatic.distribution import (
+    Allocation,
+    AllocationStatus,
+    DistributionJournal,
+    MirroredDistributionState,
+    distribute,
+    read_allocations,
+)
+from QMatic.tests.constants import (
+    DEFAULT_MINT_AMOUNT,
+    DEPLOYER_ACCOUNT_INDEX,
+    ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    MINIMUM_AMOUNT_TO_SELL,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+)
+
+
+def _write_allocations(path: Path, rows: list[tuple[str, int, bool]]) -> None:
+    with path.open("w") as target:
+        target.write("address,amount,with_locking\n")
+        for address, amount, with_locking in rows:
+            target.write(f"{address},{amount},{str(with_locking).lower()}\n")
+
+
+def test_read_allocations_from_csv_and_jsonl(tmp_path: Path) -> None:
+    csv_path = tmp_path / "allocations.csv"
+    _write_allocations(csv_path, [(accounts[1].address, 10, False)])
+    jsonl_path = tmp_path / "allocations.jsonl"
+    jsonl_path.write_text(json.dumps({"address": accounts[1].address, "amount": 10}))
+    assert list(read_allocations(csv_path)) == [
+        Allocation(index=0, address=accounts[1].address, amount=10, with_locking=False)
+    ]
+    assert list(read_allocations(jsonl_path)) == [
+        Allocation(index=0, address=accounts[1].address, amount=10, with_locking=True)
+    ]
+
+
+def test_distribution_validates_up_front_and_resumes_without_double_sending(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    allocations_path = tmp_path / "allocations.csv"
+    journal_path = tmp_path / "journal.jsonl"
+    _write_allocations(
+        allocations_path,
+        [
+            (accounts[1].address, MINIMUM_AMOUNT_TO_SELL, True),
+            (accounts[2].address, MINIMUM_AMOUNT_TO_SELL * 2, True),
+            # below the 'TF 2' minimum
+            (accounts[3].address, 10, True),
+            # the wallet is locked by the first allocation ('TF 3')
+            (accounts[1].address, MINIMUM_AMOUNT_TO_SELL, True),
+            (accounts[4].address, MINIMUM_AMOUNT_TO_SELL, False),
+            # more than the remaining balance of the deployer
+            (accounts[5].address, DEFAULT_MINT_AMOUNT, False),
+        ],
+    )
+    with DistributionJournal(journal_path) as journal:
+        report = distribute(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            allocations=read_allocations(allocations_path),
+            journal=journal,
+            caller=deployer_account,
+            multicall_contract=multicall_contract,
+            window_size=2,
+            chunk_size=4,
+        )
+    assert (report.confirmed, report.rejected, report.reverted) == (3, 3, 0)
+    assert {
+        entry.allocation.index: entry.msg
+        for entry in DistributionJournal(journal_path).entries.values()
+        if entry.status == AllocationStatus.REJECTED
+    } == {
+        2: INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+        3: WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+        5: ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE,
+    }
+    for index in (1, 2):
+        assert (
+            wallet_affected_by_locking_mechanism_state(
+                qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+                account_address=accounts[index].address,
+                caller=deployer_account,
+            ).started_date
+            != 0
+        )
+
+    # rerunning with the same journal must not send anything again.
+    deployer_balance = balance_of(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        account_address=deployer_account.address,
+        caller=deployer_account,
+    )
+    with DistributionJournal(journal_path) as journal:
+        report = distribute(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            allocations=read_allocations(allocations_path),
+            journal=journal,
+            caller=deployer_account,
+        )
+    assert report.skipped == 6
+    assert report.confirmed == report.rejected == report.resumed == 0
+    assert deployer_balance == balance_of(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        account_address=deployer_account.address,
+        caller=deployer_account,
+    )
+
+
+def test_distribution_resumes_an_allocation_that_was_not_broadcast(
+    minted_qmatic_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    allocation = Allocation(
+        index=0,
+        address=accounts[1].address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        with_locking=False,
+    )
+    journal_path = tmp_path / "journal.jsonl"
+    # simulates a crash between reserving the nonce and broadcasting the transaction.
+    with DistributionJournal(journal_path) as journal:
+        journal.started(web3.eth.block_number)
+        journal.record(
+            allocation,
+            AllocationStatus.SENDING,
+            nonce=deployer_account.nonce,
+        )
+    with DistributionJournal(journal_path) as journal:
+        report = distribute(
+            qmatic_contract=minted_qmatic_contract,
+            allocations=[allocation],
+            journal=journal,
+            caller=deployer_account,
+        )
+    assert (report.resumed, report.confirmed, report.skipped) == (1, 1, 1)
+    assert (
+        balance_of(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=accounts[1].address,
+            caller=deployer_account,
+        )
+        == MINIMUM_AMOUNT_TO_SELL
+    )
+
+    # the nonce is consumed now, resuming again only reconciles the journal.
+    with DistributionJournal(journal_path) as journal:
+        report = distribute(
+            qmatic_contract=minted_qmatic_contract,
+            allocations=[allocation],
+            journal=journal,
+            caller=deployer_account,
+        )
+    assert report.resumed == report.confirmed == 0
+    assert (
+        balance_of(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=accounts[1].address,
+            caller=deployer_account,
+        )
+        == MINIMUM_AMOUNT_TO_SELL
+    )
+
+
+def test_distribution_awaits_a_transaction_still_pending_at_crash_time(
+    minted_qmatic_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    allocation = Allocation(
+        index=0,
+        address=accounts[1].address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        with_locking=False,
+    )
+    journal_path = tmp_path / "journal.jsonl"
+    # simulates a crash while the transaction is still in the mempool.
+    web3.provider.make_request("miner_stop", [])
+    try:
+        nonce = deployer_account.nonce
+        tx = minted_qmatic_contract.transfer(
+            allocation.address,
+            allocation.amount,
+            {"from": deployer_account, "nonce": nonce, "required_confs": 0},
+        )
+        with DistributionJournal(journal_path) as journal:
+            journal.started(web3.eth.block_number)
+            journal.record(allocation, AllocationStatus.SENDING, nonce=nonce)
+            journal.record(allocation, AllocationStatus.SENT, tx_hash=tx.txid)
+        # the transaction is mined while the resumed distribution waits for it.
+        miner = Timer(1, web3.provider.make_request, ("miner_start", []))
+        miner.start()
+        with DistributionJournal(journal_path) as journal:
+            report = distribute(
+                qmatic_contract=minted_qmatic_contract,
+                allocations=[allocation],
+                journal=journal,
+                caller=deployer_account,
+            )
+        miner.join()
+    finally:
+        web3.provider.make_request("miner_start", [])
+    assert (report.resumed, report.confirmed, report.reverted) == (1, 1, 0)
+    assert deployer_account.nonce == nonce + 1
+    assert (
+        balance_of(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=accounts[1].address,
+            caller=deployer_account,
+        )
+        == MINIMUM_AMOUNT_TO_SELL
+    )
+
+
+def test_mirrored_state_compares_the_addresses_case_insensitively() -> None:
+    state = MirroredDistributionState(
+        available_balance=DEFAULT_MINT_AMOUNT, is_mechanism_activated=True
+    )
+    allocation = Allocation(
+        index=0, address=accounts[1].address, amount=MINIMUM_AMOUNT_TO_SELL
+    )
+    assert state.validate_allocation(allocation, is_already_locked=False) is None
+    state.apply(allocation)
+    assert (
+        state.validate_allocation(
+            allocation.copy(update={"index": 1, "address": allocation.address.lower()}),
+            is_already_locked=False,
+        )
+        == WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM
+    )
+
+
+def test_distribution_times_out_on_a_nonce_that_is_never_mined(
+    minted_qmatic_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    allocation = Allocation(
+        index=0,
+        address=accounts[1].address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        with_locking=False,
+    )
+    journal_path = tmp_path / "journal.jsonl"
+    # the transaction of the crashed run is broadcast, but its hash was never written.
+    web3.provider.make_request("miner_stop", [])
+    try:
+        nonce = deployer_account.nonce
+        minted_qmatic_contract.transfer(
+            allocation.address,
+            allocation.amount,
+            {"from": deployer_account, "nonce": nonce, "required_confs": 0},
+        )
+        with DistributionJournal(journal_path) as journal:
+            journal.started(web3.eth.block_number)
+            journal.record(allocation, AllocationStatus.SENDING, nonce=nonce)
+        with DistributionJournal(journal_path) as journal:
+            with pytest.raises(TimeoutError):
+                distribute(
+                    qmatic_contract=minted_qmatic_contract,
+                    allocations=[allocation],
+                    journal=journal,
+                    caller=deployer_account,
+                    settle_timeout=1,
+                )
+    finally:
+        web3.provider.make_request("miner_start", [])
@@ -0,0 +1,77 @@
+from brownie import accounts
+from brownie.network.contract import ProjectContract
+
+from QMatic.schemas import (
+    Events,
+    GeneralActiveBalanceLockingMechanismStructure,
+    WalletBalanceLockingMechanism,
+    compact_events_from_logs,
+    decode_raw_log,
+    events_from_logs,
+    to_compact,
+    to_model,
+)
+from QMatic.scripts.synthetic_logs import (
+    generic_events_from_logs,
+    synthetic_logs,
+    upgrading_qmatic_log,
+)
+from QMatic.tests.constants import DEPLOYER_ACCOUNT_INDEX, MINIMUM_AMOUNT_TO_SELL
+
+
+def test_raw_log_decoder_matches_the_generic_decoder() -> None:
+    logs = synthetic_logs(2_000) + [
+        upgrading_qmatic_log(
+            "0x" + "ab" * 20, 1_680_000_000, "https://qpoker.io/migration/report"
+        )
+    ]
+    assert events_from_logs(logs) == generic_events_from_logs(logs)
+
+
+def test_compact_schemas_convert_to_and_from_the_models() -> None:
+    logs = synthetic_logs(2_000)
+    events = events_from_logs(logs)
+    for field_name, compact_events in compact_events_from_logs(logs).items():
+        assert [to_model(event) for event in compact_events] == getattr(
+            events, field_name
+        )
+        assert [to_compact(event) for event in getattr(events, field_name)] == (
+            compact_events
+        )
+    wallet = WalletBalanceLockingMechanism(
+        started_date=1_680_000_000,
+        total_affected_tokens=850,
+        linear_release_tokens_per_period=100,
+        mechanism=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=90,
+            linear_release_period_in_days=30,
+            linear_release_dividend=1,
+            linear_release_divisor=10,
+            releasing_tge_dividend_on_100=15,
+        ),
+    )
+    assert to_model(to_compact(wallet)) == wallet
+
+
+def test_raw_log_decoder_skips_unknown_events() -> None:
+    log = {"topics": ["0x" + "00" * 32], "data": "0x"}
+    assert decode_raw_log(log) is None
+    assert events_from_logs([log]) == Events()
+
+
+def test_raw_log_decoder_matches_events_from_tx(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    tx = locking_mechanism_first_round_qmatic_contract.batchTransferWithLocking(
+        [accounts[1].address, accounts[2].address],
+        [MINIMUM_AMOUNT_TO_SELL, MINIMUM_AMOUNT_TO_SELL * 2],
+        {"from": deployer_account},
+    )
+    assert events_from_logs(tx.logs) == Events.from_tx(tx.events)
+    tx = (
+        locking_mechanism_first_round_qmatic_contract.deactivateBalanceLockingMechanism(
+            {"from": deployer_account}
+        )
+    )
+    assert events_from_logs(tx.logs) == Events.from_tx(tx.events)
@@ -0,0 +1,118 @@
+from pathlib import Path
+
+from brownie import accounts, chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    balance_of,
+    deactivate_balance_locking_mechanism,
+    normal_transfer,
+    transfer_with_locking,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.indexer import EventIndexer, IndexerStore
+from QMatic.tests.constants import DEPLOYER_ACCOUNT_INDEX, MINIMUM_AMOUNT_TO_SELL
+
+
+def _assert_store_matches_the_chain(
+    store: IndexerStore, qmatic_contract: ProjectContract, caller: Account
+) -> None:
+    for account in accounts:
+        assert store.balance_of(account.address) == balance_of(
+            qmatic_contract=qmatic_contract,
+            account_address=account.address,
+            caller=caller,
+        )
+        assert store.lock_of(
+            account.address
+        ) == wallet_affected_by_locking_mechanism_state(
+            qmatic_contract=qmatic_contract,
+            account_address=account.address,
+            caller=caller,
+        )
+
+
+def test_indexer_materializes_the_state_and_resumes_from_its_cursor(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    for index in (1, 2):
+        transfer_with_locking(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            to=accounts[index].address,
+            amount=MINIMUM_AMOUNT_TO_SELL * index,
+            caller=deployer_account,
+        )
+    normal_transfer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=accounts[3].address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        caller=deployer_account,
+    )
+    store_path = tmp_path / "qmatic.sqlite"
+    indexer = EventIndexer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        store=IndexerStore(store_path),
+        block_range=2,
+    )
+    assert indexer.sync() > 0
+    _assert_store_matches_the_chain(
+        indexer.store, locking_mechanism_first_round_qmatic_contract, deployer_account
+    )
+    assert indexer.store.active_mechanism_id() == 1
+    assert sorted(indexer.store.locked_addresses(mechanism_id=1)) == sorted(
+        [accounts[1].address, accounts[2].address]
+    )
+    assert indexer.store.top_holders(limit=1)[0][0] == deployer_account.address
+    indexer.store.close()
+
+    # a new indexer on the same database only scans the blocks after the cursor.
+    deactivate_balance_locking_mechanism(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        caller=deployer_account,
+    )
+    normal_transfer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=accounts[4].address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        caller=deployer_account,
+    )
+    indexer = EventIndexer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        store=IndexerStore(store_path),
+    )
+    assert indexer.sync() == 2
+    assert indexer.store.active_mechanism_id() is None
+    _assert_store_matches_the_chain(
+        indexer.store, locking_mechanism_first_round_qmatic_contract, deployer_account
+    )
+
+
+def test_indexer_rolls_back_a_reorg(minted_qmatic_contract: ProjectContract) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    indexer = EventIndexer(qmatic_contract=minted_qmatic_contract, store=IndexerStore())
+    normal_transfer(
+        qmatic_contract=minted_qmatic_contract,
+        to=accounts[1].address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        caller=deployer_account,
+    )
+    indexer.sync()
+    assert indexer.store.balance_of(accounts[1].address) == MINIMUM_AMOUNT_TO_SELL
+
+    # the indexed block is replaced by another block with the same number.
+    chain.undo()
+    normal_transfer(
+        qmatic_contract=minted_qmatic_contract,
+        to=accounts[2].address,
+        amount=MINIMUM_AMOUNT_TO_SELL * 2,
+        caller=deployer_account,
+    )
+    assert indexer.sync() == 1
+    assert indexer.store.balance_of(accounts[1].address) == 0
+    assert indexer.store.balance_of(accounts[2].address) == MINIMUM_AMOUNT_TO_SELL * 2
+    _assert_store_matches_the_chain(
+        indexer.store, minted_qmatic_contract, deployer_account
+    )
@@ -0,0 +1,117 @@
+import inspect
+import json
+from pathlib import Path
+
+from brownie import accounts
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import balance_of, transfer_with_locking
+from QMatic.adapters import contract_functions, instrumentation
+from QMatic.adapters.instrumentation import (
+    HistogramSink,
+    Instrumentation,
+    JsonlTraceSink,
+    PrometheusTextSink,
+)
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+)
+
+
+def test_instrumented_adapters_record_latency_rpc_gas_and_reverts(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract, tmp_path: Path
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_address = accounts[INVESTOR_ACCOUNT_INDEX].address
+    instrumentation = Instrumentation()
+    instrumented_balance_of = instrumentation.wrap(balance_of)
+    instrumented_transfer_with_locking = instrumentation.wrap(transfer_with_locking)
+
+    # without sinks nothing is recorded.
+    instrumented_balance_of(
+        locking_mechanism_first_round_qmatic_contract,
+        investor_address,
+        deployer_account,
+    )
+    histogram_sink = HistogramSink()
+    prometheus_sink = PrometheusTextSink(tmp_path / "qmatic.prom")
+    trace_sink = JsonlTraceSink(tmp_path / "trace.jsonl")
+    for sink in (histogram_sink, prometheus_sink, trace_sink):
+        instrumentation.add_sink(sink)
+    try:
+        for _ in range(2):
+            instrumented_transfer_with_locking(
+                qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+                to=investor_address,
+                amount=MINIMUM_AMOUNT_TO_SELL,
+                caller=deployer_account,
+            )
+        assert (
+            instrumented_balance_of(
+                qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+                account_address=investor_address,
+                caller=deployer_account,
+            )
+            == MINIMUM_AMOUNT_TO_SELL
+        )
+    finally:
+        instrumentation.close()
+
+    transfers = histogram_sink.histograms["transfer_with_locking"]
+    assert transfers.count == 2
+    # brownie broadcasts the reverting transactions of the development network, so the revert may have one too.
+    assert transfers.transactions >= 1
+    assert transfers.gas_used > 0
+    assert transfers.rpc_count > 0
+    assert dict(transfers.reverts) == {
+        WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM: 1
+    }
+    reads = histogram_sink.histograms["balance_of"]
+    assert (reads.count, reads.transactions) == (1, 0)
+    assert reads.rpc_count >= 1
+
+    trace = [
+        json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()
+    ]
+    assert [call["adapter"] for call in trace] == [
+        "transfer_with_locking",
+        "transfer_with_locking",
+        "balance_of",
+    ]
+    assert [call["revert_message"] for call in trace] == [
+        None,
+        WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+        None,
+    ]
+    assert trace[0]["gas_used"] > 0
+    assert trace[2]["gas_used"] is None
+
+    metrics = (tmp_path / "qmatic.prom").read_text()
+    assert (
+        'qmatic_adapter_duration_seconds_count{adapter="transfer_with_locking"} 2'
+        in metrics
+    )
+    assert (
+        f'qmatic_adapter_reverts_total{{adapter="transfer_with_locking",message="{WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM}"}} 1'
+        in metrics
+    )
+
+
+def test_every_public_adapter_is_instrumented() -> None:
+    public_adapters = {
+        adapter_name: adapter
+        for adapter_name, adapter in inspect.getmembers(
+            contract_functions, inspect.isfunction
+        )
+        if adapter.__module__ == contract_functions.__name__
+        and not adapter_name.startswith("_")
+    }
+    assert public_adapters
+    for adapter_name, adapter in public_adapters.items():
+        instrumented_adapter = getattr(instrumentation, adapter_name, None)
+        assert instrumented_adapter is not None, f"{adapter_name} is not instrumented"
+        assert instrumented_adapter.__wrapped__ is adapter
@@ -0,0 +1,46 @@
+from brownie import accounts, chain
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import balance_of, normal_transfer
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    ONE_WEI,
+)
+from QMatic.tests.isolation import nested_snapshot
+
+
+def test_nested_snapshot_keeps_the_isolation_snapshot(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    isolation_snapshot_id = chain._snapshot_id
+    normal_transfer(
+        qmatic_contract=minted_qmatic_contract,
+        to=accounts[INVESTOR_ACCOUNT_INDEX].address,
+        amount=ONE_WEI,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    with nested_snapshot():
+        normal_transfer(
+            qmatic_contract=minted_qmatic_contract,
+            to=accounts[INVESTOR_ACCOUNT_INDEX].address,
+            amount=ONE_WEI,
+            caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+        )
+        assert (
+            balance_of(
+                qmatic_contract=minted_qmatic_contract,
+                account_address=accounts[INVESTOR_ACCOUNT_INDEX].address,
+                caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+            )
+            == 2 * ONE_WEI
+        )
+    assert (
+        balance_of(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=accounts[INVESTOR_ACCOUNT_INDEX].address,
+            caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+        )
+        == ONE_WEI
+    )
+    assert chain._snapshot_id == isolation_snapshot_id
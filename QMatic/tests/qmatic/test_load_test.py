@@ -0,0 +1,37 @@
+from brownie import accounts
+
+from QMatic.load_test import LoadTestConfig, run_load_test
+from QMatic.tests.constants import MONTH_IN_DAYS
+
+
+def test_load_test_replays_the_workload_without_reverts() -> None:
+    config = LoadTestConfig(
+        investors_count=30,
+        active_investors_count=6,
+        locking_batch_size=4,
+        days_steps=[0, 6 * MONTH_IN_DAYS],
+        concurrency_levels=[1, 4],
+        operations_per_level=10,
+    )
+    accounts_count = len(accounts)
+    report = run_load_test(config)
+
+    assert len(accounts) == accounts_count
+
+    assert report.investors == config.investors_count
+    assert [(level.days, level.concurrency) for level in report.levels] == [
+        (days, concurrency)
+        for days in config.days_steps
+        for concurrency in config.concurrency_levels
+    ]
+    assert all(level.reverted == 0 for level in report.levels)
+    assert sum(latency.calls for latency in report.latencies) == sum(
+        level.operations for level in report.levels
+    )
+    gas_of_type = {gas.transaction_type: gas for gas in report.gas}
+    # 10 investors per mechanism are locked by batches of 4.
+    assert gas_of_type["batchTransferWithLocking"].transactions == 3 * 3
+    assert gas_of_type["initActiveBalanceLockingMechanism"].transactions == len(
+        config.mechanisms
+    )
+    assert gas_of_type["transfer"].transactions > 0
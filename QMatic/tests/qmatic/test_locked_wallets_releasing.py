@@ -7,6 +7,7 @@ from brownie.network.contract import ProjectContract
 
 from QMatic.adapters.contract_functions import (
     balance_of,
+    clear_fully_vested_locking_mechanism_of,
     development_push_date_of_contract,
     initializing_active_balance_locking_mechanism,
     mint,
@@ -36,6 +37,8 @@ from QMatic.tests.constants import (
     INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
     LOCKING_MECHANISM_IS_NOT_ACTIVATED,
     WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+    WALLET_IS_NOT_FULLY_VESTED,
+    YEAR_IN_DAYS,
 )
 
 
@@ -785,3 +788,110 @@ def test_remaining_locked_tokens_with_just_linear_releasing_locking_mechanism_on
     print("actual_remaining_blocked_tokens", actual_remaining_blocked_tokens)
 
     assert actual_remaining_blocked_tokens == expected_remaining_blocked_tokens
+
+
+def test_first_transfer_of_a_fully_vested_wallet_clears_its_lock(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    investor_account: Account = accounts[INVESTOR_ACCOUNT_INDEX]
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    amount_to_sell: int = 1_000 * ONE_WEI
+    transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=investor_account.address,
+        amount=amount_to_sell,
+        caller=deployer_account,
+    )
+    # 3 months of cliff and 10 monthly periods of 10%.
+    development_push_date_of_contract(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        days=2 * YEAR_IN_DAYS,
+        caller=deployer_account,
+    )
+    events, revert_exception = normal_transfer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=deployer_account.address,
+        amount=ONE_WEI,
+        caller=investor_account,
+    )
+    assert revert_exception is None
+    assert events is not None
+    assert events.locking_mechanism_cleared is not None
+    assert events.locking_mechanism_cleared[0].mechanism_id == 1
+    assert (
+        events.locking_mechanism_cleared[0].account_address == investor_account.address
+    )
+    assert (
+        wallet_affected_by_locking_mechanism_state(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            account_address=investor_account.address,
+            caller=investor_account,
+        ).started_date
+        == 0
+    )
+    # the next transfer takes the fast path and does not emit the event again.
+    events, revert_exception = normal_transfer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=deployer_account.address,
+        amount=ONE_WEI,
+        caller=investor_account,
+    )
+    assert revert_exception is None
+    assert events is not None
+    assert events.locking_mechanism_cleared is None
+    # a cleared wallet can be locked again.
+    _, revert_exception = transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=investor_account.address,
+        amount=amount_to_sell,
+        caller=deployer_account,
+    )
+    assert revert_exception is None
+
+
+def test_clear_fully_vested_locking_mechanism_on_demand(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    investor_account: Account = accounts[INVESTOR_ACCOUNT_INDEX]
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    random_account: Account = accounts[AGENT_ACCOUNT_INDEX]
+    transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=investor_account.address,
+        amount=1_000 * ONE_WEI,
+        caller=deployer_account,
+    )
+    for target_address in (investor_account.address, deployer_account.address):
+        events, revert_exception = clear_fully_vested_locking_mechanism_of(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            target_address=target_address,
+            caller=random_account,
+        )
+        assert events is None
+        assert revert_exception is not None
+        assert revert_exception.msg == WALLET_IS_NOT_FULLY_VESTED
+
+    development_push_date_of_contract(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        days=2 * YEAR_IN_DAYS,
+        caller=deployer_account,
+    )
+    events, revert_exception = clear_fully_vested_locking_mechanism_of(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        target_address=investor_account.address,
+        caller=random_account,
+    )
+    assert revert_exception is None
+    assert events is not None
+    assert events.locking_mechanism_cleared is not None
+    assert (
+        events.locking_mechanism_cleared[0].account_address == investor_account.address
+    )
+    assert (
+        remaining_blocked_tokens_at_now_of_address(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            target_address=investor_account.address,
+            caller=investor_account,
+        )
+        == 0
+    )
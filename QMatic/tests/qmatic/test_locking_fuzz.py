@@ -0,0 +1,321 @@
+from typing import Callable, Union
+
+import numpy as np
+import pytest
+from brownie import accounts, chain, history
+from brownie.network.contract import ProjectContract
+from hypothesis import strategies as st
+
+from QMatic.adapters import (
+    balance_of,
+    batch_read,
+    deactivate_balance_locking_mechanism,
+    initializing_active_balance_locking_mechanism,
+    normal_transfer,
+    remaining_blocked_tokens_at_now_of_address,
+    transfer_with_locking,
+)
+from QMatic.schemas import (
+    GeneralActiveBalanceLockingMechanismStructure,
+    WalletBalanceLockingMechanism,
+)
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    INVESTOR_ACCOUNT_INDEX,
+    LINEAR_RELEASED_DIVISOR_SUPPORTS,
+    LOCKING_MECHANISM_IS_NOT_ACTIVATED,
+    MEANINGLESS_LOCKING_MECHANISM_ERROR_MESSAGE,
+    MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING,
+    MONTH_IN_DAYS,
+    ONE_DAY_IN_SECONDS,
+    ONE_WEI,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+    YEAR_IN_DAYS,
+)
+from QMatic.vesting import (
+    build_wallet_locking_arrays,
+    init_wallet_balance_locking_mechanism,
+    remaining_blocked_tokens,
+    remaining_blocked_tokens_of,
+)
+
+INVESTORS_COUNT: int = 6
+# the transfers move a share (out of SHARE_DENOMINATOR) of the sender balance, above 1 is more than the balance.
+SHARE_DENOMINATOR: int = 100_000
+# every example starts from a snapshot of the deployed contract.
+FUZZ_SETTINGS: dict[str, int] = {"max_examples": 100, "stateful_step_count": 25}
+# the mechanism of the 'locking_mechanism_first_round_qmatic_contract' fixture.
+FIRST_ROUND_MECHANISM = GeneralActiveBalanceLockingMechanismStructure(
+    cliff_duration_in_days=3 * MONTH_IN_DAYS,
+    linear_release_period_in_days=1 * MONTH_IN_DAYS,
+    linear_release_dividend=1,
+    linear_release_divisor=10,
+    releasing_tge_dividend_on_100=15,
+)
+
+
+class LockingMathsStateMachine:
+    """
+    random mechanisms (within the 'TF' divisor rules), investments, transfers and time jumps,
+    every result of the contract is compared to the vesting engine and a mirror of the balances and locks.
+    """
+
+    investor = st.integers(min_value=0, max_value=INVESTORS_COUNT - 1)
+    # INVESTORS_COUNT is the deployer.
+    receiver = st.integers(min_value=0, max_value=INVESTORS_COUNT)
+    invest_amount = st.one_of(
+        st.integers(min_value=0, max_value=2 * MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING),
+        st.integers(
+            min_value=MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING,
+            max_value=10_000_000 * ONE_WEI,
+        ),
+    )
+    transfer_share = st.integers(min_value=0, max_value=6 * SHARE_DENOMINATOR // 5)
+    cliff_duration_in_days = st.integers(min_value=0, max_value=2 * YEAR_IN_DAYS)
+    linear_release_period_in_days = st.integers(min_value=1, max_value=YEAR_IN_DAYS)
+    dividend_share = st.integers(min_value=0, max_value=SHARE_DENOMINATOR)
+    releasing_tge_dividend_on_100 = st.integers(min_value=0, max_value=100)
+    jump_in_seconds = st.integers(
+        min_value=1, max_value=4 * MONTH_IN_DAYS * ONE_DAY_IN_SECONDS
+    )
+    boundary_period = st.integers(min_value=0, max_value=12)
+    boundary_delta = st.sampled_from((-1, 0, 1))
+
+    def __init__(
+        cls,
+        qmatic_contract: ProjectContract,
+        multicall_contract: ProjectContract,
+        linear_release_divisor: int,
+    ) -> None:
+        cls.qmatic_contract = qmatic_contract
+        cls.multicall_contract = multicall_contract
+        cls.linear_release_divisor = linear_release_divisor
+        cls.deployer_account = accounts[DEPLOYER_ACCOUNT_INDEX]
+        cls.investor_accounts = accounts[
+            INVESTOR_ACCOUNT_INDEX : INVESTOR_ACCOUNT_INDEX + INVESTORS_COUNT
+        ]
+
+    def setup(self) -> None:
+        self.active_mechanism: Union[
+            GeneralActiveBalanceLockingMechanismStructure, None
+        ] = FIRST_ROUND_MECHANISM
+        self.balances = [0] * INVESTORS_COUNT
+        self.wallets = [WalletBalanceLockingMechanism()] * INVESTORS_COUNT
+
+    def _remaining_at(self, investor: int, time_now: int) -> int:
+        return remaining_blocked_tokens_of(self.wallets[investor], time_now)
+
+    def _release_boundary(
+        self, investor: int, boundary_period: int, boundary_delta: int
+    ) -> Union[int, None]:
+        """
+        the timestamp next to the end of the cliff or of a period of `investor`, where an off-by-one would show up.
+        """
+        wallet = self.wallets[investor]
+        if wallet.started_date == 0 or wallet.mechanism is None:
+            return None
+        return (
+            wallet.started_date
+            + (
+                wallet.mechanism.cliff_duration_in_days
+                + boundary_period * wallet.mechanism.linear_release_period_in_days
+            )
+            * ONE_DAY_IN_SECONDS
+            + boundary_delta
+        )
+
+    def _transfer(self, investor: int, receiver: int, transfer_share: int) -> None:
+        balance = self.balances[investor]
+        amount = balance * transfer_share // SHARE_DENOMINATOR
+        receiver_address = (
+            self.deployer_account.address
+            if receiver == INVESTORS_COUNT
+            else self.investor_accounts[receiver].address
+        )
+        _, revert_exception = normal_transfer(
+            qmatic_contract=self.qmatic_contract,
+            to=receiver_address,
+            amount=amount,
+            caller=self.investor_accounts[investor],
+        )
+        # the development network mines the reverted transactions too, so the block time of the transfer is exact.
+        transfer_tx = history[-1]
+        assert transfer_tx.fn_name == "transfer"
+        mined_at = transfer_tx.timestamp
+        is_accepted = amount <= balance and balance - amount >= self._remaining_at(
+            investor, mined_at
+        )
+        assert (revert_exception is None) == is_accepted
+        if revert_exception is not None:
+            return
+        # '_beforeTokenTransfer' deletes the lock record of a fully vested sender.
+        if (
+            self.wallets[investor].started_date != 0
+            and self._remaining_at(investor, mined_at) == 0
+        ):
+            self.wallets[investor] = WalletBalanceLockingMechanism()
+        self.balances[investor] -= amount
+        if receiver < INVESTORS_COUNT:
+            self.balances[receiver] += amount
+
+    def rule_new_mechanism(
+        self,
+        cliff_duration_in_days: int,
+        linear_release_period_in_days: int,
+        dividend_share: int,
+        releasing_tge_dividend_on_100: int,
+    ) -> None:
+        dividend = dividend_share * self.linear_release_divisor // SHARE_DENOMINATOR
+        _, revert_exception = initializing_active_balance_locking_mechanism(
+            qmatic_contract=self.qmatic_contract,
+            entries=GeneralActiveBalanceLockingMechanismStructure(
+                cliff_duration_in_days=cliff_duration_in_days,
+                linear_release_period_in_days=linear_release_period_in_days,
+                linear_release_dividend=dividend,
+                linear_release_divisor=self.linear_release_divisor,
+                releasing_tge_dividend_on_100=releasing_tge_dividend_on_100,
+            ),
+            caller=self.deployer_account,
+        )
+        if dividend == 0 and cliff_duration_in_days == 0:
+            assert revert_exception is not None
+            assert revert_exception.msg == MEANINGLESS_LOCKING_MECHANISM_ERROR_MESSAGE
+            return
+        assert revert_exception is None
+        # a cliff-only mechanism is stored without linear release.
+        self.active_mechanism = GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=cliff_duration_in_days,
+            linear_release_period_in_days=(
+                linear_release_period_in_days if dividend else 0
+            ),
+            linear_release_dividend=dividend,
+            linear_release_divisor=self.linear_release_divisor if dividend else 0,
+            releasing_tge_dividend_on_100=releasing_tge_dividend_on_100,
+        )
+
+    def rule_deactivate(self) -> None:
+        _, revert_exception = deactivate_balance_locking_mechanism(
+            qmatic_contract=self.qmatic_contract, caller=self.deployer_account
+        )
+        assert revert_exception is None
+        self.active_mechanism = None
+
+    def rule_invest(self, investor: int, invest_amount: int) -> None:
+        events, revert_exception = transfer_with_locking(
+            qmatic_contract=self.qmatic_contract,
+            to=self.investor_accounts[investor].address,
+            amount=invest_amount,
+            caller=self.deployer_account,
+        )
+        if invest_amount < MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING:
+            expected_revert = INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE
+        elif self.active_mechanism is None:
+            expected_revert = LOCKING_MECHANISM_IS_NOT_ACTIVATED
+        elif self.wallets[investor].started_date != 0:
+            expected_revert = WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM
+        else:
+            expected_revert = None
+        assert (None if revert_exception is None else revert_exception.msg) == (
+            expected_revert
+        )
+        if expected_revert is not None:
+            return
+        assert self.active_mechanism is not None
+        wallet = init_wallet_balance_locking_mechanism(
+            amount=invest_amount,
+            mechanism=self.active_mechanism,
+            started_date=history[-1].timestamp,
+        )
+        assert (
+            events is not None
+            and events.investment_with_locking_mechanism_scenario is not None
+        )
+        investment = events.investment_with_locking_mechanism_scenario[0]
+        assert (
+            investment.started_date,
+            investment.total_affected_tokens,
+            investment.linear_release_tokens_per_period,
+        ) == (
+            wallet.started_date,
+            wallet.total_affected_tokens,
+            wallet.linear_release_tokens_per_period,
+        )
+        self.wallets[investor] = wallet
+        self.balances[investor] += invest_amount
+
+    def rule_transfer(self, investor: int, receiver: int, transfer_share: int) -> None:
+        self._transfer(investor, receiver, transfer_share)
+
+    def rule_transfer_at_release_boundary(
+        self,
+        investor: int,
+        receiver: int,
+        transfer_share: int,
+        boundary_period: int,
+        boundary_delta: int,
+    ) -> None:
+        """
+        pins the clock next to a release boundary of `investor` before the transfer,
+        the block of the transfer follows within the second of the pinned block.
+        """
+        target = self._release_boundary(investor, boundary_period, boundary_delta)
+        if target is not None and target > chain[-1].timestamp:
+            chain.mine(timestamp=target)
+        self._transfer(investor, receiver, transfer_share)
+
+    def rule_jump(self, jump_in_seconds: int) -> None:
+        chain.mine(timestamp=chain[-1].timestamp + jump_in_seconds)
+
+    def rule_jump_to_release_boundary(
+        self, investor: int, boundary_period: int, boundary_delta: int
+    ) -> None:
+        target = self._release_boundary(investor, boundary_period, boundary_delta)
+        if target is not None and target > chain[-1].timestamp:
+            chain.mine(timestamp=target)
+
+    def invariant_matches_the_vesting_engine(self) -> None:
+        block = chain[-1]
+        addresses = [account.address for account in self.investor_accounts]
+        results = batch_read(
+            qmatic_contract=self.qmatic_contract,
+            multicall_contract=self.multicall_contract,
+            requests=[
+                (adapter, address)
+                for address in addresses
+                for adapter in (balance_of, remaining_blocked_tokens_at_now_of_address)
+            ],
+            caller=self.deployer_account,
+            block_identifier=block.number,
+        )
+        balances, remaining = results[0::2], results[1::2]
+        assert balances == self.balances
+        assert remaining == [
+            self._remaining_at(investor, block.timestamp)
+            for investor in range(INVESTORS_COUNT)
+        ]
+        assert (
+            list(
+                remaining_blocked_tokens(
+                    wallets=build_wallet_locking_arrays(self.wallets),
+                    timestamps=np.array([block.timestamp], dtype=np.int64),
+                )[:, 0]
+            )
+            == remaining
+        )
+
+
+@pytest.mark.parametrize("linear_release_divisor", LINEAR_RELEASED_DIVISOR_SUPPORTS)
+def test_locking_maths_against_the_vesting_engine(
+    state_machine: Callable[..., None],
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    linear_release_divisor: int,
+) -> None:
+    state_machine(
+        LockingMathsStateMachine,
+        locking_mechanism_first_round_qmatic_contract,
+        multicall_contract,
+        linear_release_divisor,
+        settings=FUZZ_SETTINGS,
+    )
@@ -0,0 +1,98 @@
+import asyncio
+
+from brownie import accounts, web3
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    AsyncJsonRpcTransport,
+    async_contract_functions,
+    development_push_date_of_contract,
+    linear_release_dividend_and_divisor_of_address,
+    linear_release_period_and_amount_of_address,
+    locking_statuses_of_addresses,
+    remaining_blocked_tokens_at_now_of_address,
+    remaining_seconds_to_finishing_the_cliff_of_address,
+    transfer_with_locking,
+)
+from QMatic.schemas import WalletLockingStatus
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+)
+
+
+def _single_reads_status(
+    qmatic_contract: ProjectContract, address: str, caller: Account
+) -> WalletLockingStatus:
+    period = linear_release_period_and_amount_of_address(
+        qmatic_contract, address, caller
+    )
+    share = linear_release_dividend_and_divisor_of_address(
+        qmatic_contract, address, caller
+    )
+    return WalletLockingStatus(
+        remaining_blocked_tokens=remaining_blocked_tokens_at_now_of_address(
+            qmatic_contract, address, caller
+        ),
+        remaining_seconds_to_finishing_the_cliff=remaining_seconds_to_finishing_the_cliff_of_address(
+            qmatic_contract, address, caller
+        ),
+        period_in_days=period.period_in_days,
+        release_amount_per_period=period.release_amount_per_period,
+        dividend=share.dividend,
+        divisor=share.divisor,
+    )
+
+
+def test_locking_statuses_return_the_same_results_as_the_single_reads(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    # the last investors stay without lock record.
+    for index, investor_address in enumerate(investor_addresses[:-2]):
+        transfer_with_locking(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL * (index + 1),
+            caller=deployer_account,
+        )
+    addresses = [deployer_account.address] + investor_addresses
+
+    # in the cliff, in the linear release and fully vested.
+    for days in (MONTH_IN_DAYS, 5 * MONTH_IN_DAYS, 14 * MONTH_IN_DAYS):
+        development_push_date_of_contract(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            days=days,
+            caller=deployer_account,
+        )
+        statuses = locking_statuses_of_addresses(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            addresses=addresses,
+            caller=deployer_account,
+            chunk_size=3,
+        )
+
+        async def read() -> dict[str, WalletLockingStatus]:
+            async with AsyncJsonRpcTransport(web3.provider.endpoint_uri) as transport:
+                return await async_contract_functions.locking_statuses_of_addresses(
+                    transport,
+                    locking_mechanism_first_round_qmatic_contract,
+                    addresses,
+                    deployer_account,
+                    chunk_size=4,
+                )
+
+        assert asyncio.run(read()) == statuses
+        assert list(statuses) == addresses
+        for address, status in statuses.items():
+            assert status == _single_reads_status(
+                locking_mechanism_first_round_qmatic_contract,
+                address,
+                deployer_account,
+            )
@@ -0,0 +1,264 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from brownie import accounts
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    allocations_merkle_root,
+    balance_of,
+    claim_locked_allocation,
+    clear_fully_vested_locking_mechanism_of,
+    commit_allocations_merkle_root,
+    deactivate_balance_locking_mechanism,
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    is_allocation_claimed,
+    transfer_with_locking,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.distribution import (
+    Allocation,
+    build_allocations_merkle_tree,
+    iter_allocation_proofs,
+    proof_of,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.tests.constants import (
+    ALLOCATION_IS_ALREADY_CLAIMED,
+    DEPLOYER_ACCOUNT_INDEX,
+    EMPTY_BALANCE_AMOUNT,
+    INVALID_ALLOCATION_PROOF,
+    INVESTOR_ACCOUNT_INDEX,
+    LOCKING_MECHANISM_IS_NOT_ACTIVATED,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+)
+
+CLAIMING_INVESTORS_COUNT: int = 6
+# the cliff (3 months) and the 10 periods (1 month) of the first round mechanism are over.
+FULLY_VESTED_DAYS: int = 14 * MONTH_IN_DAYS
+
+
+def _allocations() -> list[Allocation]:
+    return [
+        Allocation(
+            index=index,
+            address=account.address,
+            amount=MINIMUM_AMOUNT_TO_SELL + index * 1_234 * ONE_WEI,
+            mechanism_id=1 if index % 2 == 0 else 2,
+        )
+        for index, account in enumerate(
+            accounts[
+                INVESTOR_ACCOUNT_INDEX : INVESTOR_ACCOUNT_INDEX
+                + CLAIMING_INVESTORS_COUNT
+            ]
+        )
+    ]
+
+
+def test_claiming_locked_allocations(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract, tmp_path: Path
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        entries=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=2 * MONTH_IN_DAYS,
+        ),
+        caller=deployer_account,
+    )
+    allocations = _allocations()
+    tree = build_allocations_merkle_tree(allocations, tmp_path / "tree")
+    events, revert_exception = commit_allocations_merkle_root(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        merkle_root=tree.root,
+        caller=deployer_account,
+    )
+    assert revert_exception is None
+    assert events is not None and events.allocations_merkle_root_committed is not None
+    root = "0x" + tree.root.hex()
+    assert events.allocations_merkle_root_committed[0].merkle_root == root
+    assert (
+        allocations_merkle_root(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            caller=deployer_account,
+        )
+        == root
+    )
+
+    for allocation, proof in iter_allocation_proofs(tree, allocations):
+        assert allocation.mechanism_id is not None
+        investor_account = accounts.at(allocation.address)
+        events, revert_exception = claim_locked_allocation(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            amount=allocation.amount,
+            mechanism_id=allocation.mechanism_id,
+            proof=proof,
+            caller=investor_account,
+        )
+        assert revert_exception is None
+        assert (
+            events is not None
+            and events.investment_with_locking_mechanism_scenario is not None
+        )
+        investment = events.investment_with_locking_mechanism_scenario[0]
+        assert (
+            investment.mechanism_id,
+            investment.account_address,
+            investment.amount_of_invest_in_qmatic,
+        ) == (allocation.mechanism_id, allocation.address, allocation.amount)
+        assert (
+            balance_of(
+                qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+                account_address=allocation.address,
+                caller=deployer_account,
+            )
+            == allocation.amount
+        )
+        assert is_allocation_claimed(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            account_address=allocation.address,
+            amount=allocation.amount,
+            mechanism_id=allocation.mechanism_id,
+            caller=deployer_account,
+        )
+
+    # the active mechanism is the second one, the claimed lock is the same as a transferWithLocking lock.
+    pushed_address = accounts[INVESTOR_ACCOUNT_INDEX + CLAIMING_INVESTORS_COUNT].address
+    transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=pushed_address,
+        amount=allocations[1].amount,
+        caller=deployer_account,
+    )
+    pushed_lock, claimed_lock = (
+        wallet_affected_by_locking_mechanism_state(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            account_address=address,
+            caller=deployer_account,
+        )
+        for address in (pushed_address, allocations[1].address)
+    )
+    assert claimed_lock.copy(update={"started_date": 0}) == pushed_lock.copy(
+        update={"started_date": 0}
+    )
+
+
+def test_claiming_twice_or_with_an_invalid_proof(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract, tmp_path: Path
+) -> None:
+    allocations = [
+        allocation.copy(update={"mechanism_id": 1}) for allocation in _allocations()
+    ]
+    tree = build_allocations_merkle_tree(allocations, tmp_path / "tree")
+    commit_allocations_merkle_root(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        merkle_root=tree.root,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    allocation = allocations[0]
+    assert allocation.mechanism_id is not None
+    investor_account = accounts.at(allocation.address)
+
+    _, revert_exception = claim_locked_allocation(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        amount=allocation.amount + 1,
+        mechanism_id=allocation.mechanism_id,
+        proof=proof_of(tree, 0),
+        caller=investor_account,
+    )
+    assert revert_exception is not None
+    assert revert_exception.msg == INVALID_ALLOCATION_PROOF
+
+    claim_locked_allocation(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        amount=allocation.amount,
+        mechanism_id=allocation.mechanism_id,
+        proof=proof_of(tree, 0),
+        caller=investor_account,
+    )
+    # a fully vested lock is cleared, only the claimed leaf stops the second claim.
+    development_push_date_of_contract(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        days=FULLY_VESTED_DAYS,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    clear_fully_vested_locking_mechanism_of(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        target_address=allocation.address,
+        caller=investor_account,
+    )
+    _, revert_exception = claim_locked_allocation(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        amount=allocation.amount,
+        mechanism_id=allocation.mechanism_id,
+        proof=proof_of(tree, 0),
+        caller=investor_account,
+    )
+    assert revert_exception is not None
+    assert revert_exception.msg == ALLOCATION_IS_ALREADY_CLAIMED
+
+
+def test_claiming_while_the_locking_mechanism_is_deactivated(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract, tmp_path: Path
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    allocations = [
+        allocation.copy(update={"mechanism_id": 1}) for allocation in _allocations()
+    ]
+    tree = build_allocations_merkle_tree(allocations, tmp_path / "tree")
+    commit_allocations_merkle_root(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        merkle_root=tree.root,
+        caller=deployer_account,
+    )
+    deactivate_balance_locking_mechanism(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        caller=deployer_account,
+    )
+    allocation = allocations[0]
+    assert allocation.mechanism_id is not None
+
+    events, revert_exception = claim_locked_allocation(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        amount=allocation.amount,
+        mechanism_id=allocation.mechanism_id,
+        proof=proof_of(tree, 0),
+        caller=accounts.at(allocation.address),
+    )
+    assert events is None
+    assert revert_exception is not None
+    assert revert_exception.msg == LOCKING_MECHANISM_IS_NOT_ACTIVATED
+    assert not is_allocation_claimed(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        account_address=allocation.address,
+        amount=allocation.amount,
+        mechanism_id=allocation.mechanism_id,
+        caller=deployer_account,
+    )
+    assert (
+        balance_of(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            account_address=allocation.address,
+            caller=deployer_account,
+        )
+        == EMPTY_BALANCE_AMOUNT
+    )
+
+
+def test_merkle_builder_imports_without_the_distribution_pipeline() -> None:
+    # a fresh interpreter in the directory of the `QMatic` package, the tests have imported the pipeline already.
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, QMatic.distribution; "
+            "assert 'QMatic.distribution.pipeline' not in sys.modules",
+        ],
+        cwd=Path(__file__).parents[3],
+        check=True,
+    )
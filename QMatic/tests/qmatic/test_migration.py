@@ -0,0 +1,237 @@
+from pathlib import Path
+
+import pytest
+from brownie import accounts, chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    balance_of,
+    batch_mint_migrated_holders,
+    contract_locking_for_upgrade,
+    deactivate_balance_locking_mechanism,
+    finish_migration,
+    initializing_active_balance_locking_mechanism,
+    migration_status,
+    normal_transfer,
+    remaining_blocked_tokens_at_now_of_address,
+    transfer_with_locking,
+)
+from QMatic.migration import (
+    build_migration_snapshot,
+    import_migration_snapshot,
+    verify_migration,
+    verify_migration_snapshot,
+    write_migration_snapshot,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure, MigratedHolder
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MIGRATED_HOLDER_ALREADY_HAS_BALANCE,
+    MIGRATED_LOCK_EXCEEDS_BALANCE,
+    MIGRATION_IS_FINISHED,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+    STRING_DEFAULT,
+    UNKNOWN_MECHANISM_ID,
+)
+
+
+def test_migrating_holders_to_the_successor_contract(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    source_contract = locking_mechanism_first_round_qmatic_contract
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    for investor_address in investor_addresses[:3]:
+        transfer_with_locking(
+            qmatic_contract=source_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL,
+            caller=deployer_account,
+        )
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=source_contract,
+        entries=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=2 * MONTH_IN_DAYS,
+        ),
+        caller=deployer_account,
+    )
+    for investor_address in investor_addresses[3:5]:
+        transfer_with_locking(
+            qmatic_contract=source_contract,
+            to=investor_address,
+            amount=2 * MINIMUM_AMOUNT_TO_SELL,
+            caller=deployer_account,
+        )
+    deactivate_balance_locking_mechanism(
+        qmatic_contract=source_contract, caller=deployer_account
+    )
+    # the unlocked TGE share moves on, so a holder without lock record is migrated as well.
+    normal_transfer(
+        qmatic_contract=source_contract,
+        to=investor_addresses[5],
+        amount=1_000 * ONE_WEI,
+        caller=accounts[INVESTOR_ACCOUNT_INDEX],
+    )
+    contract_locking_for_upgrade(
+        qmatic_contract=source_contract,
+        new_qmatic_address=qmatic_contract.address,
+        report_url=STRING_DEFAULT,
+        caller=deployer_account,
+    )
+
+    header, holders = build_migration_snapshot(
+        qmatic_contract=source_contract,
+        multicall_contract=multicall_contract,
+        caller=deployer_account,
+        batch_size=4,
+    )
+    assert header.new_qmatic_address == qmatic_contract.address
+    assert len(header.mechanisms) == 2
+    assert not header.is_mechanism_activated
+    assert [holder.account for holder in holders] == [
+        deployer_account.address
+    ] + investor_addresses[:6]
+
+    path = tmp_path / "snapshot.bin"
+    write_migration_snapshot(path, header, holders, chunk_size=3)
+    assert verify_migration_snapshot(path) == header
+    report = import_migration_snapshot(
+        path, successor_contract=qmatic_contract, caller=deployer_account, batch_size=2
+    )
+    assert (report.holders, report.locked_holders) == (7, 5)
+    # 2 mechanisms, the deactivation and 4 batches of holders.
+    assert report.transactions == 2 + 1 + 4
+
+    assert (
+        verify_migration(
+            path,
+            successor_contract=qmatic_contract,
+            multicall_contract=multicall_contract,
+            caller=deployer_account,
+        )
+        == []
+    )
+    for holder in holders:
+        assert (
+            balance_of(
+                qmatic_contract=qmatic_contract,
+                account_address=holder.account,
+                caller=deployer_account,
+            )
+            == holder.balance
+        )
+        assert remaining_blocked_tokens_at_now_of_address(
+            qmatic_contract=qmatic_contract,
+            target_address=holder.account,
+            caller=deployer_account,
+        ) == remaining_blocked_tokens_at_now_of_address(
+            qmatic_contract=source_contract,
+            target_address=holder.account,
+            caller=deployer_account,
+        )
+
+    # the import window is closed once the import is verified.
+    finish_migration(qmatic_contract=qmatic_contract, caller=deployer_account)
+    assert migration_status(qmatic_contract=qmatic_contract, caller=deployer_account)
+    events, revert_exception = batch_mint_migrated_holders(
+        qmatic_contract=qmatic_contract,
+        holders=[MigratedHolder(account=accounts[-1].address, balance=ONE_WEI)],
+        caller=deployer_account,
+    )
+    assert events is None
+    assert revert_exception is not None
+    assert revert_exception.msg == MIGRATION_IS_FINISHED
+
+
+def test_migrated_holder_is_minted_once(qmatic_contract: ProjectContract) -> None:
+    holder = MigratedHolder(
+        account=accounts[INVESTOR_ACCOUNT_INDEX].address, balance=MINIMUM_AMOUNT_TO_SELL
+    )
+    events, revert_exception = batch_mint_migrated_holders(
+        qmatic_contract=qmatic_contract,
+        holders=[holder, holder],
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    assert events is None
+    assert revert_exception is not None
+    assert revert_exception.msg == MIGRATED_HOLDER_ALREADY_HAS_BALANCE
+
+
+def test_migrated_lock_exceeding_the_balance(qmatic_contract: ProjectContract) -> None:
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=qmatic_contract,
+        entries=GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=3 * MONTH_IN_DAYS,
+        ),
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    # the lock is still in its cliff, so all of its tokens are blocked.
+    events, revert_exception = batch_mint_migrated_holders(
+        qmatic_contract=qmatic_contract,
+        holders=[
+            MigratedHolder(
+                account=accounts[INVESTOR_ACCOUNT_INDEX].address,
+                balance=MINIMUM_AMOUNT_TO_SELL,
+                started_date=chain.time(),
+                total_affected_tokens=2 * MINIMUM_AMOUNT_TO_SELL,
+                mechanism_id=1,
+            )
+        ],
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    assert events is None
+    assert revert_exception is not None
+    assert revert_exception.msg == MIGRATED_LOCK_EXCEEDS_BALANCE
+
+
+def test_migrated_lock_of_unknown_mechanism(qmatic_contract: ProjectContract) -> None:
+    events, revert_exception = batch_mint_migrated_holders(
+        qmatic_contract=qmatic_contract,
+        holders=[
+            MigratedHolder(
+                account=accounts[INVESTOR_ACCOUNT_INDEX].address,
+                balance=MINIMUM_AMOUNT_TO_SELL,
+                started_date=1,
+                total_affected_tokens=MINIMUM_AMOUNT_TO_SELL,
+                mechanism_id=1,
+            )
+        ],
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    assert events is None
+    assert revert_exception is not None
+    assert revert_exception.msg == UNKNOWN_MECHANISM_ID
+
+
+def test_corrupted_snapshot_is_rejected(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    tmp_path: Path,
+) -> None:
+    contract_locking_for_upgrade(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        new_qmatic_address=multicall_contract.address,
+        report_url=STRING_DEFAULT,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    header, holders = build_migration_snapshot(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        multicall_contract=multicall_contract,
+        caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+    )
+    path = tmp_path / "snapshot.bin"
+    write_migration_snapshot(path, header, holders)
+    data = bytearray(path.read_bytes())
+    data[-40] ^= 1
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        verify_migration_snapshot(path)
@@ -0,0 +1,120 @@
+from brownie import accounts
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    active_balance_locking_mechanism,
+    balance_of,
+    batch_read,
+    batch_read_for_addresses,
+    linear_release_dividend_and_divisor_of_address,
+    linear_release_period_and_amount_of_address,
+    max_supply,
+    mechanism_status,
+    remaining_blocked_tokens_at_now_of_address,
+    remaining_seconds_to_finishing_the_cliff_of_address,
+    transfer_with_locking,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.adapters.multicall import (
+    ERROR_STRING_SELECTOR,
+    BatchReadRequest,
+    decode_revert_message,
+)
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+)
+
+
+def test_batch_read_returns_same_results_as_single_reads(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    for index, investor_address in enumerate(investor_addresses):
+        _, revert_exception = transfer_with_locking(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL * (index + 1),
+            caller=deployer_account,
+        )
+        assert revert_exception is None
+
+    address_adapters = [
+        balance_of,
+        wallet_affected_by_locking_mechanism_state,
+        linear_release_dividend_and_divisor_of_address,
+        linear_release_period_and_amount_of_address,
+        remaining_seconds_to_finishing_the_cliff_of_address,
+        remaining_blocked_tokens_at_now_of_address,
+    ]
+    requests: list[BatchReadRequest] = [
+        (adapter, address)
+        for address in investor_addresses
+        for adapter in address_adapters
+    ]
+    requests += [
+        (max_supply, None),
+        (mechanism_status, None),
+        (active_balance_locking_mechanism, None),
+    ]
+    results = batch_read(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        multicall_contract=multicall_contract,
+        requests=requests,
+        caller=deployer_account,
+        batch_size=7,
+    )
+    assert len(results) == len(requests)
+    for (adapter, address), result in zip(requests, results):
+        if address is None:
+            expected = adapter(
+                qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+                caller=deployer_account,
+            )
+        else:
+            expected = adapter(
+                locking_mechanism_first_round_qmatic_contract,
+                address,
+                deployer_account,
+            )
+        assert result == expected
+
+
+def test_batch_read_for_addresses(
+    minted_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    addresses = [account.address for account in accounts]
+    balances = batch_read_for_addresses(
+        qmatic_contract=minted_qmatic_contract,
+        multicall_contract=multicall_contract,
+        adapter=balance_of,
+        addresses=addresses,
+        caller=deployer_account,
+    )
+    assert list(balances) == addresses
+    for address, balance in balances.items():
+        assert balance == balance_of(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=address,
+            caller=deployer_account,
+        )
+
+
+def test_decode_revert_message() -> None:
+    message = "TF 3"
+    return_data = (
+        ERROR_STRING_SELECTOR
+        + (32).to_bytes(32, "big")
+        + len(message).to_bytes(32, "big")
+        + message.encode().ljust(32, b"\x00")
+    )
+    assert decode_revert_message(return_data) == message
+    assert decode_revert_message(b"") is None
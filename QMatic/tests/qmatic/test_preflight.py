@@ -0,0 +1,104 @@
+from brownie import accounts, history
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    balance_of,
+    normal_transfer,
+    preflight_many,
+    transfer_with_locking,
+)
+from QMatic.schemas import RevertedMessage
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING,
+    MINIMUM_AMOUNT_TO_SELL,
+    ONE_WEI,
+)
+
+
+def test_preflight_returns_the_reverted_message_without_broadcasting(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_account: Account = accounts[INVESTOR_ACCOUNT_INDEX]
+    sent_transactions = len(history)
+
+    events, revert_exception = transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=investor_account.address,
+        amount=MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING - 1,
+        caller=deployer_account,
+        preflight=True,
+    )
+    assert events is None
+    assert revert_exception == RevertedMessage(
+        msg=INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE
+    )
+    events, revert_exception = normal_transfer(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=deployer_account.address,
+        amount=ONE_WEI,
+        caller=investor_account,
+        preflight=True,
+    )
+    assert events is None
+    assert revert_exception == RevertedMessage(
+        msg=ERC20_INVALID_TRANSFER_MORE_THAN_BALANCE
+    )
+    assert len(history) == sent_transactions
+
+    events, revert_exception = transfer_with_locking(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        to=investor_account.address,
+        amount=MINIMUM_AMOUNT_TO_SELL,
+        caller=deployer_account,
+        preflight=True,
+    )
+    assert revert_exception is None
+    assert events is not None and events.transfer is not None
+    assert events.transfer[0].value == MINIMUM_AMOUNT_TO_SELL
+    assert len(history) == sent_transactions + 1
+    assert (
+        balance_of(
+            locking_mechanism_first_round_qmatic_contract,
+            investor_account.address,
+            deployer_account,
+        )
+        == MINIMUM_AMOUNT_TO_SELL
+    )
+
+
+def test_preflight_many_returns_the_result_of_every_request_in_order(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    requests = [
+        (
+            "transferWithLocking",
+            (account.address, MINIMUM_AMOUNT_TO_SELL * (index % 2)),
+        )
+        for index, account in enumerate(accounts[INVESTOR_ACCOUNT_INDEX:])
+    ]
+    sent_transactions = len(history)
+
+    results = preflight_many(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        requests=requests,
+        caller=deployer_account,
+        max_workers=4,
+    )
+    assert results == [
+        (
+            RevertedMessage(
+                msg=INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE
+            )
+            if amount == 0
+            else None
+        )
+        for _, (_, amount) in requests
+    ]
+    assert len(history) == sent_transactions
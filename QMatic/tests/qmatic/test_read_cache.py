@@ -0,0 +1,120 @@
+from brownie import accounts, chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import ReadCache, balance_of, max_supply, normal_transfer
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MAX_SUPPLY,
+    ONE_WEI,
+)
+
+
+def test_read_cache_hits_within_a_block_and_invalidates_after_a_write(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_address = accounts[INVESTOR_ACCOUNT_INDEX].address
+    read_cache = ReadCache()
+    cached_balance_of = read_cache.wrap(balance_of)
+
+    deployer_balance = cached_balance_of(
+        minted_qmatic_contract, deployer_account.address, deployer_account
+    )
+    assert (
+        cached_balance_of(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=deployer_account.address,
+            caller=accounts[INVESTOR_ACCOUNT_INDEX],
+        )
+        == deployer_balance
+    )
+    assert (read_cache.info().hits, read_cache.info().misses) == (1, 1)
+
+    _, revert_exception = normal_transfer(
+        qmatic_contract=minted_qmatic_contract,
+        to=investor_address,
+        amount=ONE_WEI,
+        caller=deployer_account,
+    )
+    assert revert_exception is None
+    assert (
+        cached_balance_of(
+            minted_qmatic_contract, deployer_account.address, deployer_account
+        )
+        == deployer_balance - ONE_WEI
+    )
+    assert read_cache.info().misses == 2
+    assert read_cache.info().invalidations == 1
+
+    chain.undo()
+    assert (
+        cached_balance_of(
+            minted_qmatic_contract, deployer_account.address, deployer_account
+        )
+        == deployer_balance
+    )
+
+
+def test_read_cache_evicts_the_least_recently_used_entry_and_memoizes_constants(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    read_cache = ReadCache(maxsize=2, constant_adapters=(max_supply,))
+    cached_balance_of = read_cache.wrap(balance_of)
+    cached_max_supply = read_cache.wrap(max_supply)
+
+    for account in accounts[:3]:
+        cached_balance_of(minted_qmatic_contract, account.address, deployer_account)
+    assert read_cache.info().currsize == 2
+    cached_balance_of(minted_qmatic_contract, accounts[0].address, deployer_account)
+    assert read_cache.info().misses == 4
+
+    assert cached_max_supply(minted_qmatic_contract, deployer_account) == MAX_SUPPLY
+    chain.mine()
+    assert cached_max_supply(minted_qmatic_contract, deployer_account) == MAX_SUPPLY
+    assert read_cache.info().hits == 1
+
+
+def test_read_cache_polls_the_block_number_at_most_once_per_ttl(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    read_cache = ReadCache(block_number_ttl=3_600)
+    cached_balance_of = read_cache.wrap(balance_of)
+
+    cached_balance_of(
+        minted_qmatic_contract, deployer_account.address, deployer_account
+    )
+    # a block mined outside of brownie's history is not seen within the ttl.
+    chain.mine()
+    cached_balance_of(
+        minted_qmatic_contract, deployer_account.address, deployer_account
+    )
+    assert (read_cache.info().hits, read_cache.info().invalidations) == (1, 0)
+
+    read_cache.invalidate()
+    cached_balance_of(
+        minted_qmatic_contract, deployer_account.address, deployer_account
+    )
+    assert read_cache.info().misses == 2
+
+    # the transactions of this process are seen right away.
+    normal_transfer(
+        qmatic_contract=minted_qmatic_contract,
+        to=accounts[INVESTOR_ACCOUNT_INDEX].address,
+        amount=ONE_WEI,
+        caller=deployer_account,
+    )
+    cached_balance_of(
+        minted_qmatic_contract, deployer_account.address, deployer_account
+    )
+    assert read_cache.info().misses == 3
+
+    eager_read_cache = ReadCache(block_number_ttl=0)
+    eager_balance_of = eager_read_cache.wrap(balance_of)
+    eager_balance_of(minted_qmatic_contract, deployer_account.address, deployer_account)
+    chain.mine()
+    eager_balance_of(minted_qmatic_contract, deployer_account.address, deployer_account)
+    assert eager_read_cache.info().misses == 2
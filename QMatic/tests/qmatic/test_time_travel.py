@@ -0,0 +1,137 @@
+from brownie import accounts, chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    mint,
+    transfer_with_locking,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.tests.constants import (
+    DEFAULT_MINT_AMOUNT,
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+    YEAR_IN_DAYS,
+)
+from QMatic.tests.time_travel import (
+    daily_offsets,
+    mismatches_with_vesting_engine,
+    sweep_remaining_blocked_tokens,
+)
+
+WEEKLY_QUARTER_RELEASE = GeneralActiveBalanceLockingMechanismStructure(
+    cliff_duration_in_days=10,
+    linear_release_period_in_days=7,
+    linear_release_dividend=1,
+    linear_release_divisor=4,
+    releasing_tge_dividend_on_100=0,
+)
+
+
+def _lock_investors(
+    qmatic_contract: ProjectContract, investor_addresses: list[str]
+) -> None:
+    for index, investor_address in enumerate(investor_addresses):
+        _, revert_exception = transfer_with_locking(
+            qmatic_contract=qmatic_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL + index * 7_777 * ONE_WEI,
+            caller=accounts[DEPLOYER_ACCOUNT_INDEX],
+        )
+        assert revert_exception is None
+
+
+def test_full_year_daily_sweep_of_a_development_contract(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    _lock_investors(
+        locking_mechanism_first_round_qmatic_contract, investor_addresses[:4]
+    )
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        entries=WEEKLY_QUARTER_RELEASE,
+        caller=deployer_account,
+    )
+    _lock_investors(
+        locking_mechanism_first_round_qmatic_contract, investor_addresses[4:]
+    )
+    # the CONTRACT_SHIFT_DAYS of the contract is kept by the sweep.
+    development_push_date_of_contract(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        days=MONTH_IN_DAYS,
+        caller=deployer_account,
+    )
+    block_number, timestamp = chain[-1].number, chain[-1].timestamp
+
+    sweep = sweep_remaining_blocked_tokens(
+        qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+        multicall_contract=multicall_contract,
+        addresses=[deployer_account.address] + investor_addresses,
+        offsets_in_seconds=daily_offsets(YEAR_IN_DAYS),
+        caller=deployer_account,
+    )
+    assert (chain[-1].number, chain[-1].timestamp) == (block_number, timestamp)
+    assert sweep.contract_shift_days == MONTH_IN_DAYS
+    assert len(sweep.timestamps) == YEAR_IN_DAYS + 1
+    assert sweep.timestamps[0] == timestamp
+    # the cliff of the first round starts after the shift, every lock is released within the year.
+    assert all(sweep.remaining_blocked_tokens[1:, 0] > 0)
+    assert all(sweep.remaining_blocked_tokens[:, -1] == 0)
+    assert (
+        mismatches_with_vesting_engine(
+            qmatic_contract=locking_mechanism_first_round_qmatic_contract,
+            sweep=sweep,
+            caller=deployer_account,
+        )
+        == []
+    )
+
+
+def test_sweep_of_a_production_contract(
+    production_qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    mint(
+        qmatic_contract=production_qmatic_contract,
+        to=deployer_account.address,
+        amount=DEFAULT_MINT_AMOUNT,
+        caller=deployer_account,
+    )
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=production_qmatic_contract,
+        entries=WEEKLY_QUARTER_RELEASE,
+        caller=deployer_account,
+    )
+    _lock_investors(production_qmatic_contract, investor_addresses)
+
+    # every 6 hours over the cliff and the first periods.
+    sweep = sweep_remaining_blocked_tokens(
+        qmatic_contract=production_qmatic_contract,
+        multicall_contract=multicall_contract,
+        addresses=investor_addresses,
+        offsets_in_seconds=[offset // 4 for offset in daily_offsets(4 * 7 * 5)],
+        caller=deployer_account,
+    )
+    assert sweep.contract_shift_days == 0
+    assert (
+        mismatches_with_vesting_engine(
+            qmatic_contract=production_qmatic_contract,
+            sweep=sweep,
+            caller=deployer_account,
+        )
+        == []
+    )
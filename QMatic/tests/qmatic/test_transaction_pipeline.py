@@ -0,0 +1,143 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from brownie import accounts, web3
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import AsyncJsonRpcTransport, TransactionPipeline, balance_of
+from QMatic.adapters.rpc import RpcError
+from QMatic.schemas import RevertedMessage
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING,
+    MINIMUM_AMOUNT_TO_SELL,
+    ONE_WEI,
+    WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM,
+)
+
+
+def test_transaction_pipeline_sends_the_requests_in_nonce_order(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    requests = [("transfer", (address, ONE_WEI)) for address in investor_addresses]
+    requests += [
+        (
+            "transferWithLocking",
+            (investor_addresses[0], MINIMUM_AMOUNT_OF_TRANSFER_WITH_LOCKING - 1),
+        ),
+        ("transferWithLocking", (investor_addresses[1], MINIMUM_AMOUNT_TO_SELL)),
+        ("transferWithLocking", (investor_addresses[1], MINIMUM_AMOUNT_TO_SELL)),
+    ]
+    confirmed_nonce = web3.eth.get_transaction_count(deployer_account.address)
+    first_block = web3.eth.block_number + 1
+
+    async def send() -> list:
+        async with AsyncJsonRpcTransport(web3.provider.endpoint_uri) as transport:
+            return await TransactionPipeline(
+                transport,
+                locking_mechanism_first_round_qmatic_contract,
+                deployer_account,
+                max_in_flight=4,
+                poll_interval_in_seconds=0.05,
+            ).send_many(requests)
+
+    outcomes = asyncio.run(send())
+    for (events, revert_exception), address in zip(outcomes, investor_addresses):
+        assert revert_exception is None
+        assert events.transfer[0].to_address == address
+        assert events.transfer[0].value == ONE_WEI
+    assert outcomes[-3] == (
+        None,
+        RevertedMessage(msg=INVALID_AMOUNT_OF_TRANSFER_WITH_LOCKING_MECHANISM_MESSAGE),
+    )
+    # the first lock of the wallet has the lower nonce, the second one reverts in its estimation or on the chain.
+    assert outcomes[-2][1] is None
+    assert outcomes[-1][1] == RevertedMessage(
+        msg=WALLET_ALREADY_HAS_ACTIVATED_LOCKING_MECHANISM
+    )
+    sent = sorted(
+        (
+            tx
+            for number in range(first_block, web3.eth.block_number + 1)
+            for tx in web3.eth.get_block(number, True).transactions
+            if tx["to"] == locking_mechanism_first_round_qmatic_contract.address
+        ),
+        key=lambda tx: tx["nonce"],
+    )
+    assert [
+        locking_mechanism_first_round_qmatic_contract.decode_input(tx["input"])[1][0]
+        for tx in sent
+    ][: len(investor_addresses) + 1] == investor_addresses + [investor_addresses[1]]
+    assert (
+        balance_of(
+            locking_mechanism_first_round_qmatic_contract,
+            investor_addresses[1],
+            deployer_account,
+        )
+        == ONE_WEI + MINIMUM_AMOUNT_TO_SELL
+    )
+    # the rejected estimation does not leave a nonce gap.
+    assert web3.eth.get_transaction_count(deployer_account.address) >= (
+        confirmed_nonce + len(investor_addresses) + 1
+    )
+
+
+class FirstBroadcastFailingTransport(AsyncJsonRpcTransport):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.failed_broadcasts = 0
+
+    async def request(self, method: str, params: list[Any]) -> Any:
+        if method == "eth_sendTransaction" and not self.failed_broadcasts:
+            self.failed_broadcasts += 1
+            raise RpcError(-32000, "connection reset")
+        return await super().request(method, params)
+
+
+def test_transaction_pipeline_does_not_reuse_the_nonce_of_a_failed_broadcast(
+    locking_mechanism_first_round_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_address = accounts[INVESTOR_ACCOUNT_INDEX].address
+    confirmed_nonce = web3.eth.get_transaction_count(deployer_account.address)
+    first_block = web3.eth.block_number + 1
+
+    async def send() -> Any:
+        async with FirstBroadcastFailingTransport(
+            web3.provider.endpoint_uri
+        ) as transport:
+            pipeline = TransactionPipeline(
+                transport,
+                locking_mechanism_first_round_qmatic_contract,
+                deployer_account,
+                poll_interval_in_seconds=0.05,
+            )
+            with pytest.raises(RpcError):
+                await pipeline.submit("transfer", (investor_address, ONE_WEI))
+            future = await pipeline.submit("transfer", (investor_address, ONE_WEI))
+            await pipeline.drain()
+            return future.result()
+
+    events, revert_exception = asyncio.run(send())
+    assert revert_exception is None
+    assert events.transfer[0].to_address == investor_address
+    # the later submit keeps the later nonce, the gap before it is filled by a self-transfer.
+    sent = {
+        tx["nonce"]: tx["to"]
+        for number in range(first_block, web3.eth.block_number + 1)
+        for tx in web3.eth.get_block(number, True).transactions
+        if tx["from"] == deployer_account.address
+    }
+    assert sent == {
+        confirmed_nonce: deployer_account.address,
+        confirmed_nonce + 1: locking_mechanism_first_round_qmatic_contract.address,
+    }
@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import numpy as np
+from brownie import accounts, chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    remaining_blocked_tokens_at_now_of_address,
+    transfer_with_locking,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.schemas.event import (
+    BalanceLockingMechanismUpdateLog,
+    InvestmentWithLockingMechanismScenario,
+)
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+)
+from QMatic.vesting import (
+    build_unlock_schedule,
+    mechanisms_of_update_logs,
+    project_unlocks,
+    read_unlock_projection,
+    wallets_of_investments,
+    write_unlock_projection,
+)
+from QMatic.vesting.engine import ONE_DAY_IN_SECONDS
+
+LOCKING_MECHANISMS = [
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=3 * MONTH_IN_DAYS,
+        linear_release_period_in_days=1 * MONTH_IN_DAYS,
+        linear_release_dividend=1,
+        linear_release_divisor=10,
+        releasing_tge_dividend_on_100=15,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=2 * MONTH_IN_DAYS,
+        linear_release_period_in_days=0,
+        linear_release_dividend=0,
+        linear_release_divisor=0,
+        releasing_tge_dividend_on_100=0,
+    ),
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=0,
+        linear_release_period_in_days=7,
+        linear_release_dividend=333,
+        linear_release_divisor=10_000,
+        releasing_tge_dividend_on_100=7,
+    ),
+]
+HORIZON_IN_DAYS: int = 400
+
+
+def test_unlock_projection_matches_the_contract(
+    minted_qmatic_contract: ProjectContract, tmp_path: Path
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    update_logs: list[BalanceLockingMechanismUpdateLog] = []
+    investments: list[InvestmentWithLockingMechanismScenario] = []
+    for index, investor_address in enumerate(investor_addresses):
+        if index % 3 == 0:
+            events, _ = initializing_active_balance_locking_mechanism(
+                qmatic_contract=minted_qmatic_contract,
+                entries=LOCKING_MECHANISMS[index // 3 % len(LOCKING_MECHANISMS)],
+                caller=deployer_account,
+            )
+            assert events is not None
+            update_logs += events.balance_locking_mechanism_update_log or []
+        events, revert_exception = transfer_with_locking(
+            qmatic_contract=minted_qmatic_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL + index * 12_345 * ONE_WEI + index,
+            caller=deployer_account,
+        )
+        assert revert_exception is None and events is not None
+        investments += events.investment_with_locking_mechanism_scenario or []
+
+    start_date = chain[-1].timestamp
+    projection = project_unlocks(
+        build_unlock_schedule(
+            wallets_of_investments(investments, mechanisms_of_update_logs(update_logs))
+        ),
+        start_date=start_date,
+        end_date=start_date + (HORIZON_IN_DAYS + 1) * ONE_DAY_IN_SECONDS,
+    )
+    write_unlock_projection(projection, tmp_path / "unlocks.npz")
+    stored_projection = read_unlock_projection(tmp_path / "unlocks.npz")
+    assert list(stored_projection.unlock_date) == list(projection.unlock_date)
+    assert list(stored_projection.locked_tokens) == list(projection.locked_tokens)
+
+    for day_shifted in range(0, HORIZON_IN_DAYS, 9):
+        development_push_date_of_contract(
+            qmatic_contract=minted_qmatic_contract,
+            days=day_shifted,
+            caller=deployer_account,
+        )
+        time_now = chain[-1].timestamp + day_shifted * ONE_DAY_IN_SECONDS
+        rows = np.searchsorted(projection.unlock_date, time_now, side="right")
+        expected = (
+            projection.locked_tokens[rows - 1] if rows else projection.locked_at_start
+        )
+        assert expected == sum(
+            remaining_blocked_tokens_at_now_of_address(
+                qmatic_contract=minted_qmatic_contract,
+                target_address=address,
+                caller=deployer_account,
+            )
+            for address in investor_addresses
+        )
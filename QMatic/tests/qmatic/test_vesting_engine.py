@@ -0,0 +1,134 @@
+import numpy as np
+from brownie import accounts, chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    development_push_date_of_contract,
+    initializing_active_balance_locking_mechanism,
+    remaining_blocked_tokens_at_now_of_address,
+    transfer_with_locking,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.schemas import GeneralActiveBalanceLockingMechanismStructure
+from QMatic.tests.constants import (
+    DEPLOYER_ACCOUNT_INDEX,
+    INVESTOR_ACCOUNT_INDEX,
+    MINIMUM_AMOUNT_TO_SELL,
+    MONTH_IN_DAYS,
+    ONE_WEI,
+)
+from QMatic.vesting import (
+    build_wallet_locking_arrays,
+    init_wallet_balance_locking_mechanism,
+    remaining_blocked_tokens,
+)
+
+LOCKING_MECHANISMS = [
+    # cliff + vesting schedule + TGE
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=3 * MONTH_IN_DAYS,
+        linear_release_period_in_days=1 * MONTH_IN_DAYS,
+        linear_release_dividend=1,
+        linear_release_divisor=10,
+        releasing_tge_dividend_on_100=15,
+    ),
+    # only cliff
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=2 * MONTH_IN_DAYS,
+        linear_release_period_in_days=0,
+        linear_release_dividend=0,
+        linear_release_divisor=0,
+        releasing_tge_dividend_on_100=0,
+    ),
+    # only vesting schedule with a share that does not divide the amount
+    GeneralActiveBalanceLockingMechanismStructure(
+        cliff_duration_in_days=0,
+        linear_release_period_in_days=7,
+        linear_release_dividend=333,
+        linear_release_divisor=10_000,
+        releasing_tge_dividend_on_100=7,
+    ),
+]
+
+
+def test_vesting_engine_matches_the_contract(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_addresses = [
+        account.address for account in accounts[INVESTOR_ACCOUNT_INDEX:]
+    ]
+    for index, investor_address in enumerate(investor_addresses):
+        if index % 3 == 0:
+            _, revert_exception = initializing_active_balance_locking_mechanism(
+                qmatic_contract=minted_qmatic_contract,
+                entries=LOCKING_MECHANISMS[index // 3 % len(LOCKING_MECHANISMS)],
+                caller=deployer_account,
+            )
+            assert revert_exception is None
+        _, revert_exception = transfer_with_locking(
+            qmatic_contract=minted_qmatic_contract,
+            to=investor_address,
+            amount=MINIMUM_AMOUNT_TO_SELL + index * 12_345 * ONE_WEI + index,
+            caller=deployer_account,
+        )
+        assert revert_exception is None
+
+    wallets = [
+        wallet_affected_by_locking_mechanism_state(
+            qmatic_contract=minted_qmatic_contract,
+            account_address=investor_address,
+            caller=deployer_account,
+        )
+        for investor_address in investor_addresses + [deployer_account.address]
+    ]
+    wallet_locking_arrays = build_wallet_locking_arrays(wallets)
+
+    for day_shifted in range(0, 400, 3):
+        development_push_date_of_contract(
+            qmatic_contract=minted_qmatic_contract,
+            days=day_shifted,
+            caller=deployer_account,
+        )
+        expected = remaining_blocked_tokens(
+            wallets=wallet_locking_arrays,
+            timestamps=np.array([chain[-1].timestamp]),
+            contract_shift_days=day_shifted,
+        )
+        for index, address in enumerate(
+            investor_addresses + [deployer_account.address]
+        ):
+            assert expected[index, 0] == remaining_blocked_tokens_at_now_of_address(
+                qmatic_contract=minted_qmatic_contract,
+                target_address=address,
+                caller=deployer_account,
+            )
+
+
+def test_init_wallet_balance_locking_mechanism_matches_the_contract(
+    minted_qmatic_contract: ProjectContract,
+) -> None:
+    deployer_account: Account = accounts[DEPLOYER_ACCOUNT_INDEX]
+    investor_account: Account = accounts[INVESTOR_ACCOUNT_INDEX]
+    mechanism = LOCKING_MECHANISMS[2]
+    amount = MINIMUM_AMOUNT_TO_SELL + 987_654_321
+    initializing_active_balance_locking_mechanism(
+        qmatic_contract=minted_qmatic_contract,
+        entries=mechanism,
+        caller=deployer_account,
+    )
+    transfer_with_locking(
+        qmatic_contract=minted_qmatic_contract,
+        to=investor_account.address,
+        amount=amount,
+        caller=deployer_account,
+    )
+    wallet = wallet_affected_by_locking_mechanism_state(
+        qmatic_contract=minted_qmatic_contract,
+        account_address=investor_account.address,
+        caller=deployer_account,
+    )
+    assert wallet == init_wallet_balance_locking_mechanism(
+        amount=amount, mechanism=mechanism, started_date=wallet.started_date
+    )
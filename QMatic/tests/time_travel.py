@@ -0,0 +1,129 @@
+from typing import NamedTuple, Sequence
+
+import numpy as np
+from brownie import chain
+from brownie.network.account import Account
+from brownie.network.contract import ProjectContract
+
+from QMatic.adapters import (
+    batch_read_for_addresses,
+    development_status,
+    remaining_blocked_tokens_at_now_of_address,
+    shifted_days,
+    wallet_affected_by_locking_mechanism_state,
+)
+from QMatic.vesting import build_wallet_locking_arrays, remaining_blocked_tokens
+
+from .constants import ONE_DAY_IN_SECONDS
+from .isolation import nested_snapshot
+
+
+class RemainingBlockedTokensSweep(NamedTuple):
+    """
+    'getRemainingBlockedTokensAtNowOf' of every address at every block timestamp of the sweep,
+    `remaining_blocked_tokens` is a (addresses, timestamps) object array of python integers.
+    """
+
+    addresses: list[str]
+    timestamps: np.ndarray
+    contract_shift_days: int
+    remaining_blocked_tokens: np.ndarray
+
+
+class SweepMismatch(NamedTuple):
+    address: str
+    timestamp: int
+    remaining_blocked_tokens: int
+    expected: int
+
+
+def daily_offsets(days: int, step_in_days: int = 1) -> list[int]:
+    """
+    the offsets in seconds of a sweep over `days` days (both ends included) every `step_in_days` days.
+    """
+    return [day * ONE_DAY_IN_SECONDS for day in range(0, days + 1, step_in_days)]
+
+
+def sweep_remaining_blocked_tokens(
+    qmatic_contract: ProjectContract,
+    multicall_contract: ProjectContract,
+    addresses: Sequence[str],
+    offsets_in_seconds: Sequence[int],
+    caller: Account,
+) -> RemainingBlockedTokensSweep:
+    """
+    moves the local chain through the timestamps `latest block timestamp + offset` (increasing offsets)
+    by mining one empty block per timestamp and reads every address at that block with one multicall.
+    the contract is not touched, so the production contracts (without 'changeDateOfContract') are swept as well,
+    the 'CONTRACT_SHIFT_DAYS' of a development contract stays as it is and is returned in the sweep.
+    the chain is reverted to its previous state (and time) afterwards.
+    """
+    if any(
+        later <= earlier
+        for earlier, later in zip(offsets_in_seconds, offsets_in_seconds[1:])
+    ):
+        raise ValueError("the offsets of a sweep must be increasing")
+    contract_shift_days = (
+        shifted_days(qmatic_contract=qmatic_contract, caller=caller)
+        if development_status(qmatic_contract=qmatic_contract, caller=caller)
+        else 0
+    )
+    timestamps, columns = [], []
+    # 'chain.snapshot' would replace the snapshot of the test isolation.
+    with nested_snapshot():
+        start = chain[-1].timestamp
+        for offset in offsets_in_seconds:
+            if offset < 0:
+                raise ValueError("a sweep can not go back in time")
+            if offset > 0:
+                chain.mine(timestamp=start + offset)
+            block = chain[-1]
+            results = batch_read_for_addresses(
+                qmatic_contract=qmatic_contract,
+                multicall_contract=multicall_contract,
+                adapter=remaining_blocked_tokens_at_now_of_address,
+                addresses=addresses,
+                caller=caller,
+                block_identifier=block.number,
+            )
+            timestamps.append(block.timestamp)
+            columns.append([results[address] for address in addresses])
+    remaining = np.empty((len(addresses), len(timestamps)), dtype=object)
+    for index, column in enumerate(columns):
+        remaining[:, index] = column
+    return RemainingBlockedTokensSweep(
+        addresses=list(addresses),
+        timestamps=np.array(timestamps, dtype=np.int64),
+        contract_shift_days=contract_shift_days,
+        remaining_blocked_tokens=remaining,
+    )
+
+
+def mismatches_with_vesting_engine(
+    qmatic_contract: ProjectContract,
+    sweep: RemainingBlockedTokensSweep,
+    caller: Account,
+) -> list[SweepMismatch]:
+    """
+    the points of `sweep` that differ from the vesting engine over the current lock records of its addresses.
+    """
+    wallets = [
+        wallet_affected_by_locking_mechanism_state(
+            qmatic_contract=qmatic_contract, account_address=address, caller=caller
+        )
+        for address in sweep.addresses
+    ]
+    expected = remaining_blocked_tokens(
+        wallets=build_wallet_locking_arrays(wallets),
+        timestamps=sweep.timestamps,
+        contract_shift_days=sweep.contract_shift_days,
+    )
+    return [
+        SweepMismatch(
+            address=sweep.addresses[row],
+            timestamp=int(sweep.timestamps[column]),
+            remaining_blocked_tokens=sweep.remaining_blocked_tokens[row, column],
+            expected=expected[row, column],
+        )
+        for row, column in zip(*np.nonzero(sweep.remaining_blocked_tokens != expected))
+    ]
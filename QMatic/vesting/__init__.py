@@ -0,0 +1,35 @@
+from .engine import (
+    WalletLockingArrays,
+    build_wallet_locking_arrays,
+    init_wallet_balance_locking_mechanism,
+    remaining_blocked_tokens,
+    remaining_blocked_tokens_limbs,
+    remaining_blocked_tokens_of,
+)
+from .projection import (
+    UnlockProjection,
+    UnlockSchedule,
+    build_unlock_schedule,
+    mechanisms_of_update_logs,
+    project_unlocks,
+    read_unlock_projection,
+    wallets_of_investments,
+    write_unlock_projection,
+)
+
+__all__ = (
+    "WalletLockingArrays",
+    "build_wallet_locking_arrays",
+    "init_wallet_balance_locking_mechanism",
+    "remaining_blocked_tokens",
+    "remaining_blocked_tokens_limbs",
+    "remaining_blocked_tokens_of",
+    "UnlockProjection",
+    "UnlockSchedule",
+    "build_unlock_schedule",
+    "mechanisms_of_update_logs",
+    "project_unlocks",
+    "read_unlock_projection",
+    "wallets_of_investments",
+    "write_unlock_projection",
+)
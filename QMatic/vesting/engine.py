@@ -0,0 +1,244 @@
+from typing import NamedTuple, Sequence, Union
+
+import numpy as np
+
+from QMatic.schemas import (
+    GeneralActiveBalanceLockingMechanismStructure,
+    WalletBalanceLockingMechanism,
+)
+
+ONE_DAY_IN_SECONDS: int = 86400
+# amounts are kept as little-endian 32 bits limbs in uint64 arrays, so the limb products never overflow.
+LIMB_BITS: int = 32
+LIMB_MASK: int = (1 << LIMB_BITS) - 1
+# a wallet needs at most 'ceil(totalAffectedTokens / linearReleaseTokensPerPeriod)' periods to release everything,
+# the contract rules keep this number around the linear release divisor (<= 10^5).
+MAX_PERIODS_TO_RELEASE_EVERYTHING: int = 1 << 31
+NEVER_RELEASES_EVERYTHING: int = np.iinfo(np.int64).max
+MAX_SECONDS: int = np.iinfo(np.int64).max // 4
+
+
+class WalletLockingArrays(NamedTuple):
+    """
+    column oriented state of many 'WalletBalanceLockingMechanism' records.
+    the amount columns are limbs with (limbs, wallets) shape.
+    """
+
+    started_date: np.ndarray
+    cliff_end_date: np.ndarray
+    linear_release_period_in_seconds: np.ndarray
+    periods_to_release_everything: np.ndarray
+    total_affected_tokens: np.ndarray
+    linear_release_tokens_per_period: np.ndarray
+
+
+def init_wallet_balance_locking_mechanism(
+    amount: int,
+    mechanism: GeneralActiveBalanceLockingMechanismStructure,
+    started_date: int,
+) -> WalletBalanceLockingMechanism:
+    """
+    mirrors '_initWalletBalanceLockingMechanismFor' of the QMatic contract.
+    """
+    tge_release = (amount * mechanism.releasing_tge_dividend_on_100) // 100
+    amount = amount - tge_release
+    linear_release_tokens_per_period = 0
+    if mechanism.linear_release_dividend != 0:
+        linear_release_tokens_per_period = (
+            amount * mechanism.linear_release_dividend
+        ) // mechanism.linear_release_divisor
+    return WalletBalanceLockingMechanism(
+        started_date=started_date,
+        total_affected_tokens=amount,
+        linear_release_tokens_per_period=linear_release_tokens_per_period,
+        mechanism=mechanism,
+    )
+
+
+def remaining_blocked_tokens_of(
+    wallet: WalletBalanceLockingMechanism, time_now: int
+) -> int:
+    """
+    mirrors 'getRemainingBlockedTokensAtNowOf' of the QMatic contract for one wallet,
+    `time_now` must already contain the 'CONTRACT_SHIFT_DAYS' shift of the development contracts.
+    """
+    if wallet.started_date == 0 or wallet.mechanism is None:
+        return 0
+    cliff_end_date = (
+        wallet.started_date
+        + wallet.mechanism.cliff_duration_in_days * ONE_DAY_IN_SECONDS
+    )
+    if time_now < cliff_end_date:
+        return wallet.total_affected_tokens
+    if wallet.mechanism.linear_release_period_in_days == 0:
+        return 0
+    total_past_periods_count = (
+        (time_now - cliff_end_date)
+        // (wallet.mechanism.linear_release_period_in_days * ONE_DAY_IN_SECONDS)
+    ) + 1
+    total_released_tokens = (
+        total_past_periods_count * wallet.linear_release_tokens_per_period
+    )
+    if total_released_tokens >= wallet.total_affected_tokens:
+        return 0
+    return wallet.total_affected_tokens - total_released_tokens
+
+
+def to_limbs(values: Union[Sequence[int], np.ndarray], limbs_count: int) -> np.ndarray:
+    limbs = np.empty((limbs_count, len(values)), dtype=np.uint64)
+    for index, value in enumerate(values):
+        if value < 0 or value >> (LIMB_BITS * limbs_count):
+            raise ValueError(f"{value} does not fit in {limbs_count} limbs")
+        for limb in range(limbs_count):
+            limbs[limb, index] = (value >> (LIMB_BITS * limb)) & LIMB_MASK
+    return limbs
+
+
+def from_limbs(limbs: np.ndarray) -> np.ndarray:
+    """
+    joins the limbs of the first axis into exact python integers (object array).
+    """
+    result = np.zeros(limbs.shape[1:], dtype=object)
+    for limb in range(limbs.shape[0] - 1, -1, -1):
+        result = (result << LIMB_BITS) | limbs[limb].astype(object)
+    return result
+
+
+def _limbs_count_for(values: Sequence[int]) -> int:
+    max_bit_length = max((value.bit_length() for value in values), default=0)
+    return max(1, -(-max_bit_length // LIMB_BITS))
+
+
+def build_wallet_locking_arrays(
+    wallets: Sequence[WalletBalanceLockingMechanism],
+) -> WalletLockingArrays:
+    started_dates: list[int] = []
+    cliff_end_dates: list[int] = []
+    periods_in_seconds: list[int] = []
+    periods_to_release_everything: list[int] = []
+    total_affected_tokens: list[int] = []
+    tokens_per_period: list[int] = []
+    for wallet in wallets:
+        mechanism = wallet.mechanism or GeneralActiveBalanceLockingMechanismStructure()
+        started_dates.append(wallet.started_date)
+        cliff_end_dates.append(
+            min(
+                wallet.started_date
+                + mechanism.cliff_duration_in_days * ONE_DAY_IN_SECONDS,
+                MAX_SECONDS,
+            )
+        )
+        periods_in_seconds.append(
+            min(
+                mechanism.linear_release_period_in_days * ONE_DAY_IN_SECONDS,
+                MAX_SECONDS,
+            )
+        )
+        total_affected_tokens.append(wallet.total_affected_tokens)
+        tokens_per_period.append(wallet.linear_release_tokens_per_period)
+        if wallet.linear_release_tokens_per_period == 0:
+            periods_to_release_everything.append(
+                0 if wallet.total_affected_tokens == 0 else NEVER_RELEASES_EVERYTHING
+            )
+            continue
+        periods_count = -(
+            -wallet.total_affected_tokens // wallet.linear_release_tokens_per_period
+        )
+        if periods_count >= MAX_PERIODS_TO_RELEASE_EVERYTHING:
+            raise ValueError(
+                f"wallet needs {periods_count} periods to release everything, "
+                f"more than {MAX_PERIODS_TO_RELEASE_EVERYTHING}"
+            )
+        periods_to_release_everything.append(periods_count)
+
+    limbs_count = _limbs_count_for(total_affected_tokens + tokens_per_period)
+    return WalletLockingArrays(
+        started_date=np.array(started_dates, dtype=np.int64),
+        cliff_end_date=np.array(cliff_end_dates, dtype=np.int64),
+        linear_release_period_in_seconds=np.array(periods_in_seconds, dtype=np.int64),
+        periods_to_release_everything=np.array(
+            periods_to_release_everything, dtype=np.int64
+        ),
+        total_affected_tokens=to_limbs(total_affected_tokens, limbs_count),
+        linear_release_tokens_per_period=to_limbs(tokens_per_period, limbs_count),
+    )
+
+
+def remaining_blocked_tokens_limbs(
+    wallets: WalletLockingArrays,
+    timestamps: np.ndarray,
+    contract_shift_days: int = 0,
+) -> np.ndarray:
+    """
+    vectorized 'getRemainingBlockedTokensAtNowOf' over wallets x timestamps.
+    returns the exact remaining amounts as limbs with (limbs, wallets, timestamps) shape.
+    """
+    time_now = (
+        np.asarray(timestamps, dtype=np.int64)[np.newaxis, :]
+        + contract_shift_days * ONE_DAY_IN_SECONDS
+    )
+    cliff_end_date = wallets.cliff_end_date[:, np.newaxis]
+    period_in_seconds = wallets.linear_release_period_in_seconds[:, np.newaxis]
+    periods_to_release_everything = wallets.periods_to_release_everything[:, np.newaxis]
+
+    in_cliff = time_now < cliff_end_date
+    past_periods_count = (
+        np.maximum(time_now - cliff_end_date, 0) // np.maximum(period_in_seconds, 1)
+    ) + 1
+    released_everything = (wallets.started_date[:, np.newaxis] == 0) | (
+        ~in_cliff
+        & (
+            (period_in_seconds == 0)
+            | (past_periods_count >= periods_to_release_everything)
+        )
+    )
+    # past this point only the wallets in the linear release phase are meaningful,
+    # where the periods count is smaller than 'periods_to_release_everything'.
+    past_periods_count = np.minimum(
+        past_periods_count, MAX_PERIODS_TO_RELEASE_EVERYTHING - 1
+    ).astype(np.uint64)
+
+    limbs_count = wallets.total_affected_tokens.shape[0]
+    remaining = np.empty(
+        (limbs_count,) + past_periods_count.shape,
+        dtype=np.uint64,
+    )
+    carry = np.zeros(past_periods_count.shape, dtype=np.uint64)
+    borrow = np.zeros(past_periods_count.shape, dtype=np.int64)
+    for limb in range(limbs_count):
+        released = (
+            past_periods_count
+            * wallets.linear_release_tokens_per_period[limb][:, np.newaxis]
+            + carry
+        )
+        carry = released >> np.uint64(LIMB_BITS)
+        difference = (
+            wallets.total_affected_tokens[limb][:, np.newaxis].astype(np.int64)
+            - (released & np.uint64(LIMB_MASK)).astype(np.int64)
+            - borrow
+        )
+        borrow = (difference < 0).astype(np.int64)
+        remaining[limb] = (difference + (borrow << LIMB_BITS)).astype(np.uint64)
+
+    remaining = np.where(
+        in_cliff, wallets.total_affected_tokens[:, :, np.newaxis], remaining
+    )
+    remaining[:, released_everything] = 0
+    return remaining
+
+
+def remaining_blocked_tokens(
+    wallets: WalletLockingArrays,
+    timestamps: np.ndarray,
+    contract_shift_days: int = 0,
+) -> np.ndarray:
+    """
+    same as `remaining_blocked_tokens_limbs` but returns a (wallets, timestamps) object array of python integers.
+    """
+    return from_limbs(
+        remaining_blocked_tokens_limbs(
+            wallets=wallets,
+            timestamps=timestamps,
+            contract_shift_days=contract_shift_days,
+        )
+    )
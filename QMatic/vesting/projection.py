@@ -0,0 +1,291 @@
+from pathlib import Path
+from typing import Iterable, Mapping, NamedTuple, Sequence, Union
+
+import numpy as np
+
+from QMatic.schemas import (
+    GeneralActiveBalanceLockingMechanismStructure,
+    WalletBalanceLockingMechanism,
+)
+from QMatic.schemas.event import (
+    BalanceLockingMechanismUpdateLog,
+    InvestmentWithLockingMechanismScenario,
+)
+
+from .engine import (
+    LIMB_BITS,
+    WalletLockingArrays,
+    _limbs_count_for,
+    build_wallet_locking_arrays,
+    from_limbs,
+    remaining_blocked_tokens_limbs,
+    to_limbs,
+)
+
+DEFAULT_PROJECTION_CHUNK_SIZE: int = 100_000
+TOKENS_IN_QMATIC: int = 10**18
+
+
+class UnlockSchedule(NamedTuple):
+    """
+    the unlock events of many wallets, wallet i unlocks at 'cliff_end_date + k * linear_release_period_in_seconds'
+    for k < unlocks_count[i]: 'linear_release_tokens_per_period' for the first ones and `last_unlock_tokens` for the last one.
+    a cliff-only wallet has one unlock of everything at the end of its cliff.
+    """
+
+    wallets: WalletLockingArrays
+    unlocks_count: np.ndarray
+    last_unlock_tokens: np.ndarray
+
+
+class UnlockProjection(NamedTuple):
+    """
+    one row per event point (or per bucket) in (start_date, end_date],
+    `locked_tokens` is the aggregate locked amount right after the unlocks of the row.
+    the amount columns are object arrays of python integers.
+    """
+
+    start_date: int
+    end_date: int
+    locked_at_start: int
+    unlock_date: np.ndarray
+    unlocking_wallets: np.ndarray
+    unlocked_tokens: np.ndarray
+    locked_tokens: np.ndarray
+
+
+def mechanisms_of_update_logs(
+    logs: Iterable[BalanceLockingMechanismUpdateLog],
+) -> dict[int, GeneralActiveBalanceLockingMechanismStructure]:
+    """
+    the parameters of every mechanism id, a deactivation log repeats the parameters of its mechanism.
+    """
+    return {
+        log.mechanism_id: GeneralActiveBalanceLockingMechanismStructure(
+            cliff_duration_in_days=log.cliff_duration_in_days,
+            linear_release_period_in_days=log.linear_release_period_in_days,
+            linear_release_dividend=log.linear_release_dividend,
+            linear_release_divisor=log.linear_release_divisor,
+            releasing_tge_dividend_on_100=log.releasing_tge__dividend_on_100,
+        )
+        for log in logs
+    }
+
+
+def wallets_of_investments(
+    investments: Iterable[InvestmentWithLockingMechanismScenario],
+    mechanisms: Mapping[int, GeneralActiveBalanceLockingMechanismStructure],
+) -> list[WalletBalanceLockingMechanism]:
+    return [
+        WalletBalanceLockingMechanism.construct(
+            started_date=investment.started_date,
+            total_affected_tokens=investment.total_affected_tokens,
+            linear_release_tokens_per_period=investment.linear_release_tokens_per_period,
+            mechanism=mechanisms[investment.mechanism_id],
+        )
+        for investment in investments
+    ]
+
+
+def build_unlock_schedule(
+    wallets: Sequence[WalletBalanceLockingMechanism],
+) -> UnlockSchedule:
+    unlocks_count: list[int] = []
+    last_unlock_tokens: list[int] = []
+    for wallet in wallets:
+        mechanism = wallet.mechanism or GeneralActiveBalanceLockingMechanismStructure()
+        if wallet.started_date == 0 or wallet.total_affected_tokens == 0:
+            unlocks_count.append(0)
+            last_unlock_tokens.append(0)
+        elif mechanism.linear_release_period_in_days == 0:
+            unlocks_count.append(1)
+            last_unlock_tokens.append(wallet.total_affected_tokens)
+        elif wallet.linear_release_tokens_per_period == 0:
+            # the contract never releases these tokens.
+            unlocks_count.append(0)
+            last_unlock_tokens.append(0)
+        else:
+            count = -(
+                -wallet.total_affected_tokens // wallet.linear_release_tokens_per_period
+            )
+            unlocks_count.append(count)
+            last_unlock_tokens.append(
+                wallet.total_affected_tokens
+                - (count - 1) * wallet.linear_release_tokens_per_period
+            )
+    wallet_locking_arrays = build_wallet_locking_arrays(wallets)
+    return UnlockSchedule(
+        wallets=wallet_locking_arrays,
+        unlocks_count=np.array(unlocks_count, dtype=np.int64),
+        last_unlock_tokens=to_limbs(
+            last_unlock_tokens, wallet_locking_arrays.total_affected_tokens.shape[0]
+        ),
+    )
+
+
+def _chunk_of(schedule: UnlockSchedule, wallets: slice) -> UnlockSchedule:
+    return UnlockSchedule(
+        wallets=WalletLockingArrays(
+            *(column[..., wallets] for column in schedule.wallets)
+        ),
+        unlocks_count=schedule.unlocks_count[wallets],
+        last_unlock_tokens=schedule.last_unlock_tokens[:, wallets],
+    )
+
+
+def _join_limb_sums(limb_sums: np.ndarray) -> np.ndarray:
+    """
+    same as `from_limbs` for limbs that are sums of limbs, so they can be wider than LIMB_BITS.
+    """
+    result = np.zeros(limb_sums.shape[1:], dtype=object)
+    for limb in range(limb_sums.shape[0] - 1, -1, -1):
+        result = (result << LIMB_BITS) + limb_sums[limb].astype(object)
+    return result
+
+
+def _unlocks_of_chunk(
+    chunk: UnlockSchedule, start_date: int, end_date: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    the (dates, amount limbs) of the unlock events of `chunk` in (start_date, end_date].
+    """
+    first_unlock_date = chunk.wallets.cliff_end_date
+    period = np.maximum(chunk.wallets.linear_release_period_in_seconds, 1)
+    first_index = np.where(
+        first_unlock_date > start_date,
+        0,
+        (start_date - first_unlock_date) // period + 1,
+    )
+    last_index = np.where(
+        first_unlock_date > end_date,
+        -1,
+        np.minimum(chunk.unlocks_count - 1, (end_date - first_unlock_date) // period),
+    )
+    counts = np.maximum(last_index - first_index + 1, 0)
+    wallet_of_event = np.repeat(np.arange(len(counts)), counts)
+    # the index of every event inside the run of its wallet.
+    offsets = np.arange(len(wallet_of_event)) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    unlock_index = first_index[wallet_of_event] + offsets
+    dates = first_unlock_date[wallet_of_event] + unlock_index * period[wallet_of_event]
+    is_last = unlock_index == chunk.unlocks_count[wallet_of_event] - 1
+    amounts = np.where(
+        is_last,
+        chunk.last_unlock_tokens[:, wallet_of_event],
+        chunk.wallets.linear_release_tokens_per_period[:, wallet_of_event],
+    )
+    return dates, amounts
+
+
+def project_unlocks(
+    schedule: UnlockSchedule,
+    start_date: int,
+    end_date: int,
+    bucket_in_seconds: Union[int, None] = None,
+    chunk_size: int = DEFAULT_PROJECTION_CHUNK_SIZE,
+) -> UnlockProjection:
+    """
+    aggregate unlock calendar of the wallets in (start_date, end_date].
+    the rows are the cliff and period boundaries of the wallets, so the cost grows with the unlock events instead of the days of the horizon.
+    with `bucket_in_seconds` (e.g. one day) the events are summed per bucket, labeled by the start of the bucket.
+    """
+    unlocked_of_date: dict[int, int] = {}
+    wallets_of_date: dict[int, int] = {}
+    locked_at_start = 0
+    for first_wallet in range(0, len(schedule.unlocks_count), chunk_size):
+        chunk = _chunk_of(schedule, slice(first_wallet, first_wallet + chunk_size))
+        locked_at_start += int(
+            _join_limb_sums(
+                remaining_blocked_tokens_limbs(
+                    chunk.wallets, np.array([start_date])
+                ).sum(axis=1, dtype=np.uint64)
+            )[0]
+        )
+        dates, amounts = _unlocks_of_chunk(chunk, start_date, end_date)
+        if bucket_in_seconds is not None:
+            dates = (
+                start_date
+                + (dates - start_date) // bucket_in_seconds * bucket_in_seconds
+            )
+        order = np.argsort(dates, kind="stable")
+        dates = dates[order]
+        starts = np.flatnonzero(np.diff(dates, prepend=dates[:1] - 1))
+        if len(starts) == 0:
+            continue
+        # every limb is below 2^LIMB_BITS, so the sums of a chunk fit in uint64.
+        sums = _join_limb_sums(np.add.reduceat(amounts[:, order], starts, axis=1))
+        wallets_counts = np.diff(np.append(starts, len(dates)))
+        for date, unlocked, wallets_count in zip(dates[starts], sums, wallets_counts):
+            unlocked_of_date[int(date)] = unlocked_of_date.get(int(date), 0) + int(
+                unlocked
+            )
+            wallets_of_date[int(date)] = wallets_of_date.get(int(date), 0) + int(
+                wallets_count
+            )
+
+    unlock_date = np.array(sorted(unlocked_of_date), dtype=np.int64)
+    unlocked_tokens = np.array(
+        [unlocked_of_date[int(date)] for date in unlock_date], dtype=object
+    )
+    return UnlockProjection(
+        start_date=start_date,
+        end_date=end_date,
+        locked_at_start=locked_at_start,
+        unlock_date=unlock_date,
+        unlocking_wallets=np.array(
+            [wallets_of_date[int(date)] for date in unlock_date], dtype=np.int64
+        ),
+        unlocked_tokens=unlocked_tokens,
+        locked_tokens=locked_at_start - np.cumsum(unlocked_tokens, dtype=object),
+    )
+
+
+def write_unlock_projection(
+    projection: UnlockProjection,
+    path: Union[str, Path],
+    total_supply: Union[int, None] = None,
+) -> None:
+    """
+    writes the projection as the columns of an '.npz' file.
+    the exact amounts are 32 bits limbs ('*_limbs', (limbs, rows) shape), the '*_in_qmatic' columns are float64 for reading.
+    with `total_supply`, the circulating supply (total supply - locked) is added.
+    """
+    amount_columns = {
+        "unlocked_tokens": projection.unlocked_tokens,
+        "locked_tokens": projection.locked_tokens,
+    }
+    if total_supply is not None:
+        amount_columns["circulating_tokens"] = total_supply - projection.locked_tokens
+    limbs_count = _limbs_count_for(
+        [projection.locked_at_start, total_supply or 0]
+        + [int(value) for values in amount_columns.values() for value in values]
+    )
+    columns: dict[str, np.ndarray] = {}
+    for name, values in amount_columns.items():
+        columns[f"{name}_limbs"] = to_limbs(values, limbs_count)
+        columns[f"{name}_in_qmatic"] = np.array(
+            [value / TOKENS_IN_QMATIC for value in values], dtype=np.float64
+        )
+    np.savez_compressed(
+        path,
+        start_date=np.int64(projection.start_date),
+        end_date=np.int64(projection.end_date),
+        locked_at_start_limbs=to_limbs([projection.locked_at_start], limbs_count),
+        unlock_date=projection.unlock_date,
+        unlocking_wallets=projection.unlocking_wallets,
+        **columns,
+    )
+
+
+def read_unlock_projection(path: Union[str, Path]) -> UnlockProjection:
+    with np.load(path) as columns:
+        return UnlockProjection(
+            start_date=int(columns["start_date"]),
+            end_date=int(columns["end_date"]),
+            locked_at_start=int(from_limbs(columns["locked_at_start_limbs"])[0]),
+            unlock_date=columns["unlock_date"],
+            unlocking_wallets=columns["unlocking_wallets"],
+            unlocked_tokens=from_limbs(columns["unlocked_tokens_limbs"]),
+            locked_tokens=from_limbs(columns["locked_tokens_limbs"]),
+        )